@@ -8,11 +8,22 @@ Modules:
 - neo4j_client: Neo4j graph database client
 - s3_client: MinIO/S3 object storage client
 - cmf_client: NIEM CMF tool wrapper
+- tool_worker: Long-lived JVM workers for the NIEM Java tools
 """
 
 from .cmf_client import CMFError, download_and_setup_cmf, get_cmf_version, is_cmf_available, run_cmf_command
 from .neo4j_client import Neo4jClient
-from .s3_client import BUCKETS, create_buckets, download_file, list_files, upload_file
+from .s3_client import (
+    BUCKETS,
+    create_buckets,
+    download_file,
+    download_if_exists,
+    download_many,
+    list_files,
+    upload_file,
+    upload_many,
+)
+from .tool_worker import ToolWorkerError, shutdown_tool_workers
 
 __all__ = [
     # Neo4j client
@@ -21,6 +32,9 @@ __all__ = [
     "create_buckets",
     "upload_file",
     "download_file",
+    "download_if_exists",
+    "upload_many",
+    "download_many",
     "list_files",
     "BUCKETS",
     # CMF client
@@ -29,4 +43,7 @@ __all__ = [
     "get_cmf_version",
     "download_and_setup_cmf",
     "run_cmf_command",
+    # Tool workers
+    "ToolWorkerError",
+    "shutdown_tool_workers",
 ]
@@ -16,6 +16,8 @@ import subprocess
 from pathlib import Path
 from typing import Any
 
+from .tool_worker import run_tool_job
+
 logger = logging.getLogger(__name__)
 
 # CMF tool configuration
@@ -405,7 +407,10 @@ def run_cmf_command(cmd: list, timeout: int = CMF_TIMEOUT, working_dir: str | No
 
             working_dir = str(working_dir_path)
 
-        result = subprocess.run(full_cmd, capture_output=True, text=True, timeout=timeout, cwd=working_dir)
+        # Warm tool JVM when workers are enabled; one-shot process otherwise or if the worker fails
+        result = run_tool_job("cmftool", CMF_TOOL_PATH, cmd, str(working_dir), timeout)
+        if result is None:
+            result = subprocess.run(full_cmd, capture_output=True, text=True, timeout=timeout, cwd=working_dir)
 
         logger.debug(f"CMF command result: returncode={result.returncode}")
         if result.stdout:
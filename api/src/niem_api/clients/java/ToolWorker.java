@@ -0,0 +1,164 @@
+/*
+ * Persistent worker for the NIEM command-line tools (cmftool, scheval, NIEMTran).
+ *
+ * Runs the tool's main class once per job inside one long-lived JVM, so JVM
+ * start-up and class loading are paid once per worker instead of once per
+ * command. Started by niem_api/clients/tool_worker.py as
+ *
+ *     java -Djava.security.manager=allow -cp <tool classpath> ToolWorker.java <main class>
+ *
+ * Protocol (stdin/stdout, one job at a time):
+ *   worker -> "READY exit-trap\n" (or "READY no-exit-trap") once started
+ *   client -> one line per job: the base64-encoded tool arguments, space separated
+ *   worker -> "<exit code> <stdout bytes> <stderr bytes>\n", then the captured
+ *             stdout and stderr (UTF-8)
+ *
+ * System.exit() from the tool is trapped with a security manager when the JVM
+ * allows one. Without it the client does not use the worker at all.
+ */
+
+import java.io.BufferedOutputStream;
+import java.io.BufferedReader;
+import java.io.ByteArrayInputStream;
+import java.io.ByteArrayOutputStream;
+import java.io.FileDescriptor;
+import java.io.FileInputStream;
+import java.io.FileOutputStream;
+import java.io.IOException;
+import java.io.InputStreamReader;
+import java.io.OutputStream;
+import java.io.PrintStream;
+import java.lang.reflect.InvocationTargetException;
+import java.lang.reflect.Method;
+import java.nio.charset.StandardCharsets;
+import java.security.Permission;
+import java.util.Base64;
+
+public class ToolWorker {
+
+    /** Set before the worker itself exits, so the security manager lets the exit through. */
+    static volatile boolean exiting = false;
+
+    static final class ExitTrapped extends SecurityException {
+        final int status;
+
+        ExitTrapped(int status) {
+            super("System.exit(" + status + ")");
+            this.status = status;
+        }
+    }
+
+    /** Stream whose target is swapped per job; loggers keep the System.out they saw first. */
+    static final class SwitchingStream extends OutputStream {
+        volatile OutputStream target = OutputStream.nullOutputStream();
+
+        @Override
+        public void write(int b) throws IOException {
+            target.write(b);
+        }
+
+        @Override
+        public void write(byte[] b, int off, int len) throws IOException {
+            target.write(b, off, len);
+        }
+
+        @Override
+        public void flush() throws IOException {
+            target.flush();
+        }
+    }
+
+    @SuppressWarnings("removal")
+    static boolean trapExit() {
+        try {
+            System.setSecurityManager(new SecurityManager() {
+                @Override
+                public void checkExit(int status) {
+                    if (!exiting) {
+                        throw new ExitTrapped(status);
+                    }
+                }
+
+                @Override
+                public void checkPermission(Permission perm) {
+                }
+
+                @Override
+                public void checkPermission(Permission perm, Object context) {
+                }
+            });
+            return true;
+        } catch (UnsupportedOperationException | SecurityException e) {
+            return false;
+        }
+    }
+
+    static ExitTrapped exitCause(Throwable t) {
+        for (; t != null; t = t.getCause()) {
+            if (t instanceof ExitTrapped) {
+                return (ExitTrapped) t;
+            }
+        }
+        return null;
+    }
+
+    public static void main(String[] argv) throws Exception {
+        Method toolMain = Class.forName(argv[0]).getMethod("main", String[].class);
+        BufferedReader jobs = new BufferedReader(
+            new InputStreamReader(new FileInputStream(FileDescriptor.in), StandardCharsets.UTF_8));
+        OutputStream protocol = new BufferedOutputStream(new FileOutputStream(FileDescriptor.out));
+
+        SwitchingStream out = new SwitchingStream();
+        SwitchingStream err = new SwitchingStream();
+        System.setOut(new PrintStream(out, true, StandardCharsets.UTF_8));
+        System.setErr(new PrintStream(err, true, StandardCharsets.UTF_8));
+        System.setIn(new ByteArrayInputStream(new byte[0]));
+
+        boolean trapped = trapExit();
+        protocol.write(("READY " + (trapped ? "exit-trap" : "no-exit-trap") + "\n").getBytes(StandardCharsets.UTF_8));
+        protocol.flush();
+
+        String line;
+        while ((line = jobs.readLine()) != null) {
+            String[] encoded = line.isBlank() ? new String[0] : line.trim().split(" ");
+            String[] args = new String[encoded.length];
+            for (int i = 0; i < encoded.length; i++) {
+                args[i] = new String(Base64.getDecoder().decode(encoded[i]), StandardCharsets.UTF_8);
+            }
+
+            ByteArrayOutputStream stdout = new ByteArrayOutputStream();
+            ByteArrayOutputStream stderr = new ByteArrayOutputStream();
+            out.target = stdout;
+            err.target = stderr;
+            int code = 0;
+            try {
+                toolMain.invoke(null, (Object) args);
+            } catch (InvocationTargetException e) {
+                ExitTrapped exit = exitCause(e.getCause());
+                if (exit != null) {
+                    code = exit.status;
+                } else if (e.getCause() instanceof VirtualMachineError) {
+                    // The JVM is in no state to take more jobs; the client restarts the worker
+                    exiting = true;
+                    Runtime.getRuntime().halt(70);
+                } else {
+                    // Same exit code and stack trace as an uncaught exception in a one-shot run
+                    e.getCause().printStackTrace(System.err);
+                    code = 1;
+                }
+            }
+            System.out.flush();
+            System.err.flush();
+            out.target = OutputStream.nullOutputStream();
+            err.target = OutputStream.nullOutputStream();
+
+            byte[] stdoutBytes = stdout.toByteArray();
+            byte[] stderrBytes = stderr.toByteArray();
+            String header = code + " " + stdoutBytes.length + " " + stderrBytes.length + "\n";
+            protocol.write(header.getBytes(StandardCharsets.UTF_8));
+            protocol.write(stdoutBytes);
+            protocol.write(stderrBytes);
+            protocol.flush();
+        }
+    }
+}
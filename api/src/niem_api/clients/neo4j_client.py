@@ -13,12 +13,114 @@ import logging
 import os
 from typing import Any
 
-from neo4j import GraphDatabase
+from neo4j import AsyncGraphDatabase, GraphDatabase
 from neo4j.graph import Node, Path, Relationship
 
 logger = logging.getLogger(__name__)
 
 
+def _extract_graph_elements(value: Any, nodes: dict, relationships: dict) -> None:
+    """
+    Recursively extract graph elements from Neo4j result values.
+
+    Handles Neo4j types: Node, Relationship, Path, and nested collections.
+    Populates nodes and relationships dicts with unique elements.
+
+    Args:
+        value: Value from Neo4j query result (can be Node, Relationship, Path, list, dict)
+        nodes: Dict to populate with nodes (keyed by node ID)
+        relationships: Dict to populate with relationships (keyed by relationship ID)
+    """
+    if isinstance(value, Node):
+        # Use internal Neo4j ID as the key, but preserve semantic ID in properties
+        internal_id = str(value.id)
+        properties = dict(value.items())
+
+        # Extract semantic ID (NIEM structures:id) if available
+        # This is the ID used for relationships in the graph data model
+        semantic_id = properties.get("id", internal_id)
+
+        if internal_id not in nodes:
+            nodes[internal_id] = {
+                "id": semantic_id,  # Use semantic ID for display and matching
+                "internal_id": internal_id,  # Keep internal ID for reference
+                "label": list(value.labels)[0] if value.labels else "Unknown",
+                "labels": list(value.labels),
+                "properties": properties,
+            }
+
+    elif isinstance(value, Relationship):
+        rel_id = str(value.id)
+        if rel_id not in relationships:
+            # Extract start and end nodes first to get their semantic IDs
+            start_internal_id = str(value.start_node.id)
+            end_internal_id = str(value.end_node.id)
+
+            # Ensure start and end nodes are captured
+            _extract_graph_elements(value.start_node, nodes, relationships)
+            _extract_graph_elements(value.end_node, nodes, relationships)
+
+            # Use semantic IDs for relationship endpoints
+            # This matches the data model where edges reference semantic IDs
+            start_semantic_id = nodes[start_internal_id]["id"]
+            end_semantic_id = nodes[end_internal_id]["id"]
+
+            relationships[rel_id] = {
+                "id": rel_id,
+                "type": value.type,
+                "startNode": start_semantic_id,  # Use semantic ID
+                "endNode": end_semantic_id,  # Use semantic ID
+                "properties": dict(value.items()),
+            }
+
+    elif isinstance(value, Path):
+        for node in value.nodes:
+            _extract_graph_elements(node, nodes, relationships)
+        for rel in value.relationships:
+            _extract_graph_elements(rel, nodes, relationships)
+
+    elif isinstance(value, list):
+        for item in value:
+            _extract_graph_elements(item, nodes, relationships)
+
+    elif isinstance(value, dict):
+        for nested_value in value.values():
+            _extract_graph_elements(nested_value, nodes, relationships)
+
+
+def _graph_payload(nodes: dict, relationships: dict) -> dict[str, Any]:
+    """
+    Build the query_graph response from extracted nodes and relationships.
+
+    Args:
+        nodes: Nodes keyed by internal ID
+        relationships: Relationships keyed by internal ID
+
+    Returns:
+        Dictionary with nodes, relationships and metadata
+    """
+    nodes_list = list(nodes.values())
+    relationships_list = list(relationships.values())
+
+    # Get metadata
+    all_labels = set()
+    for node in nodes_list:
+        all_labels.update(node["labels"])
+
+    all_rel_types = {rel["type"] for rel in relationships_list}
+
+    return {
+        "nodes": nodes_list,
+        "relationships": relationships_list,
+        "metadata": {
+            "nodeLabels": sorted(all_labels),
+            "relationshipTypes": sorted(all_rel_types),
+            "nodeCount": len(nodes_list),
+            "relationshipCount": len(relationships_list),
+        },
+    }
+
+
 class Neo4jClient:
     """
     Neo4j database client with connection pooling and result extraction.
@@ -42,7 +144,7 @@ class Neo4jClient:
         - NEO4J_PASSWORD: Authentication password (default: password)
     """
 
-    def __init__(self, uri: str = None, user: str = None, password: str = None):
+    def __init__(self, uri: str = None, user: str = None, password: str = None, **driver_config: Any):
         """
         Initialize Neo4j client with connection parameters.
 
@@ -50,16 +152,17 @@ class Neo4jClient:
             uri: Database connection URI. If None, reads from NEO4J_URI env var.
             user: Authentication username. If None, reads from NEO4J_USER env var.
             password: Authentication password. If None, reads from NEO4J_PASSWORD env var.
+            **driver_config: Extra driver settings (connection pool size, timeouts)
 
         Raises:
             neo4j.exceptions.ServiceUnavailable: If cannot connect to database
         """
         from ..core.env_utils import getenv_clean
-        
+
         self.uri = uri or getenv_clean("NEO4J_URI", "bolt://localhost:7687")
         self.user = user or getenv_clean("NEO4J_USER", "neo4j")
         self.password = password or getenv_clean("NEO4J_PASSWORD", "password")
-        self.driver = GraphDatabase.driver(self.uri, auth=(self.user, self.password))
+        self.driver = GraphDatabase.driver(self.uri, auth=(self.user, self.password), **driver_config)
 
     def query(self, cypher_query: str, parameters: dict | None = None) -> list[dict]:
         """
@@ -128,95 +231,18 @@ class Neo4jClient:
                 for value in record.values():
                     self._extract_graph_elements(value, nodes, relationships)
 
-            # Convert to lists and add metadata
-            nodes_list = list(nodes.values())
-            relationships_list = list(relationships.values())
-
-            # Get metadata
-            all_labels = set()
-            for node in nodes_list:
-                all_labels.update(node["labels"])
-
-            all_rel_types = {rel["type"] for rel in relationships_list}
-
-            return {
-                "nodes": nodes_list,
-                "relationships": relationships_list,
-                "metadata": {
-                    "nodeLabels": sorted(all_labels),
-                    "relationshipTypes": sorted(all_rel_types),
-                    "nodeCount": len(nodes_list),
-                    "relationshipCount": len(relationships_list),
-                },
-            }
+            return _graph_payload(nodes, relationships)
 
     def _extract_graph_elements(self, value: Any, nodes: dict, relationships: dict):
         """
         Recursively extract graph elements from Neo4j result values.
 
-        Handles Neo4j types: Node, Relationship, Path, and nested collections.
-        Populates nodes and relationships dicts with unique elements.
-
         Args:
             value: Value from Neo4j query result (can be Node, Relationship, Path, list, dict)
             nodes: Dict to populate with nodes (keyed by node ID)
             relationships: Dict to populate with relationships (keyed by relationship ID)
         """
-        if isinstance(value, Node):
-            # Use internal Neo4j ID as the key, but preserve semantic ID in properties
-            internal_id = str(value.id)
-            properties = dict(value.items())
-
-            # Extract semantic ID (NIEM structures:id) if available
-            # This is the ID used for relationships in the graph data model
-            semantic_id = properties.get("id", internal_id)
-
-            if internal_id not in nodes:
-                nodes[internal_id] = {
-                    "id": semantic_id,  # Use semantic ID for display and matching
-                    "internal_id": internal_id,  # Keep internal ID for reference
-                    "label": list(value.labels)[0] if value.labels else "Unknown",
-                    "labels": list(value.labels),
-                    "properties": properties,
-                }
-
-        elif isinstance(value, Relationship):
-            rel_id = str(value.id)
-            if rel_id not in relationships:
-                # Extract start and end nodes first to get their semantic IDs
-                start_internal_id = str(value.start_node.id)
-                end_internal_id = str(value.end_node.id)
-
-                # Ensure start and end nodes are captured
-                self._extract_graph_elements(value.start_node, nodes, relationships)
-                self._extract_graph_elements(value.end_node, nodes, relationships)
-
-                # Use semantic IDs for relationship endpoints
-                # This matches the data model where edges reference semantic IDs
-                start_semantic_id = nodes[start_internal_id]["id"]
-                end_semantic_id = nodes[end_internal_id]["id"]
-
-                relationships[rel_id] = {
-                    "id": rel_id,
-                    "type": value.type,
-                    "startNode": start_semantic_id,  # Use semantic ID
-                    "endNode": end_semantic_id,  # Use semantic ID
-                    "properties": dict(value.items()),
-                }
-
-        elif isinstance(value, Path):
-            for node in value.nodes:
-                self._extract_graph_elements(node, nodes, relationships)
-            for rel in value.relationships:
-                self._extract_graph_elements(rel, nodes, relationships)
-
-        elif isinstance(value, list):
-            for item in value:
-                self._extract_graph_elements(item, nodes, relationships)
-
-        elif isinstance(value, dict):
-            for nested_value in value.values():
-                self._extract_graph_elements(nested_value, nodes, relationships)
+        _extract_graph_elements(value, nodes, relationships)
 
     def get_schema(self) -> dict[str, list[str]]:
         """
@@ -291,3 +317,108 @@ class Neo4jClient:
         """
         if self.driver:
             self.driver.close()
+
+
+class AsyncNeo4jClient:
+    """
+    Asyncio Neo4j client backed by the driver's AsyncGraphDatabase.
+
+    Queries await Bolt I/O instead of blocking the event loop, so concurrent
+    requests share one connection pool without serializing behind each other.
+    Mirrors the read API of Neo4jClient (query, query_graph, get_schema, get_stats).
+
+    Example:
+        ```python
+        client = AsyncNeo4jClient()
+        graph = await client.query_graph("MATCH (n)-[r]->(m) RETURN n, r, m LIMIT 50")
+        await client.close()
+        ```
+    """
+
+    def __init__(
+        self, uri: str | None = None, user: str | None = None, password: str | None = None, **driver_config: Any
+    ):
+        """
+        Initialize async Neo4j client with connection parameters.
+
+        Args:
+            uri: Database connection URI. If None, reads from NEO4J_URI env var.
+            user: Authentication username. If None, reads from NEO4J_USER env var.
+            password: Authentication password. If None, reads from NEO4J_PASSWORD env var.
+            **driver_config: Extra driver settings (connection pool size, timeouts)
+        """
+        from ..core.env_utils import getenv_clean
+
+        self.uri = uri or getenv_clean("NEO4J_URI", "bolt://localhost:7687")
+        self.user = user or getenv_clean("NEO4J_USER", "neo4j")
+        self.password = password or getenv_clean("NEO4J_PASSWORD", "password")
+        self.driver = AsyncGraphDatabase.driver(self.uri, auth=(self.user, self.password), **driver_config)
+
+    async def query(self, cypher_query: str, parameters: dict | None = None) -> list[dict]:
+        """
+        Execute a Cypher query and return raw record data.
+
+        Args:
+            cypher_query: Cypher query string to execute
+            parameters: Optional query parameters for parameterized queries
+
+        Returns:
+            List of dictionaries containing query result records
+        """
+        async with self.driver.session() as session:
+            result = await session.run(cypher_query, parameters or {})
+            return [record.data() async for record in result]
+
+    async def query_graph(self, cypher_query: str, parameters: dict | None = None) -> dict[str, Any]:
+        """
+        Execute a Cypher query and return structured graph data.
+
+        Args:
+            cypher_query: Cypher query string to execute
+            parameters: Optional query parameters
+
+        Returns:
+            Dictionary with nodes, relationships and metadata (see Neo4jClient.query_graph)
+        """
+        async with self.driver.session() as session:
+            logger.info(f"Executing Cypher query: {cypher_query}")
+            result = await session.run(cypher_query, parameters or {})
+
+            nodes: dict[str, dict[str, Any]] = {}
+            relationships: dict[str, dict[str, Any]] = {}
+
+            async for record in result:
+                for value in record.values():
+                    _extract_graph_elements(value, nodes, relationships)
+
+            return _graph_payload(nodes, relationships)
+
+    async def get_schema(self) -> dict[str, list[str]]:
+        """
+        Get database schema information (labels and relationship types).
+
+        Returns:
+            Dictionary with sorted nodeLabels and relationshipTypes
+        """
+        labels = await self.query("CALL db.labels()")
+        rel_types = await self.query("CALL db.relationshipTypes()")
+        return {
+            "nodeLabels": sorted(record["label"] for record in labels),
+            "relationshipTypes": sorted(record["relationshipType"] for record in rel_types),
+        }
+
+    async def get_stats(self) -> dict[str, int]:
+        """
+        Get database statistics (node and relationship counts).
+
+        Returns:
+            Dictionary with nodeCount and relationshipCount
+        """
+        node_count = await self.query("MATCH (n) RETURN count(n) as count")
+        rel_count = await self.query("MATCH ()-[r]->() RETURN count(r) as count")
+        return {"nodeCount": node_count[0]["count"], "relationshipCount": rel_count[0]["count"]}
+
+    async def close(self):
+        """Close the driver and release its connection pool."""
+        if self.driver:
+            await self.driver.close()
@@ -16,6 +16,8 @@ import subprocess
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+from .tool_worker import run_tool_job
+
 logger = logging.getLogger(__name__)
 
 # NIEMTran tool configuration
@@ -318,7 +320,10 @@ def run_niemtran_command(
 
             working_dir = str(working_dir_path)
 
-        result = subprocess.run(full_cmd, capture_output=True, text=True, timeout=timeout, cwd=working_dir)
+        # Warm tool JVM when workers are enabled; one-shot process otherwise or if the worker fails
+        result = run_tool_job("niemtran", NIEMTRAN_TOOL_PATH, cmd, str(working_dir), timeout)
+        if result is None:
+            result = subprocess.run(full_cmd, capture_output=True, text=True, timeout=timeout, cwd=working_dir)
 
         logger.debug(f"NIEMTran command result: returncode={result.returncode}")
         if result.stdout:
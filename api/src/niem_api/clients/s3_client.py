@@ -7,18 +7,73 @@ Handles bucket management and file operations with proper error handling.
 
 This client is pure infrastructure - it contains no business logic.
 Use services layer for business logic that uses this client.
+
+The MinIO SDK is synchronous. The async transfer functions run its calls on a
+bounded thread pool shared by all requests (S3_TRANSFER_CONCURRENCY threads),
+so they never block the event loop and batch transfers run in parallel.
 """
 
+import asyncio
 import logging
-from typing import Any
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, BinaryIO, TypeVar
 
 from minio import Minio
 from minio.error import S3Error
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 # Application-wide bucket configuration
-BUCKETS = ["niem-schemas", "niem-data"]  # Schema XSD files and mappings  # Uploaded XML/JSON data files
+# Schema XSD files and mappings, uploaded XML/JSON data files, derived results cached by content hash
+BUCKETS = ["niem-schemas", "niem-data", "niem-cache"]
+
+_transfer_pool: ThreadPoolExecutor | None = None
+_transfer_pool_lock = threading.Lock()
+
+
+def _get_transfer_pool() -> ThreadPoolExecutor:
+    """Return the shared transfer thread pool, creating it on first use."""
+    global _transfer_pool
+    with _transfer_pool_lock:
+        if _transfer_pool is None:
+            from ..core.config import batch_config
+
+            _transfer_pool = ThreadPoolExecutor(
+                max_workers=max(batch_config.S3_TRANSFER_CONCURRENCY, 1), thread_name_prefix="s3-transfer"
+            )
+        return _transfer_pool
+
+
+async def _run_transfer(func: Callable[..., T], *args) -> T:
+    """Run a blocking MinIO call on the transfer pool."""
+    return await asyncio.get_running_loop().run_in_executor(_get_transfer_pool(), func, *args)
+
+
+def _put_bytes(client: Minio, bucket: str, object_name: str, data: bytes, content_type: str) -> None:
+    from io import BytesIO
+
+    client.put_object(bucket, object_name, BytesIO(data), length=len(data), content_type=content_type)
+
+
+def _put_stream(client: Minio, bucket: str, object_name: str, stream: BinaryIO, content_type: str) -> int:
+    stream.seek(0, 2)
+    length = stream.tell()
+    stream.seek(0)
+    client.put_object(bucket, object_name, stream, length=length, content_type=content_type)
+    return length
+
+
+def _get_bytes(client: Minio, bucket: str, object_name: str) -> bytes:
+    response = client.get_object(bucket, object_name)
+    try:
+        return response.read()
+    finally:
+        response.close()
+        response.release_conn()
 
 
 async def create_buckets():
@@ -82,9 +137,7 @@ async def upload_file(client: Minio, bucket: str, object_name: str, data: bytes,
         ```
     """
     try:
-        from io import BytesIO
-
-        client.put_object(bucket, object_name, BytesIO(data), length=len(data), content_type=content_type)
+        await _run_transfer(_put_bytes, client, bucket, object_name, data, content_type)
         logger.info(f"Uploaded {object_name} to {bucket}")
         return f"s3://{bucket}/{object_name}"
     except S3Error as e:
@@ -92,6 +145,32 @@ async def upload_file(client: Minio, bucket: str, object_name: str, data: bytes,
         raise
 
 
+async def upload_stream(client: Minio, bucket: str, object_name: str, stream: BinaryIO, content_type: str) -> str:
+    """
+    Upload a seekable binary file to MinIO object storage without reading it into memory.
+
+    Args:
+        client: MinIO client instance
+        bucket: Target bucket name (must exist)
+        object_name: Object key/path within bucket
+        stream: Seekable binary file; uploaded from the start whatever its current position
+        content_type: MIME type
+
+    Returns:
+        S3 URI of uploaded file
+
+    Raises:
+        S3Error: If upload fails due to permissions, connectivity, or bucket not found
+    """
+    try:
+        length = await _run_transfer(_put_stream, client, bucket, object_name, stream, content_type)
+        logger.info(f"Uploaded {object_name} to {bucket} ({length} bytes, streamed)")
+        return f"s3://{bucket}/{object_name}"
+    except S3Error as e:
+        logger.error(f"Failed to upload {object_name} to {bucket}: {e}")
+        raise
+
+
 async def download_file(client: Minio, bucket: str, object_name: str) -> bytes:
     """
     Download a file from MinIO object storage.
@@ -118,16 +197,125 @@ async def download_file(client: Minio, bucket: str, object_name: str) -> bytes:
         Response connection is properly closed and released after reading.
     """
     try:
-        response = client.get_object(bucket, object_name)
-        data = response.read()
-        response.close()
-        response.release_conn()
-        return data
+        return await _run_transfer(_get_bytes, client, bucket, object_name)
     except S3Error as e:
         logger.error(f"Failed to download {object_name} from {bucket}: {e}")
         raise
 
 
+async def download_if_exists(client: Minio, bucket: str, object_name: str) -> bytes | None:
+    """
+    Download a file from MinIO object storage if it exists.
+
+    Args:
+        client: MinIO client instance
+        bucket: Source bucket name
+        object_name: Object key/path within bucket
+
+    Returns:
+        File content as bytes, or None if the object (or bucket) does not exist
+
+    Raises:
+        S3Error: If download fails for any other reason
+    """
+    try:
+        return await _run_transfer(_get_bytes, client, bucket, object_name)
+    except S3Error as e:
+        if e.code in ("NoSuchKey", "NoSuchBucket"):
+            return None
+        logger.error(f"Failed to download {object_name} from {bucket}: {e}")
+        raise
+
+
+async def upload_many(client: Minio, bucket: str, objects: Iterable[tuple[str, bytes, str]]) -> list[str]:
+    """
+    Upload several files to MinIO object storage concurrently.
+
+    Args:
+        client: MinIO client instance
+        bucket: Target bucket name (must exist)
+        objects: (object_name, data, content_type) tuples
+
+    Returns:
+        S3 URIs of the uploaded files, in input order
+
+    Raises:
+        S3Error: If any upload fails (the other uploads still run to completion)
+
+    Example:
+        ```python
+        client = get_s3_client()
+        await upload_many(
+            client,
+            "niem-schemas",
+            [("schema1/a.xsd", a_bytes, "application/xml"), ("schema1/b.xsd", b_bytes, "application/xml")],
+        )
+        ```
+    """
+    tasks = [upload_file(client, bucket, name, data, content_type) for name, data, content_type in objects]
+    return await _gather_all(tasks)
+
+
+async def download_many(client: Minio, bucket: str, object_names: Iterable[str]) -> dict[str, bytes]:
+    """
+    Download several files from MinIO object storage concurrently.
+
+    Transfers run on the shared transfer pool, so a batch takes roughly as long
+    as its slowest objects rather than the sum of all of them.
+
+    Args:
+        client: MinIO client instance
+        bucket: Source bucket name
+        object_names: Object keys/paths within bucket
+
+    Returns:
+        Dictionary of object name -> file content, in input order
+
+    Raises:
+        S3Error: If any download fails (the other downloads still run to completion)
+
+    Example:
+        ```python
+        client = get_s3_client()
+        contents = await download_many(client, "niem-schemas", ["schema1/a.xsd", "schema1/b.xsd"])
+        ```
+    """
+    names = list(object_names)
+    contents = await _gather_all([download_file(client, bucket, name) for name in names])
+    return dict(zip(names, contents, strict=False))
+
+
+def get_many_contents(client: Minio, bucket: str, object_names: Iterable[str]) -> dict[str, bytes]:
+    """
+    Synchronous counterpart of download_many for code that is not async.
+
+    Must not be called from a transfer pool thread.
+
+    Args:
+        client: MinIO client instance
+        bucket: Source bucket name
+        object_names: Object keys/paths within bucket
+
+    Returns:
+        Dictionary of object name -> file content, in input order
+
+    Raises:
+        S3Error: If any download fails
+    """
+    names = list(object_names)
+    futures = [_get_transfer_pool().submit(_get_bytes, client, bucket, name) for name in names]
+    return {name: future.result() for name, future in zip(names, futures, strict=False)}
+
+
+async def _gather_all(tasks: list) -> list:
+    """Await all tasks, then raise the first failure (if any) once every transfer has finished."""
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
+
+
 async def list_files(client: Minio, bucket: str, prefix: str = "") -> list[dict[str, Any]]:
     """
     List files in a MinIO bucket with optional prefix filter.
@@ -17,6 +17,8 @@ import subprocess
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
+from .tool_worker import run_tool_job
+
 logger = logging.getLogger(__name__)
 
 # Scheval tool configuration
@@ -428,7 +430,10 @@ def run_scheval_command(
 
             working_dir = str(working_dir_path)
 
-        result = subprocess.run(full_cmd, capture_output=True, text=True, timeout=timeout, cwd=working_dir)
+        # Warm tool JVM when workers are enabled; one-shot process otherwise or if the worker fails
+        result = run_tool_job("scheval", SCHEVAL_TOOL_PATH, args, str(working_dir), timeout)
+        if result is None:
+            result = subprocess.run(full_cmd, capture_output=True, text=True, timeout=timeout, cwd=working_dir)
 
         logger.debug(f"Scheval command result: returncode={result.returncode}")
         if result.stdout:
@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""
+Persistent JVM workers for the NIEM command-line tools
+
+cmftool, scheval and NIEMTran are Java programs; run through their launcher
+scripts every command pays a full JVM start and class loading, which is most
+of the time spent on small files. With ``TOOL_WORKERS_ENABLED`` each tool
+gets a small pool of long-lived JVMs running ``java/ToolWorker.java``, which
+calls the tool's main class once per job and returns its exit code, stdout
+and stderr over stdin/stdout.
+
+The worker is only an execution backend: callers validate commands against
+their allowlists and working directories exactly as before. Workers that
+crash are replaced on the next job, workers that time out are killed, and
+whenever a worker cannot be used the caller runs its usual one-shot
+subprocess instead.
+"""
+
+import base64
+import logging
+import os
+import re
+import select
+import shutil
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import IO
+
+logger = logging.getLogger(__name__)
+
+WORKER_SOURCE = Path(__file__).parent / "java" / "ToolWorker.java"
+WORKER_START_TIMEOUT = 60  # Seconds for a worker JVM to compile the worker and load the tool
+
+# Flags whose value is a file the tool creates (it does not exist yet)
+_OUTPUT_FLAGS = {"-o", "--output"}
+
+
+class ToolWorkerError(Exception):
+    """Raised when a worker cannot run a job; the caller falls back to a one-shot subprocess."""
+
+
+class ToolWorkerTimeoutError(ToolWorkerError):
+    """Raised when a job exceeds its timeout (the worker has been killed)."""
+
+
+def _read_launcher(launcher_path: str) -> tuple[str, str] | None:
+    """Read the classpath and main class from a tool's launcher script.
+
+    Args:
+        launcher_path: Path to the tool's Unix launcher script (bin/<tool>)
+
+    Returns:
+        (classpath, main class) or None if the script cannot be parsed
+    """
+    try:
+        script = Path(launcher_path).read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+    classpath_match = re.search(r"^CLASSPATH=(.+)$", script, re.MULTILINE)
+    main_match = re.search(r'-classpath "\$CLASSPATH" \\\s*\n\s*([\w.$]+)', script)
+    if not classpath_match or not main_match:
+        return None
+
+    app_home = str(Path(launcher_path).resolve().parent.parent)
+    return classpath_match.group(1).strip().replace("$APP_HOME", app_home), main_match.group(1)
+
+
+def _java_executable() -> str | None:
+    java_home = os.getenv("JAVA_HOME")
+    if java_home and (Path(java_home) / "bin" / "java").exists():
+        return str(Path(java_home) / "bin" / "java")
+    return shutil.which("java")
+
+
+def worker_command(launcher_path: str) -> list[str] | None:
+    """Build the command starting a worker JVM for a tool.
+
+    Args:
+        launcher_path: Path to the tool's launcher script
+
+    Returns:
+        Command list, or None if Java or the tool's classpath cannot be found
+    """
+    java = _java_executable()
+    launcher = _read_launcher(launcher_path)
+    if not java or not launcher or not WORKER_SOURCE.exists():
+        return None
+    classpath, main_class = launcher
+    return [java, "-Djava.security.manager=allow", "-cp", classpath, str(WORKER_SOURCE), main_class]
+
+
+def _absolute_args(args: list[str], working_dir: str) -> list[str]:
+    """Make relative file arguments absolute (a worker JVM cannot change directory per job).
+
+    Only arguments naming an existing file in the working directory, or the
+    value of an output flag, are rewritten; subcommands and other values are
+    passed through unchanged.
+    """
+    resolved = []
+    for index, arg in enumerate(args):
+        path = Path(working_dir) / arg
+        is_output = index > 0 and args[index - 1] in _OUTPUT_FLAGS
+        if not arg.startswith("-") and (is_output or path.exists()):
+            resolved.append(str(path))
+        else:
+            resolved.append(arg)
+    return resolved
+
+
+class _ToolWorker:
+    """One worker JVM running jobs one at a time."""
+
+    def __init__(self, command: list[str], cwd: str | None):
+        # The worker's own stderr (JVM warnings, crashes) goes to the API log
+        # The command is the configured tool launcher, not user input
+        self.process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, cwd=cwd)  # noqa: S603
+        if self.process.stdin is None or self.process.stdout is None:
+            self.process.kill()
+            raise ToolWorkerError("Worker started without stdin/stdout pipes")
+        self.stdin: IO[bytes] = self.process.stdin
+        self.stdout: IO[bytes] = self.process.stdout
+        self.jobs = 0
+        self._buffer = b""
+        try:
+            ready = self._read_line(time.monotonic() + WORKER_START_TIMEOUT).split()
+        except ToolWorkerError:
+            self.close()
+            raise
+        if ready[:1] != [b"READY"]:
+            self.close()
+            raise ToolWorkerError(f"Unexpected worker handshake: {ready!r}")
+        self.exit_trapped = ready[1:] == [b"exit-trap"]
+
+    def _fill(self, deadline: float) -> None:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise ToolWorkerTimeoutError("Worker did not answer in time")
+        readable, _, _ = select.select([self.stdout], [], [], remaining)
+        if not readable:
+            raise ToolWorkerTimeoutError("Worker did not answer in time")
+        chunk = os.read(self.stdout.fileno(), 1 << 16)
+        if not chunk:
+            raise ToolWorkerError(f"Worker exited (code {self.process.poll()})")
+        self._buffer += chunk
+
+    def _read_line(self, deadline: float) -> bytes:
+        while b"\n" not in self._buffer:
+            self._fill(deadline)
+        line, self._buffer = self._buffer.split(b"\n", 1)
+        return line
+
+    def _read_exact(self, size: int, deadline: float) -> bytes:
+        while len(self._buffer) < size:
+            self._fill(deadline)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def run(self, args: list[str], timeout: float) -> tuple[int, str, str]:
+        """Run one job and return (exit code, stdout, stderr)."""
+        deadline = time.monotonic() + timeout
+        line = " ".join(base64.b64encode(arg.encode("utf-8")).decode("ascii") for arg in args)
+        try:
+            self.stdin.write(line.encode("ascii") + b"\n")
+            self.stdin.flush()
+        except OSError as e:
+            raise ToolWorkerError(f"Worker is not accepting jobs: {e}") from e
+
+        header = self._read_line(deadline).split()
+        try:
+            returncode, stdout_size, stderr_size = (int(value) for value in header)
+        except ValueError as e:
+            raise ToolWorkerError(f"Unexpected worker response: {header!r}") from e
+        stdout = self._read_exact(stdout_size, deadline)
+        stderr = self._read_exact(stderr_size, deadline)
+        self.jobs += 1
+        return returncode, stdout.decode("utf-8", errors="replace"), stderr.decode("utf-8", errors="replace")
+
+    def close(self) -> None:
+        if self.process.poll() is None:
+            self.process.kill()
+        self.process.wait()
+        for stream in (self.stdin, self.stdout):
+            try:
+                stream.close()
+            except OSError:
+                pass
+
+
+class ToolWorkerPool:
+    """Pool of worker JVMs for one tool.
+
+    Workers are started on demand up to ``size``; callers beyond that wait for
+    a free worker. A worker is replaced after ``max_jobs`` jobs to bound any
+    state the tool keeps between runs.
+    """
+
+    def __init__(self, name: str, command: list[str], size: int, max_jobs: int, cwd: str | None = None):
+        self.name = name
+        self.command = command
+        self.size = max(size, 1)
+        self.max_jobs = max_jobs
+        self.cwd = cwd
+        self.disabled = False
+        self._idle: list[_ToolWorker] = []
+        self._count = 0
+        self._available = threading.Condition()
+
+    def _acquire(self) -> _ToolWorker:
+        with self._available:
+            while True:
+                if self.disabled:
+                    raise ToolWorkerError(f"{self.name} workers are disabled")
+                if self._idle:
+                    worker = self._idle.pop()
+                    if worker.alive():
+                        return worker
+                    logger.warning(f"{self.name} worker exited while idle; starting a new one")
+                    worker.close()
+                    self._count -= 1
+                elif self._count < self.size:
+                    self._count += 1
+                    break
+                else:
+                    self._available.wait()
+
+        try:
+            worker = _ToolWorker(self.command, self.cwd)
+        except (OSError, ToolWorkerError) as e:
+            # A worker that cannot start (classpath, JVM flags, handshake) will not start
+            # next time either; retrying would add a failed JVM start to every call
+            logger.warning(f"Could not start {self.name} worker ({e}); using one-shot processes")
+            self._disable()
+            raise ToolWorkerError(f"Could not start {self.name} worker: {e}") from e
+        if not worker.exit_trapped:
+            # Every tool run ending in System.exit() would take the worker down with it
+            logger.warning(f"{self.name} worker cannot trap System.exit(); using one-shot processes")
+            worker.close()
+            self._disable()
+            raise ToolWorkerError(f"{self.name} worker cannot trap System.exit()")
+        logger.info(f"Started {self.name} worker (pid {worker.process.pid})")
+        return worker
+
+    def _disable(self) -> None:
+        """Give up on workers after a failed start; waiting callers fall back at once."""
+        with self._available:
+            self.disabled = True
+            self._count -= 1
+            self._available.notify_all()
+
+    def _release(self, worker: _ToolWorker | None) -> None:
+        with self._available:
+            if worker is None:
+                self._count -= 1
+            elif self.disabled:
+                worker.close()
+                self._count -= 1
+            else:
+                self._idle.append(worker)
+            self._available.notify()
+
+    def run(self, args: list[str], working_dir: str, timeout: float) -> subprocess.CompletedProcess:
+        """Run a tool command on a pooled worker.
+
+        Args:
+            args: Validated tool arguments
+            working_dir: Directory relative file arguments refer to
+            timeout: Maximum execution time in seconds
+
+        Returns:
+            CompletedProcess with returncode, stdout and stderr, as from subprocess.run
+
+        Raises:
+            ToolWorkerTimeoutError: If the job timed out (the worker is killed)
+            ToolWorkerError: If no worker could run the job
+        """
+        worker = self._acquire()
+        try:
+            returncode, stdout, stderr = worker.run(_absolute_args(args, working_dir), timeout)
+        except ToolWorkerError:
+            worker.close()
+            self._release(None)
+            raise
+
+        if self.max_jobs and worker.jobs >= self.max_jobs:
+            worker.close()
+            self._release(None)
+        else:
+            self._release(worker)
+        return subprocess.CompletedProcess(args, returncode, stdout, stderr)
+
+    def close(self) -> None:
+        with self._available:
+            self.disabled = True
+            for worker in self._idle:
+                worker.close()
+            self._count -= len(self._idle)
+            self._idle.clear()
+            self._available.notify_all()
+
+
+_pools: dict[str, ToolWorkerPool | None] = {}
+_pools_lock = threading.Lock()
+
+
+def get_tool_pool(name: str, launcher_path: str) -> ToolWorkerPool | None:
+    """Return the worker pool for a tool, creating it on first use.
+
+    Args:
+        name: Tool name (pool key and log label)
+        launcher_path: Path to the tool's launcher script
+
+    Returns:
+        The pool, or None if workers are disabled or cannot run this tool
+    """
+    from ..core.config import batch_config
+
+    if not batch_config.TOOL_WORKERS_ENABLED:
+        return None
+
+    with _pools_lock:
+        if name not in _pools:
+            command = worker_command(launcher_path)
+            if command is None:
+                logger.warning(f"No Java runtime or launcher classpath for {name}; using one-shot processes")
+                _pools[name] = None
+            else:
+                _pools[name] = ToolWorkerPool(
+                    name,
+                    command,
+                    batch_config.TOOL_WORKER_POOL_SIZE,
+                    batch_config.TOOL_WORKER_MAX_JOBS,
+                    cwd=str(Path(launcher_path).resolve().parent.parent),
+                )
+        pool = _pools[name]
+    return pool if pool is not None and not pool.disabled else None
+
+
+def run_tool_job(
+    name: str, launcher_path: str, args: list[str], working_dir: str, timeout: float
+) -> subprocess.CompletedProcess | None:
+    """Run a validated tool command on the tool's worker pool.
+
+    Args:
+        name: Tool name
+        launcher_path: Path to the tool's launcher script
+        args: Tool arguments (already checked against the tool's allowlist)
+        working_dir: Directory relative file arguments refer to
+        timeout: Maximum execution time in seconds
+
+    Returns:
+        CompletedProcess, or None when the caller should run a one-shot subprocess
+
+    Raises:
+        subprocess.TimeoutExpired: If the job timed out on the worker
+    """
+    pool = get_tool_pool(name, launcher_path)
+    if pool is None:
+        return None
+    try:
+        return pool.run(args, working_dir, timeout)
+    except ToolWorkerTimeoutError as e:
+        raise subprocess.TimeoutExpired([name] + args, timeout) from e
+    except ToolWorkerError as e:
+        logger.warning(f"{name} worker failed ({e}); running as a one-shot process")
+        return None
+
+
+def shutdown_tool_workers() -> None:
+    """Stop all worker JVMs (called on API shutdown)."""
+    with _pools_lock:
+        pools = [pool for pool in _pools.values() if pool is not None]
+        _pools.clear()
+    for pool in pools:
+        pool.close()
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """
-Configuration settings for batch processing and Senzing entity resolution.
+Configuration settings for batch processing, Neo4j connections and Senzing entity resolution.
 
 These settings can be overridden via environment variables to adjust
 resource limits based on deployment environment (local dev vs production).
@@ -9,6 +9,7 @@ resource limits based on deployment environment (local dev vs production).
 import base64
 import logging
 import os
+import tempfile
 from pathlib import Path
 
 from .env_utils import getenv_bool, getenv_int, getenv_clean
@@ -43,6 +44,108 @@ class BatchConfig:
     # XML/JSON ingestion to Neo4j
     MAX_INGEST_FILES = getenv_int("BATCH_MAX_INGEST_FILES", 20)
 
+    # Graph write mode for ingestion:
+    # "batched" = parameterized UNWIND per label/relationship group (plans are cached)
+    # "statements" = one literal MERGE per node/edge (legacy behavior)
+    INGEST_WRITE_MODE = getenv_clean("INGEST_WRITE_MODE", "batched").lower()
+
+    # Max rows passed to a single UNWIND query
+    INGEST_UNWIND_BATCH_SIZE = getenv_int("INGEST_UNWIND_BATCH_SIZE", 1000)
+
+    # Chunked commits for large files: commit every N rows/statements instead of
+    # one transaction per file (0 = single transaction). A file that still fails
+    # is rolled back by deleting its nodes tagged with _upload_id/_source_file.
+    INGEST_COMMIT_EVERY = getenv_int("INGEST_COMMIT_EVERY", 0)
+    INGEST_COMMIT_MAX_RETRIES = getenv_int("INGEST_COMMIT_MAX_RETRIES", 3)
+    INGEST_COMMIT_RETRY_BACKOFF_MS = getenv_int("INGEST_COMMIT_RETRY_BACKOFF_MS", 500)
+
+    # Create a range index on the match key (label, id) for every label before
+    # ingest writes it, so MERGE and edge MATCH lookups avoid label scans
+    INGEST_AUTO_INDEXES = getenv_bool("INGEST_AUTO_INDEXES", True)
+
+    # Files at or above this size (MB) stay in the upload's temporary file on disk
+    # and are converted with the streaming converters (XML one top-level record at
+    # a time via iterparse, NIEM JSON-LD one @graph item at a time) instead of being
+    # loaded whole. Streamed files are written to Neo4j batch by batch in chunked
+    # commits. Streamed XML is validated from disk with the CMF tool; streamed
+    # NIEM JSON is validated against the JSON Schema one @graph item at a time.
+    INGEST_STREAMING_THRESHOLD_MB = getenv_int("INGEST_STREAMING_THRESHOLD_MB", 25)
+
+    # Nodes per batch when streaming XML records or NIEM JSON-LD @graph items
+    INGEST_STREAMING_BATCH_NODES = getenv_int("INGEST_STREAMING_BATCH_NODES", 10000)
+
+    # Worker processes for CPU-bound XML/JSON conversion during ingest
+    # 0 = convert in a thread of the API process instead of a process pool
+    INGEST_CONVERSION_WORKERS = getenv_int("INGEST_CONVERSION_WORKERS", MAX_CONCURRENT_OPERATIONS)
+
+    # Per-stage concurrency for the batch ingest pipeline
+    # (validate -> convert -> write -> archive; convert uses INGEST_CONVERSION_WORKERS)
+    INGEST_VALIDATE_CONCURRENCY = getenv_int("INGEST_VALIDATE_CONCURRENCY", MAX_CONCURRENT_OPERATIONS)
+    INGEST_WRITE_CONCURRENCY = getenv_int("INGEST_WRITE_CONCURRENCY", 1)
+    INGEST_ARCHIVE_CONCURRENCY = getenv_int("INGEST_ARCHIVE_CONCURRENCY", MAX_CONCURRENT_OPERATIONS)
+
+    # Background ingest jobs (background=true on the ingest endpoints): batches
+    # run at once, and finished jobs kept for status queries
+    INGEST_JOB_WORKERS = getenv_int("INGEST_JOB_WORKERS", 1)
+    INGEST_JOB_MAX_RETAINED = getenv_int("INGEST_JOB_MAX_RETAINED", 100)
+
+    # Compiled mapping plans kept in memory (one per schema/mapping version)
+    MAPPING_PLAN_CACHE_SIZE = getenv_int("MAPPING_PLAN_CACHE_SIZE", 16)
+
+    # Local cache of downloaded schema XSD directories, revalidated by MinIO ETags
+    # and evicted least-recently-used beyond the size limit (0 = no cache)
+    SCHEMA_CACHE_DIR = getenv_clean("SCHEMA_CACHE_DIR", os.path.join(tempfile.gettempdir(), "niem-schema-cache"))
+    SCHEMA_CACHE_MAX_MB = getenv_int("SCHEMA_CACHE_MAX_MB", 512)
+
+    # XSD validation backend for XML ingest/conversion:
+    # "cmftool" = cmftool xval subprocess (reference validator)
+    # "lxml" = in-process validation against a cached compiled schema set
+    #          (falls back to cmftool when lxml is missing or cannot compile the schema)
+    XML_VALIDATION_BACKEND = getenv_clean("XML_VALIDATION_BACKEND", "cmftool").lower()
+
+    # Schema files validated against the NDR schematron at once during schema upload
+    # (each is a scheval run; with tool workers also bounded by TOOL_WORKER_POOL_SIZE)
+    SCHEVAL_CONCURRENCY = getenv_int("SCHEVAL_CONCURRENCY", 4)
+    # Reuse NDR results of schema files validated before (same content, conformance
+    # target and NDR rules), stored in the niem-cache bucket
+    NDR_CACHE_ENABLED = getenv_bool("NDR_CACHE_ENABLED", True)
+
+    # Reuse the CMF and JSON Schema of a resolved schema set converted before
+    # (same files, paths and cmftool release), stored in the niem-cache bucket
+    CMF_CACHE_ENABLED = getenv_bool("CMF_CACHE_ENABLED", True)
+
+    # Compiled XSD schema sets kept in memory by the lxml backend
+    XSD_VALIDATOR_CACHE_SIZE = getenv_int("XSD_VALIDATOR_CACHE_SIZE", 8)
+
+    # Validation results of previously seen documents, keyed by content hash,
+    # schema and validator version (TTL of 0 disables the cache)
+    VALIDATION_CACHE_TTL_SECONDS = getenv_int("VALIDATION_CACHE_TTL_SECONDS", 3600)
+    VALIDATION_CACHE_MAX_ENTRIES = getenv_int("VALIDATION_CACHE_MAX_ENTRIES", 10000)
+
+    # JSON Schema validation backend for NIEM JSON ingest:
+    # "jsonschema" = Draft7Validator only
+    # "fastjsonschema" = accept valid documents with a compiled validator when the
+    #                    package is installed; errors are still reported by jsonschema
+    JSON_VALIDATION_BACKEND = getenv_clean("JSON_VALIDATION_BACKEND", "jsonschema").lower()
+
+    # JSON Schemas (with their validators) kept in memory, one per schema version
+    JSON_SCHEMA_CACHE_SIZE = getenv_int("JSON_SCHEMA_CACHE_SIZE", 8)
+
+    # JSON parser for NIEM JSON documents: "json" or "orjson" (used when installed;
+    # some versions read integers beyond 64 bits as floats)
+    JSON_PARSER = getenv_clean("JSON_PARSER", "json").lower()
+
+    # MinIO object transfers run on a shared pool of this many threads so they
+    # never block the event loop; keep it within the client's connection pool (10)
+    S3_TRANSFER_CONCURRENCY = getenv_int("S3_TRANSFER_CONCURRENCY", 8)
+
+    # Run cmftool, scheval and NIEMTran commands on pools of long-lived JVMs
+    # instead of starting the tool per call (one-shot processes remain the fallback)
+    TOOL_WORKERS_ENABLED = getenv_bool("TOOL_WORKERS_ENABLED", False)
+    TOOL_WORKER_POOL_SIZE = getenv_int("TOOL_WORKER_POOL_SIZE", 2)
+    # Jobs after which a worker JVM is replaced (0 = never)
+    TOOL_WORKER_MAX_JOBS = getenv_int("TOOL_WORKER_MAX_JOBS", 500)
+
     @classmethod
     def get_batch_limit(cls, operation_type: str) -> int:
         """Get batch size limit for specific operation type.
@@ -65,6 +168,39 @@ class BatchConfig:
 batch_config = BatchConfig()
 
 
+class Neo4jConfig:
+    """Neo4j driver connection pool configuration.
+
+    Applied to the process-wide sync and async drivers from core.dependencies.
+    """
+
+    # Max open Bolt connections per driver
+    MAX_CONNECTION_POOL_SIZE = getenv_int("NEO4J_MAX_CONNECTION_POOL_SIZE", 50)
+    # Seconds to wait for a free connection before failing the request
+    CONNECTION_ACQUISITION_TIMEOUT = getenv_int("NEO4J_CONNECTION_ACQUISITION_TIMEOUT", 60)
+    # Seconds before a pooled connection is retired and reopened
+    MAX_CONNECTION_LIFETIME = getenv_int("NEO4J_MAX_CONNECTION_LIFETIME", 3600)
+    # Seconds the readiness probe waits for Neo4j (incl. a free connection) before reporting not ready
+    READINESS_TIMEOUT = getenv_int("NEO4J_READINESS_TIMEOUT", 5)
+
+    @classmethod
+    def driver_kwargs(cls) -> dict[str, int]:
+        """Get keyword arguments for GraphDatabase.driver / AsyncGraphDatabase.driver.
+
+        Returns:
+            Dictionary of driver pool settings
+        """
+        return {
+            "max_connection_pool_size": cls.MAX_CONNECTION_POOL_SIZE,
+            "connection_acquisition_timeout": cls.CONNECTION_ACQUISITION_TIMEOUT,
+            "max_connection_lifetime": cls.MAX_CONNECTION_LIFETIME,
+        }
+
+
+# Singleton instance
+neo4j_config = Neo4jConfig()
+
+
 class SenzingConfig:
     """Senzing entity resolution configuration.
 
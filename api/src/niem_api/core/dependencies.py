@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 import os
+import threading
 
 from minio import Minio
 
@@ -25,28 +26,63 @@ def get_s3_client():
     return Minio(endpoint, access_key=access_key, secret_key=secret_key, secure=secure)
 
 
-# Global Neo4j client instance
+# Global Neo4j client instances: the sync pool serves writes (ingest, entity
+# resolution, admin reset), the async pool serves reads from the event loop
 _neo4j_client = None
+_async_neo4j_client = None
+# Routes call get_neo4j_client from worker threads; only one may build the driver
+_neo4j_client_lock = threading.Lock()
 
 
 def get_neo4j_client():
     """Get or create global Neo4j client instance"""
     global _neo4j_client
     if _neo4j_client is None:
-        from ..clients.neo4j_client import Neo4jClient
+        with _neo4j_client_lock:
+            if _neo4j_client is None:
+                from ..clients.neo4j_client import Neo4jClient
+                from .config import neo4j_config
+
+                neo4j_uri = getenv_clean("NEO4J_URI", "bolt://localhost:7687")
+                neo4j_user = getenv_clean("NEO4J_USER", "neo4j")
+                neo4j_password = getenv_clean("NEO4J_PASSWORD", "password")
+
+                _neo4j_client = Neo4jClient(neo4j_uri, neo4j_user, neo4j_password, **neo4j_config.driver_kwargs())
+
+    return _neo4j_client
+
+
+def get_async_neo4j_client():
+    """Get or create global async Neo4j client instance
+
+    Only called from the event loop thread, so no lock is needed.
+    """
+    global _async_neo4j_client
+    if _async_neo4j_client is None:
+        from ..clients.neo4j_client import AsyncNeo4jClient
+        from .config import neo4j_config
 
         neo4j_uri = getenv_clean("NEO4J_URI", "bolt://localhost:7687")
         neo4j_user = getenv_clean("NEO4J_USER", "neo4j")
         neo4j_password = getenv_clean("NEO4J_PASSWORD", "password")
 
-        _neo4j_client = Neo4jClient(neo4j_uri, neo4j_user, neo4j_password)
+        _async_neo4j_client = AsyncNeo4jClient(neo4j_uri, neo4j_user, neo4j_password, **neo4j_config.driver_kwargs())
 
-    return _neo4j_client
+    return _async_neo4j_client
 
 
 def cleanup_connections():
     """Clean up global connections on application shutdown"""
     global _neo4j_client
-    if _neo4j_client is not None:
-        _neo4j_client.close()
-        _neo4j_client = None
+    with _neo4j_client_lock:
+        if _neo4j_client is not None:
+            _neo4j_client.close()
+            _neo4j_client = None
+
+
+async def cleanup_async_connections():
+    """Close the global async Neo4j client on application shutdown"""
+    global _async_neo4j_client
+    if _async_neo4j_client is not None:
+        await _async_neo4j_client.close()
+        _async_neo4j_client = None
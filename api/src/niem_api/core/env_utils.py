@@ -8,12 +8,20 @@ when .env files are edited on different operating systems.
 
 import os
 import logging
-from typing import Any, Optional
+from typing import Any, overload
 
 logger = logging.getLogger(__name__)
 
 
-def getenv_clean(key: str, default: str = None, strip: bool = True) -> Optional[str]:
+@overload
+def getenv_clean(key: str, default: str, strip: bool = True) -> str: ...
+
+
+@overload
+def getenv_clean(key: str, default: None = None, strip: bool = True) -> str | None: ...
+
+
+def getenv_clean(key: str, default: str | None = None, strip: bool = True) -> str | None:
     """Get environment variable with automatic cleaning of line endings and whitespace.
 
     This function handles common issues with .env files:
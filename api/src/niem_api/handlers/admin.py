@@ -162,6 +162,17 @@ def reset_schemas(s3: Minio):
             logger.info("Removed all schemas from niem-schemas bucket")
         else:
             logger.info("niem-schemas bucket does not exist")
+
+        # Cached schema files, validators and results belong to schemas that no longer exist
+        from ..services.json_schema_validator import clear_json_schema_cache
+        from ..services.schema_cache import clear_schema_cache
+        from ..services.validation_cache import clear_validation_cache
+        from ..services.xsd_validator import clear_validator_cache
+
+        clear_schema_cache()
+        clear_validator_cache()
+        clear_validation_cache()
+        clear_json_schema_cache()
     except Exception as e:
         logger.error(f"Schema reset failed: {e}")
         raise
@@ -234,27 +245,59 @@ def count_neo4j_objects() -> dict[str, Any]:
 
         # Get counts
         node_count_result = neo4j_client.query("MATCH (n) RETURN count(n) as count")
-        node_count = node_count_result[0]["count"]
-
         rel_count_result = neo4j_client.query("MATCH ()-[r]->() RETURN count(r) as count")
-        rel_count = rel_count_result[0]["count"]
 
         # Get schema counts
         indexes = neo4j_client.query("SHOW INDEXES")
         constraints = neo4j_client.query("SHOW CONSTRAINTS")
 
-        # Filter out built-in indexes
-        user_indexes = [idx for idx in indexes if idx.get("type", "").lower() not in ["lookup", "token"]]
-
-        return {
-            "status": "success",
-            "stats": {
-                "nodes": node_count,
-                "relationships": rel_count,
-                "indexes": len(user_indexes),
-                "constraints": len(constraints),
-            },
-        }
+        return _neo4j_stats(node_count_result, rel_count_result, indexes, constraints)
     except Exception as e:
         logger.error(f"Failed to count Neo4j objects: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to get Neo4j stats: {str(e)}") from e
+
+
+async def count_neo4j_objects_async() -> dict[str, Any]:
+    """
+    Count Neo4j nodes, relationships, indexes, and constraints on the async client.
+
+    Same result as count_neo4j_objects, without blocking the event loop.
+
+    Returns:
+        Dictionary with status and statistics
+
+    Raises:
+        HTTPException: If counting fails
+    """
+    try:
+        from ..core.dependencies import get_async_neo4j_client
+
+        neo4j_client = get_async_neo4j_client()
+
+        node_count_result = await neo4j_client.query("MATCH (n) RETURN count(n) as count")
+        rel_count_result = await neo4j_client.query("MATCH ()-[r]->() RETURN count(r) as count")
+        indexes = await neo4j_client.query("SHOW INDEXES")
+        constraints = await neo4j_client.query("SHOW CONSTRAINTS")
+
+        return _neo4j_stats(node_count_result, rel_count_result, indexes, constraints)
+    except Exception as e:
+        logger.error(f"Failed to count Neo4j objects: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to get Neo4j stats: {str(e)}") from e
+
+
+def _neo4j_stats(
+    node_count_result: list[dict], rel_count_result: list[dict], indexes: list[dict], constraints: list[dict]
+) -> dict[str, Any]:
+    """Build the stats response from the count and schema query results."""
+    # Filter out built-in indexes
+    user_indexes = [idx for idx in indexes if idx.get("type", "").lower() not in ["lookup", "token"]]
+
+    return {
+        "status": "success",
+        "stats": {
+            "nodes": node_count_result[0]["count"],
+            "relationships": rel_count_result[0]["count"],
+            "indexes": len(user_indexes),
+            "constraints": len(constraints),
+        },
+    }
@@ -30,7 +30,7 @@ _conversion_semaphore = asyncio.Semaphore(batch_config.MAX_CONCURRENT_OPERATIONS
 
 
 async def _download_schema_files_for_validation(s3: Minio, schema_id: str) -> str:
-    """Download schema XSD files from S3 to temporary directory.
+    """Get schema XSD files in a temporary directory, served from the local schema cache.
 
     Reuses the same pattern as ingest.py for consistency.
 
@@ -39,44 +39,16 @@ async def _download_schema_files_for_validation(s3: Minio, schema_id: str) -> st
         schema_id: Schema ID
 
     Returns:
-        Path to temporary directory containing schema files
+        Path to temporary directory containing schema files (removed by the caller)
     """
-    import tempfile
+    from ..services.schema_cache import prepare_schema_dir
 
-    temp_dir = tempfile.mkdtemp(prefix="conversion_validation_")
-    logger.info(f"Downloading schema files for {schema_id} to {temp_dir}")
+    logger.info(f"Preparing schema files for {schema_id}")
 
     try:
-        # List all objects in the schema folder
-        objects = s3.list_objects("niem-schemas", prefix=f"{schema_id}/source/", recursive=True)
-
-        xsd_count = 0
-        for obj in objects:
-            if obj.object_name.endswith(".xsd"):
-                # Download the file
-                content = await download_file(s3, "niem-schemas", obj.object_name)
-
-                # Create subdirectories if needed
-                relative_path = obj.object_name.replace(f"{schema_id}/source/", "")
-                target_path = Path(temp_dir) / relative_path
-                target_path.parent.mkdir(parents=True, exist_ok=True)
-
-                # Write file
-                with open(target_path, "wb") as f:
-                    f.write(content)
-
-                xsd_count += 1
-                logger.debug(f"Downloaded schema file: {relative_path}")
-
-        logger.info(f"Downloaded {xsd_count} XSD schema files")
-        return temp_dir
-
+        return await prepare_schema_dir(s3, schema_id, prefix="conversion_validation_")
     except Exception as e:
         logger.error(f"Failed to download schema files: {e}")
-        # Clean up on error
-        import shutil
-
-        shutil.rmtree(temp_dir, ignore_errors=True)
         raise HTTPException(status_code=500, detail=f"Failed to download schema files: {str(e)}")
 
 
@@ -135,6 +107,7 @@ async def _convert_single_file(
     schema_dir: str,
     context_uri: str,
     settings=None,
+    prevalidated: dict[UploadFile, Exception | None] | None = None,
 ) -> Dict[str, Any]:
     """Convert a single XML file to JSON with error handling.
 
@@ -150,6 +123,7 @@ async def _convert_single_file(
         schema_dir: Path to schema directory for validation
         context_uri: Optional context URI
         settings: Application settings (for validation control)
+        prevalidated: Batch validation results; files found here are not validated again
 
     Returns:
         Result dictionary with success or error status
@@ -179,8 +153,12 @@ async def _convert_single_file(
 
                 if settings and settings.skip_xml_validation:
                     logger.warning(f"⚠️ Skipping XML validation for {file.filename} (skip_xml_validation=true)")
+                elif prevalidated is not None and file in prevalidated:
+                    error = prevalidated[file]
+                    if error is not None:
+                        raise error
                 else:
-                    ingest._validate_xml_content(xml_content.decode("utf-8"), schema_dir, file.filename)
+                    ingest._validate_xml_content(xml_content.decode("utf-8"), schema_dir, file.filename, schema_id)
                     logger.debug(f"XML validation passed for: {file.filename}")
             except HTTPException as e:
                 # Validation failed - extract error details
@@ -274,11 +252,10 @@ async def handle_xml_to_json_batch(
     try:
         # Step 0: Get settings
         from ..services.settings_service import SettingsService
-        from ..core.dependencies import get_neo4j_client
+        from ..core.dependencies import get_async_neo4j_client
 
-        neo4j_client = get_neo4j_client()
-        settings_service = SettingsService(neo4j_client)
-        settings = settings_service.get_settings()
+        settings_service = SettingsService(get_async_neo4j_client())
+        settings = await settings_service.get_settings_async()
         logger.info(f"Settings: skip_xml_validation={settings.skip_xml_validation}, skip_json_validation={settings.skip_json_validation}")
 
         # Step 1: Validate batch size (configurable via BATCH_MAX_CONVERSION_FILES env var)
@@ -343,10 +320,19 @@ async def handle_xml_to_json_batch(
             f"Processing {len(files)} files with max {batch_config.MAX_CONCURRENT_OPERATIONS} concurrent conversions"
         )
 
+        # Validate the whole batch in one validator run (schema set compiled once)
+        prevalidated = None
+        if len(files) > 1 and not settings.skip_xml_validation:
+            from .ingest import _prevalidate_xml_files
+
+            prevalidated = await _prevalidate_xml_files(files, schema_dir, schema_id)
+
         # Create tasks for all files with timeout
         tasks = [
             asyncio.wait_for(
-                _convert_single_file(file, s3, schema_id, schema_metadata, cmf_content, schema_dir, context_uri, settings),
+                _convert_single_file(
+                    file, s3, schema_id, schema_metadata, cmf_content, schema_dir, context_uri, settings, prevalidated
+                ),
                 timeout=batch_config.OPERATION_TIMEOUT,
             )
             for file in files
@@ -22,6 +22,7 @@ from minio import Minio
 from minio.error import S3Error
 
 from ..clients.neo4j_client import Neo4jClient
+from ..core.dependencies import get_neo4j_client
 from ..services.domain.schema.xsd_element_tree import (
     _build_indices,
     NIEM_COMPONENT_TYPES,
@@ -115,22 +116,20 @@ def _load_xsd_files_from_s3(s3: Minio, schema_id: str) -> dict[str, bytes]:
     xsd_files = {}
 
     try:
+        from ..clients.s3_client import get_many_contents
+
         # List all objects in the schema's source directory
-        objects = s3.list_objects("niem-schemas", prefix=f"{schema_id}/source/", recursive=True)
-
-        for obj in objects:
-            # Only process .xsd files
-            if obj.object_name.endswith(".xsd"):
-                # Download the file
-                response = s3.get_object("niem-schemas", obj.object_name)
-                content = response.read()
-                response.close()
-                response.release_conn()
-
-                # Extract filename from path (remove schema_id/source/ prefix)
-                filename = obj.object_name[len(f"{schema_id}/source/"):]
-                xsd_files[filename] = content
-                logger.debug(f"Loaded XSD file: {filename}")
+        prefix = f"{schema_id}/source/"
+        objects = s3.list_objects("niem-schemas", prefix=prefix, recursive=True)
+        # Only process .xsd files
+        object_names = [obj.object_name for obj in objects if obj.object_name.endswith(".xsd")]
+
+        # Download the files concurrently
+        for object_name, content in get_many_contents(s3, "niem-schemas", object_names).items():
+            # Extract filename from path (remove schema_id/source/ prefix)
+            filename = object_name[len(prefix) :]
+            xsd_files[filename] = content
+            logger.debug(f"Loaded XSD file: {filename}")
 
         logger.info(f"Loaded {len(xsd_files)} XSD files for schema {schema_id}")
         return xsd_files
@@ -1596,7 +1595,7 @@ def handle_run_entity_resolution(selected_node_types: List[str]) -> Dict:
 
     try:
         # Get Neo4j client
-        neo4j_client = Neo4jClient()
+        neo4j_client = get_neo4j_client()
 
         # Step 1: Extract entities from Neo4j
         logger.info("Extracting entities from Neo4j")
@@ -1712,7 +1711,7 @@ def handle_get_resolution_status() -> Dict:
         Dictionary with resolution status and counts
     """
     try:
-        neo4j_client = Neo4jClient()
+        neo4j_client = get_neo4j_client()
         status = _get_resolution_status(neo4j_client)
 
         return {"status": "success", **status}
@@ -1737,7 +1736,7 @@ def handle_reset_entity_resolution() -> Dict:
     logger.info("Resetting entity resolution")
 
     try:
-        neo4j_client = Neo4jClient()
+        neo4j_client = get_neo4j_client()
         counts = _reset_entity_resolution(neo4j_client)
 
         logger.info(
@@ -1766,7 +1765,7 @@ def handle_get_available_node_types() -> Dict:
     logger.info("Getting available node types for entity resolution")
 
     try:
-        neo4j_client = Neo4jClient()
+        neo4j_client = get_neo4j_client()
 
         # Get S3 client and active schema ID for schema-based discovery
         from ..core.dependencies import get_s3_client
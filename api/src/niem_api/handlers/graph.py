@@ -3,12 +3,12 @@
 import logging
 from typing import Any
 
-from ..core.dependencies import get_neo4j_client
+from ..core.dependencies import get_async_neo4j_client
 
 logger = logging.getLogger(__name__)
 
 
-def execute_cypher_query(cypher_query: str = None, limit: int = None) -> dict[str, Any]:
+async def execute_cypher_query(cypher_query: str = None, limit: int = None) -> dict[str, Any]:
     """
     Execute a Cypher query and return structured graph data.
 
@@ -32,16 +32,16 @@ def execute_cypher_query(cypher_query: str = None, limit: int = None) -> dict[st
     if "LIMIT" not in cypher_query.upper() and limit:
         cypher_query += f" LIMIT {limit}"
 
-    client = get_neo4j_client()
+    client = get_async_neo4j_client()
     try:
-        result = client.query_graph(cypher_query)
+        result = await client.query_graph(cypher_query)
         return {"status": "success", "data": result}
     except Exception as e:
         logger.error(f"Error executing Cypher query: {e}")
         raise
 
 
-def get_full_graph(limit: int = 10000, include_resolved: bool = False) -> dict[str, Any]:
+async def get_full_graph(limit: int = 10000, include_resolved: bool = False) -> dict[str, Any]:
     """
     Get the complete graph structure with all nodes and relationships.
 
@@ -74,25 +74,25 @@ def get_full_graph(limit: int = 10000, include_resolved: bool = False) -> dict[s
         """
 
     # execute_cypher_query already returns formatted response
-    return execute_cypher_query(cypher_query)
+    return await execute_cypher_query(cypher_query)
 
 
-def get_node_labels() -> list[str]:
+async def get_node_labels() -> list[str]:
     """Get all node labels in the database"""
-    client = get_neo4j_client()
+    client = get_async_neo4j_client()
     try:
-        schema = client.get_schema()
+        schema = await client.get_schema()
         return schema["nodeLabels"]
     except Exception as e:
         logger.error(f"Error getting node labels: {e}")
         raise
 
 
-def get_relationship_types() -> list[str]:
+async def get_relationship_types() -> list[str]:
     """Get all relationship types in the database"""
-    client = get_neo4j_client()
+    client = get_async_neo4j_client()
     try:
-        schema = client.get_schema()
+        schema = await client.get_schema()
         return schema["relationshipTypes"]
     except Exception as e:
         logger.error(f"Error getting relationship types: {e}")
@@ -1,14 +1,16 @@
 #!/usr/bin/env python3
 
+import asyncio
+import functools
+import io
 import json
 import logging
-from typing import Any
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from typing import Any, BinaryIO
 
 from fastapi import HTTPException, UploadFile
 from minio import Minio
 
-from ..clients.neo4j_client import Neo4jClient
-
 logger = logging.getLogger(__name__)
 
 
@@ -36,6 +38,11 @@ def _get_schema_id(s3: Minio, schema_id: str | None) -> str:
 def _load_mapping_from_s3(s3: Minio, schema_id: str) -> dict[str, Any]:
     """Load mapping YAML from S3.
 
+    The compiled mapping plan is cached per (schema_id, ETag), so repeat
+    requests only stat the object instead of downloading and re-parsing it.
+    The returned dictionary is the one the plan was compiled from, which lets
+    the converters reuse the plan for every file in the request.
+
     Args:
         s3: MinIO client
         schema_id: Schema ID
@@ -44,158 +51,318 @@ def _load_mapping_from_s3(s3: Minio, schema_id: str) -> dict[str, Any]:
         Mapping dictionary
     """
     from ..clients.s3_client import get_yaml_content
+    from ..services.domain.mapping_plan import load_mapping_plan
 
+    object_name = f"{schema_id}/mapping.yaml"
     try:
-        return get_yaml_content(s3, "niem-schemas", f"{schema_id}/mapping.yaml")
+        etag = s3.stat_object("niem-schemas", object_name).etag
+        plan = load_mapping_plan((schema_id, etag), lambda: get_yaml_content(s3, "niem-schemas", object_name))
+        return plan.mapping
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to load mapping.yaml: {str(e)}") from e
 
 
 async def _download_schema_files(s3: Minio, schema_id: str) -> str:
-    """Download schema XSD files from S3 to temporary directory.
+    """Get schema XSD files in a temporary directory, served from the local schema cache.
 
     Args:
         s3: MinIO client
         schema_id: Schema ID
 
     Returns:
-        Path to temporary directory containing schema files
+        Path to temporary directory containing schema files (removed by the caller)
     """
-    import tempfile
+    from ..services.schema_cache import prepare_schema_dir
+
+    logger.info(f"Preparing schema files for {schema_id}")
+
+    try:
+        return await prepare_schema_dir(s3, schema_id, prefix="schema_validation_")
+    except Exception as e:
+        logger.error(f"Failed to download schema files: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to download schema files: {str(e)}") from e
+
+
+def _xval_command(schema_path, xml_files: list) -> list[str]:
+    """Build an xval command for XML files against every XSD in a schema directory.
+
+    Args:
+        schema_path: Schema directory (working directory of the command)
+        xml_files: Instance document paths inside schema_path
+
+    Returns:
+        Command arguments, or an empty list when the directory has no XSD files
+    """
+    # Find all XSD files in schema directory (skip directories with .xsd extension)
+    xsd_files = [f for f in schema_path.rglob("*.xsd") if f.is_file()]
+    if not xsd_files:
+        return []
+
+    logger.info(f"Found {len(xsd_files)} XSD schema files for validation")
+
+    # Build xval command with relative paths from schema_dir
+    cmd = ["xval"]
+    for xsd_file in xsd_files:
+        rel_path = xsd_file.relative_to(schema_path)
+        cmd.extend(["--schema", str(rel_path)])
+
+    for xml_file in xml_files:
+        cmd.extend(["--file", str(xml_file.relative_to(schema_path))])
+    return cmd
+
+
+def _validation_failure(filename: str, error_list: list[dict], warning_list: list[dict]) -> HTTPException:
+    """Build the HTTPException reported for an XML file that failed XSD validation.
+
+    Args:
+        filename: File that failed validation
+        error_list: Parsed validation errors
+        warning_list: Parsed validation warnings
+
+    Returns:
+        HTTPException with structured validation result in its detail
+    """
+    from ..models.models import ValidationError, ValidationResult
+
+    # Create ValidationResult for structured response
+    validation_result = ValidationResult(
+        valid=False,
+        errors=[ValidationError(**err) for err in error_list],
+        warnings=[ValidationError(**warn) for warn in warning_list],
+        summary=f"Validation failed with {len(error_list)} error(s) and {len(warning_list)} warning(s)",
+    )
+
+    # Build detailed error message for logging
+    error_details = []
+    for err in error_list[:5]:  # Show first 5 errors
+        loc = f"{err['file']}"
+        if err["line"]:
+            loc += f":{err['line']}"
+        if err["column"]:
+            loc += f":{err['column']}"
+        error_details.append(f"  - {loc}: {err['message']}")
+
+    error_summary = f"Validation failed for {filename}"
+    if error_details:
+        error_summary += ":\n" + "\n".join(error_details)
+        if len(error_list) > 5:
+            error_summary += f"\n  ... and {len(error_list) - 5} more error(s)"
+
+    logger.error(error_summary)
+
+    # Return structured validation result in HTTPException detail
+    return HTTPException(
+        status_code=400,
+        detail={
+            "message": f"Validation error: {filename}",
+            "validation_result": validation_result.model_dump(),
+        },
+    )
+
+
+@functools.cache
+def _cmftool_release() -> str:
     from pathlib import Path
 
-    from ..clients.s3_client import download_file
+    from ..clients.cmf_client import CMF_TOOL_PATH
 
-    temp_dir = tempfile.mkdtemp(prefix="schema_validation_")
-    logger.info(f"Downloading schema files for {schema_id} to {temp_dir}")
+    # Release directory of the launcher (bin/cmftool), as in the CMF conversion cache
+    return Path(CMF_TOOL_PATH).parent.parent.name if CMF_TOOL_PATH else "cmftool"
 
-    try:
-        # List all objects in the schema folder
-        objects = s3.list_objects("niem-schemas", prefix=f"{schema_id}/source/", recursive=True)
 
-        xsd_count = 0
-        for obj in objects:
-            if obj.object_name.endswith(".xsd"):
-                # Download the file using helper
-                content = await download_file(s3, "niem-schemas", obj.object_name)
+def _xml_validator_version() -> str:
+    from ..core.config import batch_config
+    from ..services.xsd_validator import lxml_versions
 
-                # Create subdirectories if needed
-                relative_path = obj.object_name.replace(f"{schema_id}/source/", "")
-                target_path = Path(temp_dir) / relative_path
-                target_path.parent.mkdir(parents=True, exist_ok=True)
+    version = f"xsd-{batch_config.XML_VALIDATION_BACKEND}-{_cmftool_release()}"
+    # The lxml backend falls back to cmftool for schema sets it cannot compile
+    if batch_config.XML_VALIDATION_BACKEND == "lxml":
+        version += f"-{lxml_versions() or 'unavailable'}"
+    return version
 
-                # Write file
-                with open(target_path, "wb") as f:
-                    f.write(content)
 
-                xsd_count += 1
-                logger.debug(f"Downloaded schema file: {relative_path}")
+@functools.cache
+def _jsonschema_version() -> str:
+    from importlib.metadata import version
 
-        logger.info(f"Downloaded {xsd_count} XSD schema files")
-        return temp_dir
+    return version("jsonschema")
 
-    except Exception as e:
-        logger.error(f"Failed to download schema files: {e}")
-        # Clean up on error
-        import shutil
 
-        shutil.rmtree(temp_dir, ignore_errors=True)
-        raise HTTPException(status_code=500, detail=f"Failed to download schema files: {str(e)}") from e
+def _json_validator_version() -> str:
+    from ..core.config import batch_config
+
+    return f"jsonschema-{_jsonschema_version()}-draft7-{batch_config.JSON_VALIDATION_BACKEND}"
+
+
+def _cached_validation_outcome(cache_key: str, filename: str) -> tuple[bool, HTTPException | None]:
+    """Look up a cached validation result for a document.
+
+    Args:
+        cache_key: Key built by validation_cache.result_key
+        filename: File being validated
+
+    Returns:
+        (hit, exception) - exception is the cached validation failure, None if valid
+    """
+    from ..services.validation_cache import get_result
+
+    hit, detail = get_result(cache_key, filename)
+    if not hit:
+        return False, None
+
+    logger.info(f"Reusing cached validation result for {filename}")
+    return True, HTTPException(status_code=400, detail=detail) if detail is not None else None
+
+
+def _remember_validation_outcome(cache_key: str, filename: str, outcome: HTTPException | None) -> None:
+    """Cache a validation result unless it came from a tool or server error."""
+    from ..services.validation_cache import put_result
+
+    if outcome is None:
+        put_result(cache_key, filename, None)
+    elif outcome.status_code == 400 and isinstance(outcome.detail, dict):
+        put_result(cache_key, filename, outcome.detail)
+
+
+def _run_cached_validation(
+    content: str | bytes | BinaryIO, schema_id: str, validator: str, filename: str, validate: Callable[[], Any]
+) -> Any:
+    """Run a validation function unless the same document was validated recently.
+
+    Args:
+        content: Document content, or a seekable binary file
+        schema_id: Schema ID the document is validated against
+        validator: Validator identifier including its version
+        filename: File being validated
+        validate: Validation function raising HTTPException on failure
+
+    Returns:
+        Return value of validate, or None when the result came from the cache
+
+    Raises:
+        HTTPException: If validation fails now or failed for the same content before
+    """
+    from ..services.validation_cache import result_key
+
+    cache_key = result_key(content, schema_id, validator)
+    hit, outcome = _cached_validation_outcome(cache_key, filename)
+    if hit:
+        if outcome is not None:
+            raise outcome
+        return None
 
+    try:
+        result = validate()
+    except HTTPException as e:
+        _remember_validation_outcome(cache_key, filename, e)
+        raise
+    _remember_validation_outcome(cache_key, filename, None)
+    return result
+
+
+def _validate_in_process(documents: list[tuple[str, str]], schema_dir: str) -> list[HTTPException | None] | None:
+    """Validate XML documents with the in-process XSD backend when it is enabled.
+
+    Args:
+        documents: (filename, xml_content) pairs
+        schema_dir: Directory containing XSD schema files
+
+    Returns:
+        Per-document HTTPException or None if valid, or None when the documents
+        must be validated with the CMF tool instead
+    """
+    from ..services.xsd_validator import validate_documents
+
+    results = validate_documents(documents, schema_dir)
+    if results is None:
+        return None
+
+    outcomes = []
+    for (filename, _), (errors, warnings) in zip(documents, results, strict=False):
+        outcomes.append(_validation_failure(filename, errors, warnings) if errors else None)
+    return outcomes
 
-def _validate_xml_content(xml_content: str, schema_dir: str, filename: str) -> None:
+
+def _validate_xml_content(
+    xml_content: str | BinaryIO, schema_dir: str, filename: str, schema_id: str | None = None
+) -> None:
     """Validate XML content against XSD schemas using CMF tool.
 
+    With XML_VALIDATION_BACKEND=lxml the content is validated in process
+    against a cached compiled schema set instead. Streams (large uploads) are
+    always copied to disk for the CMF tool and never read into memory.
+
     Args:
-        xml_content: XML content to validate
+        xml_content: XML content to validate, or a seekable binary file
         schema_dir: Directory containing XSD schema files
         filename: File being validated (for logging purposes)
+        schema_id: Schema ID; when given, results are reused for resent identical content
 
     Raises:
         HTTPException: If validation fails (with structured error details in response)
     """
+    if schema_id is not None:
+        _run_cached_validation(
+            xml_content,
+            schema_id,
+            _xml_validator_version(),
+            filename,
+            lambda: _validate_xml_content(xml_content, schema_dir, filename),
+        )
+        return
+
     from pathlib import Path
 
     from ..clients.cmf_client import CMFError, parse_cmf_validation_output, run_cmf_command
-    from ..models.models import ValidationError, ValidationResult
 
     logger.info(f"Validating XML file {filename} against XSD schemas")
 
+    outcomes = _validate_in_process([(filename, xml_content)], schema_dir) if isinstance(xml_content, str) else None
+    if outcomes is not None:
+        if outcomes[0] is not None:
+            raise outcomes[0]
+        logger.info(f"Successfully validated {filename} against XSD schemas")
+        return
+
+    import uuid
+
     schema_path = Path(schema_dir)
 
-    # Write XML content to file in the schema directory
-    xml_file = schema_path / filename
+    # Write XML content to file in the schema directory, under a name no other
+    # validation of a same-named upload can be using at the same time
+    xml_file = schema_path / f"xval_{uuid.uuid4().hex}_{Path(filename).name}"
     try:
-        with open(xml_file, "w", encoding="utf-8") as f:
-            f.write(xml_content)
+        if isinstance(xml_content, str):
+            with open(xml_file, "w", encoding="utf-8") as f:
+                f.write(xml_content)
+        else:
+            import shutil
 
-        # Find all XSD files in schema directory (skip directories with .xsd extension)
-        xsd_files = [f for f in schema_path.rglob("*.xsd") if f.is_file()]
+            xml_content.seek(0)
+            with open(xml_file, "wb") as f:
+                shutil.copyfileobj(xml_content, f)
+            xml_content.seek(0)
 
-        if not xsd_files:
+        cmd = _xval_command(schema_path, [xml_file])
+        if not cmd:
             logger.warning(f"No XSD files found in {schema_dir}, skipping validation")
             return
 
-        logger.info(f"Found {len(xsd_files)} XSD schema files for validation")
-
-        # Build xval command with relative paths from schema_dir
-        cmd = ["xval"]
-        for xsd_file in xsd_files:
-            rel_path = xsd_file.relative_to(schema_path)
-            cmd.extend(["--schema", str(rel_path)])
-
-        xml_rel_path = xml_file.relative_to(schema_path)
-        cmd.extend(["--file", str(xml_rel_path)])
-
         # Run XSD validation command with schema_dir as working directory
         result = run_cmf_command(cmd, working_dir=schema_dir)
 
-        # Parse validation output into structured errors
+        # Parse validation output into structured errors, reported against the upload's name
         parsed = parse_cmf_validation_output(result["stdout"], result["stderr"], filename)
+        for item in parsed["errors"] + parsed["warnings"]:
+            if Path(item["file"] or "").name == xml_file.name:
+                item["file"] = filename
 
         # IMPORTANT: xval returns exit code 0 even when validation fails
         # Check both return code AND parsed errors
         validation_failed = result["returncode"] != 0 or parsed["has_errors"]
 
         if validation_failed:
-            # Build structured error response
-            error_list = parsed["errors"]
-            warning_list = parsed["warnings"]
-
-            # Create ValidationResult for structured response
-            validation_result = ValidationResult(
-                valid=False,
-                errors=[ValidationError(**err) for err in error_list],
-                warnings=[ValidationError(**warn) for warn in warning_list],
-                summary=f"Validation failed with {len(error_list)} error(s) and {len(warning_list)} warning(s)",
-            )
-
-            # Build detailed error message for logging
-            error_details = []
-            for err in error_list[:5]:  # Show first 5 errors
-                loc = f"{err['file']}"
-                if err["line"]:
-                    loc += f":{err['line']}"
-                if err["column"]:
-                    loc += f":{err['column']}"
-                error_details.append(f"  - {loc}: {err['message']}")
-
-            error_summary = f"Validation failed for {filename}"
-            if error_details:
-                error_summary += ":\n" + "\n".join(error_details)
-                if len(error_list) > 5:
-                    error_summary += f"\n  ... and {len(error_list) - 5} more error(s)"
-
-            logger.error(error_summary)
-
-            # Return structured validation result in HTTPException detail
-            raise HTTPException(
-                status_code=400,
-                detail={
-                    "message": f"Validation error: {filename}",
-                    "validation_result": validation_result.model_dump(),
-                },
-            )
+            raise _validation_failure(filename, parsed["errors"], parsed["warnings"])
 
         logger.info(f"Successfully validated {filename} against XSD schemas")
 
@@ -216,12 +383,109 @@ def _validate_xml_content(xml_content: str, schema_dir: str, filename: str) -> N
         # Clean up XML file from schema directory
         if xml_file.exists():
             xml_file.unlink()
-            logger.debug(f"Cleaned up XML file: {filename}")
+            logger.debug(f"Cleaned up XML file: {xml_file.name}")
+
+
+def _validate_xml_batch(documents: list[tuple[str, str]], schema_dir: str) -> list[HTTPException | None]:
+    """Validate several XML documents with a single xval invocation.
+
+    The schema set is assembled once for the whole batch instead of once per
+    file. Errors are mapped back to documents by the file name xval reports;
+    if any error cannot be attributed (or the tool fails outright) the batch
+    falls back to validating each document separately, so results always
+    match _validate_xml_content. With the in-process backend no xval run is
+    needed at all.
+
+    Args:
+        documents: (filename, xml_content) pairs
+        schema_dir: Directory containing XSD schema files
+
+    Returns:
+        Per-document HTTPException (as raised by _validate_xml_content) or None if valid
+    """
+    import uuid
+    from pathlib import Path
+
+    from ..clients.cmf_client import CMFError, parse_cmf_validation_output, run_cmf_command
+
+    def validate_individually() -> list[HTTPException | None]:
+        outcomes: list[HTTPException | None] = []
+        for filename, xml_content in documents:
+            try:
+                _validate_xml_content(xml_content, schema_dir, filename)
+                outcomes.append(None)
+            except HTTPException as e:
+                outcomes.append(e)
+        return outcomes
+
+    outcomes = _validate_in_process(documents, schema_dir)
+    if outcomes is not None:
+        return outcomes
+
+    if len(documents) < 2:
+        return validate_individually()
+
+    logger.info(f"Validating {len(documents)} XML files against XSD schemas in one batch")
+
+    schema_path = Path(schema_dir)
+    # Unique names so duplicate upload names can still be told apart in the output
+    # (and concurrent batches sharing the schema directory do not collide)
+    batch_id = uuid.uuid4().hex
+    batch_names = [
+        f"batch_{batch_id}_{index:04d}_{Path(filename).name}" for index, (filename, _) in enumerate(documents)
+    ]
+    xml_files = [schema_path / name for name in batch_names]
+    try:
+        for xml_file, (_, xml_content) in zip(xml_files, documents, strict=False):
+            xml_file.write_text(xml_content, encoding="utf-8")
+
+        cmd = _xval_command(schema_path, xml_files)
+        if not cmd:
+            logger.warning(f"No XSD files found in {schema_dir}, skipping validation")
+            return [None] * len(documents)
+
+        result = run_cmf_command(cmd, working_dir=schema_dir)
+        parsed = parse_cmf_validation_output(result["stdout"], result["stderr"], "")
+
+        # IMPORTANT: xval returns exit code 0 even when validation fails
+        if result["returncode"] == 0 and not parsed["has_errors"]:
+            logger.info(f"Successfully validated {len(documents)} files against XSD schemas")
+            return [None] * len(documents)
+        if not parsed["has_errors"]:
+            # Tool failure without per-file errors
+            return validate_individually()
+
+        reported: dict[str, dict[str, list]] = {name: {"errors": [], "warnings": []} for name in batch_names}
+        for kind in ("errors", "warnings"):
+            for item in parsed[kind]:
+                batch_name = Path(item["file"] or "").name
+                if batch_name not in reported:
+                    logger.info("Batch validation output not attributable to a file, validating files individually")
+                    return validate_individually()
+                reported[batch_name][kind].append(item)
+
+        outcomes = []
+        for batch_name, (filename, _) in zip(batch_names, documents, strict=False):
+            error_list, warning_list = reported[batch_name]["errors"], reported[batch_name]["warnings"]
+            for item in error_list + warning_list:
+                item["file"] = filename
+            outcomes.append(_validation_failure(filename, error_list, warning_list) if error_list else None)
+        return outcomes
+
+    except CMFError as e:
+        logger.warning(f"Batch XML validation failed ({e}), validating files individually")
+        return validate_individually()
+    finally:
+        for xml_file in xml_files:
+            xml_file.unlink(missing_ok=True)
 
 
 def _download_json_schema_from_s3(s3: Minio, schema_id: str) -> dict[str, Any]:
     """Download JSON Schema from S3.
 
+    The schema and its validator are cached per (schema_id, ETag), so repeat
+    requests only stat the object instead of downloading and re-parsing it.
+
     Args:
         s3: MinIO client
         schema_id: Schema ID
@@ -233,6 +497,7 @@ def _download_json_schema_from_s3(s3: Minio, schema_id: str) -> dict[str, Any]:
         HTTPException: If JSON Schema not found
     """
     from ..clients.s3_client import get_json_content
+    from ..services.json_schema_validator import load_json_schema_validator
     from .schema import get_schema_metadata
 
     try:
@@ -248,9 +513,15 @@ def _download_json_schema_from_s3(s3: Minio, schema_id: str) -> dict[str, Any]:
         base_name = filename_only.rsplit(".xsd", 1)[0] if filename_only.endswith(".xsd") else filename_only
         json_filename = f"{base_name}.json"
 
-        json_schema = get_json_content(s3, "niem-schemas", f"{schema_id}/{json_filename}")
-        logger.info(f"Downloaded JSON Schema {json_filename} for schema {schema_id}")
-        return json_schema
+        object_name = f"{schema_id}/{json_filename}"
+
+        def download() -> dict[str, Any]:
+            json_schema = get_json_content(s3, "niem-schemas", object_name)
+            logger.info(f"Downloaded JSON Schema {json_filename} for schema {schema_id}")
+            return json_schema
+
+        etag = s3.stat_object("niem-schemas", object_name).etag
+        return load_json_schema_validator((schema_id, etag), download).schema
     except HTTPException:
         raise
     except Exception as e:
@@ -263,29 +534,44 @@ def _download_json_schema_from_s3(s3: Minio, schema_id: str) -> dict[str, Any]:
         ) from e
 
 
-def _validate_json_content(json_content: str, json_schema: dict[str, Any], filename: str) -> None:
+def _validate_json_content(
+    json_content: str | bytes, json_schema: dict[str, Any], filename: str, schema_id: str | None = None
+) -> Any:
     """Validate NIEM JSON content against JSON Schema.
 
     NIEM JSON uses JSON-LD features (@context, @id, @type) with NIEM conventions.
     Validation checks JSON syntax, schema compliance, and optionally NIEM JSON structure.
 
     Args:
-        json_content: NIEM JSON content to validate
+        json_content: NIEM JSON content to validate (text or raw bytes)
         json_schema: JSON Schema object (generated from XSD via CMF tool)
         filename: File being validated (for logging purposes)
+        schema_id: Schema ID; when given, results are reused for resent identical content
+
+    Returns:
+        The parsed document, so conversion does not parse it again (None when
+        the result came from the validation cache)
 
     Raises:
         HTTPException: If validation fails (with structured error details in response)
     """
-    from jsonschema import Draft7Validator
+    if schema_id is not None:
+        return _run_cached_validation(
+            json_content,
+            schema_id,
+            _json_validator_version(),
+            filename,
+            lambda: _validate_json_content(json_content, json_schema, filename),
+        )
 
-    from ..models.models import ValidationError, ValidationResult
+    from ..services.domain.json_to_graph import parse_json
+    from ..services.json_schema_validator import get_json_schema_validator
 
     logger.info(f"Validating NIEM JSON file {filename} against JSON Schema")
 
     try:
         # Parse JSON content
-        data = json.loads(json_content)
+        data = parse_json(json_content)
 
         # Check NIEM JSON compliance (uses JSON-LD features)
         if "@context" not in data:
@@ -304,75 +590,189 @@ def _validate_json_content(json_content: str, json_schema: dict[str, Any], filen
                     )
 
         # Validate against JSON Schema - collect ALL errors instead of stopping at first
-        validator = Draft7Validator(json_schema)
-        validation_errors = list(validator.iter_errors(data))
+        validator = get_json_schema_validator(json_schema)
+        validation_errors = [(err.path, err.message, err.validator) for err in validator.iter_errors(data)]
 
         if validation_errors:
-            # Build list of all validation errors
-            errors = []
-            for err in validation_errors:
-                json_path = ".".join(str(p) for p in err.path) if err.path else "root"
-                error = ValidationError(
-                    file=filename,
-                    line=None,  # JSON Schema validation doesn't provide line numbers
-                    column=None,
-                    message=err.message,
-                    severity="error",
-                    rule=err.validator,  # e.g., "required", "type", "pattern"
-                    context=json_path,
-                )
-                errors.append(error)
-
-            validation_result = ValidationResult(
-                valid=False,
-                errors=errors,
-                warnings=[],
-                summary=f"Validation failed with {len(errors)} error(s) and 0 warning(s)",
-            )
-
-            logger.error(f"JSON Schema validation failed for {filename} with {len(errors)} error(s)")
-            for err in errors[:10]:  # Log first 10 errors
-                logger.error(f"  - {err.context}: {err.message}")
-            if len(errors) > 10:
-                logger.error(f"  ... and {len(errors) - 10} more error(s)")
-
-            raise HTTPException(
-                status_code=400,
-                detail={
-                    "message": f"Validation error: {filename}",
-                    "validation_result": validation_result.model_dump(),
-                },
-            )
+            raise _json_schema_failure(filename, validation_errors)
 
         logger.info(f"Successfully validated {filename} against JSON Schema")
+        return data
 
     except json.JSONDecodeError as e:
-        logger.error(f"Invalid JSON syntax in {filename}: {e}")
-        error = ValidationError(
-            file=filename,
-            line=e.lineno if hasattr(e, "lineno") else None,
-            column=e.colno if hasattr(e, "colno") else None,
-            message=f"Invalid JSON syntax: {e.msg}",
-            severity="error",
-            rule="json_syntax",
-            context=None,
-        )
-        validation_result = ValidationResult(
-            valid=False, errors=[error], warnings=[], summary=f"JSON syntax error in {filename}"
-        )
+        raise _json_syntax_failure(filename, e) from e
+
+    except HTTPException:
+        # Re-raise HTTPException from validation (already has proper detail)
+        raise
+    except Exception as e:
+        logger.error(f"Unexpected error during JSON validation: {e}")
         raise HTTPException(
-            status_code=400,
-            detail={"message": f"Invalid JSON syntax: {filename}", "validation_result": validation_result.model_dump()},
+            status_code=500, detail={"message": f"Validation error: {str(e)}", "validation_result": None}
         ) from e
 
+
+# Array keywords on @graph that need every item at once; a streamed file is never held whole
+_WHOLE_ARRAY_KEYWORDS = {"minItems", "maxItems", "uniqueItems", "contains", "minContains", "maxContains"}
+
+
+def _validate_json_stream(
+    stream: BinaryIO, json_schema: dict[str, Any], filename: str, schema_id: str | None = None
+) -> None:
+    """Validate a large NIEM JSON document against JSON Schema one @graph item at a time.
+
+    Each @graph item is validated as the only item of the array, and the other
+    top-level members (@context etc.) once with the first item, so only one
+    item is in memory at a time. Keywords that compare the items of @graph with
+    each other (minItems, maxItems, uniqueItems, contains) are not checked.
+
+    Args:
+        stream: Seekable binary file with the document (rewound afterwards)
+        json_schema: JSON Schema object (generated from XSD via CMF tool)
+        filename: File being validated (for logging purposes)
+        schema_id: Schema ID; when given, results are reused for resent identical content
+
+    Raises:
+        HTTPException: If validation fails (with structured error details in response)
+    """
+    if schema_id is not None:
+        _run_cached_validation(
+            stream,
+            schema_id,
+            _json_validator_version(),
+            filename,
+            lambda: _validate_json_stream(stream, json_schema, filename),
+        )
+        return
+
+    from ..services.domain.json_to_graph import iter_jsonld_document
+    from ..services.json_schema_validator import get_json_schema_validator
+
+    logger.info(f"Validating NIEM JSON file {filename} against JSON Schema, one @graph item at a time")
+    validator = get_json_schema_validator(json_schema)
+    validation_errors = []
+    header: dict[str, Any] = {}
+    first_item = None
+    index = 0
+
+    try:
+        stream.seek(0)
+        for key, value, is_graph_item in iter_jsonld_document(stream):
+            if not is_graph_item:
+                header[key] = value
+                continue
+            if index == 0:
+                first_item = value
+            # Errors inside the item, renumbered to its position in @graph
+            for err in validator.iter_errors({"@graph": [value]}):
+                if list(err.path)[:2] == ["@graph", 0]:
+                    validation_errors.append((["@graph", index, *list(err.path)[2:]], err.message, err.validator))
+            index += 1
+
+        # Errors outside the items (checked with the first item standing in for @graph)
+        document = {**header, "@graph": [first_item]} if index else header
+        for err in validator.iter_errors(document):
+            path = list(err.path)
+            if index and path[:2] == ["@graph", 0]:
+                continue
+            if index and path == ["@graph"] and err.validator in _WHOLE_ARRAY_KEYWORDS:
+                continue
+            validation_errors.append((path, err.message, err.validator))
+
+        if validation_errors:
+            raise _json_schema_failure(filename, validation_errors)
+        logger.info(f"Successfully validated {filename} against JSON Schema ({index} @graph items)")
+
+    except json.JSONDecodeError as e:
+        raise _json_syntax_failure(filename, e) from e
     except HTTPException:
-        # Re-raise HTTPException from validation (already has proper detail)
         raise
     except Exception as e:
         logger.error(f"Unexpected error during JSON validation: {e}")
         raise HTTPException(
             status_code=500, detail={"message": f"Validation error: {str(e)}", "validation_result": None}
         ) from e
+    finally:
+        stream.seek(0)
+
+
+def _json_schema_failure(filename: str, validation_errors: list[tuple]) -> HTTPException:
+    """Build the HTTPException for a document that failed JSON Schema validation.
+
+    Args:
+        filename: File that was validated
+        validation_errors: (path, message, keyword) of each schema error
+
+    Returns:
+        HTTPException with status 400 and the ValidationResult as detail
+    """
+    from ..models.models import ValidationError, ValidationResult
+
+    errors = []
+    for path, message, keyword in validation_errors:
+        json_path = ".".join(str(p) for p in path) if path else "root"
+        error = ValidationError(
+            file=filename,
+            line=None,  # JSON Schema validation doesn't provide line numbers
+            column=None,
+            message=message,
+            severity="error",
+            rule=keyword,  # e.g., "required", "type", "pattern"
+            context=json_path,
+        )
+        errors.append(error)
+
+    validation_result = ValidationResult(
+        valid=False,
+        errors=errors,
+        warnings=[],
+        summary=f"Validation failed with {len(errors)} error(s) and 0 warning(s)",
+    )
+
+    logger.error(f"JSON Schema validation failed for {filename} with {len(errors)} error(s)")
+    for err in errors[:10]:  # Log first 10 errors
+        logger.error(f"  - {err.context}: {err.message}")
+    if len(errors) > 10:
+        logger.error(f"  ... and {len(errors) - 10} more error(s)")
+
+    return HTTPException(
+        status_code=400,
+        detail={
+            "message": f"Validation error: {filename}",
+            "validation_result": validation_result.model_dump(),
+        },
+    )
+
+
+def _json_syntax_failure(filename: str, e: json.JSONDecodeError) -> HTTPException:
+    """Build the HTTPException for a document that is not valid JSON.
+
+    Args:
+        filename: File that was validated
+        e: The decode error
+
+    Returns:
+        HTTPException with status 400 and the ValidationResult as detail
+    """
+    from ..models.models import ValidationError, ValidationResult
+
+    logger.error(f"Invalid JSON syntax in {filename}: {e}")
+    error = ValidationError(
+        file=filename,
+        line=e.lineno if hasattr(e, "lineno") else None,
+        column=e.colno if hasattr(e, "colno") else None,
+        message=f"Invalid JSON syntax: {e.msg}",
+        severity="error",
+        rule="json_syntax",
+        context=None,
+    )
+    validation_result = ValidationResult(
+        valid=False, errors=[error], warnings=[], summary=f"JSON syntax error in {filename}"
+    )
+    return HTTPException(
+        status_code=400,
+        detail={"message": f"Invalid JSON syntax: {filename}", "validation_result": validation_result.model_dump()},
+    )
 
 
 def _clean_cypher_statement(statement: str) -> str:
@@ -392,15 +792,27 @@ def _clean_cypher_statement(statement: str) -> str:
     return "\n".join(clean_lines)
 
 
-def _execute_cypher_statements(cypher_statements: str, neo4j_client) -> int:
+def _execute_cypher_statements(
+    cypher_statements: str | list,
+    neo4j_client,
+    upload_id: str = None,
+    filename: str = None,
+    labels: Iterable[str] | None = None,
+) -> int:
     """Execute Cypher statements in Neo4j within a single transaction.
 
     All statements are executed atomically - if any statement fails, the entire
-    transaction is rolled back and no changes are committed.
+    transaction is rolled back and no changes are committed. Structured
+    statements may instead be committed in chunks (see _execute_write_batches).
 
     Args:
-        cypher_statements: Cypher statements to execute
+        cypher_statements: Cypher script text (split on ``;``), or a list of
+            CypherStatement / WriteBatch objects produced by the converters'
+            "statement_list" / "batched" write modes (executed as-is)
         neo4j_client: Neo4j client
+        upload_id: Upload batch tag on the written nodes (enables chunked commits)
+        filename: Source file tag on the written nodes (enables chunked commits)
+        labels: Node labels the file writes (scopes the rollback of a chunked write)
 
     Returns:
         Number of statements executed
@@ -408,6 +820,11 @@ def _execute_cypher_statements(cypher_statements: str, neo4j_client) -> int:
     Raises:
         Exception: If any Cypher statement fails (all changes rolled back)
     """
+    if not isinstance(cypher_statements, str):
+        return _execute_write_batches(
+            cypher_statements, neo4j_client, upload_id=upload_id, filename=filename, labels=labels
+        )
+
     statements = [stmt.strip() for stmt in cypher_statements.split(";") if stmt.strip()]
     clean_statements = []
 
@@ -432,91 +849,793 @@ def _execute_cypher_statements(cypher_statements: str, neo4j_client) -> int:
                 raise
 
 
+def _execute_write_batches(
+    batches: list,
+    neo4j_client,
+    batch_size: int = None,
+    upload_id: str = None,
+    filename: str = None,
+    labels: Iterable[str] | None = None,
+) -> int:
+    """Execute structured statements or UNWIND write batches in Neo4j within a single transaction.
+
+    Each batch is one cached query plan; rows are sent as the ``$rows`` parameter
+    in chunks of ``batch_size`` so very large label groups stay within memory limits.
+    CypherStatement objects run as a single query each.
+
+    When INGEST_COMMIT_EVERY is set and the write is tagged with ``upload_id`` and
+    ``filename``, the work is committed in chunks instead (see _execute_in_chunked_commits).
+
+    Args:
+        batches: WriteBatch / CypherStatement objects in execution order (nodes before relationships)
+        neo4j_client: Neo4j client
+        batch_size: Max rows per UNWIND call (defaults to BatchConfig.INGEST_UNWIND_BATCH_SIZE)
+        upload_id: Upload batch tag on the written nodes
+        filename: Source file tag on the written nodes
+        labels: Node labels the file writes (scopes the rollback of a chunked write)
+
+    Returns:
+        Number of queries executed
+
+    Raises:
+        Exception: If any query fails (all changes rolled back)
+    """
+    from ..core.config import batch_config
+
+    if batch_size is None:
+        batch_size = batch_config.INGEST_UNWIND_BATCH_SIZE
+
+    if batch_config.INGEST_COMMIT_EVERY > 0 and upload_id and filename:
+        return _execute_in_chunked_commits(
+            batches,
+            neo4j_client,
+            min(batch_size, batch_config.INGEST_COMMIT_EVERY),
+            upload_id,
+            filename,
+            labels=labels,
+        )
+
+    with neo4j_client.driver.session() as session:
+        with session.begin_transaction() as tx:
+            try:
+                executed = 0
+                for batch in batches:
+                    for query, parameters in batch.chunks(batch_size):
+                        tx.run(query, parameters)
+                        executed += 1
+                tx.commit()
+                return executed
+            except Exception as e:
+                logger.error(f"Batched Cypher execution failed, rolling back transaction: {e}")
+                raise
+
+
+def _commit_groups(batches: Iterable, batch_size: int, commit_every: int) -> Iterator[list[tuple[str, dict]]]:
+    """Group (query, parameters) pairs so each group writes about ``commit_every`` rows.
+
+    An UNWIND chunk counts as its row count, a plain statement as one row.
+
+    Yields:
+        Lists of (query, parameters) pairs to commit together
+    """
+    group = []
+    rows = 0
+    for batch in batches:
+        for query, parameters in batch.chunks(batch_size):
+            group.append((query, parameters))
+            rows += len(parameters.get("rows", ())) or 1
+            if rows >= commit_every:
+                yield group
+                group = []
+                rows = 0
+    if group:
+        yield group
+
+
+def _commit_with_retry(session, queries: list, max_retries: int, backoff_seconds: float) -> None:
+    """Run queries in one transaction, retrying transient failures with exponential backoff.
+
+    Re-running a group is safe because every write is a MERGE.
+
+    Args:
+        session: Neo4j session
+        queries: (query, parameters) pairs to commit together
+        max_retries: Retries after the first attempt
+        backoff_seconds: Delay before the first retry (doubled each retry)
+
+    Raises:
+        Exception: The last error once retries are exhausted, or any non-transient error
+    """
+    import time
+
+    from neo4j.exceptions import ServiceUnavailable, SessionExpired, TransientError
+
+    for attempt in range(max_retries + 1):
+        try:
+            with session.begin_transaction() as tx:
+                for query, parameters in queries:
+                    tx.run(query, parameters)
+                tx.commit()
+            return
+        except (TransientError, ServiceUnavailable, SessionExpired) as e:
+            if attempt == max_retries:
+                raise
+            delay = backoff_seconds * (2**attempt)
+            logger.warning(f"Transient Neo4j error on commit (attempt {attempt + 1}), retrying in {delay:.1f}s: {e}")
+            time.sleep(delay)
+
+
+def _execute_in_chunked_commits(
+    batches: Iterable,
+    neo4j_client,
+    batch_size: int,
+    upload_id: str,
+    filename: str,
+    commit_every: int | None = None,
+    labels: Iterable[str] | None = None,
+) -> int:
+    """Execute a file's writes as a series of bounded transactions.
+
+    Neo4j only holds one chunk's transaction state at a time, so very large files
+    ingest within a fixed memory budget. Every node and relationship the file
+    creates carries ``_upload_id`` and ``_source_file``, so if any chunk fails for
+    good the partial write is removed with _rollback_partial_write and the file
+    is all-or-nothing as before.
+
+    Args:
+        batches: WriteBatch / CypherStatement objects in execution order (any
+            iterable; a generator is consumed one commit group at a time)
+        neo4j_client: Neo4j client
+        batch_size: Max rows per UNWIND call
+        upload_id: Upload batch tag on the written nodes
+        filename: Source file tag on the written nodes
+        commit_every: Rows per commit (defaults to BatchConfig.INGEST_COMMIT_EVERY)
+        labels: Node labels the file writes, read when rolling back (a collection
+            that is filled while the batches are consumed works too)
+
+    Returns:
+        Number of queries executed
+
+    Raises:
+        Exception: If a chunk fails after retries (partial write rolled back)
+    """
+    from ..core.config import batch_config
+
+    if commit_every is None:
+        commit_every = batch_config.INGEST_COMMIT_EVERY
+
+    executed = 0
+    commits = 0
+    try:
+        with neo4j_client.driver.session() as session:
+            for group in _commit_groups(batches, batch_size, commit_every):
+                _commit_with_retry(
+                    session,
+                    group,
+                    batch_config.INGEST_COMMIT_MAX_RETRIES,
+                    batch_config.INGEST_COMMIT_RETRY_BACKOFF_MS / 1000,
+                )
+                executed += len(group)
+                commits += 1
+    except Exception as e:
+        logger.error(f"Chunked write failed for {filename} after {commits} commits, rolling back: {e}")
+        if commits:
+            _rollback_partial_write(neo4j_client, upload_id, filename, labels=labels)
+        raise
+
+    logger.info(f"Wrote {filename} in {commits} commits ({executed} queries)")
+    return executed
+
+
+def _write_streamed_batches(
+    batches: Iterable[tuple],
+    neo4j_client,
+    upload_id: str,
+    filename: str,
+    cypher_file: BinaryIO | None = None,
+    written_label: Callable[[str], str] | None = None,
+) -> tuple[int, dict[str, Any]]:
+    """Write a streamed file to Neo4j batch by batch as the converter yields it.
+
+    Only the batch being converted or written is held in memory. Writes are
+    always committed in chunks (INGEST_COMMIT_EVERY rows, or
+    INGEST_STREAMING_BATCH_NODES rows when chunked commits are off), so a
+    failure part-way through the file, in conversion or in Neo4j, is rolled
+    back with _rollback_partial_write.
+
+    Args:
+        batches: (statements, nodes, contains, edges) tuples from a streaming converter
+            ("statement_list" or "batched" write mode)
+        neo4j_client: Neo4j client
+        upload_id: Upload batch tag on the written nodes and relationships
+        filename: Source file tag on the written nodes and relationships
+        cypher_file: Binary file the rendered statements are appended to for archiving
+        written_label: Maps a converter label to the label the statements write
+            (JSON sanitizes labels); labels are used as-is when not given
+
+    Returns:
+        Tuple of (queries executed, stats)
+
+    Raises:
+        Exception: If conversion or a commit fails (partial write rolled back)
+    """
+    from ..core.config import batch_config
+    from ..services.domain.graph import render_batches_as_cypher
+
+    counts = {"nodes": 0, "contains": 0, "edges": 0}
+    labels: set[str] = set()
+
+    def statements():
+        if cypher_file is not None:
+            cypher_file.write(f"// Generated for {filename} using mapping\n".encode())
+        for batch, nodes, contains, edges in batches:
+            # Labels first seen in this batch get their index before its nodes are written
+            new_labels = {written_label(node[0]) if written_label else node[0] for node in nodes.values()} - labels
+            _ensure_ingest_indexes(neo4j_client, sorted(new_labels))
+            labels.update(new_labels)
+            counts["nodes"] += len(nodes)
+            counts["contains"] += len(contains)
+            counts["edges"] += len(edges)
+            if cypher_file is not None and batch:
+                cypher_file.write(render_batches_as_cypher(batch).encode("utf-8") + b"\n\n")
+            yield from batch
+
+    commit_every = batch_config.INGEST_COMMIT_EVERY or batch_config.INGEST_STREAMING_BATCH_NODES
+    executed = _execute_in_chunked_commits(
+        statements(),
+        neo4j_client,
+        min(batch_config.INGEST_UNWIND_BATCH_SIZE, commit_every),
+        upload_id,
+        filename,
+        commit_every,
+        labels=labels,
+    )
+
+    stats = {
+        "nodes_created": counts["nodes"],
+        "nodes_count": counts["nodes"],
+        "containment_edges": counts["contains"],
+        "contains_count": counts["contains"],
+        "reference_edges": counts["edges"],
+        "edges_count": counts["edges"],
+        "labels": sorted(labels),
+    }
+    logger.info(
+        f"Streamed {filename} to Neo4j: {stats['nodes_created']} nodes, "
+        f"{stats['containment_edges']} containment relationships, "
+        f"{stats['reference_edges']} reference/association edges"
+    )
+    return executed, stats
+
+
+def _rollback_partial_write(
+    neo4j_client, upload_id: str, filename: str, batch_size: int = 10000, labels: Iterable[str] | None = None
+) -> int:
+    """Delete everything a file wrote, in bounded batches.
+
+    Relationships the file created are deleted first, including those between
+    nodes that existed before (MERGE leaves their tags alone), then the file's
+    own nodes with anything still attached to them.
+
+    With the file's node labels the deletes go label by label, so they only scan
+    nodes of those labels (every relationship the file creates starts at a node
+    with one of them). Without labels the whole store is scanned.
+
+    Args:
+        neo4j_client: Neo4j client
+        upload_id: Upload batch tag on the written nodes and relationships
+        filename: Source file tag on the written nodes and relationships
+        batch_size: Relationships or nodes deleted per transaction
+        labels: Node labels the file wrote
+
+    Returns:
+        Number of nodes deleted
+    """
+    from ..services.domain.graph.batch_writer import _escape_identifier
+
+    tags = "{_upload_id: $upload_id, _source_file: $filename}"
+    patterns = [f":{_escape_identifier(label)}" for label in sorted(set(labels))] if labels is not None else [""]
+    relationship_queries = [
+        f"MATCH ({'a' + pattern if pattern else ''})-[r {tags}]->() "
+        "WITH r LIMIT $limit DELETE r RETURN count(*) AS deleted"
+        for pattern in patterns
+    ]
+    node_queries = [
+        f"MATCH (n{pattern} {tags}) WITH n LIMIT $limit DETACH DELETE n RETURN count(*) AS deleted"
+        for pattern in patterns
+    ]
+    totals = []
+    with neo4j_client.driver.session() as session:
+        for queries in (relationship_queries, node_queries):
+            total = 0
+            for query in queries:
+                while True:
+                    record = session.run(query, upload_id=upload_id, filename=filename, limit=batch_size).single()
+                    deleted = record["deleted"] if record else 0
+                    total += deleted
+                    if deleted < batch_size:
+                        break
+            totals.append(total)
+    logger.info(f"Rolled back {totals[1]} nodes and {totals[0]} relationships written for {filename} ({upload_id})")
+    return totals[1]
+
+
 async def _store_processed_files(
-    s3: Minio, content: bytes, filename: str, cypher_statements: str, file_type: str = "xml"
+    s3: Minio,
+    content: bytes | BinaryIO,
+    filename: str,
+    cypher_statements: str | list | BinaryIO,
+    file_type: str = "xml",
 ) -> None:
     """Store data files and Cypher files after successful processing.
 
     Args:
         s3: MinIO client
-        content: File content
-        filename: Original filename
-        cypher_statements: Generated Cypher statements
-        file_type: Type of file ("xml" or "json")
+        content: File content, or the seekable binary file of a streamed upload
+        filename: Original filename
+        cypher_statements: Generated Cypher statements (text, or CypherStatement /
+            WriteBatch objects, which are rendered to text only here), or a binary
+            file with the script of a streamed file
+        file_type: Type of file ("xml" or "json")
+    """
+    import hashlib
+    import time
+
+    from ..clients.s3_client import upload_file, upload_stream
+
+    if not isinstance(cypher_statements, str) and not hasattr(cypher_statements, "read"):
+        from ..services.domain.graph import render_batches_as_cypher
+
+        cypher_statements = render_batches_as_cypher(
+            cypher_statements, header=f"Generated for {filename} using mapping"
+        )
+
+    # Generate unique filename with timestamp
+    timestamp = int(time.time())
+    # MD5 used for filename generation only, not cryptographic security
+    if isinstance(content, bytes):
+        file_hash = hashlib.md5(content, usedforsecurity=False).hexdigest()[:8]
+    else:
+        content.seek(0)
+        file_hash = hashlib.file_digest(content, lambda: hashlib.md5(usedforsecurity=False)).hexdigest()[:8]
+    base_filename = f"{file_type}/{timestamp}_{file_hash}_{filename}"
+
+    # Determine content type
+    content_type = "application/json" if file_type == "json" else "application/xml"
+
+    # Store data file
+    try:
+        if isinstance(content, bytes):
+            await upload_file(s3, "niem-data", base_filename, content, content_type)
+        else:
+            await upload_stream(s3, "niem-data", base_filename, content, content_type)
+        logger.info(f"Stored {file_type.upper()} file in niem-data after successful ingestion: {base_filename}")
+    except Exception as e:
+        logger.warning(
+            f"Graph ingestion succeeded but failed to store {file_type.upper()} " f"file {filename} in niem-data: {e}"
+        )
+
+    # Store generated Cypher statements alongside the data file in the same folder
+    try:
+        logger.info(f"About to store Cypher file for {filename}")
+        cypher_filename = f"{file_type}/{timestamp}_{file_hash}_{filename}.cypher"
+        if hasattr(cypher_statements, "read"):
+            await upload_stream(s3, "niem-data", cypher_filename, cypher_statements, "text/plain")
+        else:
+            cypher_content = cypher_statements.encode("utf-8")
+            logger.info(f"Cypher content length: {len(cypher_content)} bytes, filename: {cypher_filename}")
+            await upload_file(s3, "niem-data", cypher_filename, cypher_content, "text/plain")
+        logger.info(f"Stored Cypher file in niem-data: {cypher_filename}")
+    except Exception as e:
+        logger.error(f"Graph ingestion succeeded but failed to store Cypher file {filename} in niem-data: {e}")
+        import traceback
+
+        logger.error(f"Traceback: {traceback.format_exc()}")
+
+
+def _create_success_result(filename: str, statements_executed: int, stats: dict[str, Any]) -> dict[str, Any]:
+    """Create success result dictionary.
+
+    Args:
+        filename: Processed filename
+        statements_executed: Number of statements executed
+        stats: Processing statistics
+
+    Returns:
+        Success result dictionary
+    """
+    return {
+        "filename": filename,
+        "status": "success",
+        "statements_executed": statements_executed,
+        "nodes_created": stats.get("nodes_count", 0),
+        "relationships_created": stats.get("edges_count", 0) + stats.get("contains_count", 0),
+    }
+
+
+def _create_error_result(filename: str, error_msg: str, validation_result: dict[str, Any] = None) -> dict[str, Any]:
+    """Create error result dictionary.
+
+    Args:
+        filename: Failed filename
+        error_msg: Error message
+        validation_result: Optional structured validation result
+
+    Returns:
+        Error result dictionary
+    """
+    result = {"filename": filename, "status": "failed", "error": error_msg}
+    if validation_result:
+        result["validation_details"] = validation_result
+    return result
+
+
+def _error_result_from_exception(filename: str, error: Exception, file_type: str = "xml") -> dict[str, Any]:
+    """Turn a failure from a per-file ingest stage into an error result.
+
+    Args:
+        filename: File that failed
+        error: Exception raised by the stage (HTTPException for validation failures)
+        file_type: "xml" or "json" (selects the help text)
+
+    Returns:
+        Error result dictionary
+    """
+    if isinstance(error, HTTPException):
+        # HTTPException from validation - extract detail message and validation result
+        if isinstance(error.detail, dict):
+            error_msg = error.detail.get("message", str(error.detail))
+            validation_result = error.detail.get("validation_result")
+
+            # If no validation_result but message indicates validation failure, provide helpful default
+            if not validation_result and "validation" in error_msg.lower():
+                if file_type == "json":
+                    error_msg = (
+                        f"{error_msg}. NIEM JSON validation failed - check that the JSON "
+                        "conforms to the active schema."
+                    )
+                else:
+                    error_msg = (
+                        f"{error_msg}. CMF validation failed - check that the XML conforms to the active schema."
+                    )
+        else:
+            error_msg = error.detail
+            validation_result = None
+
+            # Provide helpful default message for validation errors
+            if "validation" in error_msg.lower():
+                kind = "NIEM JSON" if file_type == "json" else "XML"
+                error_msg = f"{error_msg}. Check that the {kind} file conforms to the active schema."
+
+        logger.error(f"Failed to process file {filename}: {error_msg}")
+        return _create_error_result(filename, error_msg, validation_result)
+
+    logger.error(f"Failed to process file {filename}: {error}")
+    return _create_error_result(filename, f"{str(error)}. Unexpected error during processing.")
+
+
+def _converter_write_mode() -> str:
+    """Map INGEST_WRITE_MODE to the converter write mode used for ingest.
+
+    Ingest never asks the converters for script text: "statements" becomes
+    "statement_list" so statements reach the executor without a text round-trip.
+
+    Returns:
+        "batched" or "statement_list"
+    """
+    from ..core.config import batch_config
+
+    return "batched" if batch_config.INGEST_WRITE_MODE == "batched" else "statement_list"
+
+
+def _ensure_ingest_indexes(neo4j_client, labels) -> None:
+    """Provision match-key indexes for labels about to be written (if enabled).
+
+    Index provisioning only speeds up writes, so failures are logged rather than raised.
+
+    Args:
+        neo4j_client: Neo4j client
+        labels: Node labels
+    """
+    from ..core.config import batch_config
+    from ..services.domain.graph import ensure_match_key_indexes
+
+    if not batch_config.INGEST_AUTO_INDEXES or not labels:
+        return
+    try:
+        ensure_match_key_indexes(neo4j_client, labels)
+    except Exception as e:
+        logger.warning(f"Could not provision ingest indexes: {e}")
+
+
+def _write_and_archive_stages(neo4j_client, s3: Minio, upload_id: str, file_type: str) -> list:
+    """Build the write (Neo4j) and archive (MinIO) stages shared by XML and JSON ingest.
+
+    Args:
+        neo4j_client: Neo4j client
+        s3: MinIO client
+        upload_id: Unique identifier for this upload batch
+        file_type: "xml" or "json" (archive folder)
+
+    Returns:
+        List of PipelineStage objects
+    """
+    from ..core.config import batch_config
+    from ..services.ingest_pipeline import PipelineStage
+
+    async def write(job: dict[str, Any]) -> None:
+        filename = job["file"].filename
+        if "batches" in job:
+            import tempfile
+
+            # Streamed files are converted while they are written, one batch at a time
+            job["cypher"] = tempfile.TemporaryFile()
+            try:
+                job["executed"], job["stats"] = await asyncio.to_thread(
+                    _write_streamed_batches,
+                    job.pop("batches"),
+                    neo4j_client,
+                    upload_id,
+                    filename,
+                    job["cypher"],
+                    job.pop("written_label", None),
+                )
+            except Exception as e:
+                logger.error(f"Failed to stream {filename} to Neo4j: {e}")
+                job.pop("cypher").close()
+                job["result"] = _create_error_result(filename, f"Streaming ingest failed: {str(e)}")
+            return
+
+        # Labels first seen in this file (dynamic mode) get their index before the write
+        await asyncio.to_thread(_ensure_ingest_indexes, neo4j_client, job["stats"].get("labels"))
+        try:
+            job["executed"] = await asyncio.to_thread(
+                _execute_cypher_statements,
+                job["cypher"],
+                neo4j_client,
+                upload_id,
+                filename,
+                job["stats"].get("labels"),
+            )
+        except Exception as e:
+            logger.error(f"Failed to execute Cypher for {filename}: {e}")
+            job["result"] = _create_error_result(filename, f"Cypher execution failed: {str(e)}")
+
+    async def archive(job: dict[str, Any]) -> None:
+        filename = job["file"].filename
+        try:
+            # Store the data file in MinIO after successful ingestion
+            content = job["content"] if "content" in job else job["file"].file
+            await _store_processed_files(s3, content, filename, job["cypher"], file_type=file_type)
+        except Exception as e:
+            # The graph data is already committed; only the MinIO copy is missing
+            logger.error(f"Failed to archive {filename} to MinIO after writing it to Neo4j: {e}")
+            job["result"] = _create_error_result(
+                filename, f"Archiving to MinIO failed (graph data was written to Neo4j): {str(e)}"
+            )
+        else:
+            job["result"] = _create_success_result(filename, job["executed"], job["stats"])
+            logger.info(f"Successfully ingested {filename}: {job['executed']} Cypher statements executed")
+        finally:
+            # Release the document and generated statements as soon as the file is done
+            job.pop("content", None)
+            cypher = job.pop("cypher", None)
+            if hasattr(cypher, "close"):
+                cypher.close()
+
+    return [
+        PipelineStage("write", write, batch_config.INGEST_WRITE_CONCURRENCY),
+        PipelineStage("archive", archive, batch_config.INGEST_ARCHIVE_CONCURRENCY),
+    ]
+
+
+def _upload_size(file: UploadFile) -> int:
+    """Return the size of an upload in bytes without reading it.
+
+    Args:
+        file: Uploaded file (its position is left unchanged)
+
+    Returns:
+        Size in bytes
+    """
+    position = file.file.tell()
+    size = file.file.seek(0, io.SEEK_END)
+    file.file.seek(position)
+    return size
+
+
+def _xml_ingest_stages(
+    mapping: dict[str, Any],
+    neo4j_client,
+    s3: Minio,
+    schema_dir: str,
+    upload_id: str,
+    schema_id: str,
+    mode: str = "dynamic",
+    settings=None,
+    mapping_payload=None,
+    prevalidated: dict | None = None,
+) -> list:
+    """Build the validate/convert/write/archive stages for XML ingest.
+
+    Args:
+        mapping: Schema mapping
+        neo4j_client: Neo4j client
+        s3: MinIO client
+        schema_dir: Directory containing XSD schema files
+        upload_id: Unique identifier for this upload batch
+        schema_id: Schema identifier
+        mode: Converter mode - "mapping" (use selections) or "dynamic" (all complex elements)
+        settings: Application settings (for validation control)
+        mapping_payload: Batch mapping packed for the conversion pool; when omitted
+            conversion runs in a thread of this process
+        prevalidated: Results of _prevalidate_xml_files; files found here are not
+            validated again
+
+    Returns:
+        List of PipelineStage objects
     """
-    import hashlib
-    import time
+    from ..core.config import batch_config
+    from ..services.ingest_pipeline import PipelineStage
 
-    from ..clients.s3_client import upload_file
+    streaming_threshold = batch_config.INGEST_STREAMING_THRESHOLD_MB * 1024 * 1024
 
-    # Generate unique filename with timestamp
-    timestamp = int(time.time())
-    # MD5 used for filename generation only, not cryptographic security
-    file_hash = hashlib.md5(content, usedforsecurity=False).hexdigest()[:8]
-    base_filename = f"{file_type}/{timestamp}_{file_hash}_{filename}"
+    async def validate(job: dict[str, Any]) -> None:
+        file = job["file"]
+        job["size"] = _upload_size(file)
+        if job["size"] >= streaming_threshold:
+            # Large uploads stay in their spooled temporary file and are never read whole
+            document = file.file
+        else:
+            job["content"] = await file.read()
+            document = job["text"] = job["content"].decode("utf-8")
 
-    # Determine content type
-    content_type = "application/json" if file_type == "json" else "application/xml"
+        # Validate XML against XSD schemas (unless skipped via settings)
+        if settings and settings.skip_xml_validation:
+            logger.warning(f"⚠️ Skipping XML validation for {file.filename} (skip_xml_validation=true)")
+        elif prevalidated is not None and file in prevalidated:
+            if prevalidated[file] is not None:
+                raise prevalidated[file]
+        else:
+            await asyncio.to_thread(_validate_xml_content, document, schema_dir, file.filename, schema_id)
+
+    async def convert(job: dict[str, Any]) -> None:
+        filename = job["file"].filename
+        write_mode = _converter_write_mode()
+
+        # Large files are parsed record by record with iterparse while the write stage
+        # commits each batch (see _write_streamed_batches)
+        if "content" not in job:
+            from ..services.domain.xml_to_graph import iter_xml_cypher_batches
+
+            logger.info(f"Using streaming XML conversion for {filename} ({job['size']} bytes)")
+            job["file"].file.seek(0)
+            job["batches"] = iter_xml_cypher_batches(
+                job["file"].file,
+                mapping,
+                filename,
+                upload_id,
+                schema_id,
+                mode=mode,
+                batch_nodes=batch_config.INGEST_STREAMING_BATCH_NODES,
+                write_mode=write_mode,
+            )
+            return
 
-    # Store data file
-    try:
-        await upload_file(s3, "niem-data", base_filename, content, content_type)
-        logger.info(f"Stored {file_type.upper()} file in niem-data after successful ingestion: {base_filename}")
-    except Exception as e:
-        logger.warning(
-            f"Graph ingestion succeeded but failed to store {file_type.upper()} " f"file {filename} in niem-data: {e}"
-        )
+        xml_source = job.pop("text")
 
-    # Store generated Cypher statements alongside the data file in the same folder
-    try:
-        logger.info(f"About to store Cypher file for {filename}")
-        cypher_filename = f"{file_type}/{timestamp}_{file_hash}_{filename}.cypher"
-        cypher_content = cypher_statements.encode("utf-8")
-        logger.info(f"Cypher content length: {len(cypher_content)} bytes, filename: {cypher_filename}")
-        await upload_file(s3, "niem-data", cypher_filename, cypher_content, "text/plain")
-        logger.info(f"Stored Cypher file in niem-data: {cypher_filename}")
-    except Exception as e:
-        logger.error(f"Graph ingestion succeeded but failed to store Cypher file {filename} in niem-data: {e}")
-        import traceback
+        # Convert off the event loop (worker process when a batch payload is given)
+        if mapping_payload is not None:
+            from ..services.conversion_pool import run_conversion
 
-        logger.error(f"Traceback: {traceback.format_exc()}")
+            job["cypher"], job["stats"] = await run_conversion(
+                _convert_xml_in_worker, xml_source, mapping_payload, filename, upload_id, schema_id, mode, write_mode
+            )
+        else:
+            job["cypher"], job["stats"] = await asyncio.to_thread(
+                _generate_cypher_from_xml, xml_source, mapping, filename, upload_id, schema_id, mode, write_mode
+            )
 
+        if not job["cypher"]:
+            job["result"] = _create_error_result(filename, "No Cypher statements generated from XML")
 
-def _create_success_result(filename: str, statements_executed: int, stats: dict[str, Any]) -> dict[str, Any]:
-    """Create success result dictionary.
+    return [
+        PipelineStage("validate", validate, batch_config.INGEST_VALIDATE_CONCURRENCY),
+        PipelineStage("convert", convert, max(batch_config.INGEST_CONVERSION_WORKERS, 1)),
+        *_write_and_archive_stages(neo4j_client, s3, upload_id, "xml"),
+    ]
+
+
+async def _prevalidate_xml_files(
+    files: list[UploadFile], schema_dir: str, schema_id: str | None = None
+) -> dict[UploadFile, Exception | None]:
+    """Validate all XML files of a batch with one validator run.
+
+    Files are rewound after reading so later stages can read them again. Files
+    that are not valid UTF-8 are left out and fail in their own validate stage,
+    and so are files at or above INGEST_STREAMING_THRESHOLD_MB, which are
+    validated from disk on their own instead of being read into memory.
+    With a schema ID, files whose content was validated recently reuse the
+    cached result and are left out of the validator run.
 
     Args:
-        filename: Processed filename
-        statements_executed: Number of statements executed
-        stats: Processing statistics
+        files: Uploaded XML files
+        schema_dir: Directory containing XSD schema files
+        schema_id: Schema ID used to key cached validation results
 
     Returns:
-        Success result dictionary
+        Mapping of file -> validation exception (None if valid)
     """
-    return {
-        "filename": filename,
-        "status": "success",
-        "statements_executed": statements_executed,
-        "nodes_created": stats.get("nodes_count", 0),
-        "relationships_created": stats.get("edges_count", 0) + stats.get("contains_count", 0),
-    }
-
-
-def _create_error_result(filename: str, error_msg: str, validation_result: dict[str, Any] = None) -> dict[str, Any]:
-    """Create error result dictionary.
+    from ..core.config import batch_config
+    from ..services.validation_cache import result_key
+
+    streaming_threshold = batch_config.INGEST_STREAMING_THRESHOLD_MB * 1024 * 1024
+    outcomes: dict[UploadFile, Exception | None] = {}
+    documents = []
+    batch_files = []
+    cache_keys = []
+    for file in files:
+        if _upload_size(file) >= streaming_threshold:
+            continue
+        content = await file.read()
+        await file.seek(0)
+        try:
+            text = content.decode("utf-8")
+        except UnicodeDecodeError:
+            continue
+
+        cache_key = None
+        if schema_id is not None:
+            cache_key = result_key(content, schema_id, _xml_validator_version())
+            hit, outcome = _cached_validation_outcome(cache_key, file.filename)
+            if hit:
+                outcomes[file] = outcome
+                continue
+
+        documents.append((file.filename, text))
+        batch_files.append(file)
+        cache_keys.append(cache_key)
+
+    if documents:
+        batch_outcomes = await asyncio.to_thread(_validate_xml_batch, documents, schema_dir)
+        for file, cache_key, outcome in zip(batch_files, cache_keys, batch_outcomes, strict=False):
+            if cache_key is not None:
+                _remember_validation_outcome(cache_key, file.filename, outcome)
+            outcomes[file] = outcome
+    return outcomes
+
+
+async def _run_ingest_pipeline(
+    files: list[UploadFile], stages: list, file_type: str = "xml", progress: Callable | None = None
+) -> tuple[list[dict[str, Any]], int, dict[str, dict[str, Any]]]:
+    """Run files through the ingest stages and collect per-file results in upload order.
 
     Args:
-        filename: Failed filename
-        error_msg: Error message
-        validation_result: Optional structured validation result
+        files: Uploaded files
+        stages: Stages from _xml_ingest_stages / _json_ingest_stages
+        file_type: "xml" or "json" (error help text)
+        progress: Pipeline progress callback (pipeline jobs carry their file ``index``)
 
     Returns:
-        Error result dictionary
+        Tuple of (results, total_statements_executed, stage_timings)
     """
-    result = {"filename": filename, "status": "failed", "error": error_msg}
-    if validation_result:
-        result["validation_details"] = validation_result
-    return result
+    from ..services.ingest_pipeline import run_pipeline
+
+    jobs: list[dict[str, Any]] = [{"file": file, "index": index} for index, file in enumerate(files)]
+    stage_timings = await run_pipeline(jobs, stages, progress)
+
+    results = []
+    total_statements_executed = 0
+    for job in jobs:
+        if "error" in job:
+            result = _error_result_from_exception(job["file"].filename, job["error"], file_type)
+        else:
+            result = job["result"]
+            if result["status"] == "success":
+                total_statements_executed += job["executed"]
+        result["timings"] = job.get("timings", {})
+        results.append(result)
+    return results, total_statements_executed, stage_timings
 
 
 async def _process_single_file(
@@ -529,8 +1648,9 @@ async def _process_single_file(
     schema_id: str,
     mode: str = "dynamic",
     settings=None,
+    mapping_payload=None,
 ) -> tuple[dict[str, Any], int]:
-    """Process a single XML file.
+    """Process a single XML file through all ingest stages.
 
     Args:
         file: Uploaded file
@@ -542,70 +1662,33 @@ async def _process_single_file(
         schema_id: Schema identifier
         mode: Converter mode - "mapping" (use selections) or "dynamic" (all complex elements)
         settings: Application settings (for validation control)
+        mapping_payload: Batch mapping packed for the conversion pool; when omitted
+            conversion runs in a thread of this process
 
     Returns:
         Tuple of (result_dict, statements_executed)
     """
-    try:
-        content = await file.read()
-        xml_content = content.decode("utf-8")
-
-        # Validate XML against XSD schemas (unless skipped via settings)
-        if settings and settings.skip_xml_validation:
-            logger.warning(f"⚠️ Skipping XML validation for {file.filename} (skip_xml_validation=true)")
-        else:
-            _validate_xml_content(xml_content, schema_dir, file.filename)
-
-        # Use import_xml_to_cypher service to generate Cypher
-        cypher_statements, stats = _generate_cypher_from_xml(
-            xml_content, mapping, file.filename, upload_id, schema_id, mode
-        )
-
-        if not cypher_statements:
-            return _create_error_result(file.filename, "No Cypher statements generated from XML"), 0
-
-        # Execute Cypher statements in Neo4j
-        try:
-            statements_executed = _execute_cypher_statements(cypher_statements, neo4j_client)
-
-            # Store XML file in MinIO after successful ingestion
-            await _store_processed_files(s3, content, file.filename, cypher_statements)
-
-            result = _create_success_result(file.filename, statements_executed, stats)
-            logger.info(f"Successfully ingested {file.filename}: {statements_executed} Cypher statements executed")
-            return result, statements_executed
-
-        except Exception as e:
-            logger.error(f"Failed to execute Cypher for {file.filename}: {e}")
-            return _create_error_result(file.filename, f"Cypher execution failed: {str(e)}"), 0
+    stages = _xml_ingest_stages(
+        mapping, neo4j_client, s3, schema_dir, upload_id, schema_id, mode, settings, mapping_payload
+    )
+    results, statements_executed, _ = await _run_ingest_pipeline([file], stages, "xml")
+    return results[0], statements_executed
 
-    except HTTPException as e:
-        # HTTPException from validation - extract detail message and validation result
-        if hasattr(e, "detail") and isinstance(e.detail, dict):
-            error_msg = e.detail.get("message", str(e.detail))
-            validation_result = e.detail.get("validation_result")
-
-            # If no validation_result but message indicates validation failure, provide helpful default
-            if not validation_result and "validation" in error_msg.lower():
-                error_msg = f"{error_msg}. CMF validation failed - check that the XML conforms to the active schema."
-        else:
-            error_msg = e.detail if hasattr(e, "detail") else str(e)
-            validation_result = None
-
-            # Provide helpful default message for validation errors
-            if "validation" in error_msg.lower() and not validation_result:
-                error_msg = f"{error_msg}. Check that the XML file conforms to the active schema."
 
-        logger.error(f"Failed to process file {file.filename}: {error_msg}")
-        return _create_error_result(file.filename, error_msg, validation_result), 0
-    except Exception as e:
-        logger.error(f"Failed to process file {file.filename}: {e}")
-        error_msg = f"{str(e)}. Unexpected error during processing."
-        return _create_error_result(file.filename, error_msg), 0
+async def handle_xml_ingest(
+    files: list[UploadFile], s3: Minio, schema_id: str = None, progress: Callable | None = None
+) -> dict[str, Any]:
+    """Handle XML file ingestion to Neo4j using import_xml_to_cypher service
 
+    Args:
+        files: Uploaded XML files
+        s3: MinIO client
+        schema_id: Schema ID (uses the active schema if not provided)
+        progress: Per-file progress callback for background jobs
 
-async def handle_xml_ingest(files: list[UploadFile], s3: Minio, schema_id: str = None) -> dict[str, Any]:
-    """Handle XML file ingestion to Neo4j using import_xml_to_cypher service"""
+    Returns:
+        Batch result with per-file results and stage timings
+    """
     logger.info(f"Starting XML ingestion for {len(files)} files using import_xml_to_cypher service")
 
     schema_dir = None
@@ -616,7 +1699,7 @@ async def handle_xml_ingest(files: list[UploadFile], s3: Minio, schema_id: str =
 
         neo4j_client_for_settings = get_neo4j_client()
         settings_service = SettingsService(neo4j_client_for_settings)
-        settings = settings_service.get_settings()
+        settings = await asyncio.to_thread(settings_service.get_settings)
         logger.info(f"Settings: skip_xml_validation={settings.skip_xml_validation}, skip_json_validation={settings.skip_json_validation}")
 
         # Step 1: Generate unique upload ID for this ingestion batch
@@ -686,26 +1769,46 @@ async def handle_xml_ingest(files: list[UploadFile], s3: Minio, schema_id: str =
         schema_dir = await _download_schema_files(s3, schema_id)
 
         # Step 5: Process files
-        results = []
-        total_statements_executed = 0
         total_nodes = 0
         total_relationships = 0
 
-        # Initialize Neo4j client
-        neo4j_client = Neo4jClient()
+        # Writes share the process-wide connection pool
+        neo4j_client = get_neo4j_client()
 
-        try:
-            for file in files:
-                result, statements_executed = await _process_single_file(
-                    file, mapping, neo4j_client, s3, schema_dir, upload_id, schema_id, mode, settings
-                )
-                results.append(result)
-                total_statements_executed += statements_executed
-                total_nodes += result.get("nodes_created", 0)
-                total_relationships += result.get("relationships_created", 0)
+        # Index every label the mapping can produce before the first write
+        from ..services.domain.graph import mapping_labels
 
-        finally:
-            neo4j_client.driver.close()
+        await asyncio.to_thread(_ensure_ingest_indexes, neo4j_client, mapping_labels(mapping))
+
+        # Files flow through validate -> convert -> write -> archive stages concurrently;
+        # the mapping is packed once per batch for the conversion pool
+        from ..services.conversion_pool import pack_mapping
+
+        mapping_payload = pack_mapping(mapping)
+        batch_started = time.perf_counter()
+
+        # Validate the whole batch in one validator run (schema set compiled once)
+        prevalidated = None
+        if len(files) > 1 and not settings.skip_xml_validation:
+            prevalidated = await _prevalidate_xml_files(files, schema_dir, schema_id)
+        validation_seconds = round(time.perf_counter() - batch_started, 4)
+
+        stages = _xml_ingest_stages(
+            mapping, neo4j_client, s3, schema_dir, upload_id, schema_id, mode, settings, mapping_payload, prevalidated
+        )
+        results, total_statements_executed, stage_timings = await _run_ingest_pipeline(files, stages, "xml", progress)
+        if prevalidated is not None:
+            stage_timings = {
+                "batch_validate": {
+                    "files": len(prevalidated),
+                    "total_seconds": validation_seconds,
+                    "max_seconds": validation_seconds,
+                },
+                **stage_timings,
+            }
+        for result in results:
+            total_nodes += result.get("nodes_created", 0)
+            total_relationships += result.get("relationships_created", 0)
 
         return {
             "schema_id": schema_id,
@@ -713,6 +1816,8 @@ async def handle_xml_ingest(files: list[UploadFile], s3: Minio, schema_id: str =
             "total_nodes_created": total_nodes,
             "total_relationships_created": total_relationships,
             "total_statements_executed": total_statements_executed,
+            "elapsed_seconds": round(time.perf_counter() - batch_started, 4),
+            "stage_timings": stage_timings,
             "results": results,
         }
 
@@ -736,8 +1841,7 @@ async def handle_xml_ingest(files: list[UploadFile], s3: Minio, schema_id: str =
                 logger.warning(f"Failed to clean up schema directory: {e}")
 
 
-async def _process_single_json_file(
-    file: UploadFile,
+def _json_ingest_stages(
     mapping: dict[str, Any],
     json_schema: dict[str, Any] | None,
     neo4j_client,
@@ -746,11 +1850,11 @@ async def _process_single_json_file(
     schema_id: str | None,
     mode: str = "dynamic",
     settings=None,
-) -> tuple[dict[str, Any], int]:
-    """Process a single NIEM JSON file.
+    mapping_payload=None,
+) -> list:
+    """Build the validate/convert/write/archive stages for NIEM JSON ingest.
 
     Args:
-        file: Uploaded file
         mapping: Schema mapping (can be empty dict if no schema)
         json_schema: JSON Schema for validation (optional, can be None)
         neo4j_client: Neo4j client
@@ -759,74 +1863,169 @@ async def _process_single_json_file(
         schema_id: Schema identifier (optional, can be None)
         mode: Converter mode - "mapping" (use selections) or "dynamic" (all complex elements)
         settings: Application settings (for validation control)
+        mapping_payload: Batch mapping packed for the conversion pool; when omitted
+            conversion runs in a thread of this process
 
     Returns:
-        Tuple of (result_dict, statements_executed)
+        List of PipelineStage objects
     """
-    try:
-        content = await file.read()
-        json_content = content.decode("utf-8")
+    from ..core.config import batch_config
+    from ..services.conversion_pool import pack_mapping
+    from ..services.ingest_pipeline import PipelineStage
+    from ..services.validation_cache import result_key
+
+    streaming_threshold = batch_config.INGEST_STREAMING_THRESHOLD_MB * 1024 * 1024
+    validation_enabled = bool(json_schema) and not (settings and settings.skip_json_validation)
+
+    # With the conversion pool, documents are validated in the worker on the same
+    # parse that conversion uses; the schema is shipped once per batch like the mapping
+    schema_payload = pack_mapping(json_schema) if validation_enabled and mapping_payload is not None else None
+
+    async def validate(job: dict[str, Any]) -> None:
+        file = job["file"]
+        job["size"] = _upload_size(file)
+        if job["size"] < streaming_threshold:
+            job["content"] = await file.read()
 
         # Validate NIEM JSON against JSON Schema (unless skipped via settings or no schema available)
         if settings and settings.skip_json_validation:
             logger.warning(f"⚠️ Skipping JSON validation for {file.filename} (skip_json_validation=true)")
         elif not json_schema:
             logger.warning(f"⚠️ Skipping JSON validation for {file.filename} (no JSON schema available)")
+        elif "content" not in job:
+            # Large uploads stay on disk and are validated one @graph item at a time
+            await asyncio.to_thread(_validate_json_stream, file.file, json_schema, file.filename, schema_id)
+        elif schema_payload is not None:
+            # Resent identical content reuses its cached result; otherwise the worker validates
+            cache_key = None
+            if schema_id is not None:
+                cache_key = result_key(job["content"], schema_id, _json_validator_version())
+                hit, outcome = _cached_validation_outcome(cache_key, file.filename)
+                if hit:
+                    if outcome is not None:
+                        raise outcome
+                    return
+            job["validate_in_worker"] = True
+            job["validation_key"] = cache_key
         else:
             logger.info(f"Validating JSON for {file.filename}")
-            _validate_json_content(json_content, json_schema, file.filename)
-
-        # Generate Cypher from NIEM JSON
-        cypher_statements, stats = _generate_cypher_from_json(
-            json_content, mapping, file.filename, upload_id, schema_id, mode
-        )
-
-        if not cypher_statements:
-            return _create_error_result(file.filename, "No Cypher statements generated from NIEM JSON"), 0
+            # Keep the parsed document for conversion
+            job["document"] = await asyncio.to_thread(
+                _validate_json_content, job["content"], json_schema, file.filename, schema_id
+            )
 
-        # Execute Cypher statements in Neo4j
-        try:
-            statements_executed = _execute_cypher_statements(cypher_statements, neo4j_client)
+    async def convert(job: dict[str, Any]) -> None:
+        filename = job["file"].filename
+        document = job.pop("document", None)
+        # JSON has no batched writer; statements are still handed over as objects
+        write_mode = "statement_list"
+
+        # Large JSON-LD files are converted @graph item by item from the spooled upload
+        # while the write stage commits each batch (see _write_streamed_batches)
+        if "content" not in job:
+            from ..services.domain.json_to_graph import iter_json_cypher_batches, sanitize_neo4j_label
+
+            logger.info(f"Using streaming JSON conversion for {filename} ({job['size']} bytes)")
+            job["file"].file.seek(0)
+            job["batches"] = iter_json_cypher_batches(
+                job["file"].file,
+                mapping,
+                filename,
+                upload_id,
+                schema_id,
+                mode=mode,
+                batch_nodes=batch_config.INGEST_STREAMING_BATCH_NODES,
+                write_mode=write_mode,
+            )
+            job["written_label"] = sanitize_neo4j_label
+            return
 
-            # Store NIEM JSON file in MinIO after successful ingestion
-            await _store_processed_files(s3, content, file.filename, cypher_statements, file_type="json")
+        json_source = job["content"]
+
+        # Convert off the event loop (worker process when a batch payload is given)
+        if mapping_payload is not None:
+            from ..services.conversion_pool import run_conversion
+
+            validate_with = schema_payload if job.pop("validate_in_worker", False) else None
+            if validate_with is not None:
+                logger.info(f"Validating JSON for {filename} in the conversion worker")
+
+            # Raw bytes are cheaper to send to a worker than a pickled document
+            job["cypher"], job["stats"], failure = await run_conversion(
+                _convert_json_in_worker,
+                json_source,
+                mapping_payload,
+                filename,
+                upload_id,
+                schema_id,
+                mode,
+                write_mode,
+                validate_with,
+            )
+            if validate_with is not None:
+                outcome = HTTPException(status_code=failure[0], detail=failure[1]) if failure else None
+                cache_key = job.pop("validation_key", None)
+                if cache_key is not None:
+                    _remember_validation_outcome(cache_key, filename, outcome)
+                if outcome is not None:
+                    raise outcome
+        else:
+            if document is not None:
+                json_source = document
+            job["cypher"], job["stats"] = await asyncio.to_thread(
+                _generate_cypher_from_json, json_source, mapping, filename, upload_id, schema_id, mode, write_mode
+            )
 
-            result = _create_success_result(file.filename, statements_executed, stats)
-            logger.info(f"Successfully ingested {file.filename}: {statements_executed} Cypher statements executed")
-            return result, statements_executed
+        if not job["cypher"]:
+            job["result"] = _create_error_result(filename, "No Cypher statements generated from NIEM JSON")
 
-        except Exception as e:
-            logger.error(f"Failed to execute Cypher for {file.filename}: {e}")
-            return _create_error_result(file.filename, f"Cypher execution failed: {str(e)}"), 0
+    return [
+        PipelineStage("validate", validate, batch_config.INGEST_VALIDATE_CONCURRENCY),
+        PipelineStage("convert", convert, max(batch_config.INGEST_CONVERSION_WORKERS, 1)),
+        *_write_and_archive_stages(neo4j_client, s3, upload_id, "json"),
+    ]
 
-    except HTTPException as e:
-        # HTTPException from validation - extract detail message and validation result
-        if hasattr(e, "detail") and isinstance(e.detail, dict):
-            error_msg = e.detail.get("message", str(e.detail))
-            validation_result = e.detail.get("validation_result")
 
-            # If no validation_result but message indicates validation failure, provide helpful default
-            if not validation_result and "validation" in error_msg.lower():
-                error_msg = (
-                    f"{error_msg}. NIEM JSON validation failed - check that the JSON " f"conforms to the active schema."
-                )
-        else:
-            error_msg = e.detail if hasattr(e, "detail") else str(e)
-            validation_result = None
+async def _process_single_json_file(
+    file: UploadFile,
+    mapping: dict[str, Any],
+    json_schema: dict[str, Any] | None,
+    neo4j_client,
+    s3: Minio,
+    upload_id: str,
+    schema_id: str | None,
+    mode: str = "dynamic",
+    settings=None,
+    mapping_payload=None,
+) -> tuple[dict[str, Any], int]:
+    """Process a single NIEM JSON file through all ingest stages.
 
-            # Provide helpful default message for validation errors
-            if "validation" in error_msg.lower() and not validation_result:
-                error_msg = f"{error_msg}. Check that the NIEM JSON file conforms to the active schema."
+    Args:
+        file: Uploaded file
+        mapping: Schema mapping (can be empty dict if no schema)
+        json_schema: JSON Schema for validation (optional, can be None)
+        neo4j_client: Neo4j client
+        s3: MinIO client
+        upload_id: Unique identifier for this upload batch
+        schema_id: Schema identifier (optional, can be None)
+        mode: Converter mode - "mapping" (use selections) or "dynamic" (all complex elements)
+        settings: Application settings (for validation control)
+        mapping_payload: Batch mapping packed for the conversion pool; when omitted
+            conversion runs in a thread of this process
 
-        logger.error(f"Failed to process file {file.filename}: {error_msg}")
-        return _create_error_result(file.filename, error_msg, validation_result), 0
-    except Exception as e:
-        logger.error(f"Failed to process file {file.filename}: {e}")
-        error_msg = f"{str(e)}. Unexpected error during processing."
-        return _create_error_result(file.filename, error_msg), 0
+    Returns:
+        Tuple of (result_dict, statements_executed)
+    """
+    stages = _json_ingest_stages(
+        mapping, json_schema, neo4j_client, s3, upload_id, schema_id, mode, settings, mapping_payload
+    )
+    results, statements_executed, _ = await _run_ingest_pipeline([file], stages, "json")
+    return results[0], statements_executed
 
 
-async def handle_json_ingest(files: list[UploadFile], s3: Minio, schema_id: str = None) -> dict[str, Any]:
+async def handle_json_ingest(
+    files: list[UploadFile], s3: Minio, schema_id: str = None, progress: Callable | None = None
+) -> dict[str, Any]:
     """Handle NIEM JSON file ingestion to Neo4j using json_to_graph service.
 
     NIEM JSON uses JSON-LD features (@context, @id, @type) with NIEM-specific conventions
@@ -834,6 +2033,15 @@ async def handle_json_ingest(files: list[UploadFile], s3: Minio, schema_id: str
     from XSD by CMF tool) and converted to Cypher using the same mapping as XML.
 
     Schema and JSON schema are optional - uploads can proceed without them when validation is skipped.
+
+    Args:
+        files: Uploaded NIEM JSON files
+        s3: MinIO client
+        schema_id: Schema ID (uses the active schema if not provided)
+        progress: Per-file progress callback for background jobs
+
+    Returns:
+        Batch result with per-file results and stage timings
     """
     logger.info(f"Starting NIEM JSON ingestion for {len(files)} files using json_to_graph service")
 
@@ -844,7 +2052,7 @@ async def handle_json_ingest(files: list[UploadFile], s3: Minio, schema_id: str
 
         neo4j_client_for_settings = get_neo4j_client()
         settings_service = SettingsService(neo4j_client_for_settings)
-        settings = settings_service.get_settings()
+        settings = await asyncio.to_thread(settings_service.get_settings)
         logger.info(f"Settings: skip_xml_validation={settings.skip_xml_validation}, skip_json_validation={settings.skip_json_validation}")
 
         # Step 1: Generate unique upload ID for this ingestion batch
@@ -911,26 +2119,33 @@ async def handle_json_ingest(files: list[UploadFile], s3: Minio, schema_id: str
             logger.info("No schema_id - skipping JSON Schema download")
 
         # Step 6: Process files
-        results = []
-        total_statements_executed = 0
         total_nodes = 0
         total_relationships = 0
 
-        # Initialize Neo4j client
-        neo4j_client = Neo4jClient()
+        # Writes share the process-wide connection pool
+        neo4j_client = get_neo4j_client()
 
-        try:
-            for file in files:
-                result, statements_executed = await _process_single_json_file(
-                    file, mapping, json_schema, neo4j_client, s3, upload_id, schema_id, mode, settings
-                )
-                results.append(result)
-                total_statements_executed += statements_executed
-                total_nodes += result.get("nodes_created", 0)
-                total_relationships += result.get("relationships_created", 0)
+        # Index every label the mapping can produce before the first write, as JSON writes them
+        from ..services.domain.graph import mapping_labels
+        from ..services.domain.json_to_graph import sanitize_neo4j_label
 
-        finally:
-            neo4j_client.driver.close()
+        json_labels = {sanitize_neo4j_label(label) for label in mapping_labels(mapping)}
+        await asyncio.to_thread(_ensure_ingest_indexes, neo4j_client, json_labels)
+
+        # Files flow through validate -> convert -> write -> archive stages concurrently;
+        # the mapping is packed once per batch for the conversion pool
+        from ..services.conversion_pool import pack_mapping
+
+        mapping_payload = pack_mapping(mapping)
+        batch_started = time.perf_counter()
+
+        stages = _json_ingest_stages(
+            mapping, json_schema, neo4j_client, s3, upload_id, schema_id, mode, settings, mapping_payload
+        )
+        results, total_statements_executed, stage_timings = await _run_ingest_pipeline(files, stages, "json", progress)
+        for result in results:
+            total_nodes += result.get("nodes_created", 0)
+            total_relationships += result.get("relationships_created", 0)
 
         return {
             "schema_id": schema_id or "none",
@@ -938,6 +2153,8 @@ async def handle_json_ingest(files: list[UploadFile], s3: Minio, schema_id: str
             "total_nodes_created": total_nodes,
             "total_relationships_created": total_relationships,
             "total_statements_executed": total_statements_executed,
+            "elapsed_seconds": round(time.perf_counter() - batch_started, 4),
+            "stage_timings": stage_timings,
             "results": results,
         }
 
@@ -951,9 +2168,67 @@ async def handle_json_ingest(files: list[UploadFile], s3: Minio, schema_id: str
         raise HTTPException(status_code=500, detail=f"NIEM JSON ingestion failed: {str(e)}") from e
 
 
+def _convert_xml_in_worker(
+    xml_content: str,
+    mapping_payload,
+    filename: str,
+    upload_id: str,
+    schema_id: str,
+    mode: str,
+    write_mode: str,
+) -> tuple[str | list, dict[str, Any]]:
+    """Conversion pool entry point for XML (unpacks the batch mapping once per worker)."""
+    from ..services.conversion_pool import unpack_mapping
+
+    return _generate_cypher_from_xml(
+        xml_content, unpack_mapping(mapping_payload), filename, upload_id, schema_id, mode, write_mode
+    )
+
+
+def _convert_json_in_worker(
+    json_content: str | bytes,
+    mapping_payload,
+    filename: str,
+    upload_id: str,
+    schema_id: str,
+    mode: str,
+    write_mode: str,
+    schema_payload=None,
+) -> tuple[str | list | None, dict[str, Any] | None, tuple[int, Any] | None]:
+    """Conversion pool entry point for NIEM JSON (unpacks the batch mapping once per worker).
+
+    With a schema payload the document is validated first and the document
+    parsed for validation is converted, so each file is parsed once.
+
+    Returns:
+        Tuple of (cypher_statements, stats, validation_failure); validation_failure is
+        (status_code, detail) of the validation HTTPException (which does not pickle)
+    """
+    from ..services.conversion_pool import unpack_mapping
+
+    # Unpack the mapping first, so a worker that has not loaded it fails before validating
+    mapping = unpack_mapping(mapping_payload)
+    if schema_payload is not None:
+        try:
+            json_content = _validate_json_content(json_content, unpack_mapping(schema_payload), filename)
+        except HTTPException as e:
+            return None, None, (e.status_code, e.detail)
+
+    cypher_statements, stats = _generate_cypher_from_json(
+        json_content, mapping, filename, upload_id, schema_id, mode, write_mode
+    )
+    return cypher_statements, stats, None
+
+
 def _generate_cypher_from_xml(
-    xml_content: str, mapping: dict[str, Any], filename: str, upload_id: str, schema_id: str, mode: str = "dynamic"
-) -> tuple[str, dict[str, Any]]:
+    xml_content: str,
+    mapping: dict[str, Any],
+    filename: str,
+    upload_id: str,
+    schema_id: str,
+    mode: str = "dynamic",
+    write_mode: str = "statements",
+) -> tuple[str | list, dict[str, Any]]:
     """
     Generate Cypher statements from XML content using the import_xml_to_cypher service.
 
@@ -964,6 +2239,8 @@ def _generate_cypher_from_xml(
         upload_id: Unique identifier for this upload batch
         schema_id: Schema identifier
         mode: Converter mode - "mapping" (use selections) or "dynamic" (all complex elements)
+        write_mode: "statements" (literal Cypher text), "statement_list" (list of
+            CypherStatement) or "batched" (list of WriteBatch)
 
     Returns:
         Tuple of (cypher_statements, stats)
@@ -973,7 +2250,7 @@ def _generate_cypher_from_xml(
 
         # Generate Cypher statements using in-memory processing (no temporary files needed)
         cypher_statements, nodes, contains, edges = generate_for_xml_content(
-            xml_content, mapping, filename, upload_id, schema_id, mode=mode
+            xml_content, mapping, filename, upload_id, schema_id, mode=mode, write_mode=write_mode
         )
 
         # Create stats dictionary from the returned data
@@ -984,6 +2261,7 @@ def _generate_cypher_from_xml(
             "contains_count": len(contains),
             "reference_edges": len(edges),
             "edges_count": len(edges),
+            "labels": sorted({node[0] for node in nodes.values()}),
         }
 
         logger.info(
@@ -1000,8 +2278,14 @@ def _generate_cypher_from_xml(
 
 
 def _generate_cypher_from_json(
-    json_content: str, mapping: dict[str, Any], filename: str, upload_id: str, schema_id: str, mode: str = "dynamic"
-) -> tuple[str, dict[str, Any]]:
+    json_content: str | bytes | dict[str, Any],
+    mapping: dict[str, Any],
+    filename: str,
+    upload_id: str,
+    schema_id: str,
+    mode: str = "dynamic",
+    write_mode: str = "statements",
+) -> tuple[str | list, dict[str, Any]]:
     """
     Generate Cypher statements from NIEM JSON content using the json_to_graph service.
 
@@ -1009,21 +2293,24 @@ def _generate_cypher_from_json(
     mapping rules as XML to ensure consistent graph structures.
 
     Args:
-        json_content: Raw NIEM JSON content as string
+        json_content: Raw NIEM JSON content (text or bytes), or the document already parsed during
+            validation
         mapping: Mapping dictionary (YAML format, same as XML)
         filename: Source filename for provenance
         upload_id: Unique identifier for this upload batch
         schema_id: Schema identifier
+        mode: Converter mode - "mapping" (use selections) or "dynamic" (all complex elements)
+        write_mode: "statements" (literal Cypher text) or "statement_list" (list of CypherStatement)
 
     Returns:
         Tuple of (cypher_statements, stats)
     """
     try:
-        from ..services.domain.json_to_graph import generate_for_json_content
+        from ..services.domain.json_to_graph import generate_for_json_content, sanitize_neo4j_label
 
         # Generate Cypher statements from NIEM JSON
         cypher_statements, nodes, contains, edges = generate_for_json_content(
-            json_content, mapping, filename, upload_id, schema_id, mode=mode
+            json_content, mapping, filename, upload_id, schema_id, mode=mode, write_mode=write_mode
         )
 
         # Create stats dictionary from the returned data
@@ -1034,6 +2321,8 @@ def _generate_cypher_from_json(
             "contains_count": len(contains),
             "reference_edges": len(edges),
             "edges_count": len(edges),
+            # Labels as written (sanitized), so rollback and index provisioning find the nodes
+            "labels": sorted({sanitize_neo4j_label(node[0]) for node in nodes.values()}),
         }
 
         logger.info(
@@ -1049,6 +2338,131 @@ def _generate_cypher_from_json(
         raise
 
 
+async def _spool_upload(file: UploadFile) -> UploadFile:
+    """Copy an upload into a spooled temporary file that outlives the request.
+
+    Small files stay in memory; larger ones spill to disk.
+    """
+    import shutil
+    import tempfile
+
+    spooled = tempfile.SpooledTemporaryFile(max_size=1024 * 1024)
+    await file.seek(0)
+    await asyncio.to_thread(shutil.copyfileobj, file.file, spooled)
+    spooled.seek(0)
+    return UploadFile(file=spooled, filename=file.filename, headers=file.headers)
+
+
+async def handle_submit_ingest_job(
+    files: list[UploadFile], s3: Minio, schema_id: str = None, file_type: str = "xml"
+) -> dict[str, Any]:
+    """Queue an ingest batch as a background job and return immediately.
+
+    The uploads are copied first because the request's files are closed once
+    the response is sent.
+
+    Args:
+        files: Uploaded XML or NIEM JSON files
+        s3: MinIO client
+        schema_id: Schema ID (uses the active schema if not provided)
+        file_type: "xml" or "json"
+
+    Returns:
+        Job ID, status and the URLs for progress
+    """
+    from ..services.ingest_jobs import submit_ingest_job
+
+    uploads = [await _spool_upload(file) for file in files]
+    handler = handle_xml_ingest if file_type == "xml" else handle_json_ingest
+
+    async def run(progress: Callable) -> dict[str, Any]:
+        return await handler(uploads, s3, schema_id, progress=progress)
+
+    async def cleanup() -> None:
+        for upload in uploads:
+            await upload.close()
+
+    job = submit_ingest_job(file_type, [file.filename for file in files], run, schema_id, cleanup)
+    return {
+        "job_id": job.job_id,
+        "status": job.status,
+        "files_total": len(files),
+        "status_url": f"/api/ingest/jobs/{job.job_id}",
+        "events_url": f"/api/ingest/jobs/{job.job_id}/events",
+    }
+
+
+def _require_ingest_job(job_id: str):
+    from ..services.ingest_jobs import get_ingest_job
+
+    job = get_ingest_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Ingest job not found: {job_id}")
+    return job
+
+
+def handle_get_ingest_job(job_id: str) -> dict[str, Any]:
+    """Get the status of a background ingest job.
+
+    Args:
+        job_id: Job ID returned on submission
+
+    Returns:
+        Job status with per-file stage, status and timings (and the result once completed)
+
+    Raises:
+        HTTPException: If the job does not exist (or is no longer retained)
+    """
+    return _require_ingest_job(job_id).snapshot()
+
+
+def handle_list_ingest_jobs() -> dict[str, Any]:
+    """List retained background ingest jobs, newest first (without per-file results)."""
+    from ..services.ingest_jobs import list_ingest_jobs
+
+    jobs = [job.snapshot(include_result=False) for job in reversed(list_ingest_jobs())]
+    for job in jobs:
+        del job["files"]
+    return {"jobs": jobs}
+
+
+def handle_ingest_job_events(job_id: str, keepalive_seconds: float = 15.0) -> AsyncIterator[str]:
+    """Stream a background ingest job's progress as server-sent events.
+
+    A ``progress`` event is sent whenever the job changed (changes are
+    coalesced), a comment line keeps idle connections open, and a final
+    ``done`` event carries the complete status including the result.
+
+    Args:
+        job_id: Job ID returned on submission
+        keepalive_seconds: Idle seconds between keep-alive comments
+
+    Returns:
+        Async iterator of event-stream chunks
+
+    Raises:
+        HTTPException: If the job does not exist
+    """
+    import json
+
+    job = _require_ingest_job(job_id)
+
+    async def events() -> AsyncIterator[str]:
+        version = -1
+        while True:
+            if job.version != version:
+                version = job.version
+                if job.finished:
+                    yield f"event: done\nid: {version}\ndata: {json.dumps(job.snapshot(), default=str)}\n\n"
+                    return
+                snapshot = json.dumps(job.snapshot(include_result=False), default=str)
+                yield f"event: progress\nid: {version}\ndata: {snapshot}\n\n"
+            if not await job.wait_for_change(version, keepalive_seconds):
+                yield ": keep-alive\n\n"
+
+    return events()
+
+
 async def handle_get_uploaded_files(s3: Minio) -> dict[str, Any]:
     """Get list of uploaded data files
 
@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 
+import asyncio
 import hashlib
 import json
 import logging
 import os
+import time
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -16,15 +18,18 @@ from minio.error import S3Error
 # Use defusedxml for secure XML parsing (prevents XXE attacks)
 import defusedxml.ElementTree as ET
 
-from ..clients.s3_client import download_file, upload_file
+from ..clients.s3_client import download_file, download_many, upload_file, upload_many
 from ..clients.scheval_client import is_scheval_available
+from ..core.config import batch_config
 from ..models.models import SchevalIssue, SchevalReport, SchemaResponse
+from ..services.cmf_cache import get_cached_conversion, put_conversion, resolved_schema_set_hash
 from ..services.cmf_tool import (
     convert_cmf_to_jsonschema,
     convert_xsd_to_cmf,
     is_cmf_available,
 )
 from ..services.domain.schema.scheval_validator import SchevalValidator
+from ..services.ndr_cache import get_cached_ndr_results, ndr_cache_key, ndr_rules_version, put_ndr_results
 
 logger = logging.getLogger(__name__)
 
@@ -413,7 +418,60 @@ async def _validate_and_read_files(
     return file_contents, file_path_map, primary_file, schema_id
 
 
-async def _validate_all_scheval(file_contents: dict[str, bytes]) -> SchevalReport:
+async def _scheval_file(
+    scheval_validator: SchevalValidator, filename: str, content: bytes, xslt_path: Path, slots: asyncio.Semaphore
+) -> dict[str, Any]:
+    """Run NDR schematron validation on one schema file.
+
+    Args:
+        scheval_validator: Validator running the scheval tool
+        filename: Uploaded filename (for logging and tool failures)
+        content: File content
+        xslt_path: Pre-compiled schematron XSLT for the conformance target
+        slots: Semaphore bounding concurrent scheval runs
+
+    Returns:
+        Dictionary with the file's errors and warnings as reported by scheval,
+        whether it failed, and whether the result is definitive (cacheable)
+    """
+    async with slots:
+        logger.info(f"Validating {filename} with scheval using {xslt_path.name}")
+        try:
+            scheval_result = await scheval_validator.validate_xsd_with_schematron(
+                content.decode(), str(xslt_path), use_compiled_xslt=True
+            )
+        except Exception as e:
+            logger.error(f"Failed to validate {filename} with scheval: {e}")
+            error = {
+                "file": filename,
+                "line": 1,
+                "column": 1,
+                "message": f"Scheval validation failed: {str(e)}",
+                "severity": "error",
+                "rule": None,
+            }
+            return {"errors": [error], "warnings": [], "failed": True, "cacheable": False}
+
+    return {
+        "errors": scheval_result.get("errors", []),
+        "warnings": scheval_result.get("warnings", []),
+        "failed": scheval_result["status"] == "fail",
+        "cacheable": scheval_result["status"] in ("pass", "fail"),
+    }
+
+
+def _with_file_context(issues: list[dict[str, Any]], filename: str) -> list[dict[str, Any]]:
+    """Report issues against the uploaded filename (the tool only sees the temp filename)."""
+    with_context = []
+    for issue in issues:
+        issue = issue.copy()
+        if issue["file"] in ["schema.xsd", "instance.xml"]:
+            issue["file"] = filename
+        with_context.append(issue)
+    return with_context
+
+
+async def _validate_all_scheval(file_contents: dict[str, bytes], s3: Minio | None = None) -> SchevalReport:
     """Validate all files using schematron rules via scheval tool.
 
     This is the primary NIEM NDR validation method, providing actionable validation
@@ -421,6 +479,7 @@ async def _validate_all_scheval(file_contents: dict[str, bytes]) -> SchevalRepor
 
     Args:
         file_contents: Dictionary mapping filename to file content
+        s3: MinIO client holding the NDR result cache (None = validate every file)
 
     Returns:
         Aggregated scheval validation report with line/column information
@@ -475,59 +534,51 @@ async def _validate_all_scheval(file_contents: dict[str, bytes]) -> SchevalRepor
             metadata={"xslt_path": str(xslt_path), "xslt_found": False},
         )
 
+    # Files validated before (same content, target and NDR rules) reuse their cached issues
+    rules_version = ndr_rules_version(xslt_path)
+    cache_keys = {
+        filename: ndr_cache_key(content, xslt_path, rules_version) for filename, content in file_contents.items()
+    }
+    file_results = await get_cached_ndr_results(s3, list(set(cache_keys.values()))) if s3 is not None else {}
+    cached_count = sum(1 for key in cache_keys.values() if key in file_results)
+
+    # Each remaining file (identical files once) is a separate scheval run;
+    # run them concurrently up to the configured limit
+    pending = {}
+    for filename, key in cache_keys.items():
+        if key not in file_results and key not in pending:
+            pending[key] = filename
     scheval_validator = SchevalValidator()
+    slots = asyncio.Semaphore(max(batch_config.SCHEVAL_CONCURRENCY, 1))
+    fresh_results = await asyncio.gather(
+        *(
+            _scheval_file(scheval_validator, filename, file_contents[filename], xslt_path, slots)
+            for filename in pending.values()
+        )
+    )
+    for key, result in zip(pending, fresh_results, strict=False):
+        file_results[key] = result
+    if s3 is not None:
+        await put_ndr_results(
+            s3,
+            {
+                key: {name: result[name] for name in ("errors", "warnings", "failed")}
+                for key, result in zip(pending, fresh_results, strict=False)
+                if result["cacheable"]
+            },
+        )
 
-    # Aggregate results across all files
+    # Aggregate results across all files (in upload order)
     all_errors = []
     all_warnings = []
-    total_error_count = 0
-    total_warning_count = 0
     has_failures = False
-
-    # Validate each file
-    for filename, content in file_contents.items():
-        logger.info(f"Validating {filename} with scheval using {xslt_filename}")
-        try:
-            scheval_result = await scheval_validator.validate_xsd_with_schematron(
-                content.decode(), str(xslt_path), use_compiled_xslt=True
-            )
-
-            # Track overall status
-            if scheval_result["status"] == "fail":
-                has_failures = True
-
-            # Add file context to errors and warnings
-            for error in scheval_result.get("errors", []):
-                error_with_context = error.copy()
-                # Update file field if it's just the temp filename
-                if error_with_context["file"] in ["schema.xsd", "instance.xml"]:
-                    error_with_context["file"] = filename
-                all_errors.append(error_with_context)
-                total_error_count += 1
-
-            for warning in scheval_result.get("warnings", []):
-                warning_with_context = warning.copy()
-                # Update file field if it's just the temp filename
-                if warning_with_context["file"] in ["schema.xsd", "instance.xml"]:
-                    warning_with_context["file"] = filename
-                all_warnings.append(warning_with_context)
-                total_warning_count += 1
-
-        except Exception as e:
-            logger.error(f"Failed to validate {filename} with scheval: {e}")
-            has_failures = True
-            # Add error for failed validation
-            all_errors.append(
-                {
-                    "file": filename,
-                    "line": 1,
-                    "column": 1,
-                    "message": f"Scheval validation failed: {str(e)}",
-                    "severity": "error",
-                    "rule": None,
-                }
-            )
-            total_error_count += 1
+    for filename, key in cache_keys.items():
+        result = file_results[key]
+        all_errors.extend(_with_file_context(result["errors"], filename))
+        all_warnings.extend(_with_file_context(result["warnings"], filename))
+        has_failures = has_failures or result["failed"]
+    total_error_count = len(all_errors)
+    total_warning_count = len(all_warnings)
 
     # Determine overall status
     if has_failures or total_error_count > 0:
@@ -566,22 +617,34 @@ async def _validate_all_scheval(file_contents: dict[str, bytes]) -> SchevalRepor
             "warning_count": total_warning_count,
             "files_validated": len(file_contents),
         },
-        metadata={"schema_type": schema_type, "xslt_file": xslt_filename, "validation_tool": "scheval"},
+        metadata={
+            "schema_type": schema_type,
+            "xslt_file": xslt_filename,
+            "validation_tool": "scheval",
+            "files_from_cache": cached_count,
+        },
     )
 
     return scheval_report
 
 
 async def _convert_to_cmf(
-    file_contents: dict[str, bytes], file_path_map: dict[str, str], primary_file: UploadFile, primary_content: bytes
+    file_contents: dict[str, bytes],
+    file_path_map: dict[str, str],
+    primary_file: UploadFile,
+    primary_content: bytes,
+    s3: Minio | None = None,
 ) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
     """Convert XSD to CMF and optionally to JSON Schema.
 
+    A resolved schema set converted before is served from the conversion cache.
+
     Args:
         file_contents: Dictionary of filename to file content
         file_path_map: Dictionary of filename to relative path
         primary_file: Primary uploaded file
         primary_content: Primary file content
+        s3: MinIO client holding the conversion cache (None = always convert)
 
     Returns:
         Tuple of (cmf_conversion_result, json_schema_conversion_result)
@@ -639,6 +702,30 @@ async def _convert_to_cmf(
 
             logger.info("All dependencies satisfied, proceeding with CMF conversion")
 
+            # The same resolved schema set converted before: skip both cmftool runs
+            schema_set_hash = resolved_schema_set_hash(resolved_temp_path, primary_file_path)
+            cached = await get_cached_conversion(s3, schema_set_hash) if s3 is not None else None
+            if cached is not None:
+                cmf_content, json_schema = cached
+                logger.info(f"Using cached CMF and JSON Schema conversion of schema set {schema_set_hash[:12]}")
+                cache_metadata = {"converter": "cmftool", "conversion_time": time.time(), "cache_hit": True}
+                cmf_conversion_result = {
+                    "status": "success",
+                    "cmf_content": cmf_content,
+                    "metadata": {
+                        **cache_metadata,
+                        "resolved_schemas_count": len(list(resolved_temp_path.rglob("*.xsd"))),
+                    },
+                    "dependency_report": dependency_report,
+                    "import_validation_report": dependency_report.get("import_validation_report"),
+                }
+                json_schema_conversion_result: dict[str, Any] | None = {
+                    "status": "success",
+                    "jsonschema": json_schema,
+                    "metadata": cache_metadata,
+                }
+                return cmf_conversion_result, json_schema_conversion_result
+
             # Convert XSD to CMF using resolved temp path with primary file's relative path
             cmf_conversion_result = convert_xsd_to_cmf(resolved_temp_path, primary_file_path)
 
@@ -682,6 +769,10 @@ async def _convert_to_cmf(
                 # Create error result structure
                 json_schema_conversion_result = {"status": "error", "error": str(e), "details": []}
 
+            if s3 is not None and json_schema_conversion_result.get("status") == "success":
+                cmf_content = cmf_conversion_result["cmf_content"]
+                await put_conversion(s3, schema_set_hash, cmf_content, json_schema_conversion_result["jsonschema"])
+
             return cmf_conversion_result, json_schema_conversion_result
 
         finally:
@@ -716,13 +807,14 @@ async def _store_schema_files(
         cmf_conversion_result: CMF conversion result
         json_schema_conversion_result: JSON Schema conversion result
     """
-    # Store all original XSD files in MinIO WITH directory structure
-    for filename, content in file_contents.items():
-        # Use the relative path to preserve directory structure
-        relative_path = file_path_map.get(filename, filename)
-        object_path = f"{schema_id}/source/{relative_path}"
-        await upload_file(s3, "niem-schemas", object_path, content, "application/xml")
-        logger.info(f"Stored schema file: {object_path}")
+    # Store all original XSD files in MinIO WITH directory structure (uploaded concurrently)
+    # Use the relative path to preserve directory structure
+    source_objects = [
+        (f"{schema_id}/source/{file_path_map.get(filename, filename)}", content, "application/xml")
+        for filename, content in file_contents.items()
+    ]
+    await upload_many(s3, "niem-schemas", source_objects)
+    logger.info(f"Stored {len(source_objects)} schema files under {schema_id}/source/")
 
     # Extract base name from primary filename (remove path and .xsd extension)
     # Handle both forward slashes (Unix/Mac) and backslashes (Windows)
@@ -859,13 +951,13 @@ async def handle_schema_upload(
         # Note: scheval runs the NIEM NDR schematron rules and provides detailed error reporting
         scheval_report = None
         if not skip_niem_ndr:
-            scheval_report = await _validate_all_scheval(file_contents)
+            scheval_report = await _validate_all_scheval(file_contents, s3)
         else:
             logger.info("Skipping NIEM NDR validation as requested")
 
         # Step 3: Convert to CMF and JSON Schema
         cmf_conversion_result, json_schema_conversion_result = await _convert_to_cmf(
-            file_contents, file_path_map, primary_file, primary_content
+            file_contents, file_path_map, primary_file, primary_content, s3
         )
 
         # Step 3.5: Check all validations and fail with combined reports if any failed
@@ -1113,6 +1205,25 @@ async def handle_schema_file_download(schema_id: str, file_type: str, s3: Minio)
         raise HTTPException(status_code=404, detail=f"{file_type.upper()} file not found in storage") from e
 
 
+async def _download_source_files(s3: Minio, schema_id: str, filenames: list[str]) -> dict[str, bytes]:
+    """Download a schema's source XSD files concurrently.
+
+    Args:
+        s3: MinIO client
+        schema_id: Schema ID
+        filenames: Source file paths relative to the schema's source/ folder
+
+    Returns:
+        Dictionary of filename -> XSD content
+
+    Raises:
+        S3Error: If any file cannot be downloaded
+    """
+    prefix = f"{schema_id}/source/"
+    contents = await download_many(s3, "niem-schemas", [prefix + filename for filename in filenames])
+    return {filename: contents[prefix + filename] for filename in filenames}
+
+
 async def handle_get_element_tree(schema_id: str, s3: Minio):
     """Get element tree structure for graph schema design.
 
@@ -1143,14 +1254,8 @@ async def handle_get_element_tree(schema_id: str, s3: Minio):
         )
 
     # Download all source XSD files from MinIO
-    from ..clients.s3_client import download_file
-
-    xsd_files = {}
     try:
-        for filename in all_filenames:
-            object_path = f"{schema_id}/source/{filename}"
-            content = await download_file(s3, "niem-schemas", object_path)
-            xsd_files[filename] = content
+        xsd_files = await _download_source_files(s3, schema_id, all_filenames)
     except S3Error as e:
         logger.error(f"Failed to download XSD files for schema {schema_id}: {e}")
         raise HTTPException(status_code=404, detail="XSD files not found in storage") from e
@@ -1203,12 +1308,8 @@ async def handle_apply_schema_design(schema_id: str, selections: dict[str, bool]
         raise HTTPException(status_code=404, detail="No source XSD files found for validation")
 
     # Download XSD files for element tree
-    xsd_files = {}
     try:
-        for filename in all_filenames:
-            object_path = f"{schema_id}/source/{filename}"
-            content = await download_file(s3, "niem-schemas", object_path)
-            xsd_files[filename] = content
+        xsd_files = await _download_source_files(s3, schema_id, all_filenames)
     except S3Error as e:
         logger.error(f"Failed to download XSD files for schema {schema_id}: {e}")
         raise HTTPException(status_code=404, detail="XSD files not found in storage") from e
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+import asyncio
 import logging
 import os
 import time
@@ -9,7 +10,7 @@ from typing import List
 from dotenv import load_dotenv
 from fastapi import Depends, FastAPI, File, Form, HTTPException, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
-from neo4j import GraphDatabase
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from .core.auth import verify_token
 from .core.dependencies import get_s3_client
@@ -41,6 +42,17 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down NIEM API service")
 
+    from .clients.tool_worker import shutdown_tool_workers
+    from .core.dependencies import cleanup_async_connections, cleanup_connections
+    from .services.conversion_pool import shutdown_conversion_pool
+    from .services.ingest_jobs import shutdown_ingest_jobs
+
+    await shutdown_ingest_jobs()
+    shutdown_conversion_pool()
+    shutdown_tool_workers()
+    cleanup_connections()
+    await cleanup_async_connections()
+
 
 async def startup_tasks():
     """Initialize external services"""
@@ -167,15 +179,12 @@ async def readiness_check():
         s3_client = get_s3_client()
         list(s3_client.list_buckets())
 
-        # Quick Neo4j connectivity test
-        neo4j_uri = getenv_clean("NEO4J_URI", "bolt://localhost:7687")
-        neo4j_user = getenv_clean("NEO4J_USER", "neo4j")
-        neo4j_password = getenv_clean("NEO4J_PASSWORD", "password")
+        # Quick Neo4j connectivity test on the shared async driver; bounded so a
+        # saturated pool reports not ready instead of holding the probe open
+        from .core.config import neo4j_config
+        from .core.dependencies import get_async_neo4j_client
 
-        driver = GraphDatabase.driver(neo4j_uri, auth=(neo4j_user, neo4j_password))
-        with driver.session() as session:
-            session.run("RETURN 1").single()
-        driver.close()
+        await asyncio.wait_for(get_async_neo4j_client().query("RETURN 1"), timeout=neo4j_config.READINESS_TIMEOUT)
 
         return {"status": "ready"}
 
@@ -315,12 +324,20 @@ async def get_schema_selections(schema_id: str, s3=Depends(get_s3_client)):
 async def ingest_xml(
     files: list[UploadFile] = File(...),
     schema_id: str = Form(None),  # Optional schema selection
+    background: bool = Form(False),  # Return a job ID immediately instead of waiting
     token: str = Depends(verify_token),
     s3=Depends(get_s3_client),
 ):
-    """Ingest XML files directly to Neo4j"""
-    from .handlers.ingest import handle_xml_ingest
+    """Ingest XML files directly to Neo4j.
 
+    With background=true the batch runs as a background job: the response
+    (202) carries the job ID, and progress is available from
+    /api/ingest/jobs/{job_id} and its /events stream.
+    """
+    from .handlers.ingest import handle_submit_ingest_job, handle_xml_ingest
+
+    if background:
+        return JSONResponse(status_code=202, content=await handle_submit_ingest_job(files, s3, schema_id, "xml"))
     return await handle_xml_ingest(files, s3, schema_id)
 
 
@@ -328,6 +345,7 @@ async def ingest_xml(
 async def ingest_json(
     files: list[UploadFile] = File(...),
     schema_id: str = Form(None),  # Optional schema selection
+    background: bool = Form(False),  # Return a job ID immediately instead of waiting
     token: str = Depends(verify_token),
     s3=Depends(get_s3_client),
 ):
@@ -335,12 +353,43 @@ async def ingest_json(
 
     NIEM JSON uses JSON-LD features (@context, @id, @type) with NIEM-specific conventions.
     Files are validated against JSON Schema and converted to graph using the same mapping as XML.
+    With background=true the batch runs as a background job (see /api/ingest/xml).
     """
-    from .handlers.ingest import handle_json_ingest
+    from .handlers.ingest import handle_json_ingest, handle_submit_ingest_job
 
+    if background:
+        return JSONResponse(status_code=202, content=await handle_submit_ingest_job(files, s3, schema_id, "json"))
     return await handle_json_ingest(files, s3, schema_id)
 
 
+@app.get("/api/ingest/jobs")
+async def list_ingest_jobs(token: str = Depends(verify_token)):
+    """List background ingest jobs, newest first"""
+    from .handlers.ingest import handle_list_ingest_jobs
+
+    return handle_list_ingest_jobs()
+
+
+@app.get("/api/ingest/jobs/{job_id}")
+async def get_ingest_job(job_id: str, token: str = Depends(verify_token)):
+    """Get a background ingest job's status, per-file progress and (once completed) result"""
+    from .handlers.ingest import handle_get_ingest_job
+
+    return handle_get_ingest_job(job_id)
+
+
+@app.get("/api/ingest/jobs/{job_id}/events")
+async def stream_ingest_job_events(job_id: str, token: str = Depends(verify_token)):
+    """Stream a background ingest job's progress as server-sent events"""
+    from .handlers.ingest import handle_ingest_job_events
+
+    return StreamingResponse(
+        handle_ingest_job_events(job_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.get("/api/ingest/files")
 async def get_uploaded_files(token: str = Depends(verify_token), s3=Depends(get_s3_client)):
     """Get list of uploaded data files"""
@@ -408,15 +457,16 @@ async def reset_system(request: ResetRequest, token: str = Depends(verify_token)
     """Reset system components"""
     from .handlers.admin import handle_reset
 
-    return handle_reset(request, s3)
+    # Reset is blocking (MinIO, sync Neo4j writes, Senzing), so it runs off the event loop
+    return await asyncio.to_thread(handle_reset, request, s3)
 
 
 @app.get("/api/admin/neo4j/stats")
 async def get_neo4j_stats(token: str = Depends(verify_token)):
     """Get Neo4j database statistics"""
-    from .handlers.admin import count_neo4j_objects
+    from .handlers.admin import count_neo4j_objects_async
 
-    return count_neo4j_objects()
+    return await count_neo4j_objects_async()
 
 
 # Settings Routes
@@ -426,12 +476,11 @@ async def get_neo4j_stats(token: str = Depends(verify_token)):
 async def get_settings():
     """Get current application settings"""
     from .services.settings_service import SettingsService
-    from .core.dependencies import get_neo4j_client
+    from .core.dependencies import get_async_neo4j_client
 
-    neo4j_client = get_neo4j_client()
-    settings_service = SettingsService(neo4j_client)
+    settings_service = SettingsService(get_async_neo4j_client())
 
-    return settings_service.get_settings()
+    return await settings_service.get_settings_async()
 
 
 @app.put("/api/settings", response_model=Settings)
@@ -443,7 +492,7 @@ async def update_settings(settings: Settings):
     neo4j_client = get_neo4j_client()
     settings_service = SettingsService(neo4j_client)
 
-    return settings_service.update_settings(settings)
+    return await asyncio.to_thread(settings_service.update_settings, settings)
 
 
 @app.post("/api/graph/query")
@@ -454,7 +503,7 @@ async def execute_graph_query(request: dict, token: str = Depends(verify_token))
     cypher_query = request.get("query")
     limit = request.get("limit")  # None if not provided
 
-    return execute_cypher_query(cypher_query, limit)
+    return await execute_cypher_query(cypher_query, limit)
 
 
 @app.get("/api/graph/full")
@@ -467,7 +516,7 @@ async def get_full_graph(limit: int = 500, include_resolved: bool = False, token
     """
     from .handlers.graph import get_full_graph
 
-    return get_full_graph(limit, include_resolved)
+    return await get_full_graph(limit, include_resolved)
 
 
 # Entity Resolution Routes
@@ -489,7 +538,7 @@ async def run_entity_resolution(request: EntityResolutionRequest, token: str = D
     if not request.selectedNodeTypes:
         raise HTTPException(status_code=400, detail="selectedNodeTypes is required and cannot be empty")
 
-    return handle_run_entity_resolution(request.selectedNodeTypes)
+    return await asyncio.to_thread(handle_run_entity_resolution, request.selectedNodeTypes)
 
 
 @app.get("/api/entity-resolution/node-types")
@@ -501,7 +550,7 @@ async def get_available_node_types(token: str = Depends(verify_token)):
     """
     from .handlers.entity_resolution import handle_get_available_node_types
 
-    return handle_get_available_node_types()
+    return await asyncio.to_thread(handle_get_available_node_types)
 
 
 @app.get("/api/entity-resolution/status")
@@ -509,7 +558,7 @@ async def get_entity_resolution_status(token: str = Depends(verify_token)):
     """Get current entity resolution statistics"""
     from .handlers.entity_resolution import handle_get_resolution_status
 
-    return handle_get_resolution_status()
+    return await asyncio.to_thread(handle_get_resolution_status)
 
 
 @app.delete("/api/entity-resolution/reset")
@@ -517,7 +566,7 @@ async def reset_entity_resolution(token: str = Depends(verify_token)):
     """Reset entity resolution by removing all ResolvedEntity nodes"""
     from .handlers.entity_resolution import handle_reset_entity_resolution
 
-    return handle_reset_entity_resolution()
+    return await asyncio.to_thread(handle_reset_entity_resolution)
 
 
 @app.get("/api/entity-resolution/health")
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Cache of XSD to CMF and JSON Schema conversions keyed by the resolved schema set.
+
+Schema upload converts the resolved schema set with ``cmftool x2m`` and then
+``m2jmsg``, two JVM runs that dominate upload time. The output only depends
+on the schema files, their paths and the converter, so a re-upload of the
+same set (e.g. under a new schema ID after a metadata-only change) reuses
+the CMF and JSON Schema stored in MinIO under the hash of the set.
+
+The hash covers every file of the resolved directory (relative path and
+content), the primary file path, the cmftool release and CONVERSION_VERSION.
+Only successful conversions are cached, and cache reads and writes never
+fail an upload.
+"""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+from minio import Minio
+
+from ..clients.cmf_client import CMF_TOOL_PATH
+from ..clients.s3_client import download_if_exists, upload_many
+from ..core.config import batch_config
+from .ndr_cache import CACHE_BUCKET
+
+logger = logging.getLogger(__name__)
+
+CMF_CACHE_PREFIX = "cmf"
+
+# Bump when the stored output changes for the same input (e.g. JSON Schema post-processing)
+CONVERSION_VERSION = "1"
+
+
+def resolved_schema_set_hash(resolved_dir: Path, primary_path: str) -> str:
+    """Hash a resolved schema set as the CMF conversion sees it.
+
+    Args:
+        resolved_dir: Resolved directory holding every schema of the set
+        primary_path: Primary schema path relative to resolved_dir
+
+    Returns:
+        SHA-256 hex digest of the set
+    """
+    converter = Path(CMF_TOOL_PATH).parent.parent.name if CMF_TOOL_PATH else "cmftool"
+    primary_path = primary_path.replace("\\", "/")
+    digest = hashlib.sha256(f"{converter}\0{CONVERSION_VERSION}\0{primary_path}\0".encode())
+
+    files = {file.relative_to(resolved_dir).as_posix(): file for file in resolved_dir.rglob("*") if file.is_file()}
+    for rel_path in sorted(files):
+        content = files[rel_path].read_bytes()
+        # Length-prefixed so no two different sets produce the same byte stream
+        digest.update(f"{rel_path}\0{len(content)}\0".encode())
+        digest.update(content)
+    return digest.hexdigest()
+
+
+def _object_names(set_hash: str) -> tuple[str, str]:
+    return f"{CMF_CACHE_PREFIX}/{set_hash}/model.cmf", f"{CMF_CACHE_PREFIX}/{set_hash}/schema.json"
+
+
+async def get_cached_conversion(s3: Minio, set_hash: str) -> tuple[str, dict[str, Any]] | None:
+    """Fetch the cached conversion of a resolved schema set.
+
+    Args:
+        s3: MinIO client
+        set_hash: Hash from resolved_schema_set_hash
+
+    Returns:
+        (CMF content, JSON Schema) or None on a cache miss
+    """
+    if not batch_config.CMF_CACHE_ENABLED:
+        return None
+
+    cmf_name, json_name = _object_names(set_hash)
+    try:
+        cmf_content = await download_if_exists(s3, CACHE_BUCKET, cmf_name)
+        json_content = await download_if_exists(s3, CACHE_BUCKET, json_name) if cmf_content is not None else None
+    except Exception as e:
+        logger.warning(f"Could not read cached CMF conversion {set_hash}: {e}")
+        return None
+    if cmf_content is None or json_content is None:
+        return None
+    return cmf_content.decode("utf-8"), json.loads(json_content)
+
+
+async def put_conversion(s3: Minio, set_hash: str, cmf_content: str, json_schema: dict[str, Any]) -> None:
+    """Store the conversion of a resolved schema set.
+
+    Args:
+        s3: MinIO client
+        set_hash: Hash from resolved_schema_set_hash
+        cmf_content: CMF produced by cmftool x2m
+        json_schema: JSON Schema produced by cmftool m2jmsg (post-processed)
+    """
+    if not batch_config.CMF_CACHE_ENABLED:
+        return
+
+    cmf_name, json_name = _object_names(set_hash)
+    try:
+        await upload_many(
+            s3,
+            CACHE_BUCKET,
+            [
+                (cmf_name, cmf_content.encode("utf-8"), "application/xml"),
+                (json_name, json.dumps(json_schema).encode("utf-8"), "application/json"),
+            ],
+        )
+    except Exception as e:
+        logger.warning(f"Could not cache CMF conversion {set_hash}: {e}")
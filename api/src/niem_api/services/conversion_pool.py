@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""Process pool for CPU-bound instance conversion during ingest.
+
+XML/JSON to Cypher conversion is pure Python and holds the GIL, so running it
+on the event loop stalls every other request while a batch converts. Ingest
+handlers submit conversion to a shared ProcessPoolExecutor instead, sized by
+``INGEST_CONVERSION_WORKERS`` (0 runs conversion in a thread of the API
+process instead).
+
+The mapping is serialized once per batch (``pack_mapping``). Tasks carry only
+its content hash: a worker that has not seen the mapping yet fails the task
+with ``MappingNotLoadedError`` and ``run_conversion`` resubmits it once with the
+pickled mapping, so each worker receives and unpickles a mapping once and
+files after the first reuse the worker's compiled mapping plan.
+"""
+
+import asyncio
+import hashlib
+import logging
+import multiprocessing
+import pickle
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, replace
+from typing import Any
+
+from ..core.config import batch_config
+
+logger = logging.getLogger(__name__)
+
+# Mappings unpickled in this (worker) process, keyed by content hash
+_WORKER_MAPPING_CACHE_SIZE = 4
+_worker_mappings: OrderedDict[str, dict[str, Any]] = OrderedDict()
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class MappingPayload:
+    """A mapping serialized once for shipping to worker processes.
+
+    Attributes:
+        key: Content hash of the serialized mapping
+        data: Pickled mapping dictionary (None in the key-only form sent with tasks)
+    """
+
+    key: str
+    data: bytes | None
+
+
+class MappingNotLoadedError(LookupError):
+    """Raised in a worker given a key-only payload for a mapping it has not loaded."""
+
+
+def pack_mapping(mapping: dict[str, Any]) -> MappingPayload:
+    """Serialize a mapping for the conversion workers.
+
+    Args:
+        mapping: Mapping dictionary shared by the batch
+
+    Returns:
+        MappingPayload to pass with every conversion task in the batch
+    """
+    data = pickle.dumps(mapping, protocol=pickle.HIGHEST_PROTOCOL)
+    # SHA1 used as a cache key only, not cryptographic security
+    return MappingPayload(key=hashlib.sha1(data, usedforsecurity=False).hexdigest(), data=data)
+
+
+def unpack_mapping(payload: MappingPayload) -> dict[str, Any]:
+    """Return the mapping for a payload, unpickling it once per process.
+
+    Returning the same dictionary object for the same payload lets the
+    converters reuse their cached mapping plan across files.
+
+    Args:
+        payload: Payload created by pack_mapping, or its key-only form
+
+    Returns:
+        Mapping dictionary
+
+    Raises:
+        MappingNotLoadedError: If the payload is key-only and this process does not have the mapping
+    """
+    mapping = _worker_mappings.get(payload.key)
+    if mapping is None:
+        if payload.data is None:
+            raise MappingNotLoadedError(payload.key)
+        mapping = pickle.loads(payload.data)  # noqa: S301 - pickled by the API process itself
+        _worker_mappings[payload.key] = mapping
+        while len(_worker_mappings) > _WORKER_MAPPING_CACHE_SIZE:
+            _worker_mappings.popitem(last=False)
+    else:
+        _worker_mappings.move_to_end(payload.key)
+    return mapping
+
+
+def get_conversion_pool() -> ProcessPoolExecutor | None:
+    """Get or create the shared conversion pool.
+
+    Returns:
+        The process pool, or None when INGEST_CONVERSION_WORKERS is 0
+    """
+    global _pool
+    if batch_config.INGEST_CONVERSION_WORKERS < 1:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            # Spawn avoids forking the API process with live driver/HTTP threads
+            _pool = ProcessPoolExecutor(
+                max_workers=batch_config.INGEST_CONVERSION_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            logger.info(f"Started conversion pool with {batch_config.INGEST_CONVERSION_WORKERS} workers")
+        return _pool
+
+
+async def run_conversion(fn: Callable[..., Any], *args: Any) -> Any:
+    """Run a conversion function off the event loop.
+
+    MappingPayload arguments are sent to the worker as their key only; if the
+    worker has not loaded the mapping yet, the task is resubmitted once with
+    the full payloads.
+
+    Args:
+        fn: Module-level (picklable) function to call
+        *args: Picklable positional arguments
+
+    Returns:
+        The function's return value
+    """
+    pool = get_conversion_pool()
+    if pool is None:
+        return await asyncio.to_thread(fn, *args)
+
+    loop = asyncio.get_running_loop()
+    key_only_args = [replace(arg, data=None) if isinstance(arg, MappingPayload) else arg for arg in args]
+    try:
+        try:
+            return await loop.run_in_executor(pool, fn, *key_only_args)
+        except MappingNotLoadedError:
+            return await loop.run_in_executor(pool, fn, *args)
+    except BrokenProcessPool:
+        # A worker died (e.g. OOM on a huge document); start a fresh pool for later tasks
+        logger.error("Conversion pool broken, restarting it")
+        shutdown_conversion_pool(wait=False)
+        raise
+
+
+def shutdown_conversion_pool(wait: bool = True) -> None:
+    """Shut down the shared conversion pool (application shutdown).
+
+    Args:
+        wait: Wait for running conversions to finish
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=wait, cancel_futures=not wait)
+            _pool = None
@@ -5,8 +5,18 @@ Handles Neo4j graph database schema management:
 - Schema configuration from mappings
 - Index and constraint management
 - Schema inspection and reporting
+- Parameterized UNWIND write batches and structured statements
 """
 
-from .schema_manager import GraphSchemaManager, get_graph_schema_manager
+from .batch_writer import CypherStatement, WriteBatch, render_batches_as_cypher
+from .schema_manager import GraphSchemaManager, ensure_match_key_indexes, get_graph_schema_manager, mapping_labels
 
-__all__ = ["GraphSchemaManager", "get_graph_schema_manager"]
+__all__ = [
+    "GraphSchemaManager",
+    "get_graph_schema_manager",
+    "ensure_match_key_indexes",
+    "mapping_labels",
+    "CypherStatement",
+    "WriteBatch",
+    "render_batches_as_cypher",
+]
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""Parameterized UNWIND batches for graph writes.
+
+The converters emit one literal MERGE statement per node and relationship,
+which forces Neo4j to plan every statement from scratch. This module groups
+converter output into row batches keyed by label (nodes) or by
+(from_label, to_label, rel_type) (relationships) so each group is written
+with a single cached ``UNWIND $rows`` query.
+
+Property values are normalized to match what the literal statement renderer
+stores, so both write modes produce the same graph.
+
+Literal statements are handed to the executor as CypherStatement objects
+rather than one joined script, so they never need to be split on ``;`` again.
+"""
+
+import json
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+CYPHER_SAFE_PROPERTY_NAME = r"^[a-zA-Z_][a-zA-Z0-9_]*$"
+
+
+@dataclass
+class WriteBatch:
+    """A parameterized Cypher query plus the rows it unwinds.
+
+    Attributes:
+        query: Cypher query that reads ``$rows`` (and any extra params)
+        rows: Row maps passed as the ``rows`` parameter
+        params: Additional query-level parameters shared by all rows
+        kind: "node" or "relationship" (used for stats and ordering)
+    """
+
+    query: str
+    rows: list[dict[str, Any]] = field(default_factory=list)
+    params: dict[str, Any] = field(default_factory=dict)
+    kind: str = "node"
+
+    def chunks(self, size: int) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Yield (query, parameters) pairs with at most ``size`` rows each.
+
+        Args:
+            size: Maximum rows per chunk (values < 1 disable chunking)
+
+        Yields:
+            Tuple of (query, parameters dict)
+        """
+        if size < 1:
+            size = max(len(self.rows), 1)
+        for start in range(0, len(self.rows), size):
+            yield self.query, {**self.params, "rows": self.rows[start : start + size]}
+
+    def to_cypher(self) -> str:
+        """Render the batch as a cypher-shell script for archiving.
+
+        Returns:
+            ``:param`` directives followed by the UNWIND query
+        """
+        lines = [f":param {key} => {_cypher_literal(value)};" for key, value in sorted(self.params.items())]
+        lines.append(f":param rows => {_cypher_literal(self.rows)};")
+        lines.append(f"{self.query};")
+        return "\n".join(lines)
+
+
+@dataclass
+class CypherStatement:
+    """A single Cypher statement with optional parameters.
+
+    Offers the same ``chunks``/``to_cypher`` interface as WriteBatch so the
+    executor and archive renderer can consume either.
+
+    Attributes:
+        query: Complete Cypher statement (no trailing semicolon)
+        params: Query parameters
+    """
+
+    query: str
+    params: dict[str, Any] = field(default_factory=dict)
+
+    def chunks(self, size: int) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Yield the statement as a single (query, parameters) pair.
+
+        Args:
+            size: Ignored (a statement is never split)
+
+        Yields:
+            Tuple of (query, parameters dict)
+        """
+        yield self.query, self.params
+
+    def to_cypher(self) -> str:
+        """Render the statement for archiving.
+
+        Returns:
+            ``:param`` directives (if any) followed by the statement
+        """
+        lines = [f":param {key} => {_cypher_literal(value)};" for key, value in sorted(self.params.items())]
+        lines.append(f"{self.query};")
+        return "\n".join(lines)
+
+
+def _escape_identifier(name: str) -> str:
+    """Backtick-escape a label, relationship type or property key."""
+    return "`" + str(name).replace("`", "``") + "`"
+
+
+def _cypher_literal(value: Any) -> str:
+    """Render a parameter value as a Cypher literal (for the archived script)."""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return str(value).lower()
+    if isinstance(value, int | float):
+        return repr(value)
+    if isinstance(value, dict):
+        items = []
+        for key, item in value.items():
+            key_str = key if re.match(CYPHER_SAFE_PROPERTY_NAME, key) else _escape_identifier(key)
+            items.append(f"{key_str}: {_cypher_literal(item)}")
+        return "{" + ", ".join(items) + "}"
+    if isinstance(value, list | tuple):
+        return "[" + ", ".join(_cypher_literal(item) for item in value) + "]"
+    # json.dumps produces a double-quoted string with escapes Cypher understands
+    return json.dumps(str(value))
+
+
+def _array_item(item: Any) -> Any:
+    """Normalize a list item the way the literal renderer writes array elements."""
+    if isinstance(item, str | int | float | bool):
+        return item
+    return str(item)
+
+
+def normalize_property_value(value: Any, allow_arrays: bool = True, allow_booleans: bool = True) -> Any:
+    """Normalize a property value to the type the literal Cypher renderer stores.
+
+    Args:
+        value: Raw property value from converter output
+        allow_arrays: Keep lists as native arrays (otherwise stringify them)
+        allow_booleans: Keep booleans as native booleans (otherwise stringify them)
+
+    Returns:
+        Neo4j-compatible parameter value
+    """
+    if allow_booleans and isinstance(value, bool):
+        return value
+    if allow_arrays and isinstance(value, list):
+        return [_array_item(item) for item in value]
+    return str(value)
+
+
+def _match_pattern(alias: str, label: str | None, id_key: str, isolation_keys: list[str]) -> str:
+    """Build a MATCH node pattern keyed on a row id plus isolation params."""
+    props = [f"id: row.{id_key}"] + [f"{key}: ${key}" for key in isolation_keys]
+    label_part = f":{_escape_identifier(label)}" if label else ""
+    return f"({alias}{label_part} {{{', '.join(props)}}})"
+
+
+def build_node_batches(node_rows: dict[str, list[dict[str, Any]]], keep_existing: bool = False) -> list[WriteBatch]:
+    """Build one MERGE batch per node label.
+
+    Args:
+        node_rows: Mapping of label -> list of ``{"id": ..., "props": {...}}`` rows
+        keep_existing: Add the row's properties to nodes that already exist,
+            keeping the values they have, instead of setting them on create only
+
+    Returns:
+        List of node WriteBatch objects
+    """
+    batches = []
+    for label, rows in node_rows.items():
+        query = f"UNWIND $rows AS row\nMERGE (n:{_escape_identifier(label)} {{id: row.id}})\n"
+        if keep_existing:
+            query += "WITH n, row, properties(n) AS existing\nSET n += row.props, n += existing"
+        else:
+            query += "ON CREATE SET n += row.props"
+        batches.append(WriteBatch(query=query, rows=rows, kind="node"))
+    return batches
+
+
+def build_relationship_batches(
+    rel_rows: dict[tuple[str | None, str | None, str], list[dict[str, Any]]],
+    upload_id: str | None = None,
+    filename: str | None = None,
+) -> list[WriteBatch]:
+    """Build one MATCH/MERGE batch per (from_label, to_label, rel_type) group.
+
+    Endpoints are matched on id plus the same isolation properties
+    (``_upload_id``, ``_source_file``) used by the literal statements, and
+    relationships created by the batch are tagged with them.
+    A ``None`` label matches the endpoint without a label.
+
+    Args:
+        rel_rows: Mapping of (from_label, to_label, rel_type) ->
+            list of ``{"from_id": ..., "to_id": ..., "props": {...}}`` rows
+        upload_id: Upload batch identifier for graph isolation
+        filename: Source filename for graph isolation
+
+    Returns:
+        List of relationship WriteBatch objects
+    """
+    params = {}
+    if upload_id:
+        params["_upload_id"] = upload_id
+    if filename:
+        params["_source_file"] = filename
+    isolation_keys = list(params.keys())
+
+    batches = []
+    for (from_label, to_label, rel_type), rows in rel_rows.items():
+        from_pattern = _match_pattern("a", from_label, "from_id", isolation_keys)
+        to_pattern = _match_pattern("b", to_label, "to_id", isolation_keys)
+        query = (
+            f"UNWIND $rows AS row\nMATCH {from_pattern}, {to_pattern}\n"
+            f"MERGE (a)-[r:{_escape_identifier(rel_type)}]->(b)"
+        )
+        # Created relationships carry the same upload tags as nodes so a failed file can be rolled back
+        set_clauses = ["r += row.props"] if any(row.get("props") for row in rows) else []
+        set_clauses.extend(f"r.{key} = ${key}" for key in isolation_keys)
+        if set_clauses:
+            query += "\nON CREATE SET " + ", ".join(set_clauses)
+        batches.append(WriteBatch(query=query, rows=rows, params=dict(params), kind="relationship"))
+    return batches
+
+
+def render_batches_as_cypher(batches: list[WriteBatch | CypherStatement], header: str | None = None) -> str:
+    """Render batches or statements as a single cypher-shell script.
+
+    Args:
+        batches: WriteBatch / CypherStatement objects in execution order
+        header: Optional comment line to prepend
+
+    Returns:
+        Script text suitable for archiving next to the source file
+    """
+    parts = [f"// {header}"] if header else []
+    for batch in batches:
+        # Plain statements go one per line; batches (with their :param blocks) are spaced out
+        separator = "\n" if isinstance(batch, CypherStatement) and not batch.params else "\n\n"
+        if parts:
+            parts.append(separator)
+        parts.append(batch.to_cypher())
+    return "".join(parts)
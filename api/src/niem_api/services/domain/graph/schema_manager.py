@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 
 import logging
+import threading
+from collections.abc import Iterable
 from typing import Any
 
 from neo4j.exceptions import ClientError
@@ -13,6 +15,90 @@ logger = logging.getLogger(__name__)
 SHOW_INDEXES_QUERY = "SHOW INDEXES"
 SHOW_CONSTRAINTS_QUERY = "SHOW CONSTRAINTS"
 
+# Ingest MERGEs nodes on (label, id) and MATCHes edge endpoints on the same key
+MATCH_KEY_PROPERTY = "id"
+
+# Labels whose match-key index is known to exist (per process, per database)
+_indexed_labels: set[str] = set()
+_indexed_labels_lock = threading.Lock()
+
+
+def mapping_labels(mapping: dict[str, Any]) -> set[str]:
+    """Collect every node label a generated mapping can produce.
+
+    Args:
+        mapping: Mapping dictionary (objects/associations/references format)
+
+    Returns:
+        Set of Neo4j labels
+    """
+    labels = {obj["label"] for obj in mapping.get("objects", []) if obj.get("label")}
+    for assoc in mapping.get("associations", []):
+        if assoc.get("qname"):
+            labels.add(assoc["qname"].replace(":", "_"))
+        labels.update(ep["maps_to_label"] for ep in assoc.get("endpoints", []) if ep.get("maps_to_label"))
+    labels.update(ref["target_label"] for ref in mapping.get("references", []) if ref.get("target_label"))
+    return labels
+
+
+def ensure_match_key_indexes(neo4j_client, labels: Iterable[str]) -> list[str]:
+    """Create a range index on the ingest match key for each label that lacks one.
+
+    Existing indexes are read once per call with SHOW INDEXES and labels already
+    handled by this process are skipped without a round trip, so calling this
+    for every file of a batch is cheap. Index creation is idempotent
+    (``IF NOT EXISTS``); a failure for one label is logged, does not stop ingest
+    and is retried on the next call.
+
+    Args:
+        neo4j_client: Neo4j client
+        labels: Node labels about to be written
+
+    Returns:
+        Labels for which an index was created
+    """
+    from .batch_writer import _escape_identifier
+
+    with _indexed_labels_lock:
+        pending = {label for label in labels if label} - _indexed_labels
+    if not pending:
+        return []
+
+    existing = set()
+    for index in neo4j_client.query(SHOW_INDEXES_QUERY):
+        label_list = index.get("labelsOrTypes") or []
+        properties = index.get("properties") or []
+        # Any node index (or constraint index) whose leading property is the match key serves the lookup
+        if index.get("entityType", "NODE") != "NODE" or len(label_list) != 1:
+            continue
+        if properties[:1] == [MATCH_KEY_PROPERTY]:
+            existing.add(label_list[0])
+
+    created = []
+    for label in sorted(pending - existing):
+        query = (
+            f"CREATE INDEX IF NOT EXISTS FOR (n:{_escape_identifier(label)}) "
+            f"ON (n.{_escape_identifier(MATCH_KEY_PROPERTY)})"
+        )
+        try:
+            neo4j_client.query(query)
+            created.append(label)
+        except ClientError as e:
+            logger.warning(f"Failed to create match-key index on {label}.{MATCH_KEY_PROPERTY}: {e}")
+
+    # Labels whose CREATE failed are left out so the next call retries them
+    with _indexed_labels_lock:
+        _indexed_labels.update((pending & existing) | set(created))
+    if created:
+        logger.info(f"Created match-key indexes for {len(created)} labels")
+    return created
+
+
+def clear_indexed_labels() -> None:
+    """Forget which labels have been indexed (e.g. after a schema reset)."""
+    with _indexed_labels_lock:
+        _indexed_labels.clear()
+
 
 class GraphSchemaManager:
     """Manages Neo4j database schema configuration from mapping specifications"""
@@ -47,6 +133,21 @@ class GraphSchemaManager:
             results["labels_identified"] = [node["label"] for node in mapping.get("nodes", [])]
             results["relationship_types_identified"] = [rel["type"] for rel in mapping.get("relationships", [])]
 
+            # Generated mappings (objects/associations/references) carry no nodes or
+            # indexes sections; index the ingest match key for every label they produce
+            if "objects" in mapping:
+                labels = mapping_labels(mapping)
+                results["labels_identified"] = sorted(labels)
+                rel_types = {
+                    item["rel_type"]
+                    for key in ("associations", "references")
+                    for item in mapping.get(key, [])
+                    if item.get("rel_type")
+                }
+                results["relationship_types_identified"] = sorted(rel_types)
+                created = ensure_match_key_indexes(self.neo4j_client, labels)
+                results["indexes_created"].extend(f"{label}.{MATCH_KEY_PROPERTY}" for label in created)
+
             # Create uniqueness constraints for ID properties (constraints include indexes)
             id_properties_handled = set()
 
@@ -228,6 +329,7 @@ class GraphSchemaManager:
                     except ClientError as e:
                         logger.warning(f"Could not drop index {index_name}: {e}")
 
+            clear_indexed_labels()
             logger.info(
                 f"Schema reset completed: dropped {len(dropped_constraints)} constraints, "
                 f"{len(dropped_indexes)} indexes"
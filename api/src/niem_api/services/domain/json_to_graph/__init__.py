@@ -5,6 +5,14 @@ Handles conversion of NIEM JSON (JSON-LD compliant) instance documents to Neo4j
 NIEM JSON uses JSON-LD features (@context, @id, @type) with NIEM-specific conventions.
 """
 
-from .converter import generate_for_json_content
+from .converter import generate_for_json_content, sanitize_neo4j_label
+from .parser import parse_json
+from .streaming import iter_json_cypher_batches, iter_jsonld_document
 
-__all__ = ["generate_for_json_content"]
+__all__ = [
+    "generate_for_json_content",
+    "iter_json_cypher_batches",
+    "iter_jsonld_document",
+    "parse_json",
+    "sanitize_neo4j_label",
+]
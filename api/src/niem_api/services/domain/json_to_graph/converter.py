@@ -28,9 +28,13 @@ import logging
 import re
 import time
 from collections import defaultdict
+from collections.abc import Iterable, Iterator
 from datetime import datetime, timezone
 from typing import Any
 
+from ..mapping_plan import MappingPlan, get_mapping_plan
+from .parser import parse_json
+
 logger = logging.getLogger(__name__)
 
 # Cypher property name validation pattern - only alphanumeric and underscore are safe
@@ -309,7 +313,7 @@ def _recursively_flatten_json_object(
         key_normalized = key.replace(":", "_")
         prop_path = f"{path_prefix}__{key_normalized}" if path_prefix else key_normalized
 
-        if isinstance(value, (str, int, float, bool)):
+        if isinstance(value, str | int | float | bool):
             # Simple value - add directly
             flattened[prop_path] = value
 
@@ -319,7 +323,7 @@ def _recursively_flatten_json_object(
             complex_instances = []  # Accumulate complex objects for JSON encoding
 
             for item in value:
-                if isinstance(item, (str, int, float, bool)):
+                if isinstance(item, str | int | float | bool):
                     simple_values.append(item)
                 elif isinstance(item, dict):
                     # Check if this is a TextLiteral wrapper - extract value directly
@@ -552,14 +556,15 @@ def _is_complex_json_element(obj: dict[str, Any]) -> bool:
 
 
 def generate_for_json_content(
-    json_content: str,
-    mapping_dict: dict[str, Any],
+    json_content: str | bytes | dict[str, Any],
+    mapping_dict: dict[str, Any] | MappingPlan,
     filename: str = "memory",
     upload_id: str = None,
     schema_id: str = None,
     cmf_element_index: set = None,
     mode: str = "dynamic",
-) -> tuple[str, dict[str, Any], list[tuple], list[tuple]]:
+    write_mode: str = "statements",
+) -> tuple[str | list, dict[str, Any], list[tuple], list[tuple]]:
     """Generate Cypher statements from NIEM JSON content and mapping dictionary.
 
     NIEM JSON uses JSON-LD features (@context, @id, @type) with NIEM conventions.
@@ -567,44 +572,149 @@ def generate_for_json_content(
     consistent graph structures between XML and JSON representations.
 
     Args:
-        json_content: NIEM JSON content as string
-        mapping_dict: Mapping dictionary (same as used for XML)
+        json_content: NIEM JSON content as string or bytes, or the already parsed document
+        mapping_dict: Mapping dictionary or compiled MappingPlan (same as used for XML)
         filename: Source filename for provenance
         upload_id: Unique identifier for this upload batch (for graph isolation)
         schema_id: Schema identifier (for graph isolation)
         cmf_element_index: Set of known CMF element QNames
         mode: Converter mode - "mapping" (use selections) or "dynamic" (all complex elements)
+        write_mode: "statements" (literal Cypher script) or "statement_list"
+            (the same statements as CypherStatement objects)
 
     Returns:
         Tuple of (cypher_statements, nodes_dict, contains_list, edges_list)
     """
-    # Parse NIEM JSON
-    data = json.loads(json_content)
+    # Parse NIEM JSON (callers that validated the document pass it parsed)
+    data = parse_json(json_content) if isinstance(json_content, str | bytes | bytearray) else json_content
 
     # Extract context
     context = data.get("@context", {})
 
-    # Load mapping
-    _, obj_rules, associations, references, _ = load_mapping_from_dict(mapping_dict)
+    # Get objects from @graph or treat data as single object
+    has_content = "@type" in data or any(k for k in data.keys() if not k.startswith("@"))
+    objects = data.get("@graph", [data] if has_content else [])
+
+    # Pre-scan: Count @id occurrences to determine which need hub nodes
+    id_occurrence_count = {}
+    for obj in objects:
+        if isinstance(obj, dict):
+            _count_id_occurrences(obj, id_occurrence_count)
+
+    ingest_timestamp = datetime.now(timezone.utc).isoformat()
+    nodes, contains, edges = next(
+        _iter_jsonld_conversion(
+            objects,
+            id_occurrence_count,
+            data,
+            context,
+            mapping_dict,
+            filename,
+            upload_id,
+            schema_id,
+            cmf_element_index,
+            mode,
+        )
+    )
+
+    # Generate Cypher statements
+    cypher_statements: str | list
+    if write_mode == "statement_list":
+        cypher_statements = build_cypher_statements(nodes, edges, contains, upload_id, filename, ingest_timestamp)
+    else:
+        cypher_statements = generate_cypher_from_structures(
+            nodes, edges, contains, upload_id, filename, ingest_timestamp
+        )
+
+    return cypher_statements, nodes, contains, edges
 
-    # Build association index for quick lookup
-    assoc_by_qn = build_assoc_index(associations)
-    logger.info(f"Loaded {len(assoc_by_qn)} associations from mapping: {list(assoc_by_qn.keys())}")
 
-    # Build augmentation index from mapping
-    augmentation_index = build_augmentation_index_from_mapping(mapping_dict)
+def _count_id_occurrences(obj: dict[str, Any], counts: dict[str, int]) -> None:
+    """Recursively count non-reference @id occurrences (for hub detection).
+
+    Args:
+        obj: JSON-LD object
+        counts: Occurrence counts by @id (without leading #), updated in place
+    """
+    if not isinstance(obj, dict):
+        return
+
+    # Check if this object has @id and is not a pure reference
+    obj_id = obj.get("@id")
+    if obj_id and not is_reference(obj):
+        # This object OWNS the id (not just referencing it)
+        clean_id = obj_id.lstrip("#")
+        counts[clean_id] = counts.get(clean_id, 0) + 1
+
+    # Recurse into nested objects
+    for key, value in obj.items():
+        if key.startswith("@"):
+            continue
+        if isinstance(value, dict):
+            _count_id_occurrences(value, counts)
+        elif isinstance(value, list):
+            for item in value:
+                if isinstance(item, dict):
+                    _count_id_occurrences(item, counts)
+
+
+def _iter_jsonld_conversion(
+    objects: Iterable[Any],
+    id_occurrence_count: dict[str, int],
+    assoc_source: dict[str, Any],
+    context: dict[str, Any],
+    mapping_dict: dict[str, Any] | MappingPlan,
+    filename: str,
+    upload_id: str | None,
+    schema_id: str | None,
+    cmf_element_index: set | frozenset | None,
+    mode: str,
+    batch_nodes: int = 0,
+) -> Iterator[tuple[dict[str, Any], list[tuple], list[tuple]]]:
+    """Convert top-level JSON-LD objects into node and edge structures.
+
+    With batch_nodes of 0 a single (nodes, contains, edges) tuple covering all
+    objects is yielded. Otherwise nodes and containment edges are yielded
+    whenever at least batch_nodes nodes are pending after a top-level object,
+    and the last tuple carries the remaining nodes and the EntityHub nodes.
+    Each reference/association edge is handed out with the first batch after
+    both of its endpoints have been; edges to IDs that never become nodes go
+    out last. No tuple carries more than batch_nodes reference/association
+    edges (extra ones follow in edge-only tuples).
+
+    Args:
+        objects: Top-level objects (@graph items, or the document itself)
+        id_occurrence_count: Non-reference @id occurrences across all objects
+        assoc_source: Data scanned for associations in dynamic mode
+        context: JSON-LD @context
+        mapping_dict: Mapping dictionary or compiled MappingPlan
+        filename: Source filename for provenance
+        upload_id: Unique identifier for this upload batch (for graph isolation)
+        schema_id: Schema identifier (for graph isolation)
+        cmf_element_index: Set of known CMF element QNames
+        mode: Converter mode - "mapping" (use selections) or "dynamic" (all complex elements)
+        batch_nodes: Node count that triggers a batch (0 = one batch)
+
+    Yields:
+        Tuples of (nodes_dict, contains_list, edges_list)
+    """
+    # Compiled lookups are shared across files using the same mapping
+    plan = get_mapping_plan(mapping_dict)
+    obj_rules = plan.obj_rules
+
+    # Association index (copied - dynamic mode adds auto-detected associations)
+    assoc_by_qn = dict(plan.assoc_by_qn)
+    logger.info(f"Loaded {len(assoc_by_qn)} associations from mapping: {list(assoc_by_qn.keys())}")
 
     # In dynamic mode, auto-detect associations from data structure
     if mode == "dynamic":
-        auto_detected_assocs = detect_associations_from_json_data(data)
+        auto_detected_assocs = detect_associations_from_json_data(assoc_source)
         assoc_by_qn.update(auto_detected_assocs)
         logger.info(f"Dynamic mode: Total associations (mapping + auto-detected): {len(assoc_by_qn)}")
 
-    # Extract CMF element index from mapping metadata if not provided
+    # Use the CMF element index from mapping metadata if not provided
     if cmf_element_index is None:
-        metadata = mapping_dict.get("metadata", {})
-        cmf_elements_list = metadata.get("cmf_element_index", [])
-        cmf_element_index = set(cmf_elements_list) if cmf_elements_list else set()
+        cmf_element_index = plan.cmf_element_index
 
     # In dynamic mode, disable augmentation detection (all properties are standard)
     if mode == "dynamic":
@@ -614,50 +724,15 @@ def generate_for_json_content(
     # Generate file-specific prefix for node IDs
     # SHA1 used for ID generation only, not cryptographic security
     file_prefix = hashlib.sha1(f"{filename}_{time.time()}".encode(), usedforsecurity=False).hexdigest()[:8]
-    ingest_timestamp = datetime.now(timezone.utc).isoformat()
 
     nodes = {}  # id -> (label, qname, props_dict, aug_props_dict)
     edges = []  # (from_id, from_label, to_id, to_label, rel_type, rel_props)
     contains = []  # (parent_id, parent_label, child_id, child_label, HAS_REL)
 
     # Hub node tracking for co-referencing
-    id_occurrence_count = {}  # Count non-reference occurrences of each @id (for hub detection)
     hub_nodes_needed = set()  # Set of @id values that need separate hub nodes
     id_entity_registry = {}  # Track @id-based entities for co-referencing
 
-    # Get objects from @graph or treat data as single object
-    has_content = "@type" in data or any(k for k in data.keys() if not k.startswith("@"))
-    objects = data.get("@graph", [data] if has_content else [])
-
-    # Pre-scan: Count @id occurrences to determine which need hub nodes
-    def count_id_occurrences(obj: dict[str, Any]):
-        """Recursively count non-reference @id occurrences."""
-        if not isinstance(obj, dict):
-            return
-
-        # Check if this object has @id and is not a pure reference
-        obj_id = obj.get("@id")
-        if obj_id and not is_reference(obj):
-            # This object OWNS the id (not just referencing it)
-            clean_id = obj_id.lstrip("#")
-            id_occurrence_count[clean_id] = id_occurrence_count.get(clean_id, 0) + 1
-
-        # Recurse into nested objects
-        for key, value in obj.items():
-            if key.startswith("@"):
-                continue
-            if isinstance(value, dict):
-                count_id_occurrences(value)
-            elif isinstance(value, list):
-                for item in value:
-                    if isinstance(item, dict):
-                        count_id_occurrences(item)
-
-    # Run pre-scan
-    for obj in objects:
-        if isinstance(obj, dict):
-            count_id_occurrences(obj)
-
     # Determine which @ids need hub nodes (2+ non-reference occurrences)
     for id_value, count in id_occurrence_count.items():
         if count >= 2:
@@ -769,7 +844,7 @@ def generate_for_json_content(
                         # Process as child of parent (not augmentation)
                         process_jsonld_object(value, parent_id, parent_label, key)
                     # If simple value, flatten into parent properties
-                    elif isinstance(value, (str, int, float, bool)):
+                    elif isinstance(value, str | int | float | bool):
                         prop_name = key.replace(":", "_")
                         parent_props[prop_name] = value
                         parent_props[f"{prop_name}_isAugmentation"] = True
@@ -779,7 +854,7 @@ def generate_for_json_content(
                             if isinstance(item, dict) and _is_complex_json_element(item):
                                 # Complex objects become children of parent
                                 process_jsonld_object(item, parent_id, parent_label, key)
-                            elif isinstance(item, (str, int, float, bool)):
+                            elif isinstance(item, str | int | float | bool):
                                 # Simple values get flattened (as arrays)
                                 prop_name = key.replace(":", "_")
                                 if prop_name not in parent_props:
@@ -842,7 +917,7 @@ def generate_for_json_content(
                     prefix = key.replace(":", "_")
                     flattened, _meta = _recursively_flatten_json_object(value, obj_rules, assoc_by_qn, prefix)
                     aug_props.update(flattened)
-                elif isinstance(value, (str, int, float, bool)):
+                elif isinstance(value, str | int | float | bool):
                     prop_key = key.replace(":", "_")
                     aug_props[prop_key] = value
                 elif isinstance(value, list):
@@ -1000,7 +1075,7 @@ def generate_for_json_content(
                         # Process as child of parent (not augmentation)
                         process_jsonld_object(value, parent_id, parent_label, key)
                     # If simple value, flatten into parent properties
-                    elif isinstance(value, (str, int, float, bool)):
+                    elif isinstance(value, str | int | float | bool):
                         prop_name = key.replace(":", "_")
                         parent_props[prop_name] = value
                         parent_props[f"{prop_name}_isAugmentation"] = True
@@ -1010,7 +1085,7 @@ def generate_for_json_content(
                             if isinstance(item, dict) and _is_complex_json_element(item):
                                 # Complex objects become children of parent
                                 process_jsonld_object(item, parent_id, parent_label, key)
-                            elif isinstance(item, (str, int, float, bool)):
+                            elif isinstance(item, str | int | float | bool):
                                 # Simple values get flattened (as arrays)
                                 prop_name = key.replace(":", "_")
                                 if prop_name not in parent_props:
@@ -1123,12 +1198,12 @@ def generate_for_json_content(
             # If not a node, flatten it as a property
             if not should_be_node:
                 prop_name = key.replace(":", "_")
-                if isinstance(value, (str, int, float, bool)):
+                if isinstance(value, str | int | float | bool):
                     # Simple scalar value
                     props_dict[prop_name] = value
                 elif isinstance(value, list):
                     # Array - extract simple values
-                    simple_values = [item for item in value if isinstance(item, (str, int, float, bool))]
+                    simple_values = [item for item in value if isinstance(item, str | int | float | bool)]
                     if simple_values:
                         props_dict[prop_name] = simple_values[0] if len(simple_values) == 1 else simple_values
 
@@ -1293,19 +1368,57 @@ def generate_for_json_content(
 
         return obj_id
 
+    def merge_flattened_instances() -> None:
+        """Merge accumulated flattened instances onto their parent nodes.
+
+        This handles cases where multiple unselected objects with the same qname
+        were flattened onto the same parent (prevents data loss from overwrites).
+        """
+        for (parent_id, qname), instances in flattened_accumulator.items():
+            if parent_id in nodes:
+                parent_props = nodes[parent_id][2]  # props_dict is at index 2
+                merged = _merge_flattened_instances({qname: instances})
+                parent_props.update(merged)
+        flattened_accumulator.clear()
+
+    # Streaming: node IDs handed out so far, and edges parked on an endpoint not handed out yet
+    written: set[str] = set()
+    waiting: dict[str, list[tuple]] = {}
+
+    def take_ready_edges(batch_node_ids: Iterable[str]) -> list[tuple]:
+        """Hand out the edges whose endpoints have both been handed out.
+
+        New edges and the edges waiting on one of batch_node_ids are checked;
+        the rest are parked on their first missing endpoint, so each edge is
+        only looked at again once that node is handed out.
+        """
+        written.update(batch_node_ids)
+        candidates = list(edges)
+        edges.clear()
+        for node_id in batch_node_ids:
+            candidates.extend(waiting.pop(node_id, ()))
+        ready = []
+        for edge in candidates:
+            missing = edge[0] if edge[0] not in written else edge[2] if edge[2] not in written else None
+            if missing is None:
+                ready.append(edge)
+            else:
+                waiting.setdefault(missing, []).append(edge)
+        return ready
+
     # Process all top-level objects
     for obj in objects:
         if isinstance(obj, dict):
             process_jsonld_object(obj)
 
-    # Merge accumulated flattened instances onto their parent nodes
-    # This handles cases where multiple unselected objects with the same qname
-    # were flattened onto the same parent (prevents data loss from overwrites)
-    for (parent_id, qname), instances in flattened_accumulator.items():
-        if parent_id in nodes:
-            parent_props = nodes[parent_id][2]  # props_dict is at index 2
-            merged = _merge_flattened_instances({qname: instances})
-            parent_props.update(merged)
+            # Flattened instances and containment edges never cross top-level objects
+            if batch_nodes and len(nodes) >= batch_nodes:
+                merge_flattened_instances()
+                yield from _with_edge_slices(nodes, contains, take_ready_edges(nodes), batch_nodes)
+                nodes = {}
+                contains = []
+
+    merge_flattened_instances()
 
     # Generate EntityHub nodes for multi-occurrence @ids
     for entity_id, hub_info in id_entity_registry.items():
@@ -1333,10 +1446,40 @@ def generate_for_json_content(
             nodes[hub_id] = (hub_label, hub_label, hub_props, {})
             logger.info(f"Created {hub_label} {hub_id} with {len(role_qnames)} roles: {role_qnames}")
 
-    # Generate Cypher statements
-    cypher_statements = generate_cypher_from_structures(nodes, edges, contains, upload_id, filename, ingest_timestamp)
+    if not batch_nodes:
+        yield nodes, contains, edges
+        return
+
+    ready = take_ready_edges(nodes)
+    # Edges to IDs that never became nodes: their MATCH finds no endpoint, as without streaming
+    ready.extend(edge for parked in waiting.values() for edge in parked)
+    waiting.clear()
+    yield from _with_edge_slices(nodes, contains, ready, batch_nodes)
 
-    return cypher_statements, nodes, contains, edges
+
+def _with_edge_slices(
+    nodes: dict[str, Any], contains: list[tuple], edges: list[tuple], batch_size: int
+) -> Iterator[tuple[dict[str, Any], list[tuple], list[tuple]]]:
+    """Yield a batch with at most batch_size edges, then the remaining edges in edge-only batches."""
+    yield nodes, contains, edges[:batch_size]
+    for start in range(batch_size, len(edges), batch_size):
+        yield {}, [], edges[start : start + batch_size]
+
+
+def sanitize_neo4j_label(label: str) -> str:
+    """Sanitize a node label the way build_cypher_statements writes it.
+
+    Neo4j labels are written unescaped, so hyphens and dots become underscores.
+    Anything that looks nodes up by label (rollback, index provisioning) must
+    use this form too.
+
+    Args:
+        label: Label as produced by the converter (e.g. "my-ext_Report.Info")
+
+    Returns:
+        Label as written to Neo4j (e.g. "my_ext_Report_Info")
+    """
+    return label.replace("-", "_").replace(".", "_")
 
 
 def _sanitize_neo4j_relationship_type(rel_type: str) -> str:
@@ -1371,15 +1514,44 @@ def _sanitize_neo4j_relationship_type(rel_type: str) -> str:
     return sanitized or "RELATED_TO"
 
 
-def generate_cypher_from_structures(
+def _node_property_value(value: Any) -> Any:
+    """Normalize a node property value to a Neo4j parameter (None = skip the property)."""
+    if isinstance(value, list | tuple):
+        return [item if isinstance(item, str | int | float | bool) else str(item) for item in value]
+    if value is None or isinstance(value, str | int | float | bool):
+        return value
+    return str(value)
+
+
+def _node_property_literal(value: Any) -> str:
+    """Render a normalized node property value as a Cypher literal."""
+    if isinstance(value, list):
+        # Use Neo4j native array syntax
+        return f"[{', '.join(_node_property_literal(item) for item in value)}]"
+    if isinstance(value, bool):
+        return str(value).lower()
+    if isinstance(value, int | float):
+        # Numbers and booleans don't need quotes
+        return str(value)
+    # Escape single quotes in strings
+    escaped_value = value.replace("'", "\\'")
+    return f"'{escaped_value}'"
+
+
+def build_cypher_statements(
     nodes: dict[str, tuple],
     edges: list[tuple],
     contains: list[tuple],
     upload_id: str = None,
     filename: str = None,
     ingest_timestamp: str = None,
-) -> str:
-    """Generate Cypher statements from node and edge structures.
+    parameterized: bool = True,
+) -> list:
+    """Build one Cypher statement per node and edge from converter structures.
+
+    Nodes are merged on their identity key only (id plus the isolation
+    properties that relationship MATCHes use), so the MERGE can use the
+    (label, id) index; every other property is applied with ON CREATE SET.
 
     Args:
         nodes: Dictionary of node structures
@@ -1388,66 +1560,65 @@ def generate_cypher_from_structures(
         upload_id: Unique identifier for this upload batch (for graph isolation)
         filename: Source filename (for graph isolation)
         ingest_timestamp: ISO timestamp of ingestion (for provenance)
+        parameterized: Pass node keys and properties as query parameters
+            (one query text per label); otherwise inline them as literals
 
     Returns:
-        Cypher statements as string
+        List of CypherStatement objects in execution order (nodes first)
     """
-    cypher_lines = []
+    from ..graph.batch_writer import CypherStatement
+
+    statements = []
+
+    # Identity key shared by node MERGEs and relationship MATCHes
+    isolation = {}
+    if upload_id:
+        isolation["_upload_id"] = upload_id
+    if filename:
+        isolation["_source_file"] = filename
+    if parameterized:
+        key_str = ", ".join(["id: $id"] + [f"{key}: ${key}" for key in isolation])
+    else:
+        key_literals = ", ".join(f"{key}: {_node_property_literal(value)}" for key, value in isolation.items())
 
     # Generate MERGE statements for nodes
     for node_id, (label, qname, props, aug_props) in nodes.items():
         # Sanitize label for Neo4j (labels cannot contain hyphens or other special chars)
-        sanitized_label = label.replace("-", "_").replace(".", "_")
+        sanitized_label = sanitize_neo4j_label(label)
 
-        # Build properties string - include qname for display consistency with XML
-        # Also include upload_id, source_file, and ingestDate for provenance
-        props_parts = []
+        # Include qname for display consistency with XML, and ingestDate for provenance
         all_props = {**props, **aug_props, "qname": qname}
-
-        # Add provenance and graph isolation metadata (consistent with XML converter)
-        if upload_id:
-            all_props["_upload_id"] = upload_id
-        if filename:
-            all_props["_source_file"] = filename
         if ingest_timestamp:
             all_props["ingestDate"] = ingest_timestamp
+        for key in isolation:
+            all_props.pop(key, None)
 
+        set_props = {}
         for key, value in all_props.items():
+            value = _node_property_value(value)
+            # Skip null values
+            if value is not None:
+                set_props[key] = value
+
+        if parameterized:
+            statements.append(
+                CypherStatement(
+                    f"MERGE (n:{sanitized_label} {{{key_str}}}) ON CREATE SET n += $props",
+                    {"id": node_id, **isolation, "props": set_props},
+                )
+            )
+            continue
+
+        setbits = []
+        for key, value in set_props.items():
             # Escape property names with special characters (dots, hyphens, etc.) using backticks
             # Only alphanumeric and underscore are safe without backticks in Cypher
             prop_key = f"`{key}`" if not re.match(CYPHER_SAFE_PROPERTY_NAME, key) else key
-            
-            # Handle different value types properly
-            if isinstance(value, (list, tuple)):
-                # Use Neo4j native array syntax
-                array_items = []
-                for item in value:
-                    if isinstance(item, str):
-                        escaped_item = item.replace("'", "\\'")
-                        array_items.append(f"'{escaped_item}'")
-                    elif isinstance(item, (int, float, bool)):
-                        array_items.append(str(item).lower() if isinstance(item, bool) else str(item))
-                    else:
-                        escaped_item = str(item).replace("'", "\\'")
-                        array_items.append(f"'{escaped_item}'")
-                props_parts.append(f"{prop_key}: [{', '.join(array_items)}]")
-            elif isinstance(value, str):
-                # Escape single quotes in strings
-                escaped_value = value.replace("'", "\\'")
-                props_parts.append(f"{prop_key}: '{escaped_value}'")
-            elif isinstance(value, (int, float, bool)):
-                # Numbers and booleans don't need quotes
-                props_parts.append(f"{prop_key}: {str(value).lower() if isinstance(value, bool) else value}")
-            elif value is None:
-                # Skip null values
-                continue
-            else:
-                # Convert other types to string
-                escaped_value = str(value).replace("'", "\\'")
-                props_parts.append(f"{prop_key}: '{escaped_value}'")
-
-        props_str = ", ".join(props_parts)
-        cypher_lines.append(f"MERGE (n:{sanitized_label} {{id: '{node_id}', {props_str}}});")
+            setbits.append(f"n.{prop_key} = {_node_property_literal(value)}")
+        node_key = f"id: {_node_property_literal(node_id)}" + (f", {key_literals}" if key_literals else "")
+        statements.append(
+            CypherStatement(f"MERGE (n:{sanitized_label} {{{node_key}}}) ON CREATE SET {', '.join(setbits)}")
+        )
 
     # Helper function to build match properties for a specific node ID
     def build_node_match_props(node_id: str) -> str:
@@ -1459,26 +1630,37 @@ def generate_cypher_from_structures(
             props += f", _source_file: '{filename}'"
         return props
 
+    # Relationships created by this file carry its upload tags (for rollback of a failed file)
+    rel_tags = []
+    if upload_id:
+        rel_tags.append(f"r._upload_id='{upload_id}'")
+    if filename:
+        rel_tags.append(f"r._source_file='{filename}'")
+    tags_clause = f" ON CREATE SET {', '.join(rel_tags)}" if rel_tags else ""
+
     # Generate MERGE statements for containment relationships
     for parent_id, parent_label, child_id, child_label, rel_type in contains:
         # Sanitize labels for Neo4j
-        sanitized_parent_label = parent_label.replace("-", "_").replace(".", "_")
-        sanitized_child_label = child_label.replace("-", "_").replace(".", "_")
+        sanitized_parent_label = sanitize_neo4j_label(parent_label)
+        sanitized_child_label = sanitize_neo4j_label(child_label)
         sanitized_rel_type = _sanitize_neo4j_relationship_type(rel_type)
 
         parent_match = build_node_match_props(parent_id)
         child_match = build_node_match_props(child_id)
 
-        cypher_lines.append(
-            f"MATCH (parent:{sanitized_parent_label} {{{parent_match}}}), (child:{sanitized_child_label} {{{child_match}}}) "
-            f"MERGE (parent)-[:{sanitized_rel_type}]->(child);"
+        statements.append(
+            CypherStatement(
+                f"MATCH (parent:{sanitized_parent_label} {{{parent_match}}}), "
+                f"(child:{sanitized_child_label} {{{child_match}}}) "
+                f"MERGE (parent)-[r:{sanitized_rel_type}]->(child){tags_clause}"
+            )
         )
 
     # Generate MERGE statements for reference/association edges
     for from_id, from_label, to_id, to_label, rel_type, edge_props in edges:
         # Sanitize labels and relationship type for Neo4j
-        sanitized_from_label = from_label.replace("-", "_").replace(".", "_")
-        sanitized_to_label = to_label.replace("-", "_").replace(".", "_") if to_label else None
+        sanitized_from_label = sanitize_neo4j_label(from_label)
+        sanitized_to_label = sanitize_neo4j_label(to_label) if to_label else None
         clean_rel_type = _sanitize_neo4j_relationship_type(rel_type)
 
         # Build match properties for graph isolation
@@ -1512,31 +1694,68 @@ def generate_cypher_from_structures(
                     escaped_value = str(value).replace("'", "\\'")
                     prop_setters.append(f"r.{key}='{escaped_value}'")
 
-            props_clause = ", ".join(prop_setters)
+            props_clause = ", ".join(prop_setters + rel_tags)
 
             if sanitized_to_label:
-                cypher_lines.append(
-                    f"MATCH (from:{sanitized_from_label} {{{from_match}}}), (to:{sanitized_to_label} {{{to_match}}}) "
-                    f"MERGE (from)-[r:{clean_rel_type}]->(to) ON CREATE SET {props_clause};"
+                statements.append(
+                    CypherStatement(
+                        f"MATCH (from:{sanitized_from_label} {{{from_match}}}), "
+                        f"(to:{sanitized_to_label} {{{to_match}}}) "
+                        f"MERGE (from)-[r:{clean_rel_type}]->(to) ON CREATE SET {props_clause}"
+                    )
                 )
             else:
                 # Find target by ID only
-                cypher_lines.append(
-                    f"MATCH (from:{sanitized_from_label} {{{from_match}}}), (to {{{to_match}}}) "
-                    f"MERGE (from)-[r:{clean_rel_type}]->(to) ON CREATE SET {props_clause};"
+                statements.append(
+                    CypherStatement(
+                        f"MATCH (from:{sanitized_from_label} {{{from_match}}}), (to {{{to_match}}}) "
+                        f"MERGE (from)-[r:{clean_rel_type}]->(to) ON CREATE SET {props_clause}"
+                    )
                 )
         else:
             # Simple edge without properties
             if sanitized_to_label:
-                cypher_lines.append(
-                    f"MATCH (from:{sanitized_from_label} {{{from_match}}}), (to:{sanitized_to_label} {{{to_match}}}) "
-                    f"MERGE (from)-[:{clean_rel_type}]->(to);"
+                statements.append(
+                    CypherStatement(
+                        f"MATCH (from:{sanitized_from_label} {{{from_match}}}), "
+                        f"(to:{sanitized_to_label} {{{to_match}}}) "
+                        f"MERGE (from)-[r:{clean_rel_type}]->(to){tags_clause}"
+                    )
                 )
             else:
                 # Find target by ID only
-                cypher_lines.append(
-                    f"MATCH (from:{sanitized_from_label} {{{from_match}}}), (to {{{to_match}}}) "
-                    f"MERGE (from)-[:{clean_rel_type}]->(to);"
+                statements.append(
+                    CypherStatement(
+                        f"MATCH (from:{sanitized_from_label} {{{from_match}}}), (to {{{to_match}}}) "
+                        f"MERGE (from)-[r:{clean_rel_type}]->(to){tags_clause}"
+                    )
                 )
 
-    return "\n".join(cypher_lines)
+    return statements
+
+
+def generate_cypher_from_structures(
+    nodes: dict[str, tuple],
+    edges: list[tuple],
+    contains: list[tuple],
+    upload_id: str = None,
+    filename: str = None,
+    ingest_timestamp: str = None,
+) -> str:
+    """Generate Cypher statements from node and edge structures.
+
+    Args:
+        nodes: Dictionary of node structures
+        edges: List of edge tuples
+        contains: List of containment edge tuples
+        upload_id: Unique identifier for this upload batch (for graph isolation)
+        filename: Source filename (for graph isolation)
+        ingest_timestamp: ISO timestamp of ingestion (for provenance)
+
+    Returns:
+        Cypher statements as string
+    """
+    statements = build_cypher_statements(
+        nodes, edges, contains, upload_id, filename, ingest_timestamp, parameterized=False
+    )
+    return "\n".join(f"{statement.query};" for statement in statements)
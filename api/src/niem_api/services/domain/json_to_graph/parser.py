@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""JSON document parsing for NIEM JSON ingest.
+
+Documents are parsed straight from the uploaded bytes (no intermediate str)
+with the standard library, or with orjson when JSON_PARSER is "orjson" and
+the package is installed. Input orjson rejects but the standard library
+accepts (NaN/Infinity literals) is re-parsed with ``json``, so syntax errors
+are always reported as ``json.JSONDecodeError`` with line and column.
+
+orjson is opt-in because depending on its version it reads integers beyond
+64 bits as floats instead of exact ints.
+"""
+
+import json
+from typing import Any
+
+from ....core.config import batch_config
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def parse_json(content: str | bytes) -> Any:
+    """Parse a JSON document.
+
+    Args:
+        content: JSON text or UTF-8/16/32 encoded bytes
+
+    Returns:
+        Parsed document
+
+    Raises:
+        json.JSONDecodeError: If the content is not valid JSON
+    """
+    if ORJSON_AVAILABLE and batch_config.JSON_PARSER == "orjson":
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
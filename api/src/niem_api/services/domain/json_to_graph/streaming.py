@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""Streaming conversion of large NIEM JSON-LD documents.
+
+``generate_for_json_content`` parses the whole document and keeps every node
+of the file until the Cypher statements are built. For JSON-LD exports with
+hundreds of thousands of ``@graph`` entries that holds the document in memory
+several times over. This module instead reads the document in two passes over
+the raw bytes:
+
+1. A cheap first pass reads one ``@graph`` item at a time to count @id
+   occurrences (for hub nodes) and to collect the other top-level members
+   such as ``@context``. Only the @id table is kept.
+2. The second pass reads the items again and converts them with the same
+   rules as ``generate_for_json_content``. Nodes and containment edges are
+   emitted in batches of roughly ``batch_nodes`` nodes; reference and
+   association edges (compact tuples) are emitted last, after every node
+   they can point at.
+
+Documents without an ``@graph`` array are a single object and are converted
+in one batch as usual. Streaming input must be UTF-8.
+"""
+
+import codecs
+import json
+import logging
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from typing import Any, BinaryIO
+
+from ..mapping_plan import MappingPlan
+from .converter import (
+    _count_id_occurrences,
+    _iter_jsonld_conversion,
+    build_cypher_statements,
+    generate_cypher_from_structures,
+    generate_for_json_content,
+)
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = " \t\n\r"
+
+
+class _StreamReader:
+    """Incremental JSON tokenizer over a binary stream.
+
+    Values are decoded with ``json.JSONDecoder.raw_decode`` from a text buffer
+    that is refilled from the stream; only the value being decoded (plus one
+    read chunk) is held in memory.
+    """
+
+    def __init__(self, stream: BinaryIO, chunk_size: int):
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self._json = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, size: int) -> bool:
+        """Append up to size bytes of decoded input; False at end of stream."""
+        if self._eof:
+            return False
+        chunk = self._stream.read(size)
+        self._eof = not chunk
+        self._buffer = self._buffer[self._pos :] + self._decoder.decode(chunk, final=self._eof)
+        self._pos = 0
+        return not self._eof
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self._buffer, self._pos)
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ("" at end of input)."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill(self._chunk_size):
+                return ""
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise self._error(f"Expecting '{char}'")
+        self._pos += 1
+
+    def read_value(self) -> Any:
+        """Decode the next complete JSON value."""
+        self.peek()
+        size = self._chunk_size
+        while True:
+            try:
+                value, end = self._json.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # Incomplete value: read more (doubling so huge values stay linear)
+                if not self._fill(size):
+                    raise
+                size *= 2
+                continue
+            # A number ending at the buffer edge may continue in the next chunk
+            if end == len(self._buffer) and not self._eof:
+                self._fill(size)
+                continue
+            self._pos = end
+            return value
+
+
+def iter_jsonld_document(stream: BinaryIO, chunk_size: int = 1 << 16) -> Iterator[tuple[str, Any, bool]]:
+    """Read a JSON object member by member, yielding ``@graph`` items one at a time.
+
+    Args:
+        stream: Binary stream positioned at the start of a JSON object
+        chunk_size: Bytes read from the stream at a time
+
+    Yields:
+        (key, value, is_graph_item) - one tuple per top-level member, except
+        that a non-empty ``@graph`` array yields one tuple per item instead
+
+    Raises:
+        json.JSONDecodeError: If the input is not a JSON object
+    """
+    reader = _StreamReader(stream, chunk_size)
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+
+    while True:
+        key = reader.read_value()
+        if not isinstance(key, str):
+            raise reader._error("Expecting property name enclosed in double quotes")
+        reader.expect(":")
+
+        if key == "@graph" and reader.peek() == "[":
+            reader.expect("[")
+            if reader.peek() == "]":
+                reader.expect("]")
+                yield key, [], False
+            else:
+                while True:
+                    yield key, reader.read_value(), True
+                    if reader.peek() == ",":
+                        reader.expect(",")
+                        continue
+                    reader.expect("]")
+                    break
+        else:
+            yield key, reader.read_value(), False
+
+        if reader.peek() == ",":
+            reader.expect(",")
+            continue
+        reader.expect("}")
+        return
+
+
+def iter_json_cypher_batches(
+    stream: BinaryIO,
+    mapping_dict: dict[str, Any] | MappingPlan,
+    filename: str = "memory",
+    upload_id: str = None,
+    schema_id: str = None,
+    cmf_element_index: set = None,
+    mode: str = "dynamic",
+    batch_nodes: int = 10000,
+    write_mode: str = "statement_list",
+) -> Iterator[tuple[str | list, dict[str, Any], list[tuple], list[tuple]]]:
+    """Convert a NIEM JSON-LD document to Cypher statements in bounded batches.
+
+    Produces the same statements as ``generate_for_json_content``, split into
+    batches. Batches must be executed in order: an edge is only emitted in or
+    after the batch that writes both of its endpoints. Each batch carries at
+    most about ``batch_nodes`` reference/association edges.
+
+    Args:
+        stream: Seekable binary stream with the NIEM JSON document
+        mapping_dict: Mapping dictionary or compiled MappingPlan
+        filename: Source filename for provenance
+        upload_id: Unique identifier for this upload batch (for graph isolation)
+        schema_id: Schema identifier (for graph isolation)
+        cmf_element_index: Set of known CMF element QNames
+        mode: Converter mode - "mapping" (use selections) or "dynamic" (all complex elements)
+        batch_nodes: Approximate number of nodes per batch
+        write_mode: "statement_list" (list of CypherStatement) or "statements"
+            (literal Cypher script per batch)
+
+    Yields:
+        Tuples of (cypher_statements, nodes_dict, contains_list, edges_list) per batch
+    """
+    # First pass: @id occurrence table and the non-@graph members
+    header: dict[str, Any] = {}
+    id_occurrence_count: dict[str, int] = {}
+    graph_items = 0
+    for key, value, is_graph_item in iter_jsonld_document(stream):
+        if is_graph_item:
+            graph_items += 1
+            if isinstance(value, dict):
+                _count_id_occurrences(value, id_occurrence_count)
+        else:
+            header[key] = value
+
+    if not graph_items:
+        # Single object (or empty/non-array @graph): nothing to stream
+        yield generate_for_json_content(
+            header, mapping_dict, filename, upload_id, schema_id, cmf_element_index, mode, write_mode
+        )
+        return
+
+    logger.info(f"Streaming {graph_items} @graph items from {filename} ({len(id_occurrence_count)} distinct @ids)")
+
+    # Second pass: convert items as they are read
+    stream.seek(0)
+    items = (value for _, value, is_graph_item in iter_jsonld_document(stream) if is_graph_item)
+    ingest_timestamp = datetime.now(UTC).isoformat()
+    for nodes, contains, edges in _iter_jsonld_conversion(
+        items,
+        id_occurrence_count,
+        header,
+        header.get("@context", {}),
+        mapping_dict,
+        filename,
+        upload_id,
+        schema_id,
+        cmf_element_index,
+        mode,
+        batch_nodes=max(batch_nodes, 1),
+    ):
+        statements: str | list
+        if write_mode == "statement_list":
+            statements = build_cypher_statements(nodes, edges, contains, upload_id, filename, ingest_timestamp)
+        else:
+            statements = generate_cypher_from_structures(nodes, edges, contains, upload_id, filename, ingest_timestamp)
+        yield statements, nodes, contains, edges
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""Compiled mapping plans shared by the XML and JSON converters.
+
+Both converters need the same lookups derived from a mapping dictionary:
+object rules by qname, associations by qname, the augmentation index and the
+CMF element set used for augmentation detection. Building them on every
+document is wasted work when a batch of files shares one mapping, so they are
+compiled once into a MappingPlan and kept in a small in-process LRU cache.
+
+Plans are cached two ways:
+
+- by a version key such as ``(schema_id, etag)`` when the caller knows the
+  mapping version, skipping the download and YAML parse on a hit
+- by identity of the mapping dictionary, so repeated converter calls with the
+  same dict reuse the plan without the caller doing anything
+
+Mapping dictionaries are treated as read-only once compiled. Converters that
+extend the association index (dynamic mode auto-detection) work on a copy.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+from ...core.config import batch_config
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class MappingPlan:
+    """Prebuilt lookups for a mapping dictionary.
+
+    Attributes:
+        mapping: The source mapping dictionary
+        obj_rules: Object rules keyed by qname
+        associations: Association rules in mapping order
+        references: Reference rules in mapping order
+        namespaces: Namespace prefix -> URI map from the mapping
+        assoc_by_qn: Association rules keyed by qname
+        augmentation_index: Augmentation definitions keyed by augmentation element qname
+        cmf_element_index: Known CMF element qnames (from mapping metadata)
+    """
+
+    mapping: dict[str, Any]
+    obj_rules: dict[str, dict[str, Any]]
+    associations: list[dict[str, Any]]
+    references: list[dict[str, Any]]
+    namespaces: dict[str, str]
+    assoc_by_qn: dict[str, dict[str, Any]]
+    augmentation_index: dict[str, dict[str, Any]]
+    cmf_element_index: frozenset
+
+    @classmethod
+    def from_dict(cls, mapping_dict: dict[str, Any]) -> "MappingPlan":
+        """Compile a plan from a mapping dictionary.
+
+        Args:
+            mapping_dict: Mapping dictionary (mapping.yaml format)
+
+        Returns:
+            Compiled MappingPlan
+        """
+        associations = mapping_dict.get("associations", [])
+        metadata = mapping_dict.get("metadata") or {}
+        return cls(
+            mapping=mapping_dict,
+            obj_rules={o["qname"]: o for o in mapping_dict.get("objects", [])},
+            associations=associations,
+            references=mapping_dict.get("references", []),
+            namespaces=mapping_dict.get("namespaces", {}),
+            assoc_by_qn={assoc["qname"]: assoc for assoc in associations},
+            augmentation_index={
+                aug["augmentation_element_qname"]: aug for aug in mapping_dict.get("augmentations", [])
+            },
+            cmf_element_index=frozenset(metadata.get("cmf_element_index") or ()),
+        )
+
+
+class _PlanCache:
+    """Thread-safe LRU cache of compiled plans."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._plans: OrderedDict[Hashable, MappingPlan] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> MappingPlan | None:
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is not None:
+                self._plans.move_to_end(key)
+            return plan
+
+    def put(self, key: Hashable, plan: MappingPlan) -> None:
+        if self.max_size < 1:
+            return
+        with self._lock:
+            self._plans[key] = plan
+            self._plans.move_to_end(key)
+            while len(self._plans) > self.max_size:
+                self._plans.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._plans.clear()
+
+    def __len__(self) -> int:
+        return len(self._plans)
+
+
+_plan_cache = _PlanCache(batch_config.MAPPING_PLAN_CACHE_SIZE)
+
+
+def _compile(key: Hashable, mapping_dict: dict[str, Any]) -> MappingPlan:
+    """Compile a plan and cache it under ``key`` and under the dict's identity."""
+    plan = MappingPlan.from_dict(mapping_dict)
+    _plan_cache.put(key, plan)
+    _plan_cache.put(("id", id(mapping_dict)), plan)
+    logger.debug(f"Compiled mapping plan ({len(plan.obj_rules)} objects, {len(plan.assoc_by_qn)} associations)")
+    return plan
+
+
+def get_mapping_plan(mapping: "dict[str, Any] | MappingPlan") -> MappingPlan:
+    """Return the compiled plan for a mapping, compiling it on first use.
+
+    Args:
+        mapping: Mapping dictionary or an already compiled plan
+
+    Returns:
+        Compiled MappingPlan (cached by identity of the mapping dictionary)
+    """
+    if isinstance(mapping, MappingPlan):
+        return mapping
+
+    key = ("id", id(mapping))
+    plan = _plan_cache.get(key)
+    # A cached plan keeps its dict alive, so the id cannot be reused while the
+    # entry exists; the identity check is a cheap guard all the same
+    if plan is not None and plan.mapping is mapping:
+        return plan
+    return _compile(key, mapping)
+
+
+def load_mapping_plan(cache_key: Hashable, loader: Callable[[], dict[str, Any]]) -> MappingPlan:
+    """Return the plan for a versioned mapping, calling ``loader`` only on a miss.
+
+    Args:
+        cache_key: Version key for the mapping, e.g. ``(schema_id, etag)``
+        loader: Callable returning the mapping dictionary
+
+    Returns:
+        Compiled MappingPlan
+    """
+    key = ("key", cache_key)
+    plan = _plan_cache.get(key)
+    if plan is not None:
+        return plan
+    return _compile(key, loader())
+
+
+def clear_mapping_plan_cache() -> None:
+    """Drop all cached plans (used after mapping updates and in tests)."""
+    _plan_cache.clear()
@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 
+import bisect
 import logging
 import re
 from pathlib import Path
+from typing import Any
 
 # Use defusedxml for secure XML parsing (prevents XXE attacks)
 from defusedxml import ElementTree as ET
@@ -10,6 +12,61 @@ from defusedxml import ElementTree as ET
 logger = logging.getLogger(__name__)
 
 
+# Prefix usage in references and tags (ref="nc:Person", <j:Crash>, </j:Crash>) and
+# xmlns:prefix declarations, found in one scan of the schema text. The lookahead
+# keeps every match zero-width so matches of different kinds may overlap
+# ("</j:" is both a tag and a closing tag).
+_PREFIX_SCAN_PATTERN = re.compile(
+    r"""(?=(ref|type|base|substitutionGroup)\s*=\s*["']([^:"'\s]+):"""
+    r"""|<([^:>\s]+):"""
+    r"""|xmlns:([^=\s]+)\s*=\s*["']([^"']+)["'])"""
+)
+
+STANDARD_NAMESPACES = {
+    "http://www.w3.org/2001/XMLSchema",
+    "http://www.w3.org/2001/XMLSchema-instance",
+    "http://www.w3.org/XML/1998/namespace",
+}
+
+
+class _SchemaPathIndex:
+    """Index of uploaded schema paths for resolving import schemaLocations.
+
+    Answers the same question as comparing a schemaLocation against every
+    uploaded path (exact path, basename, path suffix, and the part after a
+    folder named *.xsd), in O(log n) per import instead of O(n).
+    """
+
+    def __init__(self, uploaded_names):
+        self._names = set(uploaded_names)
+        normalized = [name.replace("\\", "/") for name in self._names]
+        # Reversed paths, sorted: "ends with X" becomes a prefix search for reversed X
+        self._reversed = sorted(name[::-1] for name in normalized)
+        # Path after any folder containing .xsd (e.g. "model.xsd/niem/domains/justice.xsd")
+        self._after_xsd_folder = {name.split(".xsd/")[-1] for name in normalized if ".xsd/" in name}
+
+    def _has_path_ending_with(self, suffix: str) -> bool:
+        reversed_suffix = suffix[::-1]
+        index = bisect.bisect_left(self._reversed, reversed_suffix)
+        return index < len(self._reversed) and self._reversed[index].startswith(reversed_suffix)
+
+    def resolves(self, schema_location: str) -> bool:
+        """Check whether an import schemaLocation matches an uploaded file."""
+        normalized_location = schema_location.replace("\\", "/")
+        import_filename = Path(schema_location).name
+
+        # Exact relative path, or just the basename (backwards compatibility)
+        if normalized_location in self._names or import_filename in self._names:
+            return True
+        # Any uploaded path ending with the import path or its basename
+        if self._has_path_ending_with(normalized_location) or self._has_path_ending_with(import_filename):
+            return True
+        # Uploaded folders named *.xsd: compare the path after that folder
+        if normalized_location.lstrip("../") in self._after_xsd_folder:
+            return True
+        return any(normalized_location[i:] in self._after_xsd_folder for i in range(len(normalized_location) + 1))
+
+
 class SchemaValidator:
     """
     Validates that all schema dependencies exist within uploaded files.
@@ -22,128 +79,92 @@ class SchemaValidator:
     def __init__(self):
         pass
 
-    def _extract_schema_imports(self, xsd_content: str) -> set[str]:
-        """Extract schemaLocation paths from XSD imports"""
+    def _analyze_schema(self, xsd_content: str) -> dict[str, Any]:
+        """Extract everything dependency validation needs from one schema in a single parse.
+
+        Args:
+            xsd_content: XSD file content
+
+        Returns:
+            Dict with target_namespace, schema_locations (import schemaLocation paths),
+            imported_namespaces (xs:import namespaces and xsi:schemaLocation URIs),
+            namespace_map (prefix to URI) and used_prefixes (prefixes used in
+            references and tags)
+        """
+        target_namespace = None
         schema_locations = set()
+        imported_namespaces = set()
+        namespace_map = {}
 
         try:
             root = ET.fromstring(xsd_content)
+            target_namespace = root.get("targetNamespace")
 
-            # Find all xs:import elements with schemaLocation
             for elem in root.iter():
                 if elem.tag.endswith("}import") or elem.tag == "import":
                     schema_location = elem.get("schemaLocation")
                     if schema_location:
                         schema_locations.add(schema_location)
-
-        except ET.ParseError as e:
-            logger.error(f"Failed to parse XSD for import extraction: {e}")
-
-            # Fallback to regex parsing
-            import_pattern = r'schemaLocation\s*=\s*["\']([^"\']+)["\']'
-            for match in re.finditer(import_pattern, xsd_content):
-                schema_locations.add(match.group(1))
-
-        return schema_locations
-
-    def _extract_imported_namespaces(self, xsd_content: str) -> set[str]:
-        """Extract namespace URIs from xs:import elements"""
-        imported_namespaces = set()
-
-        try:
-            root = ET.fromstring(xsd_content)
-
-            # Find all xs:import elements
-            for elem in root.iter():
-                if elem.tag.endswith("}import") or elem.tag == "import":
                     namespace = elem.get("namespace")
                     if namespace:
                         imported_namespaces.add(namespace)
 
-            # Also check xsi:schemaLocation in root element
-            schema_location = root.get("{http://www.w3.org/2001/XMLSchema-instance}schemaLocation")
-            if schema_location:
-                # xsi:schemaLocation format: "namespace1 location1 namespace2 location2"
-                parts = schema_location.split()
-                for i in range(0, len(parts), 2):
-                    if i < len(parts):
-                        namespace_uri = parts[i]
-                        imported_namespaces.add(namespace_uri)
-
-        except ET.ParseError as e:
-            logger.warning(f"Failed to parse XSD for import extraction: {e}")
-            # Fallback to regex parsing
-            import_pattern = r'<xs:import[^>]+namespace\s*=\s*["\']([^"\']+)["\']'
-            for match in re.finditer(import_pattern, xsd_content):
-                imported_namespaces.add(match.group(1))
-
-            # Also parse xsi:schemaLocation with regex
-            schema_location_pattern = r'xsi:schemaLocation\s*=\s*["\']([^"\']+)["\']'
-            for match in re.finditer(schema_location_pattern, xsd_content):
-                schema_location = match.group(1)
-                parts = schema_location.split()
-                for i in range(0, len(parts), 2):
-                    if i < len(parts):
-                        namespace_uri = parts[i]
-                        imported_namespaces.add(namespace_uri)
-
-        return imported_namespaces
-
-    def _extract_namespace_declarations(self, xsd_content: str) -> dict[str, str]:
-        """Extract namespace prefix to URI mappings from schema root element"""
-        namespace_map = {}
+            # xsi:schemaLocation format: "namespace1 location1 namespace2 location2"
+            xsi_schema_location = root.get("{http://www.w3.org/2001/XMLSchema-instance}schemaLocation")
+            if xsi_schema_location:
+                imported_namespaces.update(xsi_schema_location.split()[::2])
 
-        try:
-            root = ET.fromstring(xsd_content)
-
-            # Get all namespace declarations (xmlns:prefix="uri")
             for key, value in root.attrib.items():
                 if key.startswith("{http://www.w3.org/2000/xmlns/}"):
-                    # Remove namespace prefix to get the local prefix
-                    prefix = key.split("}")[1] if "}" in key else ""
-                    namespace_map[prefix] = value
+                    namespace_map[key.split("}")[1]] = value
                 elif key == "xmlns":
-                    # Default namespace
                     namespace_map[""] = value
 
-            # ElementTree doesn't always capture xmlns attributes correctly, so also use regex
-            xmlns_pattern = r'xmlns:([^=\s]+)\s*=\s*["\']([^"\']+)["\']'
-            for match in re.finditer(xmlns_pattern, xsd_content):
-                prefix, uri = match.groups()
-                namespace_map[prefix] = uri
-
         except ET.ParseError as e:
-            logger.warning(f"Failed to parse XSD for namespace extraction: {e}")
-            # Fallback to regex parsing only
-            xmlns_pattern = r'xmlns:([^=\s]+)\s*=\s*["\']([^"\']+)["\']'
-            for match in re.finditer(xmlns_pattern, xsd_content):
-                prefix, uri = match.groups()
-                namespace_map[prefix] = uri
-
-        return namespace_map
-
-    def _find_used_namespace_prefixes(self, xsd_content: str) -> set[str]:
-        """Find all namespace prefixes that are actually used in element/type references"""
-        used_prefixes = set()
-
-        # Pattern to find prefixed element/type references like "nc:Person", "j:Crash", etc.
-        prefix_usage_patterns = [
-            r'ref\s*=\s*["\']([^:"\'\s]+):',  # ref="prefix:ElementName"
-            r'type\s*=\s*["\']([^:"\'\s]+):',  # type="prefix:TypeName"
-            r'base\s*=\s*["\']([^:"\'\s]+):',  # base="prefix:BaseType"
-            r'substitutionGroup\s*=\s*["\']([^:"\'\s]+):',  # substitutionGroup="prefix:Element"
-            r"<([^:>\s]+):",  # <prefix:ElementName> (element declarations/usage)
-            r"</([^:>\s]+):",  # </prefix:ElementName> (closing tags)
-        ]
-
-        for pattern in prefix_usage_patterns:
-            for match in re.finditer(pattern, xsd_content):
-                prefix = match.group(1)
-                if prefix and prefix != "xs":  # Exclude XML Schema namespace
-                    used_prefixes.add(prefix)
+            logger.warning(f"Failed to parse XSD, falling back to regex extraction: {e}")
+            for match in re.finditer(r'schemaLocation\s*=\s*["\']([^"\']+)["\']', xsd_content):
+                schema_locations.add(match.group(1))
+            for match in re.finditer(r'<xs:import[^>]+namespace\s*=\s*["\']([^"\']+)["\']', xsd_content):
+                imported_namespaces.add(match.group(1))
+            for match in re.finditer(r'xsi:schemaLocation\s*=\s*["\']([^"\']+)["\']', xsd_content):
+                imported_namespaces.update(match.group(1).split()[::2])
+
+        # ElementTree does not report xmlns attributes, so declarations and
+        # prefix usage both come from the text scan. Matches are kept per kind of
+        # reference, skipping those overlapping the previous match of the same
+        # kind, so the result is the same as scanning once per pattern.
+        matches_by_kind: dict[str, list[Any]] = {
+            kind: [] for kind in ("ref", "type", "base", "substitutionGroup", "<", "</", "xmlns")
+        }
+        match_end = dict.fromkeys(matches_by_kind, 0)
+        for match in _PREFIX_SCAN_PATTERN.finditer(xsd_content):
+            attribute, attribute_prefix, tag_prefix, declared_prefix, declared_uri = match.groups()
+            if declared_prefix is not None:
+                found: list[tuple[str, Any, int]] = [("xmlns", (declared_prefix, declared_uri), match.end(5) + 1)]
+            elif attribute is not None:
+                found = [(attribute, attribute_prefix, match.end(2) + 1)]
+            else:
+                found = [("<", tag_prefix, match.end(3) + 1)]
+                if tag_prefix.startswith("/") and len(tag_prefix) > 1:
+                    found.append(("</", tag_prefix[1:], match.end(3) + 1))
+            for kind, value, end in found:
+                if match.start() >= match_end[kind]:
+                    matches_by_kind[kind].append(value)
+                    match_end[kind] = end
+
+        namespace_map.update(matches_by_kind.pop("xmlns"))
+        used_prefixes: set[str] = set()
+        for prefixes in matches_by_kind.values():
+            used_prefixes.update(prefix for prefix in prefixes if prefix != "xs")
 
         logger.debug(f"Found used namespace prefixes: {used_prefixes}")
-        return used_prefixes
+        return {
+            "target_namespace": target_namespace,
+            "schema_locations": schema_locations,
+            "imported_namespaces": imported_namespaces,
+            "namespace_map": namespace_map,
+            "used_prefixes": used_prefixes,
+        }
 
     def validate_uploaded_schemas(self, uploaded_schemas: dict[str, str]) -> dict[str, any]:
         """
@@ -157,78 +178,35 @@ class SchemaValidator:
         """
         logger.info(f"Validating dependencies for {len(uploaded_schemas)} uploaded schemas")
 
+        # Parse every schema once, and index the uploaded paths for import lookups
+        analyses = {filename: self._analyze_schema(content) for filename, content in uploaded_schemas.items()}
+        path_index = _SchemaPathIndex(uploaded_schemas)
+
         # Build a map of target namespaces to filenames from uploaded schemas
         namespace_to_file = {}
-        for filename, content in uploaded_schemas.items():
-            try:
-                root = ET.fromstring(content)
-                target_namespace = root.get("targetNamespace")
-                if target_namespace:
-                    namespace_to_file[target_namespace] = filename
-                    logger.debug(f"Mapped namespace {target_namespace} -> {filename}")
-            except ET.ParseError:
-                logger.warning(f"Failed to parse {filename} for targetNamespace")
+        for filename, analysis in analyses.items():
+            target_namespace = analysis["target_namespace"]
+            if target_namespace:
+                namespace_to_file[target_namespace] = filename
+                logger.debug(f"Mapped namespace {target_namespace} -> {filename}")
 
         # Track per-file validation details
         file_details = []
         total_missing_count = 0
 
         # Validate each uploaded schema
-        for filename, content in uploaded_schemas.items():
+        for filename, analysis in analyses.items():
             logger.debug(f"Validating dependencies in {filename}")
 
             file_imports = []
             file_namespaces = []
 
             # Check schemaLocation imports
-            schema_imports = self._extract_schema_imports(content)
-            imported_namespaces_set = self._extract_imported_namespaces(content)
+            imported_namespaces_set = analysis["imported_namespaces"]
 
-            for schema_location in schema_imports:
-                # Normalize the path (convert backslashes to forward slashes)
-                normalized_location = schema_location.replace("\\", "/")
+            for schema_location in analysis["schema_locations"]:
                 import_filename = Path(schema_location).name
-
-                # Check if this file exists in uploaded schemas
-                found = False
-
-                # First, try exact match with schema location (handles relative paths like niem/domains/justice.xsd)
-                if normalized_location in uploaded_schemas:
-                    found = True
-                # Second, try matching just the basename (backwards compatibility)
-                elif import_filename in uploaded_schemas:
-                    found = True
-                else:
-                    # Also check if any uploaded schema path ends with this import path
-                    for uploaded_name in uploaded_schemas.keys():
-                        normalized_uploaded = uploaded_name.replace("\\", "/")
-
-                        # Check various matching patterns
-                        if normalized_uploaded.endswith(normalized_location):
-                            found = True
-                            break
-                        elif normalized_uploaded.endswith(import_filename):
-                            found = True
-                            break
-
-                        # Special handling: If the uploaded path contains .xsd in folder names,
-                        # try to match by comparing the final path components
-                        # Example: "model.xsd/niem/domains/justice.xsd" should match import "../niem/domains/justice.xsd"
-                        if ".xsd/" in normalized_uploaded:
-                            # Extract the path after any folder containing .xsd
-                            # This handles cases like "model.xsd/niem/domains/justice.xsd"
-                            parts = normalized_uploaded.split(".xsd/")
-                            if len(parts) > 1:
-                                # Get everything after the .xsd/ folder
-                                path_after_xsd_folder = parts[-1]
-                                # Check if this matches our import location
-                                if path_after_xsd_folder == normalized_location.lstrip("../"):
-                                    found = True
-                                    break
-                                # Also check if import path ends with this
-                                if normalized_location.endswith(path_after_xsd_folder):
-                                    found = True
-                                    break
+                found = path_index.resolves(schema_location)
 
                 # Get namespace for this import
                 import_namespace = ""
@@ -254,8 +232,8 @@ class SchemaValidator:
                     logger.warning(f"{filename} imports {schema_location} which is not in uploaded files")
 
             # Check namespace references
-            namespace_prefixes = self._extract_namespace_declarations(content)
-            used_prefixes = self._find_used_namespace_prefixes(content)
+            namespace_prefixes = analysis["namespace_map"]
+            used_prefixes = analysis["used_prefixes"]
 
             # Check that used namespace prefixes have corresponding uploaded schemas
             for prefix in used_prefixes:
@@ -263,13 +241,7 @@ class SchemaValidator:
                     namespace_uri = namespace_prefixes[prefix]
 
                     # Skip standard XML/XSD namespaces
-                    standard_namespaces = [
-                        "http://www.w3.org/2001/XMLSchema",
-                        "http://www.w3.org/2001/XMLSchema-instance",
-                        "http://www.w3.org/XML/1998/namespace",
-                    ]
-
-                    if namespace_uri in standard_namespaces:
+                    if namespace_uri in STANDARD_NAMESPACES:
                         continue
 
                     status = "satisfied" if namespace_uri in namespace_to_file else "missing"
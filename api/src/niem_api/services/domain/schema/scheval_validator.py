@@ -8,6 +8,7 @@ Provides high-level validation operations with structured error reporting includ
 This service layer orchestrates schematron validation operations using the scheval_client for execution.
 """
 
+import asyncio
 import logging
 import os
 import tempfile
@@ -139,7 +140,8 @@ class SchevalValidator:
                 logger.info(f"Running scheval validation with schematron: {schematron_file}")
 
                 # Run scheval command
-                result = run_scheval_command(cmd, timeout=120, working_dir=str(temp_dir_path))
+                # (blocking subprocess; run off the event loop so files can validate concurrently)
+                result = await asyncio.to_thread(run_scheval_command, cmd, timeout=120, working_dir=str(temp_dir_path))
 
                 # Parse validation output
                 parsed = parse_scheval_validation_output(result["stdout"], result["stderr"], xsd_file.name)
@@ -255,7 +257,8 @@ class SchevalValidator:
                 logger.info(f"Running scheval validation on XML with schematron: {schematron_file}")
 
                 # Run scheval command
-                result = run_scheval_command(cmd, timeout=120, working_dir=str(temp_dir_path))
+                # (blocking subprocess; run off the event loop so files can validate concurrently)
+                result = await asyncio.to_thread(run_scheval_command, cmd, timeout=120, working_dir=str(temp_dir_path))
 
                 # Parse validation output
                 parsed = parse_scheval_validation_output(result["stdout"], result["stderr"], xml_file.name)
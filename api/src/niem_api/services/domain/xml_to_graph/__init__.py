@@ -4,6 +4,6 @@ XML to Graph Conversion Domain
 Handles conversion of XML instance documents to Neo4j graph structures.
 """
 
-from .converter import generate_for_xml_content
+from .converter import generate_for_xml_content, generate_for_xml_stream, iter_xml_cypher_batches
 
-__all__ = ["generate_for_xml_content"]
+__all__ = ["generate_for_xml_content", "generate_for_xml_stream", "iter_xml_cypher_batches"]
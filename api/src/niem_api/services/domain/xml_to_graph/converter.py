@@ -7,9 +7,11 @@ reference relationships.
 """
 import argparse
 import hashlib
+import io
 import json
 import re
 from collections import defaultdict
+from collections.abc import Iterator
 
 # Use defusedxml for secure XML parsing (prevents XXE attacks)
 import defusedxml.ElementTree as ET
@@ -17,7 +19,9 @@ import defusedxml.ElementTree as ET
 # Import Element type from standard library for type hints
 from xml.etree.ElementTree import Element
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
+
+from ..mapping_plan import MappingPlan, get_mapping_plan
 
 import yaml
 import logging
@@ -89,6 +93,10 @@ def get_structures_attr(elem: Element, attr_local_name: str, struct_ns: str = No
     Returns:
         Attribute value or None if not found
     """
+    # Most elements carry no attributes at all
+    if not elem.attrib:
+        return None
+
     # Try detected namespace first (fastest path)
     if struct_ns:
         val = elem.attrib.get(f"{{{struct_ns}}}{attr_local_name}")
@@ -208,16 +216,47 @@ def parse_ns(xml_text: str) -> dict[str, str]:
     return ns_map
 
 
+class NamespaceMap(dict):
+    """Namespace prefix -> URI mapping that memoizes tag -> qname lookups.
+
+    The converter resolves the same handful of tags many thousands of times per
+    document; the cache is cleared whenever a prefix is (re)declared.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.qname_cache = {}
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.qname_cache.clear()
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.qname_cache.clear()
+
+
 def qname_from_tag(tag: str, ns_map: dict[str, str]) -> str:
     """Convert XML tag to qualified name using namespace map.
 
     Args:
         tag: XML element tag (may include namespace URI)
-        ns_map: Namespace prefix to URI mapping
+        ns_map: Namespace prefix to URI mapping (a NamespaceMap caches results)
 
     Returns:
         Qualified name in prefix:localname format
     """
+    cache = getattr(ns_map, "qname_cache", None)
+    if cache is None:
+        return _resolve_qname(tag, ns_map)
+    qname = cache.get(tag)
+    if qname is None:
+        qname = cache[tag] = _resolve_qname(tag, ns_map)
+    return qname
+
+
+def _resolve_qname(tag: str, ns_map: dict[str, str]) -> str:
+    """Resolve a tag to prefix:localname (first non-default prefix bound to its URI)."""
     if tag.startswith("{"):
         uri, local = tag[1:].split("}", 1)
         for prefix, namespace_uri in ns_map.items():
@@ -786,102 +825,281 @@ def _is_complex_element(elem: Element, ns_map: dict[str, str], struct_ns: str) -
     return False
 
 
-def detect_associations_from_xml_data(root: Element, xml_ns_map: dict[str, str]) -> dict[str, dict[str, Any]]:
-    """Auto-detect association patterns in XML data for dynamic mode.
+def _detect_association_pattern(elem: Element, xml_ns_map: dict[str, str]) -> dict[str, Any] | None:
+    """Check whether a single element looks like a NIEM association.
 
     NIEM associations follow naming convention: elements ending with "Association"
     that have 2+ child elements representing endpoint roles.
 
     Args:
-        root: XML root element
+        elem: XML element (with its children parsed)
         xml_ns_map: Namespace prefix mapping
 
     Returns:
-        Dictionary mapping association QName to association rule
+        Association rule dictionary, or None if the element is not an association
     """
-    from .converter import qname_from_tag
+    elem_qn = qname_from_tag(elem.tag, xml_ns_map)
 
-    auto_assocs = {}
+    # Check if this looks like an association (ends with "Association")
+    if not elem_qn.endswith("Association"):
+        return None
 
-    def scan_element_for_associations(elem: Element):
-        """Recursively scan element for association patterns."""
-        elem_qn = qname_from_tag(elem.tag, xml_ns_map)
+    # Extract potential endpoints (child elements)
+    endpoints = []
 
-        # Check if this looks like an association (ends with "Association")
-        if elem_qn.endswith("Association"):
-            # Extract potential endpoints (child elements)
-            endpoints = []
+    for child in elem:
+        child_qn = qname_from_tag(child.tag, xml_ns_map)
+
+        # Check if child has a reference (structures:ref, structures:uri, or structures:id)
+        # This indicates it's an endpoint role, not just a property
+        has_ref = False
+        for attr in child.attrib.keys():
+            if "ref" in attr.lower() or "uri" in attr.lower() or "id" in attr.lower():
+                if any(ns in attr for ns in ["structures", "s:"]):
+                    has_ref = True
+                    break
 
-            for child in elem:
-                child_qn = qname_from_tag(child.tag, xml_ns_map)
+        if has_ref:
+            endpoints.append(
+                {
+                    "role_qname": child_qn,
+                    "maps_to_label": child_qn.replace(":", "_"),
+                    "direction": "source" if len(endpoints) == 0 else "target",
+                    "via": "structures:ref",
+                    "cardinality": "0..*",
+                }
+            )
 
-                # Check if child has a reference (structures:ref, structures:uri, or structures:id)
-                # This indicates it's an endpoint role, not just a property
-                has_ref = False
-                for attr in child.attrib.keys():
-                    if "ref" in attr.lower() or "uri" in attr.lower() or "id" in attr.lower():
-                        if any(ns in attr for ns in ["structures", "s:"]):
-                            has_ref = True
-                            break
+    # Valid association must have 2+ endpoints
+    if len(endpoints) < 2:
+        return None
 
-                if has_ref:
-                    endpoints.append(
-                        {
-                            "role_qname": child_qn,
-                            "maps_to_label": child_qn.replace(":", "_"),
-                            "direction": "source" if len(endpoints) == 0 else "target",
-                            "via": "structures:ref",
-                            "cardinality": "0..*",
-                        }
-                    )
+    return {
+        "qname": elem_qn,
+        "rel_type": elem_qn.replace(":", "_").upper(),
+        "endpoints": endpoints,
+        "rel_props": [],
+    }
 
-            # Valid association must have 2+ endpoints
-            if len(endpoints) >= 2:
-                auto_assocs[elem_qn] = {
-                    "qname": elem_qn,
-                    "rel_type": elem_qn.replace(":", "_").upper(),
-                    "endpoints": endpoints,
-                    "rel_props": [],
-                }
-                logger.info(
-                    f"Auto-detected association: {elem_qn} with {len(endpoints)} endpoints: {[ep['role_qname'] for ep in endpoints]}"
-                )
 
-        # Recurse into children
-        for child in elem:
-            scan_element_for_associations(child)
+def detect_associations_from_xml_data(root: Element, xml_ns_map: dict[str, str]) -> dict[str, dict[str, Any]]:
+    """Auto-detect association patterns in XML data for dynamic mode.
+
+    NIEM associations follow naming convention: elements ending with "Association"
+    that have 2+ child elements representing endpoint roles.
+
+    Args:
+        root: XML root element
+        xml_ns_map: Namespace prefix mapping
+
+    Returns:
+        Dictionary mapping association QName to association rule
+    """
+    auto_assocs = {}
 
-    # Scan entire XML tree
-    scan_element_for_associations(root)
+    # Scan entire XML tree (document order; the last occurrence of a qname wins)
+    for elem in root.iter():
+        rule = _detect_association_pattern(elem, xml_ns_map)
+        if rule:
+            auto_assocs[rule["qname"]] = rule
+            logger.info(
+                f"Auto-detected association: {rule['qname']} with {len(rule['endpoints'])} endpoints: "
+                f"{[ep['role_qname'] for ep in rule['endpoints']]}"
+            )
 
     return auto_assocs
 
 
 def generate_for_xml_content(
     xml_content: str,
-    mapping_dict: dict[str, Any],
+    mapping_dict: dict[str, Any] | MappingPlan,
     filename: str = "memory",
     upload_id: str = None,
     schema_id: str = None,
     cmf_element_index: set = None,
     mode: str = "dynamic",
-) -> tuple[str, dict[str, Any], list[tuple], list[tuple]]:
+    write_mode: str = "statements",
+) -> tuple[str | list, dict[str, Any], list[tuple], list[tuple]]:
     """Generate Cypher statements from XML content and mapping dictionary.
 
     Args:
         xml_content: XML content as string
-        mapping_dict: Mapping dictionary
+        mapping_dict: Mapping dictionary or compiled MappingPlan
+        filename: Source filename for provenance
+        upload_id: Unique identifier for this upload batch (for graph isolation)
+        schema_id: Schema identifier (for graph isolation)
+        cmf_element_index: Set of known CMF element QNames for augmentation detection
+        mode: Converter mode - "mapping" (use selections) or "dynamic" (all complex elements)
+        write_mode: "statements" (literal Cypher script, one MERGE per element),
+            "statement_list" (the same statements as CypherStatement objects) or
+            "batched" (parameterized UNWIND batches grouped by label / relationship type)
+
+    Returns:
+        Tuple of (cypher_statements, nodes_dict, contains_list, edges_list).
+        In "statement_list" / "batched" write modes the first element is a list of
+        CypherStatement / WriteBatch objects.
+    """
+    return _convert_xml(
+        xml_content, None, mapping_dict, filename, upload_id, schema_id, cmf_element_index, mode, write_mode
+    )
+
+
+def generate_for_xml_stream(
+    source: str | Path | BinaryIO,
+    mapping_dict: dict[str, Any] | MappingPlan,
+    filename: str = "memory",
+    upload_id: str = None,
+    schema_id: str = None,
+    cmf_element_index: set = None,
+    mode: str = "dynamic",
+    write_mode: str = "statements",
+) -> tuple[str | list, dict[str, Any], list[tuple], list[tuple]]:
+    """Generate Cypher statements from an XML file or stream using incremental parsing.
+
+    Produces the same graph as generate_for_xml_content without building the
+    whole document tree. Two iterparse passes are made over the source:
+
+    1. Collect namespaces, structures:id/uri registrations, URI hub counts and
+       (dynamic mode) association patterns, clearing elements as they close.
+    2. Convert each top-level record (child of the root element) as soon as it
+       closes, then discard it. Only the root element and its flattened
+       property children stay in memory until the end of the document.
+
+    Memory is therefore bounded by the largest top-level record plus the
+    compact ID registry and the generated graph, not by the file size.
+
+    Args:
+        source: Path to the XML file, or a seekable binary file object
+        mapping_dict: Mapping dictionary or compiled MappingPlan
         filename: Source filename for provenance
         upload_id: Unique identifier for this upload batch (for graph isolation)
         schema_id: Schema identifier (for graph isolation)
         cmf_element_index: Set of known CMF element QNames for augmentation detection
         mode: Converter mode - "mapping" (use selections) or "dynamic" (all complex elements)
+        write_mode: "statements", "statement_list" or "batched" (see generate_for_xml_content)
 
     Returns:
         Tuple of (cypher_statements, nodes_dict, contains_list, edges_list)
     """
-    # Load mapping from dictionary
-    mapping, obj_rules, associations, references, ns_map = load_mapping_from_dict(mapping_dict)
+    return _convert_xml(None, source, mapping_dict, filename, upload_id, schema_id, cmf_element_index, mode, write_mode)
+
+
+def _iterparse_source(source: str | Path | BinaryIO, events: tuple[str, ...]):
+    """Start an iterparse pass over a path or a rewound binary file object."""
+    if hasattr(source, "read"):
+        source.seek(0)
+    return ET.iterparse(source, events=events)
+
+
+def iter_xml_cypher_batches(
+    source: str | Path | BinaryIO,
+    mapping_dict: dict[str, Any] | MappingPlan,
+    filename: str = "memory",
+    upload_id: str = None,
+    schema_id: str = None,
+    cmf_element_index: set = None,
+    mode: str = "dynamic",
+    batch_nodes: int = 10000,
+    write_mode: str = "statement_list",
+) -> Iterator[tuple[list, dict[str, Any], list[tuple], list[tuple]]]:
+    """Convert an XML file or stream to Cypher statements in bounded batches.
+
+    Parses like generate_for_xml_stream, but whenever at least ``batch_nodes``
+    nodes are pending after a top-level record closes they are handed out with
+    the containment and reference edges whose endpoints have both been handed
+    out. Edges to nodes that do not exist yet (forward references, EntityHub
+    nodes, unresolved references) wait for them; the last batch takes the rest.
+    The root node is written with the first batch and completed in the last.
+    Batches must be executed in order.
+
+    Args:
+        source: Path to the XML file, or a seekable binary file object
+        mapping_dict: Mapping dictionary or compiled MappingPlan
+        filename: Source filename for provenance
+        upload_id: Unique identifier for this upload batch (for graph isolation)
+        schema_id: Schema identifier (for graph isolation)
+        cmf_element_index: Set of known CMF element QNames for augmentation detection
+        mode: Converter mode - "mapping" (use selections) or "dynamic" (all complex elements)
+        batch_nodes: Approximate number of nodes per batch
+        write_mode: "statement_list" (list of CypherStatement) or "batched" (list of WriteBatch)
+
+    Yields:
+        Tuples of (cypher_statements, nodes_dict, contains_list, edges_list) per batch;
+        nodes_dict holds the nodes first written by that batch
+    """
+    from datetime import UTC, datetime
+
+    ingest_timestamp = datetime.now(UTC).isoformat()
+    for nodes, contains, edges, rewritten in _iter_xml_conversion(
+        None, source, mapping_dict, filename, upload_id, schema_id, cmf_element_index, mode, max(batch_nodes, 1)
+    ):
+        builder = build_write_batches if write_mode == "batched" else build_cypher_statements
+        statements = builder(nodes, contains, edges, filename, upload_id, schema_id, ingest_timestamp, rewritten)
+        first_written = {nid: node for nid, node in nodes.items() if nid not in rewritten}
+        yield statements, first_written, contains, edges
+
+
+def _convert_xml(
+    xml_content: str | None,
+    source: str | Path | BinaryIO | None,
+    mapping_dict: dict[str, Any] | MappingPlan,
+    filename: str,
+    upload_id: str,
+    schema_id: str,
+    cmf_element_index: set,
+    mode: str,
+    write_mode: str,
+) -> tuple[str | list, dict[str, Any], list[tuple], list[tuple]]:
+    """Shared implementation for in-memory (xml_content) and streaming (source) conversion."""
+    from datetime import UTC, datetime
+
+    ingest_timestamp = datetime.now(UTC).isoformat()
+    [(nodes, contains, edges, _rewritten)] = _iter_xml_conversion(
+        xml_content, source, mapping_dict, filename, upload_id, schema_id, cmf_element_index, mode
+    )
+
+    if write_mode == "batched":
+        batches = build_write_batches(nodes, contains, edges, filename, upload_id, schema_id, ingest_timestamp)
+        return batches, nodes, contains, edges
+
+    statements = build_cypher_statements(nodes, contains, edges, filename, upload_id, schema_id, ingest_timestamp)
+    if write_mode == "statement_list":
+        return statements, nodes, contains, edges
+
+    # Literal Cypher script (CLI output and callers that want text)
+    lines = [f"// Generated for {filename} using mapping"]
+    lines.extend(f"{statement.query};" for statement in statements)
+    return "\n".join(lines), nodes, contains, edges
+
+
+def _iter_xml_conversion(
+    xml_content: str | None,
+    source: str | Path | BinaryIO | None,
+    mapping_dict: dict[str, Any] | MappingPlan,
+    filename: str,
+    upload_id: str,
+    schema_id: str,
+    cmf_element_index: set,
+    mode: str,
+    batch_nodes: int = 0,
+) -> Iterator[tuple[dict[str, Any], list[tuple], list[tuple], set[str]]]:
+    """Convert in-memory (xml_content) or streamed (source) XML into node and edge structures.
+
+    With batch_nodes of 0 a single tuple covering the whole document is
+    yielded. Otherwise (streaming only) a tuple is yielded whenever at least
+    batch_nodes nodes are pending after a top-level record; see
+    iter_xml_cypher_batches.
+
+    Yields:
+        Tuples of (nodes_dict, contains_list, edges_list, rewritten_ids), where
+        rewritten_ids are nodes already handed out by an earlier tuple
+    """
+    streaming = source is not None
+
+    # Compiled lookups are shared across files using the same mapping
+    plan = get_mapping_plan(mapping_dict)
+    mapping_dict = plan.mapping
+    obj_rules, associations, references, ns_map = plan.obj_rules, plan.associations, plan.references, plan.namespaces
 
     # Log mapping statistics for debugging
     logger.info(f"Converter mode: {mode}")
@@ -892,56 +1110,41 @@ def generate_for_xml_content(
     else:
         logger.warning("⚠️  obj_rules is EMPTY - no nodes will be created in mapping mode!")
 
-    # Extract CMF element index from mapping metadata if not provided
+    # Use the CMF element index from mapping metadata if not provided
     if cmf_element_index is None:
-        metadata = mapping_dict.get("metadata", {})
-        cmf_elements_list = metadata.get("cmf_element_index", [])
-        cmf_element_index = set(cmf_elements_list) if cmf_elements_list else set()
+        cmf_element_index = plan.cmf_element_index
 
     # In dynamic mode, disable augmentation detection (all properties are standard)
     if mode == "dynamic":
         cmf_element_index = set()
         logger.info("Dynamic mode: Augmentation detection disabled - will create nodes for all complex elements")
 
-    # Prepare association index
-    assoc_by_qn = build_assoc_index(associations)
+    # Association index (copied - dynamic mode adds auto-detected associations)
+    assoc_by_qn = dict(plan.assoc_by_qn)
 
-    # Build augmentation index from mapping
-    augmentation_index = build_augmentation_index_from_mapping(mapping_dict)
+    # Augmentation index from mapping
+    augmentation_index = plan.augmentation_index
 
-    root = ET.fromstring(xml_content)
-    xml_ns_map = parse_ns(xml_content)
-
-    # In dynamic mode, auto-detect associations from XML structure
-    if mode == "dynamic":
-        auto_detected_assocs = detect_associations_from_xml_data(root, xml_ns_map)
-        assoc_by_qn.update(auto_detected_assocs)
-        logger.info(f"Dynamic mode: Total associations (mapping + auto-detected): {len(assoc_by_qn)}")
-
-    # Detect NIEM structures namespace dynamically
-    struct_ns = detect_structures_namespace(root)
-
-    # Detect NIEM core namespace (attempt to find from namespaces)
-    nc_ns = ns_map.get("nc", "https://docs.oasis-open.org/niemopen/ns/model/niem-core/6.0/")
-
-    # Build reference attribute registry
-    reference_registry = build_standard_reference_registry(struct_ns, nc_ns)
+    # Namespaces, the structures namespace, IDs and (dynamic mode) associations are
+    # collected while parsing in pass 1 - no separate walks over the tree
+    root = None
+    xml_ns_map = NamespaceMap()
+    struct_ns = None
 
     # Generate file-specific prefix for node IDs to ensure uniqueness across files
     # Use timestamp + filename hash for uniqueness
     import json
     import time
-    from datetime import datetime, timezone
 
     # SHA1 used for file prefix generation only, not cryptographic security
     file_prefix = hashlib.sha1(f"{filename}_{time.time()}".encode(), usedforsecurity=False).hexdigest()[:8]
-    ingest_timestamp = datetime.now(timezone.utc).isoformat()
 
-    nodes = {}  # id -> (label, qname, props_dict, aug_props_dict)
-    edges = []  # (from_id, from_label, to_id, to_label, rel_type, rel_props)
-    contains = []  # (parent_id, parent_label, child_id, child_label, HAS_REL)
+    nodes: dict[str, list[Any]] = {}  # id -> (label, qname, props_dict, aug_props_dict)
+    edges: list[tuple] = []  # (from_id, from_label, to_id, to_label, rel_type, rel_props)
+    contains: list[tuple] = []  # (parent_id, parent_label, child_id, child_label, HAS_REL)
     root_node_id = None  # Track root node ID to ensure all nodes connect to it
     element_to_node = {}  # Map XML element -> node_id to find parent nodes in tree
+    elem_to_parent = {}  # Map XML element -> parent element, recorded during traversal
 
     # ID registry for two-pass traversal
     # Collect all IDs in first pass to enable forward reference resolution
@@ -950,10 +1153,17 @@ def generate_for_xml_content(
     uri_occurrence_count = {}  # Count non-reference occurrences of each URI (for hub detection)
     hub_nodes_needed = set()  # Set of URI values that need separate hub nodes
     pending_refs = []  # List of (source_id, target_id, context) for validation
+    streamed_root_complex = None  # Streaming mode: whether the root had content before its records were discarded
     id_collisions = []  # List of ID collisions detected during Pass 1
+    written: dict[str, str] = {}  # Batched streaming: id -> label of every node already handed out
+    written_children: set[str] = set()  # Batched streaming: ids with a CONTAINS edge already handed out
+    root_stub = None  # Batched streaming: (id, label, qname) of the root, handed out with the first batch
 
-    def collect_ids_pass1(elem: Element):
-        """Pass 1: Collect all elements with structures:id or structures:uri for forward reference resolution.
+    def register_ids(elem: Element):
+        """Pass 1: Register an element's structures:id or structures:uri for forward reference resolution.
+
+        Only the qname and raw ID are kept so the registry stays compact
+        (elements are not retained after they are processed).
 
         Args:
             elem: XML element to process
@@ -977,7 +1187,7 @@ def generate_for_xml_content(
                 # Later we can decide whether to error or warn
             else:
                 # Register new ID
-                id_registry[prefixed_id] = {"element": elem, "qname": elem_qn, "raw_id": sid}
+                id_registry[prefixed_id] = {"qname": elem_qn, "raw_id": sid}
 
         # Process structures:uri - these also define identifiable resources
         # URI fragments (#P01) or full URIs can be used as identifiers
@@ -1010,15 +1220,132 @@ def generate_for_xml_content(
                     pass
                 else:
                     # Register new URI-based ID
-                    id_registry[prefixed_id] = {"element": elem, "qname": elem_qn, "raw_id": uri_id, "source": "uri"}
+                    id_registry[prefixed_id] = {"qname": elem_qn, "raw_id": uri_id, "source": "uri"}
+
+    def scan_pass1():
+        """Pass 1, fused with parsing: register namespaces, IDs and associations.
+
+        Namespaces come from start-ns events, IDs are registered on start events
+        (document order, same as a pre-order walk) and association patterns are
+        detected on end events once an element's children are parsed. In
+        streaming mode each top-level record is discarded as it closes;
+        otherwise the parsed tree is kept for pass 2.
+
+        Returns:
+            The root element
+        """
+        nonlocal struct_ns
+        parsed_root = None
+        depth = 0
+        start_order = []  # Document order of the currently open elements
+        element_count = 0
+        # qname -> (document_order, rule); last occurrence wins
+        detected_assocs: dict[str, tuple[int, dict[str, Any]]] = {}
+
+        parse_source = source if streaming else io.StringIO(xml_content)
+        for event, item in _iterparse_source(parse_source, ("start-ns", "start", "end")):
+            if event == "start-ns":
+                prefix, uri = item
+                if prefix:
+                    xml_ns_map[prefix] = uri
+                elif "" not in xml_ns_map:
+                    xml_ns_map[""] = uri
+            elif event == "start":
+                depth += 1
+                if parsed_root is None:
+                    parsed_root = item
+                    # Detect NIEM structures namespace dynamically
+                    struct_ns = detect_structures_namespace(item)
+                register_ids(item)
+                if mode == "dynamic":
+                    start_order.append(element_count)
+                    element_count += 1
+            else:
+                depth -= 1
+                if mode == "dynamic":
+                    order = start_order.pop()
+                    rule = _detect_association_pattern(item, xml_ns_map)
+                    if rule and detected_assocs.get(rule["qname"], (-1, None))[0] < order:
+                        detected_assocs[rule["qname"]] = (order, rule)
+                if streaming and depth == 1:
+                    parsed_root.remove(item)
+                    item.clear()
+
+        # In dynamic mode, auto-detected associations extend the mapping's associations
+        if mode == "dynamic":
+            for assoc_qn, (_order, rule) in detected_assocs.items():
+                assoc_by_qn[assoc_qn] = rule
+                logger.info(
+                    f"Auto-detected association: {assoc_qn} with {len(rule['endpoints'])} endpoints: "
+                    f"{[ep['role_qname'] for ep in rule['endpoints']]}"
+                )
+            logger.info(f"Dynamic mode: Total associations (mapping + auto-detected): {len(assoc_by_qn)}")
 
-        # Recurse to all children
-        for child in elem:
-            collect_ids_pass1(child)
+        return parsed_root
+
+    def node_identity(elem, elem_qn, obj_rule, parent_info, path_stack):
+        """Compute the (node_id, node_label) an object element will be written with.
+
+        Uses structures:id if present, otherwise structures:uri (unless the URI
+        needs a hub, in which case the role node gets a synthetic ID), otherwise
+        a synthetic ID based on the element position.
+
+        Args:
+            elem: XML element
+            elem_qn: Element qualified name
+            obj_rule: Object rule from mapping (or None)
+            parent_info: (parent_id, parent_label) or None for the root
+            path_stack: Ancestor elements of elem
+
+        Returns:
+            Tuple of (node_id, node_label)
+        """
+        # Use label from mapping, or generate label from qname (dynamic mode)
+        node_label = obj_rule["label"] if obj_rule else elem_qn.replace(":", "_")
+
+        sid = get_structures_attr(elem, "id", struct_ns)
+        if sid:
+            return f"{file_prefix}_{sid}", node_label
+
+        uri_ref = get_structures_attr(elem, "uri", struct_ns)
+        if uri_ref and uri_ref.lstrip("#") not in hub_nodes_needed:
+            return f"{file_prefix}_{uri_ref.lstrip('#')}", node_label
+
+        parent_id = parent_info[0] if parent_info else "root"
+        chain = [qname_from_tag(e.tag, xml_ns_map) for e in path_stack] + [elem_qn]
+        ordinal_path = "/".join(chain)
+        return synth_id(parent_id, elem_qn, ordinal_path, file_prefix), node_label
+
+    def element_is_complex(elem, is_root):
+        """Check complexity, using the recorded answer for a streamed root (its records are already gone)."""
+        if is_root and streamed_root_complex is not None:
+            return streamed_root_complex
+        return _is_complex_element(elem, xml_ns_map, struct_ns)
 
     def traverse(elem, parent_info=None, path_stack=None):
         """Traverse XML tree and generate nodes and relationships.
 
+        Iterative depth-first walk with an explicit stack (no recursion-depth
+        limit). Children are visited in document order, exactly as a recursive
+        pre-order walk would, and each child's parent element is recorded in
+        elem_to_parent for the orphan fix-up.
+
+        Args:
+            elem: Element to start from
+            parent_info: (parent_id, parent_label) of the containing node, or None for the root
+            path_stack: Ancestor elements of elem
+        """
+        stack = [(elem, parent_info, tuple(path_stack or ()))]
+        while stack:
+            current, current_parent_info, current_path = stack.pop()
+            child_frames = visit(current, current_parent_info, current_path)
+            for frame in reversed(child_frames):
+                elem_to_parent[frame[0]] = current
+                stack.append(frame)
+
+    def visit(elem, parent_info, path_stack):
+        """Generate nodes and relationships for one element.
+
         CRITICAL: Augmentations are processed FIRST to ensure they never create nodes.
 
         Processing order:
@@ -1027,10 +1354,17 @@ def generate_for_xml_content(
         3. Objects (create entity nodes)
 
         This order ensures augmentations are completely invisible in the graph.
+
+        Args:
+            elem: XML element to process
+            parent_info: (parent_id, parent_label) of the containing node, or None for the root
+            path_stack: Tuple of ancestor elements
+
+        Returns:
+            List of (child_elem, parent_info, path_stack) frames to visit next, in document order
         """
-        nonlocal root_node_id, element_to_node
-        if path_stack is None:
-            path_stack = []
+        nonlocal root_node_id
+        child_frames = []
 
         elem_qn = qname_from_tag(elem.tag, xml_ns_map)
 
@@ -1059,7 +1393,7 @@ def generate_for_xml_content(
                     # Check if this child is a complex element that should become a node
                     if _is_complex_element(aug_child, xml_ns_map, struct_ns):
                         # Process as direct child of PARENT (not augmentation)
-                        traverse(aug_child, parent_info=parent_info, path_stack=path_stack + [elem])
+                        child_frames.append((aug_child, parent_info, path_stack + (elem,)))
                     # If simple property, flatten into parent properties
                     elif aug_child.text and aug_child.text.strip() and len(list(aug_child)) == 0:
                         prop_name = aug_child_qn.replace(":", "_")
@@ -1078,7 +1412,7 @@ def generate_for_xml_content(
                                     nodes[parent_id][2][f"{key}_isAugmentation"] = True
 
             # Never create node for augmentation - return early
-            return
+            return child_frames
 
         # Handle Association elements (create intermediate nodes with hypergraph pattern)
         assoc_rule = assoc_by_qn.get(elem_qn)
@@ -1140,7 +1474,7 @@ def generate_for_xml_content(
                 assoc_props["structures_ref"] = struct_ref
 
             # Register association node in id_registry for reference resolution
-            id_registry[assoc_node_id] = {"qname": elem_qn, "label": assoc_label, "element": elem}
+            id_registry[assoc_node_id] = {"qname": elem_qn, "label": assoc_label}
 
             # Create association node (nodes is a dict, not a list)
             nodes[assoc_node_id] = [assoc_label, elem_qn, assoc_props, aug_props]
@@ -1214,7 +1548,6 @@ def generate_for_xml_content(
                                 id_registry[endpoint_id] = {
                                     "qname": qname_from_tag(endpoint_elem.tag, xml_ns_map),
                                     "label": ep["maps_to_label"],
-                                    "element": endpoint_elem,
                                 }
                             else:
                                 # Inline element without ID - will be processed recursively
@@ -1242,9 +1575,8 @@ def generate_for_xml_content(
                     edges.append((assoc_node_id, assoc_label, endpoint_id, endpoint_label, rel_type, edge_props))
 
             # Recursively process children (for nested objects within association)
-            for ch in elem:
-                traverse(ch, (assoc_node_id, assoc_label), path_stack + [elem])
-            return
+            assoc_path = path_stack + (elem,)
+            return [(ch, (assoc_node_id, assoc_label), assoc_path) for ch in elem]
 
         # Handle Object elements (nodes)
         obj_rule = obj_rules.get(elem_qn)
@@ -1261,9 +1593,7 @@ def generate_for_xml_content(
         # Skip pure reference elements (ref or uri with nil) - they don't create nodes
         if (ref or uri_ref) and is_nil:
             # Just traverse children without creating any nodes
-            for ch in elem:
-                traverse(ch, parent_info, path_stack)
-            return
+            return [(ch, parent_info, path_stack) for ch in elem]
 
         # Check if this is an augmentation element (never create nodes for augmentations)
         is_augmentation_elem = elem_qn.endswith("Augmentation")
@@ -1280,7 +1610,7 @@ def generate_for_xml_content(
             # Skip augmentations even if they're in the mapping
             # EXCEPTION: Root element always creates a node if complex (ensures containment tree)
             if is_root:
-                is_complex = _is_complex_element(elem, xml_ns_map, struct_ns)
+                is_complex = element_is_complex(elem, is_root)
                 should_create_node = is_complex and not is_augmentation_elem
             else:
                 should_create_node = obj_rule is not None and not is_augmentation_elem
@@ -1291,7 +1621,7 @@ def generate_for_xml_content(
                     logger.debug(f"Skipping {elem_qn} - not in mapping (obj_rule is None)")
         elif mode == "dynamic":
             # Dynamic mode: Create nodes for all complex elements EXCEPT augmentations
-            is_complex = _is_complex_element(elem, xml_ns_map, struct_ns)
+            is_complex = element_is_complex(elem, is_root)
             should_create_node = is_complex and not is_augmentation_elem
             if not should_create_node:
                 if is_augmentation_elem:
@@ -1301,30 +1631,16 @@ def generate_for_xml_content(
 
         if should_create_node:
             logger.debug(f"Creating node for {elem_qn} (mode: {mode})")
-            # Generate label
-            if obj_rule:
-                # Use label from mapping
-                node_label = obj_rule["label"]
-            else:
-                # Dynamic mode: generate label from qname
-                node_label = elem_qn.replace(":", "_")
+            # Generate label and node ID (structures:id, then structures:uri, then synthetic)
+            node_id, node_label = node_identity(elem, elem_qn, obj_rule, parent_info, path_stack)
 
-            # Generate node ID - use structures:id if present, otherwise structures:uri, otherwise synthetic
-            if sid:
-                node_id = f"{file_prefix}_{sid}"
-            elif uri_ref:
+            if uri_ref and not sid:
                 # Extract fragment for co-referencing: "#P01" -> "P01"
                 entity_id = uri_ref.lstrip("#")
 
                 # Check if this URI needs a separate hub node (2+ role occurrences)
                 if entity_id in hub_nodes_needed:
-                    # SEPARATE HUB PATTERN: Create role node + hub node
-                    # Always create role node with synthetic ID (for ALL occurrences)
-                    parent_id = parent_info[0] if parent_info else "root"
-                    chain = [qname_from_tag(e.tag, xml_ns_map) for e in path_stack] + [elem_qn]
-                    ordinal_path = "/".join(chain)
-                    node_id = synth_id(parent_id, elem_qn, ordinal_path, file_prefix)
-
+                    # SEPARATE HUB PATTERN: Create role node (synthetic ID) + hub node
                     # Mark as role node
                     props["_isRole"] = True
                     props["structures_uri"] = uri_ref
@@ -1359,16 +1675,8 @@ def generate_for_xml_content(
                     )
                     logger.debug(f"Role node {elem_qn} REPRESENTS {hub_label} {hub_id} (via {uri_ref})")
                 else:
-                    # SINGLE OCCURRENCE: Use URI as node ID (no hub needed)
-                    canonical_id = f"{file_prefix}_{entity_id}"
-                    node_id = canonical_id
+                    # SINGLE OCCURRENCE: URI is the node ID (no hub needed)
                     logger.debug(f"Single occurrence URI {uri_ref} - no hub needed")
-            else:
-                # Generate synthetic ID based on element position
-                parent_id = parent_info[0] if parent_info else "root"
-                chain = [qname_from_tag(e.tag, xml_ns_map) for e in path_stack] + [elem_qn]
-                ordinal_path = "/".join(chain)
-                node_id = synth_id(parent_id, elem_qn, ordinal_path, file_prefix)
 
             # Capture NIEM structures attributes as metadata (with # prefix to match JSON-LD format)
             if sid:
@@ -1571,7 +1879,7 @@ def generate_for_xml_content(
                     # Check if this child is a complex element that should become a node
                     if _is_complex_element(aug_child, xml_ns_map, struct_ns):
                         # Process as direct child of PARENT (not augmentation)
-                        traverse(aug_child, parent_info=parent_info, path_stack=path_stack + [elem])
+                        child_frames.append((aug_child, parent_info, path_stack + (elem,)))
                     # If simple property, flatten into parent properties
                     elif aug_child.text and aug_child.text.strip() and len(list(aug_child)) == 0:
                         prop_name = aug_child_qn.replace(":", "_")
@@ -1592,15 +1900,218 @@ def generate_for_xml_content(
             # Unselected elements are already flattened by their parent (lines 1280-1305)
             # No need for additional processing here - skip to avoid duplicate properties
 
-        # Recurse to children
-        path_stack.append(elem)
-        for ch in elem:
-            traverse(ch, parent_ctx, path_stack)
-        path_stack.pop()
+        # Visit children next
+        child_path = path_stack + (elem,)
+        child_frames.extend((ch, parent_ctx, child_path) for ch in elem)
+        return child_frames
+
+    def attach_orphans(orphan_ids):
+        """Connect orphaned nodes to their nearest ancestor node in the XML tree.
+
+        Uses the parent links recorded in elem_to_parent during traversal.
+
+        Args:
+            orphan_ids: Node IDs without an incoming CONTAINS edge
+        """
+        # Build reverse mapping: node_id -> XML element
+        node_to_element = {node_id: elem for elem, node_id in element_to_node.items()}
+
+        for orphan_id in orphan_ids:
+            orphan_label = nodes[orphan_id][0] if orphan_id in nodes else written[orphan_id]
+            orphan_elem = node_to_element.get(orphan_id)
+
+            if orphan_elem is not None:
+                # Walk up the XML tree to find nearest ancestor node
+                parent_elem = elem_to_parent.get(orphan_elem)
+                parent_node_id = None
+
+                while parent_elem is not None:
+                    if parent_elem in element_to_node:
+                        parent_node_id = element_to_node[parent_elem]
+                        if parent_node_id in nodes:
+                            parent_label = nodes[parent_node_id][0]
+                            logger.debug(
+                                f"Connecting orphaned node {orphan_id} ({orphan_label}) "
+                                f"to parent {parent_node_id} ({parent_label})"
+                            )
+                            contains.append((parent_node_id, parent_label, orphan_id, orphan_label, "CONTAINS"))
+                            break
+                    parent_elem = elem_to_parent.get(parent_elem)
+
+                # If no parent found in tree, use root as fallback (shouldn't happen)
+                if not parent_node_id and root_node_id:
+                    root_label = nodes[root_node_id][0]
+                    logger.warning(
+                        f"Could not find parent in XML tree for {orphan_id} ({orphan_label}), using root as fallback"
+                    )
+                    contains.append((root_node_id, root_label, orphan_id, orphan_label, "CONTAINS"))
+            else:
+                # Node not in element_to_node mapping (e.g., hub node) - use root as fallback
+                if root_node_id:
+                    root_label = nodes[root_node_id][0]
+                    logger.warning(
+                        f"Orphaned node {orphan_id} ({orphan_label}) not in element mapping, using root as fallback"
+                    )
+                    contains.append((root_node_id, root_label, orphan_id, orphan_label, "CONTAINS"))
+
+    def is_retained_root_child(child):
+        """Streaming mode: whether a root child must stay attached until the root node is built.
+
+        Mirrors the root's own child handling in traverse(): augmentations and
+        children that are flattened into the root's properties are kept; children
+        that become their own nodes are converted and discarded as they close.
+        """
+        child_qn = qname_from_tag(child.tag, xml_ns_map)
+        if child_qn in augmentation_index or child_qn.endswith("Augmentation"):
+            return True
+        if mode == "mapping":
+            child_is_node = child_qn in obj_rules or child_qn in assoc_by_qn
+        elif mode == "dynamic":
+            child_is_node = _is_complex_element(child, xml_ns_map, struct_ns) or child_qn in assoc_by_qn
+        else:
+            child_is_node = False
+        return not child_is_node
+
+    def take_batch(final=False):
+        """Hand out the pending nodes and the edges whose endpoints have both been handed out.
+
+        Edges to nodes that are not handed out yet stay pending. Until the last
+        batch the root is handed out as a bare node so records can be contained
+        by it; the last batch completes it and takes everything left.
+
+        Args:
+            final: Whether this is the last batch
+
+        Returns:
+            Tuple of (nodes_dict, contains_list, edges_list, rewritten_ids)
+        """
+        batch = dict(nodes)
+        nodes.clear()
+        if not final and root_stub and root_stub[0] not in written:
+            root_id, root_label, root_qn = root_stub
+            batch.setdefault(root_id, [root_label, root_qn, {}, {}])
+
+        # A node handed out before (repeated IDs) keeps its first label; the builders add its missing props
+        rewritten = set()
+        for nid, node in batch.items():
+            if nid in written:
+                node[0] = written[nid]
+                rewritten.add(nid)
+            else:
+                written[nid] = node[0]
+
+        def split(pending):
+            """Remove and return the edges whose endpoints have both been handed out."""
+            if final and not batch_nodes:
+                ready = list(pending)
+                pending.clear()
+                return ready
+            ready, waiting = [], []
+            for edge in pending:
+                if final or (edge[0] in written and edge[2] in written):
+                    from_id, from_label, to_id, to_label, *rest = edge
+                    from_label, to_label = written.get(from_id, from_label), written.get(to_id, to_label)
+                    ready.append((from_id, from_label, to_id, to_label, *rest))
+                else:
+                    waiting.append(edge)
+            pending[:] = waiting
+            return ready
+
+        batch_contains = split(contains)
+        batch_edges = split(edges)
+        written_children.update(cid for _pid, _pl, cid, _cl, _rel in batch_contains)
+        pending_refs[:] = [ref for ref in pending_refs if ref[1] not in written]
+        return batch, batch_contains, batch_edges, rewritten
+
+    def stream_pass2():
+        """Streaming pass 2: convert each top-level record as it closes, then discard it.
+
+        Records are traversed with the root's node ID/label computed up front
+        from its attributes. The root node itself is built last from the
+        children that were retained for it. With batch_nodes set, a batch is
+        yielded after a record once that many nodes are pending.
+
+        Returns:
+            The root element (holding only retained children)
+        """
+        nonlocal streamed_root_complex, root_stub
+        stream_root = None
+        root_ctx = None
+        depth = 0
+        contained_ids: set[str] = set()
+
+        for event, elem in _iterparse_source(source, ("start", "end")):
+            if event == "start":
+                depth += 1
+                if stream_root is None:
+                    stream_root = elem
+                    root_qn = qname_from_tag(elem.tag, xml_ns_map)
+                    root_ctx = node_identity(elem, root_qn, obj_rules.get(root_qn), None, [])
+                    root_stub = (*root_ctx, root_qn)
+                elif depth == 2:
+                    streamed_root_complex = True
+                continue
+
+            depth -= 1
+            if depth != 1 or is_retained_root_child(elem):
+                continue
+
+            contains_start = len(contains)
+            traverse(elem, root_ctx, [stream_root])
+            contained_ids.update(cid for _pid, _pl, cid, _cl, _rel in contains[contains_start:])
+
+            # Association nodes get their CONTAINS edge from the nearest ancestor node;
+            # resolve that now while the record's parent links are still available
+            orphan_ids = [
+                nid for nid in dict.fromkeys(element_to_node.values()) if nid not in contained_ids and nid in nodes
+            ]
+            if orphan_ids:
+                elem_to_parent[elem] = stream_root
+                contains_start = len(contains)
+                attach_orphans(orphan_ids)
+                contained_ids.update(cid for _pid, _pl, cid, _cl, _rel in contains[contains_start:])
+
+            # Discard the record - nothing references its elements any more
+            element_to_node.clear()
+            elem_to_parent.clear()
+            stream_root.remove(elem)
+            elem.clear()
+
+            if batch_nodes and len(nodes) >= batch_nodes:
+                yield take_batch()
+
+        if streamed_root_complex is None:
+            streamed_root_complex = _is_complex_element(stream_root, xml_ns_map, struct_ns)
+        traverse(stream_root, None, [])
+        return stream_root
 
     # TWO-PASS TRAVERSAL for forward reference resolution
     # Pass 1: Collect all IDs to enable forward/backward reference resolution
-    collect_ids_pass1(root)
+    root = scan_pass1()
+    if streaming:
+        root_qn = qname_from_tag(root.tag, xml_ns_map)
+        is_nil_ref = (
+            get_structures_attr(root, "ref", struct_ns) or get_structures_attr(root, "uri", struct_ns)
+        ) and root.attrib.get(f"{{{XSI_NS}}}nil") == "true"
+        if root_qn in assoc_by_qn or root_qn.endswith(("Association", "Augmentation")) or is_nil_ref:
+            # The root's own handling needs its full subtree - convert in memory instead
+            logger.warning(f"Root element {root_qn} of {filename} cannot be streamed, parsing in memory")
+            if hasattr(source, "read"):
+                source.seek(0)
+                raw = source.read()
+            else:
+                raw = Path(source).read_bytes()
+            content = raw.decode("utf-8") if isinstance(raw, bytes) else raw
+            yield from _iter_xml_conversion(
+                content, None, mapping_dict, filename, upload_id, schema_id, cmf_element_index, mode
+            )
+            return
+
+    # Detect NIEM core namespace (attempt to find from namespaces)
+    nc_ns = ns_map.get("nc", "https://docs.oasis-open.org/niemopen/ns/model/niem-core/6.0/")
+
+    # Build reference attribute registry
+    reference_registry = build_standard_reference_registry(struct_ns, nc_ns)
 
     # Determine which URIs need separate hub nodes (2+ non-reference occurrences)
     for uri_id, count in uri_occurrence_count.items():
@@ -1619,7 +2130,10 @@ def generate_for_xml_content(
             )
 
     # Pass 2: Process root element and create graph structure (always)
-    traverse(root, None, [])
+    if streaming:
+        root = yield from stream_pass2()
+    else:
+        traverse(root, None, [])
 
     # Generate EntityHub nodes for multi-occurrence URIs
     for entity_id, hub_info in uri_entity_registry.items():
@@ -1656,7 +2170,7 @@ def generate_for_xml_content(
     # These indicate potential data quality issues or forward/external references
     unresolved_refs = []
     for source_qn, target_id, context in pending_refs:
-        if target_id not in nodes:
+        if target_id not in nodes and target_id not in written:
             # Target ID doesn't exist - could be forward ref or missing element
             # Extract the element qname and label from context (format: "Association X endpoint Y")
             # Parse context to get the role qname
@@ -1706,6 +2220,8 @@ def generate_for_xml_content(
         if tlabel is None and tid in nodes:
             # Resolve target label from nodes dictionary
             tlabel = nodes[tid][0]
+        elif tlabel is None:
+            tlabel = written.get(tid)
         resolved_edges.append((fid, flabel, tid, tlabel, rel, rprops))
     edges = resolved_edges
 
@@ -1715,72 +2231,61 @@ def generate_for_xml_content(
         if clabel is None and cid in nodes:
             # Resolve child label from nodes dictionary
             clabel = nodes[cid][0]
+        elif clabel is None:
+            clabel = written.get(cid)
         resolved_contains.append((pid, plabel, cid, clabel, rel))
     contains = resolved_contains
-    
+
     # Ensure all nodes have a containment path back to root
     # This is critical for NIEM instance documents - every node must be reachable from root
     # Find orphaned nodes (nodes without incoming CONTAINS edges, excluding root itself)
     if root_node_id and root_node_id in nodes:
-        nodes_with_parent = {cid for pid, plabel, cid, clabel, rel in contains}
+        nodes_with_parent = {cid for pid, plabel, cid, clabel, rel in contains} | written_children
         orphaned_nodes = []
-        for node_id in nodes.keys():
+        for node_id in dict.fromkeys([*written, *nodes]):
             if node_id != root_node_id and node_id not in nodes_with_parent:
                 orphaned_nodes.append(node_id)
-        
+
         # For orphaned nodes, find their actual parent in the XML tree
-        # We need to track which element created which node and walk up the tree
-        # Since ElementTree doesn't have getparent(), we need to track parent relationships during traversal
+        # ElementTree doesn't have getparent(), so parent links are recorded during traversal
         if orphaned_nodes:
             logger.warning(f"Found {len(orphaned_nodes)} orphaned nodes in {filename}, attempting to find parent")
-            # Build reverse mapping: node_id -> XML element  
-            node_to_element = {node_id: elem for elem, node_id in element_to_node.items()}
-            
-            # Build element -> parent element mapping by re-traversing the tree
-            # This is needed because ElementTree doesn't have getparent()
-            elem_to_parent = {}
-            def build_parent_map(elem, parent_elem=None):
-                elem_to_parent[elem] = parent_elem
-                for child in elem:
-                    build_parent_map(child, elem)
-            build_parent_map(root)
-            
-            for orphan_id in orphaned_nodes:
-                orphan_label = nodes[orphan_id][0]
-                orphan_elem = node_to_element.get(orphan_id)
-                
-                if orphan_elem is not None:
-                    # Walk up the XML tree to find nearest ancestor node
-                    parent_elem = elem_to_parent.get(orphan_elem)
-                    parent_node_id = None
-                    
-                    while parent_elem is not None:
-                        if parent_elem in element_to_node:
-                            parent_node_id = element_to_node[parent_elem]
-                            if parent_node_id in nodes:
-                                parent_label = nodes[parent_node_id][0]
-                                logger.debug(f"Connecting orphaned node {orphan_id} ({orphan_label}) to parent {parent_node_id} ({parent_label})")
-                                contains.append((parent_node_id, parent_label, orphan_id, orphan_label, "CONTAINS"))
-                                break
-                        parent_elem = elem_to_parent.get(parent_elem)
-                    
-                    # If no parent found in tree, use root as fallback (shouldn't happen)
-                    if not parent_node_id and root_node_id:
-                        root_label = nodes[root_node_id][0]
-                        logger.warning(f"Could not find parent in XML tree for {orphan_id} ({orphan_label}), using root as fallback")
-                        contains.append((root_node_id, root_label, orphan_id, orphan_label, "CONTAINS"))
-                else:
-                    # Node not in element_to_node mapping (e.g., hub node) - use root as fallback
-                    if root_node_id:
-                        root_label = nodes[root_node_id][0]
-                        logger.warning(f"Orphaned node {orphan_id} ({orphan_label}) not in element mapping, using root as fallback")
-                        contains.append((root_node_id, root_label, orphan_id, orphan_label, "CONTAINS"))
+            attach_orphans(orphaned_nodes)
     elif len(nodes) > 0:
         # Root node not found but nodes exist - this shouldn't happen, but log a warning
         logger.warning(f"Root node not found in {filename}, but {len(nodes)} nodes exist")
 
-    # Build Cypher lines
-    lines = [f"// Generated for {filename} using mapping"]
+    yield take_batch(final=True)
+
+
+def build_cypher_statements(
+    nodes: dict[str, Any],
+    contains: list[tuple],
+    edges: list[tuple],
+    filename: str,
+    upload_id: str = None,
+    schema_id: str = None,
+    ingest_timestamp: str = None,
+    existing_ids: set[str] = None,
+) -> list:
+    """Render converter output as one literal MERGE statement per node and edge.
+
+    Args:
+        nodes: Node dictionary from the converter
+        contains: Containment edge tuples
+        edges: Reference/association edge tuples
+        filename: Source filename for provenance and isolation
+        upload_id: Unique identifier for this upload batch
+        schema_id: Schema identifier
+        ingest_timestamp: ISO timestamp stored as ingestDate
+        existing_ids: IDs of nodes written by an earlier batch; their missing properties are added
+
+    Returns:
+        List of CypherStatement objects in execution order (nodes first)
+    """
+    from ..graph.batch_writer import CypherStatement
+
+    statements = []
 
     # MERGE nodes
     for nid, node_data in nodes.items():
@@ -1789,7 +2294,6 @@ def generate_for_xml_content(
         props = node_data[2]
         aug_props = node_data[3] if len(node_data) > 3 else {}
 
-        lines.append(f"MERGE (n:`{label}` {{id:'{nid}'}})")
         setbits = [f"n.qname='{qn}'", f"n.ingestDate='{ingest_timestamp}'"]
         # Add isolation properties for graph separation
         if upload_id:
@@ -1839,7 +2343,12 @@ def generate_for_xml_content(
                 escaped_value = str(value).replace("\\", "\\\\").replace("'", "\\'")
                 setbits.append(f"n.{prop_key}='{escaped_value}'")
 
-        lines.append("  ON CREATE SET " + ", ".join(setbits) + ";")
+        if existing_ids and nid in existing_ids:
+            # Keep the values already written for this node
+            set_clause = "\n  WITH n, properties(n) AS existing SET " + ", ".join(setbits + ["n += existing"])
+        else:
+            set_clause = "\n  ON CREATE SET " + ", ".join(setbits)
+        statements.append(CypherStatement(f"MERGE (n:`{label}` {{id:'{nid}'}})" + set_clause))
 
     # Build match properties for graph isolation
     def build_match_props(node_id):
@@ -1850,12 +2359,23 @@ def generate_for_xml_content(
             props += f", _source_file:'{filename}'"
         return props
 
+    # Relationships created by this file carry its upload tags (for rollback of a failed file)
+    rel_tags = []
+    if upload_id:
+        rel_tags.append(f"r._upload_id='{upload_id}'")
+    if filename:
+        rel_tags.append(f"r._source_file='{filename}'")
+    tags_clause = f" ON CREATE SET {', '.join(rel_tags)}" if rel_tags else ""
+
     # MERGE containment edges
     for pid, plabel, cid, clabel, rel in contains:
         parent_match = build_match_props(pid)
         child_match = build_match_props(cid)
-        lines.append(
-            f"MATCH (p:`{plabel}` {{{parent_match}}}), (c:`{clabel}` {{{child_match}}}) MERGE (p)-[:`{rel}`]->(c);"
+        statements.append(
+            CypherStatement(
+                f"MATCH (p:`{plabel}` {{{parent_match}}}), (c:`{clabel}` {{{child_match}}}) "
+                f"MERGE (p)-[r:`{rel}`]->(c){tags_clause}"
+            )
         )
 
     # MERGE reference/association edges
@@ -1890,18 +2410,92 @@ def generate_for_xml_content(
                     prop_setters.append(f"r.{prop_key}='{escaped_value}'")
 
             # MERGE with properties on relationship (rich edge pattern)
-            props_clause = ", ".join(prop_setters)
-            lines.append(
-                f"MATCH (a:`{flabel}` {{{from_match}}}), (b:`{tlabel}` {{{to_match}}}) "
-                f"MERGE (a)-[r:`{rel}`]->(b) ON CREATE SET {props_clause};"
+            props_clause = ", ".join(prop_setters + rel_tags)
+            statements.append(
+                CypherStatement(
+                    f"MATCH (a:`{flabel}` {{{from_match}}}), (b:`{tlabel}` {{{to_match}}}) "
+                    f"MERGE (a)-[r:`{rel}`]->(b) ON CREATE SET {props_clause}"
+                )
             )
         else:
             # Simple edge without properties
-            lines.append(
-                f"MATCH (a:`{flabel}` {{{from_match}}}), (b:`{tlabel}` {{{to_match}}}) MERGE (a)-[:`{rel}`]->(b);"
+            statements.append(
+                CypherStatement(
+                    f"MATCH (a:`{flabel}` {{{from_match}}}), (b:`{tlabel}` {{{to_match}}}) "
+                    f"MERGE (a)-[r:`{rel}`]->(b){tags_clause}"
+                )
             )
 
-    return "\n".join(lines), nodes, contains, edges
+    return statements
+
+
+def build_write_batches(
+    nodes: dict[str, Any],
+    contains: list[tuple],
+    edges: list[tuple],
+    filename: str,
+    upload_id: str = None,
+    schema_id: str = None,
+    ingest_timestamp: str = None,
+    existing_ids: set[str] = None,
+) -> list:
+    """Group converter output into parameterized UNWIND write batches.
+
+    Nodes are grouped by label; containment and reference edges are grouped by
+    (from_label, to_label, rel_type). Property values follow the same rules as
+    the literal statement renderer so both write modes produce the same graph.
+
+    Args:
+        nodes: Node dictionary from the converter
+        contains: Containment edge tuples
+        edges: Reference/association edge tuples
+        filename: Source filename for provenance and isolation
+        upload_id: Unique identifier for this upload batch
+        schema_id: Schema identifier
+        ingest_timestamp: ISO timestamp stored as ingestDate
+        existing_ids: IDs of nodes written by an earlier batch; their missing properties are added
+
+    Returns:
+        List of WriteBatch objects in execution order (nodes first)
+    """
+    from ..graph.batch_writer import build_node_batches, build_relationship_batches, normalize_property_value
+
+    node_rows: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
+    existing_rows: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
+    for nid, node_data in nodes.items():
+        label = node_data[0]
+        props = node_data[2]
+        aug_props = node_data[3] if len(node_data) > 3 else {}
+
+        row_props = {"qname": str(node_data[1]), "ingestDate": ingest_timestamp}
+        if upload_id:
+            row_props["_upload_id"] = upload_id
+        if schema_id:
+            row_props["_schema_id"] = schema_id
+        if filename:
+            row_props["_source_file"] = filename
+        for key, value in props.items():
+            row_props[key] = normalize_property_value(value, allow_arrays=False)
+        for key, value in aug_props.items():
+            row_props[key] = normalize_property_value(value)
+        (existing_rows if existing_ids and nid in existing_ids else node_rows)[label].append(
+            {"id": nid, "props": row_props}
+        )
+
+    rel_rows = defaultdict(list)
+    for pid, plabel, cid, clabel, rel in contains:
+        rel_rows[(plabel, clabel, rel)].append({"from_id": pid, "to_id": cid, "props": {}})
+    for fid, flabel, tid, tlabel, rel, rprops in edges:
+        row_props = {
+            key: normalize_property_value(value, allow_booleans=False) for key, value in (rprops or {}).items()
+        }
+        rel_rows[(flabel, tlabel, rel)].append({"from_id": fid, "to_id": tid, "props": row_props})
+
+    return (
+        build_node_batches(node_rows)
+        + build_node_batches(existing_rows, keep_existing=True)
+        + build_relationship_batches(rel_rows, upload_id, filename)
+    )
 
 
 def main():
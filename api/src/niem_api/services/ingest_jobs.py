@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""Background ingest jobs.
+
+Large ingest batches can outlive client and proxy timeouts when the request
+is held open until every file is written. In background mode the ingest
+handler only registers a job and returns its ID; the batch then runs on the
+API event loop like a normal request would, and progress is read from the
+job (status endpoint or server-sent events).
+
+At most ``INGEST_JOB_WORKERS`` jobs run at once; later submissions wait in
+submission order. Finished jobs are kept in memory for status queries, the
+oldest being dropped beyond ``INGEST_JOB_MAX_RETAINED``. Jobs are per API
+process and are not persisted across restarts.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from typing import Any
+
+from fastapi import HTTPException
+
+from ..core.config import batch_config
+
+logger = logging.getLogger(__name__)
+
+FINISHED_STATUSES = ("completed", "failed", "cancelled")
+
+# Runs the batch: called with a progress callback for the ingest pipeline
+JobRunner = Callable[[Callable[[dict[str, Any], str | None], None]], Awaitable[dict[str, Any]]]
+
+
+def _now() -> str:
+    return datetime.now(UTC).isoformat()
+
+
+class IngestJob:
+    """State of one background ingest batch.
+
+    Attributes:
+        job_id: Job identifier
+        file_type: "xml" or "json"
+        schema_id: Requested schema ID (None = active schema)
+        status: "queued", "running", "completed", "failed" or "cancelled"
+        files: Per-file progress dicts (filename, stage, status, timings)
+        result: Ingest response once completed
+        error: Error status code and detail if the batch failed
+        version: Incremented on every change (used by event streams)
+    """
+
+    def __init__(self, job_id: str, file_type: str, filenames: list[str], schema_id: str | None = None):
+        self.job_id = job_id
+        self.file_type = file_type
+        self.schema_id = schema_id
+        self.status = "queued"
+        self.submitted_at = _now()
+        self.started_at: str | None = None
+        self.finished_at: str | None = None
+        self._started: float | None = None
+        self._elapsed: float | None = None
+        self.files: list[dict[str, Any]] = [
+            {"filename": name, "stage": None, "status": "queued", "timings": {}} for name in filenames
+        ]
+        self.result: dict[str, Any] | None = None
+        self.error: dict[str, Any] | None = None
+        self.version = 0
+        self._changed = asyncio.Event()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    def _touch(self) -> None:
+        """Record a change and wake up everyone waiting for one."""
+        self.version += 1
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def start(self) -> None:
+        self.status = "running"
+        self.started_at = _now()
+        self._started = time.perf_counter()
+        self._touch()
+
+    def finish(self, status: str, result: dict[str, Any] | None = None, error: dict[str, Any] | None = None) -> None:
+        self.status = status
+        self.result = result
+        self.error = error
+        self.finished_at = _now()
+        if self._started is not None:
+            self._elapsed = round(time.perf_counter() - self._started, 4)
+        # Files the pipeline never reached (batch failed early) did not run
+        for file in self.files:
+            if file["status"] in ("queued", "running"):
+                file["status"] = "skipped" if status != "cancelled" else "cancelled"
+                file["stage"] = None
+        if result:
+            for file, file_result in zip(self.files, result.get("results", []), strict=False):
+                file["status"] = file_result.get("status", file["status"])
+        self._touch()
+
+    def file_progress(self, pipeline_job: dict[str, Any], stage: str | None) -> None:
+        """Ingest pipeline progress callback (pipeline jobs carry their file index)."""
+        file = self.files[pipeline_job["index"]]
+        file["timings"] = dict(pipeline_job.get("timings", {}))
+        if stage is not None:
+            file["stage"] = stage
+            file["status"] = "running"
+        else:
+            file["stage"] = None
+            if "error" in pipeline_job:
+                file["status"] = "failed"
+            else:
+                file["status"] = pipeline_job.get("result", {}).get("status", "failed")
+        self._touch()
+
+    async def wait_for_change(self, version: int, timeout: float) -> bool:
+        """Wait until the job changes after ``version``.
+
+        Args:
+            version: Last version seen by the caller
+            timeout: Seconds to wait at most
+
+        Returns:
+            True if the job changed, False on timeout
+        """
+        if self.version != version:
+            return True
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def snapshot(self, include_result: bool = True) -> dict[str, Any]:
+        """Return the job state as a JSON-serializable dict.
+
+        Args:
+            include_result: Include the full ingest response of a completed job
+
+        Returns:
+            Job status dictionary
+        """
+        counts: dict[str, int] = {}
+        for file in self.files:
+            counts[file["status"]] = counts.get(file["status"], 0) + 1
+        if self._elapsed is not None:
+            elapsed = self._elapsed
+        elif self._started is not None:
+            elapsed = round(time.perf_counter() - self._started, 4)
+        else:
+            elapsed = None
+
+        snapshot = {
+            "job_id": self.job_id,
+            "file_type": self.file_type,
+            "schema_id": self.result.get("schema_id") if self.result else self.schema_id,
+            "status": self.status,
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "elapsed_seconds": elapsed,
+            "files_total": len(self.files),
+            "file_counts": counts,
+            "files": [dict(file) for file in self.files],
+            "error": self.error,
+        }
+        if include_result:
+            snapshot["result"] = self.result
+        return snapshot
+
+
+class _JobRegistry:
+    """Thread-safe registry of ingest jobs, dropping the oldest finished jobs beyond the limit."""
+
+    def __init__(self, max_retained: int):
+        self.max_retained = max_retained
+        self._jobs: OrderedDict[str, IngestJob] = OrderedDict()
+        self._tasks: dict[str, asyncio.Task] = {}
+        self._lock = threading.Lock()
+
+    def add(self, job: IngestJob) -> None:
+        with self._lock:
+            self._jobs[job.job_id] = job
+            finished = [job_id for job_id, existing in self._jobs.items() if existing.finished]
+            for job_id in finished[: max(len(finished) - self.max_retained, 0)]:
+                del self._jobs[job_id]
+
+    def get(self, job_id: str) -> IngestJob | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def all(self) -> list[IngestJob]:
+        with self._lock:
+            return list(self._jobs.values())
+
+    def track(self, job_id: str, task: asyncio.Task) -> None:
+        # Keep a reference so the task is not garbage collected while it runs
+        with self._lock:
+            self._tasks[job_id] = task
+        task.add_done_callback(lambda _: self._untrack(job_id))
+
+    def _untrack(self, job_id: str) -> None:
+        with self._lock:
+            self._tasks.pop(job_id, None)
+
+    def running_tasks(self) -> list[asyncio.Task]:
+        with self._lock:
+            return list(self._tasks.values())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._jobs.clear()
+
+
+_registry = _JobRegistry(batch_config.INGEST_JOB_MAX_RETAINED)
+_job_slots: asyncio.Semaphore | None = None
+
+
+def _get_job_slots() -> asyncio.Semaphore:
+    global _job_slots
+    if _job_slots is None:
+        _job_slots = asyncio.Semaphore(max(batch_config.INGEST_JOB_WORKERS, 1))
+    return _job_slots
+
+
+async def _run_job(job: IngestJob, runner: JobRunner, cleanup: Callable[[], Awaitable[None]] | None) -> None:
+    try:
+        async with _get_job_slots():
+            job.start()
+            logger.info(f"Ingest job {job.job_id} started ({len(job.files)} {job.file_type} files)")
+            result = await runner(job.file_progress)
+        job.finish("completed", result=result)
+        logger.info(f"Ingest job {job.job_id} completed in {job.snapshot(include_result=False)['elapsed_seconds']}s")
+    except asyncio.CancelledError:
+        job.finish("cancelled", error={"status_code": 503, "detail": "Ingest job cancelled (API shutting down)"})
+        raise
+    except HTTPException as e:
+        logger.error(f"Ingest job {job.job_id} failed: {e.detail}")
+        job.finish("failed", error={"status_code": e.status_code, "detail": e.detail})
+    except Exception as e:
+        logger.error(f"Ingest job {job.job_id} failed: {e}")
+        job.finish("failed", error={"status_code": 500, "detail": f"Ingest job failed: {str(e)}"})
+    finally:
+        if cleanup is not None:
+            await cleanup()
+
+
+def submit_ingest_job(
+    file_type: str,
+    filenames: list[str],
+    runner: JobRunner,
+    schema_id: str | None = None,
+    cleanup: Callable[[], Awaitable[None]] | None = None,
+) -> IngestJob:
+    """Register a background ingest job and schedule it on the running event loop.
+
+    Args:
+        file_type: "xml" or "json"
+        filenames: Names of the files in the batch, in upload order
+        runner: Coroutine function running the batch; called with the
+            pipeline progress callback and returning the ingest response
+        schema_id: Requested schema ID (None = active schema)
+        cleanup: Coroutine function called once the job has finished (e.g. to close spooled files)
+
+    Returns:
+        The queued IngestJob
+    """
+    job = IngestJob(uuid.uuid4().hex, file_type, filenames, schema_id)
+    _registry.add(job)
+    _registry.track(job.job_id, asyncio.create_task(_run_job(job, runner, cleanup)))
+    logger.info(f"Queued ingest job {job.job_id} with {len(filenames)} {file_type} files")
+    return job
+
+
+def get_ingest_job(job_id: str) -> IngestJob | None:
+    """Look up an ingest job by ID."""
+    return _registry.get(job_id)
+
+
+def list_ingest_jobs() -> list[IngestJob]:
+    """Return all retained ingest jobs, oldest first."""
+    return _registry.all()
+
+
+async def shutdown_ingest_jobs() -> None:
+    """Cancel running and queued jobs (called on API shutdown)."""
+    tasks = _registry.running_tasks()
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def clear_ingest_jobs() -> None:
+    """Forget all retained jobs and the job slots (used in tests)."""
+    global _job_slots
+    _registry.clear()
+    _job_slots = None
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Bounded staged pipeline for batch ingest.
+
+Each file in a batch passes through the same stages (validate, convert,
+write, archive). Instead of finishing all stages for one file before the
+next starts, every stage runs its own pool of workers connected by bounded
+asyncio queues, so file N+1 validates while file N converts and file N-1
+writes. Batch throughput then approaches that of the slowest stage rather
+than the sum of all stages.
+
+Jobs are plain dicts owned by the caller. A stage finishes a job early by
+setting ``job["result"]``; an exception escaping a stage is stored in
+``job["error"]``. Either way the remaining stages skip that job.
+
+An optional progress callback is told when a job enters each stage and when
+it leaves the pipeline, so background ingest jobs can report per-file stage.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+ProgressCallback = Callable[[dict[str, Any], str | None], None]
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PipelineStage:
+    """One pipeline stage.
+
+    Attributes:
+        name: Stage name used in timings
+        run: Coroutine function called with the job dict
+        concurrency: Number of jobs this stage works on at once
+    """
+
+    name: str
+    run: Callable[[dict[str, Any]], Awaitable[None]]
+    concurrency: int = 1
+
+
+def _is_finished(job: dict[str, Any]) -> bool:
+    return "result" in job or "error" in job
+
+
+async def run_pipeline(
+    jobs: list[dict[str, Any]], stages: list[PipelineStage], progress: ProgressCallback | None = None
+) -> dict[str, dict[str, Any]]:
+    """Push jobs through the stages and wait for all of them to complete.
+
+    Each job gets a ``timings`` dict of stage name -> seconds spent in that stage.
+
+    Args:
+        jobs: Job dicts (mutated in place)
+        stages: Stages in execution order
+        progress: Called as ``progress(job, stage_name)`` when a job starts a
+            stage and ``progress(job, None)`` when it leaves the last stage
+
+    Returns:
+        Per-stage summary: files handled, busy seconds summed over files, slowest file
+    """
+    queues: list[asyncio.Queue[dict[str, Any]]] = [
+        asyncio.Queue(maxsize=max(stage.concurrency, 1) * 2) for stage in stages
+    ]
+    summary = {stage.name: {"files": 0, "total_seconds": 0.0, "max_seconds": 0.0} for stage in stages}
+
+    async def worker(index: int, stage: PipelineStage) -> None:
+        inbox = queues[index]
+        outbox = queues[index + 1] if index + 1 < len(queues) else None
+        while True:
+            job = await inbox.get()
+            try:
+                if not _is_finished(job):
+                    if progress is not None:
+                        progress(job, stage.name)
+                    started = time.perf_counter()
+                    try:
+                        await stage.run(job)
+                    except Exception as e:
+                        job["error"] = e
+                    elapsed = time.perf_counter() - started
+                    job.setdefault("timings", {})[stage.name] = round(elapsed, 4)
+                    stats = summary[stage.name]
+                    stats["files"] += 1
+                    stats["total_seconds"] += elapsed
+                    stats["max_seconds"] = max(stats["max_seconds"], elapsed)
+                if outbox is not None:
+                    await outbox.put(job)
+                elif progress is not None:
+                    progress(job, None)
+            finally:
+                inbox.task_done()
+
+    tasks = [
+        asyncio.create_task(worker(index, stage))
+        for index, stage in enumerate(stages)
+        for _ in range(max(stage.concurrency, 1))
+    ]
+    try:
+        for job in jobs:
+            await queues[0].put(job)
+        # Stage i's queue drains only after every job has been handed to stage i + 1
+        for queue in queues:
+            await queue.join()
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    for stats in summary.values():
+        stats["total_seconds"] = round(stats["total_seconds"], 4)
+        stats["max_seconds"] = round(stats["max_seconds"], 4)
+    return summary
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""Compiled JSON Schema validators shared across NIEM JSON ingest requests.
+
+NIEM JSON Schemas generated by the CMF tool are large. Downloading, parsing
+and building a validator for every request (and a new Draft7Validator for
+every file) dominated small-file JSON ingest, so validators are built once
+and kept in a small in-process LRU cache.
+
+Validators are cached two ways, as mapping plans are:
+
+- by a version key such as ``(schema_id, etag)``, skipping the download and
+  JSON parse on a hit; a re-uploaded schema object gets a new ETag
+- by identity of the schema dictionary, so repeated validation calls with the
+  same dict reuse the validator without the caller doing anything
+
+With JSON_VALIDATION_BACKEND=fastjsonschema (and the package installed) the
+schema is also compiled to Python code. Valid documents are then accepted by
+the compiled function alone; invalid ones are re-checked with jsonschema so
+every error is reported with the usual path and rule information.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
+from typing import Any
+
+from ..core.config import batch_config
+
+logger = logging.getLogger(__name__)
+
+try:
+    import fastjsonschema
+
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    fastjsonschema = None
+    FASTJSONSCHEMA_AVAILABLE = False
+
+
+class JsonSchemaValidator:
+    """A JSON Schema with its prebuilt validators.
+
+    Attributes:
+        schema: The source JSON Schema dictionary (treated as read-only)
+        validator: jsonschema Draft7Validator for the schema
+        fast_validate: Compiled fastjsonschema function, or None
+    """
+
+    def __init__(self, schema: dict[str, Any]):
+        from jsonschema import Draft7Validator
+
+        self.schema = schema
+        self.validator = Draft7Validator(schema)
+        self.fast_validate = _compile_fast(schema)
+
+    def iter_errors(self, data: Any) -> Iterator:
+        """Iterate over the validation errors of a document (jsonschema ValidationError objects)."""
+        if self.fast_validate is not None:
+            try:
+                self.fast_validate(data)
+                return iter(())
+            except fastjsonschema.JsonSchemaException:
+                # Collect the full error list with the reference validator
+                pass
+        return self.validator.iter_errors(data)
+
+
+def _compile_fast(schema: dict[str, Any]) -> Callable[[Any], Any] | None:
+    if batch_config.JSON_VALIDATION_BACKEND != "fastjsonschema":
+        return None
+    if not FASTJSONSCHEMA_AVAILABLE:
+        logger.warning("JSON_VALIDATION_BACKEND=fastjsonschema but fastjsonschema is not installed, using jsonschema")
+        return None
+    try:
+        # Draft7Validator ignores "format" unless given a format checker; match that
+        return fastjsonschema.compile(schema, use_formats=False)
+    except Exception as e:
+        logger.warning(f"Could not compile JSON Schema with fastjsonschema, using jsonschema: {e}")
+        return None
+
+
+class _ValidatorCache:
+    """Thread-safe LRU cache of JSON Schema validators."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._validators: OrderedDict[Hashable, JsonSchemaValidator] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> JsonSchemaValidator | None:
+        with self._lock:
+            validator = self._validators.get(key)
+            if validator is not None:
+                self._validators.move_to_end(key)
+            return validator
+
+    def put(self, key: Hashable, validator: JsonSchemaValidator) -> None:
+        if self.max_size < 1:
+            return
+        with self._lock:
+            self._validators[key] = validator
+            self._validators.move_to_end(key)
+            while len(self._validators) > self.max_size:
+                self._validators.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._validators.clear()
+
+    def __len__(self) -> int:
+        return len(self._validators)
+
+
+_validator_cache = _ValidatorCache(batch_config.JSON_SCHEMA_CACHE_SIZE)
+
+
+def _build(key: Hashable, schema: dict[str, Any]) -> JsonSchemaValidator:
+    """Build a validator and cache it under ``key`` and under the dict's identity."""
+    validator = JsonSchemaValidator(schema)
+    _validator_cache.put(key, validator)
+    _validator_cache.put(("id", id(schema)), validator)
+    logger.debug(f"Built JSON Schema validator (fast path: {validator.fast_validate is not None})")
+    return validator
+
+
+def get_json_schema_validator(schema: "dict[str, Any] | JsonSchemaValidator") -> JsonSchemaValidator:
+    """Return the validator for a JSON Schema, building it on first use.
+
+    Args:
+        schema: JSON Schema dictionary or an already built validator
+
+    Returns:
+        JsonSchemaValidator (cached by identity of the schema dictionary)
+    """
+    if isinstance(schema, JsonSchemaValidator):
+        return schema
+
+    key = ("id", id(schema))
+    validator = _validator_cache.get(key)
+    # A cached validator keeps its dict alive, so the id cannot be reused while
+    # the entry exists; the identity check is a cheap guard all the same
+    if validator is not None and validator.schema is schema:
+        return validator
+    return _build(key, schema)
+
+
+def load_json_schema_validator(cache_key: Hashable, loader: Callable[[], dict[str, Any]]) -> JsonSchemaValidator:
+    """Return the validator for a versioned JSON Schema, calling ``loader`` only on a miss.
+
+    Args:
+        cache_key: Version key for the schema, e.g. ``(schema_id, etag)``
+        loader: Callable returning the JSON Schema dictionary
+
+    Returns:
+        JsonSchemaValidator
+    """
+    key = ("key", cache_key)
+    validator = _validator_cache.get(key)
+    if validator is not None:
+        return validator
+    return _build(key, loader())
+
+
+def clear_json_schema_cache() -> None:
+    """Drop all cached validators (used after schema resets and in tests)."""
+    _validator_cache.clear()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Content-addressed cache of NIEM NDR schematron results.
+
+Most files of a NIEM subset (niem-core, structures, domain schemas) are
+byte-identical across every schema uploaded, yet each upload ran the NDR
+schematron on all of them. The issues scheval reports for a file only depend
+on the file content, the conformance target XSLT and the NDR rules, so they
+are stored in MinIO under (SHA-256 of content, XSLT name, rules version) and
+later uploads only send new or changed files to scheval.
+
+The rules version is the SHA-256 of the pre-compiled XSLT itself, so
+updated NDR rules never hit results of the old ones. Issues are stored with
+scheval's temporary filename, exactly as the validator returned them; the
+caller substitutes the uploaded filename as it does for fresh results.
+
+Only definitive results are cached (scheval ran and reported pass or fail);
+tool errors are retried on the next upload. Cache reads and writes never fail
+an upload - on any storage error the files are simply validated again.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from minio import Minio
+
+from ..clients.s3_client import download_if_exists, upload_many
+from ..core.config import batch_config
+
+logger = logging.getLogger(__name__)
+
+CACHE_BUCKET = "niem-cache"
+NDR_CACHE_PREFIX = "ndr"
+
+
+@lru_cache(maxsize=16)
+def _file_digest(path: str, mtime_ns: int, size: int) -> str:
+    # mtime and size are part of the cache key so a replaced XSLT is hashed again
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def ndr_rules_version(xslt_path: Path) -> str:
+    """Return the version of the NDR rules compiled into a schematron XSLT.
+
+    Args:
+        xslt_path: Pre-compiled schematron XSLT
+
+    Returns:
+        Short SHA-256 digest of the XSLT content
+    """
+    stat = xslt_path.stat()
+    return _file_digest(str(xslt_path), stat.st_mtime_ns, stat.st_size)[:16]
+
+
+def ndr_cache_key(content: bytes, xslt_path: Path, rules_version: str) -> str:
+    """Build the object name of a file's cached NDR result.
+
+    Args:
+        content: Schema file content
+        xslt_path: Conformance target XSLT the file is validated with
+        rules_version: Version from ndr_rules_version
+
+    Returns:
+        Object name in the cache bucket
+    """
+    digest = hashlib.sha256(content).hexdigest()
+    return f"{NDR_CACHE_PREFIX}/{xslt_path.stem}/{rules_version}/{digest}.json"
+
+
+async def get_cached_ndr_results(s3: Minio, keys: list[str]) -> dict[str, dict[str, Any]]:
+    """Fetch cached NDR results.
+
+    Args:
+        s3: MinIO client
+        keys: Object names from ndr_cache_key
+
+    Returns:
+        Dictionary mapping each cached key to its result
+        ({"errors": [...], "warnings": [...], "failed": bool}); misses are omitted
+    """
+    if not batch_config.NDR_CACHE_ENABLED or not keys:
+        return {}
+
+    async def fetch(key: str) -> dict[str, Any] | None:
+        try:
+            content = await download_if_exists(s3, CACHE_BUCKET, key)
+            return json.loads(content) if content is not None else None
+        except Exception as e:
+            logger.warning(f"Could not read cached NDR result {key}: {e}")
+            return None
+
+    results = await asyncio.gather(*(fetch(key) for key in keys))
+    cached = {key: result for key, result in zip(keys, results, strict=False) if result is not None}
+    logger.info(f"NDR cache: {len(cached)} of {len(keys)} files already validated")
+    return cached
+
+
+async def put_ndr_results(s3: Minio, results: dict[str, dict[str, Any]]) -> None:
+    """Store NDR results of freshly validated files.
+
+    Args:
+        s3: MinIO client
+        results: Dictionary mapping object names from ndr_cache_key to results
+            ({"errors": [...], "warnings": [...], "failed": bool})
+    """
+    if not batch_config.NDR_CACHE_ENABLED or not results:
+        return
+
+    objects = [
+        (key, json.dumps(result, separators=(",", ":")).encode("utf-8"), "application/json")
+        for key, result in results.items()
+    ]
+    try:
+        await upload_many(s3, CACHE_BUCKET, objects)
+    except Exception as e:
+        logger.warning(f"Could not cache NDR results: {e}")
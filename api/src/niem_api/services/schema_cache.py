@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""Local on-disk cache of schema XSD directories.
+
+XML validation needs every XSD of a schema on local disk. Downloading them on
+each ingest or conversion request was the dominant fixed cost of small
+requests, so downloaded files are kept under SCHEMA_CACHE_DIR, one entry per
+schema ID and content fingerprint. The fingerprint is computed from the object
+names and ETags of the MinIO listing: an unchanged schema costs one LIST call,
+a changed one gets a new entry and the stale one is dropped.
+
+Callers never use cache entries directly. ``prepare_schema_dir`` returns a
+private working directory populated with hard links to the cached files
+(copies where links are not possible). Callers can write instance documents
+into it and delete it afterwards as before, and evicting an entry never pulls
+files out from under a running validation.
+
+Entries are built in a staging directory and renamed into place, so readers
+only ever see complete entries. Two requests missing the same entry at the
+same time both download it; the second rename loses and its copy is discarded.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import re
+import shutil
+import tempfile
+import threading
+import uuid
+from pathlib import Path
+
+from minio import Minio
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_BUCKET = "niem-schemas"
+
+# Written last into a complete entry; holds the entry size, mtime = last use
+_COMPLETE_MARKER = ".complete"
+
+# Guards entry installation and eviction within this process
+_cache_lock = threading.Lock()
+
+
+def _cache_root() -> Path:
+    from ..core.config import batch_config
+
+    return Path(batch_config.SCHEMA_CACHE_DIR)
+
+
+def _max_cache_bytes() -> int:
+    from ..core.config import batch_config
+
+    return batch_config.SCHEMA_CACHE_MAX_MB * 1024 * 1024
+
+
+def _safe_name(schema_id: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]", "_", schema_id)
+
+
+def _list_schema_objects(s3: Minio, schema_id: str) -> list[tuple[str, str]]:
+    """List the XSD objects of a schema.
+
+    Args:
+        s3: MinIO client
+        schema_id: Schema ID
+
+    Returns:
+        Sorted list of (relative_path, etag) tuples
+    """
+    prefix = f"{schema_id}/source/"
+    objects = s3.list_objects(SCHEMA_BUCKET, prefix=prefix, recursive=True)
+    return sorted(
+        (obj.object_name.replace(prefix, ""), obj.etag or "") for obj in objects if obj.object_name.endswith(".xsd")
+    )
+
+
+def _fingerprint(objects: list[tuple[str, str]]) -> str:
+    digest = hashlib.sha256()
+    for relative_path, etag in objects:
+        digest.update(f"{relative_path}\0{etag}\n".encode())
+    return digest.hexdigest()[:16]
+
+
+async def _download_into(s3: Minio, schema_id: str, objects: list[tuple[str, str]], target_dir: Path) -> int:
+    """Download schema objects into a directory.
+
+    Returns:
+        Total bytes written
+    """
+    from ..clients.s3_client import download_many
+
+    prefix = f"{schema_id}/source/"
+    contents = await download_many(s3, SCHEMA_BUCKET, [prefix + relative_path for relative_path, _ in objects])
+
+    total = 0
+    for relative_path, _ in objects:
+        content = contents[prefix + relative_path]
+        target_path = target_dir / relative_path
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        target_path.write_bytes(content)
+        total += len(content)
+        logger.debug(f"Downloaded schema file: {relative_path}")
+    return total
+
+
+def _entry_size(entry: Path) -> int:
+    try:
+        return int((entry / _COMPLETE_MARKER).read_text() or 0)
+    except (OSError, ValueError):
+        return 0
+
+
+def _install_entry(staging: Path, entry: Path, size: int) -> None:
+    """Atomically move a downloaded staging directory into place and drop stale entries."""
+    (staging / _COMPLETE_MARKER).write_text(str(size))
+    with _cache_lock:
+        try:
+            os.rename(staging, entry)
+        except OSError:
+            # Another request installed the same entry first
+            shutil.rmtree(staging, ignore_errors=True)
+        # Entries for older versions of this schema can never be hit again
+        for sibling in entry.parent.iterdir():
+            if sibling != entry and not sibling.name.startswith("."):
+                shutil.rmtree(sibling, ignore_errors=True)
+
+
+def _evict(keep: Path) -> None:
+    """Remove least recently used entries until the cache fits its size limit."""
+    max_bytes = _max_cache_bytes()
+    with _cache_lock:
+        entries = []
+        for marker in _cache_root().glob(f"*/*/{_COMPLETE_MARKER}"):
+            try:
+                entries.append((marker.stat().st_mtime, marker.parent))
+            except FileNotFoundError:
+                continue
+        total = sum(_entry_size(entry) for _, entry in entries)
+        for _, entry in sorted(entries):
+            if total <= max_bytes:
+                break
+            if entry == keep:
+                continue
+            total -= _entry_size(entry)
+            shutil.rmtree(entry, ignore_errors=True)
+            logger.info(f"Evicted schema cache entry {entry.parent.name}/{entry.name}")
+
+
+def _link_tree(source: Path, target: Path) -> None:
+    """Populate target with hard links (or copies) of every file under source."""
+    for path in source.rglob("*"):
+        if path.is_dir() or path.name == _COMPLETE_MARKER:
+            continue
+        destination = target / path.relative_to(source)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.link(path, destination)
+        except FileNotFoundError:
+            # Source evicted meanwhile; the caller falls back to downloading
+            raise
+        except OSError:
+            # Cross-device or unsupported filesystem
+            shutil.copy2(path, destination)
+
+
+async def prepare_schema_dir(s3: Minio, schema_id: str, prefix: str = "schema_validation_") -> str:
+    """Get a private directory containing the schema's XSD files.
+
+    The directory belongs to the caller, who removes it when done. Files come
+    from the local cache when the MinIO ETags still match and are downloaded
+    (and cached) otherwise. A SCHEMA_CACHE_MAX_MB of 0 disables the cache.
+
+    Args:
+        s3: MinIO client
+        schema_id: Schema ID
+        prefix: Prefix for the working directory name
+
+    Returns:
+        Path to the working directory
+    """
+    workspace = Path(tempfile.mkdtemp(prefix=prefix))
+    try:
+        objects = await asyncio.to_thread(_list_schema_objects, s3, schema_id)
+
+        if _max_cache_bytes() <= 0:
+            await _download_into(s3, schema_id, objects, workspace)
+            logger.info(f"Downloaded {len(objects)} XSD schema files")
+            return str(workspace)
+
+        entry = _cache_root() / _safe_name(schema_id) / _fingerprint(objects)
+        if (entry / _COMPLETE_MARKER).exists():
+            logger.info(f"Using cached schema files for {schema_id} ({len(objects)} XSD files)")
+        else:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            staging = entry.parent / f".staging-{uuid.uuid4().hex}"
+            staging.mkdir()
+            try:
+                size = await _download_into(s3, schema_id, objects, staging)
+            except BaseException:
+                shutil.rmtree(staging, ignore_errors=True)
+                raise
+            await asyncio.to_thread(_install_entry, staging, entry, size)
+            logger.info(f"Downloaded and cached {len(objects)} XSD schema files for {schema_id}")
+
+        try:
+            # Mark as recently used before linking so eviction skips it
+            os.utime(entry / _COMPLETE_MARKER)
+            await asyncio.to_thread(_link_tree, entry, workspace)
+        except FileNotFoundError:
+            # Entry evicted by another process mid-link; fall back to a direct download
+            logger.warning(f"Schema cache entry for {schema_id} disappeared, downloading directly")
+            shutil.rmtree(workspace, ignore_errors=True)
+            workspace.mkdir()
+            await _download_into(s3, schema_id, objects, workspace)
+
+        await asyncio.to_thread(_evict, entry)
+        return str(workspace)
+
+    except BaseException:
+        shutil.rmtree(workspace, ignore_errors=True)
+        raise
+
+
+def clear_schema_cache() -> None:
+    """Remove every cached schema directory (e.g. after a schema reset)."""
+    with _cache_lock:
+        shutil.rmtree(_cache_root(), ignore_errors=True)
@@ -7,9 +7,9 @@ Provides get/update operations with defaults for missing settings.
 """
 
 import logging
-from typing import Any
+from typing import Any, cast
 
-from ..clients.neo4j_client import Neo4jClient
+from ..clients.neo4j_client import AsyncNeo4jClient, Neo4jClient
 from ..models.models import Settings
 
 logger = logging.getLogger(__name__)
@@ -25,12 +25,19 @@ class SettingsService:
 
     SETTINGS_NODE_ID = "app_settings"  # Constant ID for the single settings node
 
-    def __init__(self, neo4j_client: Neo4jClient):
+    GET_SETTINGS_QUERY = """
+    MATCH (s:Settings {id: $id})
+    RETURN s.skip_xml_validation AS skip_xml_validation,
+           s.skip_json_validation AS skip_json_validation
+    """
+
+    def __init__(self, neo4j_client: Neo4jClient | AsyncNeo4jClient):
         """
         Initialize settings service.
 
         Args:
             neo4j_client: Neo4j client for database operations
+                (an AsyncNeo4jClient for get_settings_async)
         """
         self.neo4j_client = neo4j_client
 
@@ -43,32 +50,49 @@ class SettingsService:
         Returns:
             Settings object with current configuration
         """
-        query = """
-        MATCH (s:Settings {id: $id})
-        RETURN s.skip_xml_validation AS skip_xml_validation,
-               s.skip_json_validation AS skip_json_validation
+        try:
+            neo4j_client = cast(Neo4jClient, self.neo4j_client)
+            results = neo4j_client.query(self.GET_SETTINGS_QUERY, {"id": self.SETTINGS_NODE_ID})
+            return self._settings_from_results(results)
+
+        except Exception as e:
+            logger.error(f"Error retrieving settings: {e}")
+            logger.info("Returning default settings due to error")
+            return Settings()
+
+    async def get_settings_async(self) -> Settings:
         """
+        Retrieve current application settings without blocking the event loop.
 
+        Same behavior as get_settings, using an AsyncNeo4jClient.
+
+        Returns:
+            Settings object with current configuration
+        """
         try:
-            results = self.neo4j_client.query(query, {"id": self.SETTINGS_NODE_ID})
-
-            if results:
-                # Settings exist in database
-                result = results[0]
-                return Settings(
-                    skip_xml_validation=result.get("skip_xml_validation", False),
-                    skip_json_validation=result.get("skip_json_validation", False),
-                )
-            else:
-                # No settings in database, return defaults
-                logger.info("No settings found in database, using defaults")
-                return Settings()
+            async_client = cast(AsyncNeo4jClient, self.neo4j_client)
+            results = await async_client.query(self.GET_SETTINGS_QUERY, {"id": self.SETTINGS_NODE_ID})
+            return self._settings_from_results(results)
 
         except Exception as e:
             logger.error(f"Error retrieving settings: {e}")
             logger.info("Returning default settings due to error")
             return Settings()
 
+    @staticmethod
+    def _settings_from_results(results: list[dict[str, Any]]) -> Settings:
+        """Build Settings from the settings query results (defaults when none exist)."""
+        if results:
+            # Settings exist in database
+            result = results[0]
+            return Settings(
+                skip_xml_validation=result.get("skip_xml_validation", False),
+                skip_json_validation=result.get("skip_json_validation", False),
+            )
+        # No settings in database, return defaults
+        logger.info("No settings found in database, using defaults")
+        return Settings()
+
     def update_settings(self, settings: Settings) -> Settings:
         """
         Update application settings in the database.
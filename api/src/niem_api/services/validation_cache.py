@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Cache of XML/JSON validation results keyed by document content.
+
+Upstream systems frequently resend identical files. A validation result only
+depends on the document bytes, the schema and the validator, so results are
+kept in memory under (content hash, schema_id, validator version) for
+VALIDATION_CACHE_TTL_SECONDS. A resent file skips the validator and gets the
+cached outcome: valid, or the same ValidationResult it failed with before.
+
+Schema IDs are derived from the uploaded schema content and never reused, so
+a re-uploaded schema gets a new ID and never hits results of the old one.
+The validator version covers the validation backend and library version.
+
+Only definitive outcomes are cached (valid or failed validation). Tool errors
+are not, so a transient failure is retried on the next upload.
+"""
+
+import copy
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, BinaryIO
+
+from ..core.config import batch_config
+
+logger = logging.getLogger(__name__)
+
+
+class _ResultCache:
+    """Thread-safe LRU cache of validation results with a time-to-live."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        # key -> (expires_at, filename, failure detail or None)
+        self._results: OrderedDict[str, tuple[float, str, dict | None]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> tuple[str, dict | None] | None:
+        with self._lock:
+            entry = self._results.get(key)
+            if entry is None:
+                return None
+            expires_at, filename, detail = entry
+            if expires_at <= time.monotonic():
+                del self._results[key]
+                return None
+            self._results.move_to_end(key)
+            return filename, detail
+
+    def put(self, key: str, filename: str, detail: dict | None, ttl_seconds: int) -> None:
+        if self.max_entries < 1 or ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._results[key] = (time.monotonic() + ttl_seconds, filename, detail)
+            self._results.move_to_end(key)
+            while len(self._results) > self.max_entries:
+                self._results.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._results.clear()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+
+_result_cache = _ResultCache(batch_config.VALIDATION_CACHE_MAX_ENTRIES)
+
+
+def result_key(content: str | bytes | BinaryIO, schema_id: str, validator: str) -> str:
+    """Build the cache key of a validation result.
+
+    Args:
+        content: Document content, or a seekable binary file that is hashed in
+            chunks and rewound
+        schema_id: Schema the document is validated against
+        validator: Validator identifier including its version
+
+    Returns:
+        Cache key
+    """
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    if isinstance(content, bytes):
+        digest = hashlib.sha256(content)
+    else:
+        content.seek(0)
+        digest = hashlib.file_digest(content, "sha256")
+        content.seek(0)
+    return f"{digest.hexdigest()}:{schema_id}:{validator}"
+
+
+def _rename_detail(detail: dict, old_filename: str, new_filename: str) -> dict:
+    """Point a cached failure detail at the file name of the resent document."""
+    detail = copy.deepcopy(detail)
+    if old_filename == new_filename:
+        return detail
+
+    detail["message"] = detail.get("message", "").replace(old_filename, new_filename)
+    validation_result = detail.get("validation_result") or {}
+    if validation_result.get("summary"):
+        validation_result["summary"] = validation_result["summary"].replace(old_filename, new_filename)
+    for item in validation_result.get("errors", []) + validation_result.get("warnings", []):
+        if item.get("file") == old_filename:
+            item["file"] = new_filename
+    return detail
+
+
+def get_result(key: str, filename: str) -> tuple[bool, dict | None]:
+    """Look up a cached validation result.
+
+    Args:
+        key: Key from result_key
+        filename: Name of the document being validated now
+
+    Returns:
+        (hit, failure_detail) - failure_detail is None for a valid document
+    """
+    entry = _result_cache.get(key)
+    if entry is None:
+        return False, None
+
+    cached_filename, detail = entry
+    if detail is None:
+        return True, None
+    return True, _rename_detail(detail, cached_filename, filename)
+
+
+def put_result(key: str, filename: str, detail: dict[str, Any] | None) -> None:
+    """Remember a validation result.
+
+    Args:
+        key: Key from result_key
+        filename: Name of the validated document
+        detail: HTTPException detail of the failed validation, or None if valid
+    """
+    _result_cache.put(key, filename, copy.deepcopy(detail), batch_config.VALIDATION_CACHE_TTL_SECONDS)
+
+
+def clear_validation_cache() -> None:
+    """Drop every cached validation result."""
+    _result_cache.clear()
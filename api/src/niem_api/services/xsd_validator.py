@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""In-process XSD validation with a cache of compiled schema sets.
+
+Validating through ``cmftool xval`` starts a JVM and reassembles the schema
+set for every call, which costs seconds even for a tiny message. When
+XML_VALIDATION_BACKEND is "lxml", documents are validated in process instead:
+the XSD files of a schema directory are compiled once into an
+``lxml.etree.XMLSchema`` and kept in a small LRU cache, so later messages for
+the same schema validate in milliseconds.
+
+The schema set is the same one xval sees: every XSD file in the directory.
+A generated wrapper schema imports each target namespace (and includes
+no-namespace schemas) so they compile as one set.
+
+Cache keys are built from the path, inode, size and mtime of each XSD file.
+Schema directories handed out by ``schema_cache.prepare_schema_dir`` are hard
+links to the cached files, so every request for an unchanged schema maps to
+the same key without reading the files.
+
+lxml is an optional dependency. When it is missing, or a schema set cannot
+be compiled, ``validate_documents`` returns None and callers fall back to
+xval, which remains the reference validator.
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from pathlib import Path
+from typing import Any
+from xml.sax.saxutils import quoteattr
+
+from ..core.config import batch_config
+
+logger = logging.getLogger(__name__)
+
+try:
+    from lxml import etree
+
+    LXML_AVAILABLE = True
+except ImportError:
+    etree = None
+    LXML_AVAILABLE = False
+
+XSD_NAMESPACE = "http://www.w3.org/2001/XMLSchema"
+
+
+class _CompiledSchema:
+    """A compiled schema set; None when compilation failed (xval is used instead)."""
+
+    def __init__(self, schema: Any | None):
+        self.schema = schema
+        # libxml2 validation contexts are not safe to share between threads
+        self.lock = threading.Lock()
+
+
+class _SchemaCache:
+    """Thread-safe LRU cache of compiled schema sets."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._schemas: OrderedDict[Hashable, _CompiledSchema] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> _CompiledSchema | None:
+        with self._lock:
+            compiled = self._schemas.get(key)
+            if compiled is not None:
+                self._schemas.move_to_end(key)
+            return compiled
+
+    def put(self, key: Hashable, compiled: _CompiledSchema) -> None:
+        if self.max_size < 1:
+            return
+        with self._lock:
+            self._schemas[key] = compiled
+            self._schemas.move_to_end(key)
+            while len(self._schemas) > self.max_size:
+                self._schemas.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._schemas.clear()
+
+    def __len__(self) -> int:
+        return len(self._schemas)
+
+
+_schema_cache = _SchemaCache(batch_config.XSD_VALIDATOR_CACHE_SIZE)
+
+# Serializes compilation so concurrent first requests compile a schema set once
+_compile_lock = threading.Lock()
+
+
+def in_process_validation_enabled() -> bool:
+    """Check whether XML should be validated in process.
+
+    Returns:
+        True when the lxml backend is configured and lxml is installed
+    """
+    if batch_config.XML_VALIDATION_BACKEND != "lxml":
+        return False
+    if not LXML_AVAILABLE:
+        logger.warning("XML_VALIDATION_BACKEND=lxml but lxml is not installed, using cmftool")
+        return False
+    return True
+
+
+def lxml_versions() -> str | None:
+    """Return the lxml and libxml2 versions used for in-process validation.
+
+    Returns:
+        Version string, or None when lxml is not installed
+    """
+    if not LXML_AVAILABLE:
+        return None
+    lxml_version = ".".join(str(part) for part in etree.LXML_VERSION)
+    libxml_version = ".".join(str(part) for part in etree.LIBXML_VERSION)
+    return f"lxml-{lxml_version}-libxml2-{libxml_version}"
+
+
+def _xsd_files(schema_path: Path) -> list[Path]:
+    return sorted(f for f in schema_path.rglob("*.xsd") if f.is_file())
+
+
+def _schema_set_key(schema_path: Path, xsd_files: list[Path]) -> str:
+    digest = hashlib.sha256()
+    for xsd_file in xsd_files:
+        stat = xsd_file.stat()
+        relative_path = xsd_file.relative_to(schema_path)
+        digest.update(f"{relative_path}\0{stat.st_ino}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def _safe_parser() -> Any:
+    return etree.XMLParser(resolve_entities=False, no_network=True, load_dtd=False)
+
+
+def _target_namespace(xsd_file: Path) -> str:
+    for _, element in etree.iterparse(str(xsd_file), events=("start",), resolve_entities=False, no_network=True):
+        return element.get("targetNamespace", "")
+    return ""
+
+
+def _wrapper_schema(schema_path: Path, xsd_files: list[Path]) -> bytes:
+    """Build a schema document that pulls every XSD file into one schema set.
+
+    Each target namespace is imported once (from its first file in path order;
+    the others are expected to be reached through that file's own imports and
+    includes). Schemas without a target namespace are included.
+    """
+    imports: dict[str, str] = {}
+    includes: list[str] = []
+    for xsd_file in xsd_files:
+        location = xsd_file.relative_to(schema_path).as_posix()
+        namespace = _target_namespace(xsd_file)
+        if not namespace:
+            includes.append(location)
+        elif namespace not in imports:
+            imports[namespace] = location
+
+    lines = [f'<xs:schema xmlns:xs="{XSD_NAMESPACE}">']
+    lines.extend(f"  <xs:include schemaLocation={quoteattr(location)}/>" for location in includes)
+    lines.extend(
+        f"  <xs:import namespace={quoteattr(namespace)} schemaLocation={quoteattr(location)}/>"
+        for namespace, location in imports.items()
+    )
+    lines.append("</xs:schema>")
+    return "\n".join(lines).encode("utf-8")
+
+
+def _compile(schema_path: Path, xsd_files: list[Path]) -> Any | None:
+    """Compile the schema set of a directory.
+
+    Returns:
+        Compiled XMLSchema, or None if lxml cannot compile the set
+    """
+    try:
+        wrapper = etree.fromstring(
+            _wrapper_schema(schema_path, xsd_files),
+            parser=_safe_parser(),
+            base_url=schema_path.resolve().as_uri() + "/",
+        )
+        schema = etree.XMLSchema(wrapper)
+    except (etree.XMLSchemaParseError, etree.XMLSyntaxError, OSError) as e:
+        logger.warning(f"Could not compile {len(xsd_files)} XSD files in process, using cmftool: {e}")
+        return None
+
+    logger.info(f"Compiled XSD schema set ({len(xsd_files)} files) for in-process validation")
+    return schema
+
+
+def _get_compiled_schema(schema_path: Path, xsd_files: list[Path]) -> _CompiledSchema:
+    """Get the compiled schema set for a directory, compiling it on first use."""
+    key = _schema_set_key(schema_path, xsd_files)
+    compiled = _schema_cache.get(key)
+    if compiled is not None:
+        return compiled
+
+    with _compile_lock:
+        compiled = _schema_cache.get(key)
+        if compiled is None:
+            compiled = _CompiledSchema(_compile(schema_path, xsd_files))
+            _schema_cache.put(key, compiled)
+    return compiled
+
+
+def _log_entry_to_error(entry: Any, filename: str) -> dict[str, Any]:
+    """Convert an lxml error log entry into a ValidationError dict."""
+    severity = "warning" if entry.level_name == "WARNING" else "error"
+    return {
+        "file": filename,
+        "line": entry.line or None,
+        "column": entry.column or None,
+        "message": entry.message,
+        "severity": severity,
+        "rule": None,
+        "context": entry.path or None,
+    }
+
+
+def _validate_one(compiled: _CompiledSchema, xml_content: str, filename: str) -> tuple[list[dict], list[dict]]:
+    try:
+        document = etree.fromstring(xml_content.encode("utf-8"), parser=_safe_parser())
+    except etree.XMLSyntaxError as e:
+        # Not well-formed; xval reports this as a single error too
+        error = {
+            "file": filename,
+            "line": e.lineno or None,
+            "column": e.offset or None,
+            "message": e.msg,
+            "severity": "error",
+            "rule": None,
+            "context": None,
+        }
+        return [error], []
+
+    with compiled.lock:
+        compiled.schema.validate(document)
+        entries = list(compiled.schema.error_log)
+
+    issues = [_log_entry_to_error(entry, filename) for entry in entries]
+    errors = [issue for issue in issues if issue["severity"] == "error"]
+    warnings = [issue for issue in issues if issue["severity"] == "warning"]
+    return errors, warnings
+
+
+def validate_documents(documents: list[tuple[str, str]], schema_dir: str) -> list[tuple[list[dict], list[dict]]] | None:
+    """Validate XML documents in process against the XSD files in a directory.
+
+    Args:
+        documents: (filename, xml_content) pairs
+        schema_dir: Directory containing XSD schema files
+
+    Returns:
+        Per-document (errors, warnings) lists in ValidationError dict form, or
+        None if the caller should validate with cmftool instead
+    """
+    if not in_process_validation_enabled():
+        return None
+
+    schema_path = Path(schema_dir)
+    xsd_files = _xsd_files(schema_path)
+    if not xsd_files:
+        logger.warning(f"No XSD files found in {schema_dir}, skipping validation")
+        return [([], []) for _ in documents]
+
+    compiled = _get_compiled_schema(schema_path, xsd_files)
+    if compiled.schema is None:
+        return None
+
+    return [_validate_one(compiled, xml_content, filename) for filename, xml_content in documents]
+
+
+def clear_validator_cache() -> None:
+    """Drop every compiled schema set."""
+    _schema_cache.clear()
@@ -0,0 +1,84 @@
+"""
+Unit tests for the MinIO transfer helpers.
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, Mock
+
+import pytest
+from minio.error import S3Error
+
+from niem_api.clients.s3_client import download_many, get_many_contents, upload_many
+
+
+def slow_minio(delay: float = 0.2):
+    """MinIO mock whose transfers each take ``delay`` seconds and record the calling thread."""
+    s3 = MagicMock()
+    s3.threads = set()
+
+    def get_object(bucket, name):
+        s3.threads.add(threading.current_thread().name)
+        time.sleep(delay)
+        if name == "missing":
+            raise S3Error(Mock(), "NoSuchKey", "", "", "", "")
+        response = MagicMock()
+        response.read.return_value = name.encode()
+        return response
+
+    def put_object(bucket, name, data, length, content_type):
+        s3.threads.add(threading.current_thread().name)
+        time.sleep(delay)
+
+    s3.get_object.side_effect = get_object
+    s3.put_object.side_effect = put_object
+    return s3
+
+
+@pytest.mark.asyncio
+async def test_download_many_runs_transfers_in_parallel():
+    s3 = slow_minio()
+    names = [f"s1/source/{i}.xsd" for i in range(4)]
+
+    started = time.monotonic()
+    contents = await download_many(s3, "niem-schemas", names)
+    elapsed = time.monotonic() - started
+
+    assert list(contents) == names
+    assert contents["s1/source/2.xsd"] == b"s1/source/2.xsd"
+    assert elapsed < 0.6
+    assert all(name.startswith("s3-transfer") for name in s3.threads)
+
+
+@pytest.mark.asyncio
+async def test_transfers_do_not_block_event_loop():
+    s3 = slow_minio()
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        for _ in range(5):
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    await asyncio.gather(upload_many(s3, "niem-data", [("a.xml", b"<a/>", "application/xml")]), ticker())
+
+    assert ticks == 5
+    assert s3.put_object.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_download_many_raises_after_all_transfers_finish():
+    s3 = slow_minio(delay=0.05)
+
+    with pytest.raises(S3Error):
+        await download_many(s3, "niem-schemas", ["a.xsd", "missing", "b.xsd"])
+
+    assert s3.get_object.call_count == 3
+
+
+def test_get_many_contents_from_sync_code():
+    s3 = slow_minio(delay=0.01)
+
+    assert get_many_contents(s3, "niem-schemas", ["a.xsd", "b.xsd"]) == {"a.xsd": b"a.xsd", "b.xsd": b"b.xsd"}
@@ -0,0 +1,149 @@
+"""
+Unit tests for the persistent tool worker pool.
+
+A small Python script stands in for ToolWorker.java and speaks the same
+stdin/stdout protocol, so no JVM is needed.
+"""
+
+import subprocess
+import sys
+import textwrap
+from unittest.mock import patch
+
+import pytest
+
+from niem_api.clients import tool_worker
+from niem_api.clients.tool_worker import ToolWorkerError, ToolWorkerPool, ToolWorkerTimeoutError, run_tool_job
+from niem_api.core.config import batch_config
+
+FAKE_WORKER = textwrap.dedent(
+    """
+    import base64, os, sys, time
+
+    print("READY " + sys.argv[1], flush=True)
+    for line in sys.stdin:
+        args = [base64.b64decode(arg).decode() for arg in line.split()]
+        if args[0] == "crash":
+            sys.exit(3)
+        if args[0] == "sleep":
+            time.sleep(float(args[1]))
+        out = ("pid=%d " % os.getpid() + " ".join(args)).encode()
+        err = "ümlaut".encode() if args[0] == "fail" else b""
+        sys.stdout.write("%d %d %d\\n" % (2 if err else 0, len(out), len(err)))
+        sys.stdout.flush()
+        sys.stdout.buffer.write(out + err)
+        sys.stdout.buffer.flush()
+    """
+)
+
+
+@pytest.fixture
+def worker_command(tmp_path):
+    script = tmp_path / "fake_worker.py"
+    script.write_text(FAKE_WORKER, encoding="utf-8")
+    return lambda mode="exit-trap": [sys.executable, str(script), mode]
+
+
+def pids(result):
+    return result.stdout.split()[0]
+
+
+def test_jobs_reuse_the_worker_and_resolve_files(worker_command, tmp_path):
+    (tmp_path / "schema.xsd").write_text("<xs:schema/>")
+    pool = ToolWorkerPool("fake", worker_command(), size=1, max_jobs=0)
+
+    first = pool.run(["x2m", "-o", "model.cmf", "schema.xsd", "--niem-version", "6.0"], str(tmp_path), timeout=10)
+    second = pool.run(["fail"], str(tmp_path), timeout=10)
+    pool.close()
+
+    output, schema = str(tmp_path / "model.cmf"), str(tmp_path / "schema.xsd")
+    assert first.returncode == 0
+    assert first.stdout.split()[1:] == ["x2m", "-o", output, schema, "--niem-version", "6.0"]
+    assert (second.returncode, second.stderr) == (2, "ümlaut")
+    assert pids(first) == pids(second)
+
+
+def test_crashed_worker_is_replaced(worker_command, tmp_path):
+    pool = ToolWorkerPool("fake", worker_command(), size=1, max_jobs=0)
+    before = pool.run(["version"], str(tmp_path), timeout=10)
+
+    with pytest.raises(ToolWorkerError):
+        pool.run(["crash"], str(tmp_path), timeout=10)
+    after = pool.run(["version"], str(tmp_path), timeout=10)
+    pool.close()
+
+    assert pids(before) != pids(after)
+
+
+def test_timed_out_worker_is_killed(worker_command, tmp_path):
+    pool = ToolWorkerPool("fake", worker_command(), size=1, max_jobs=0)
+    before = pool.run(["version"], str(tmp_path), timeout=10)
+
+    with pytest.raises(ToolWorkerTimeoutError):
+        pool.run(["sleep", "5"], str(tmp_path), timeout=0.2)
+    after = pool.run(["version"], str(tmp_path), timeout=10)
+    pool.close()
+
+    assert pids(before) != pids(after)
+
+
+def test_worker_replaced_after_max_jobs(worker_command, tmp_path):
+    pool = ToolWorkerPool("fake", worker_command(), size=1, max_jobs=2)
+
+    results = [pool.run(["version"], str(tmp_path), timeout=10) for _ in range(3)]
+    pool.close()
+
+    assert pids(results[0]) == pids(results[1]) != pids(results[2])
+
+
+def test_pool_without_exit_trap_is_disabled(worker_command, tmp_path):
+    pool = ToolWorkerPool("fake", worker_command("no-exit-trap"), size=1, max_jobs=0)
+
+    with pytest.raises(ToolWorkerError):
+        pool.run(["version"], str(tmp_path), timeout=10)
+    assert pool.disabled
+
+
+def test_pool_is_disabled_when_a_worker_cannot_start(tmp_path):
+    pool = ToolWorkerPool("fake", [sys.executable, "-c", "raise SystemExit(1)"], size=1, max_jobs=0)
+
+    with patch.object(tool_worker.subprocess, "Popen", wraps=subprocess.Popen) as popen:
+        with pytest.raises(ToolWorkerError):
+            pool.run(["version"], str(tmp_path), timeout=10)
+        with pytest.raises(ToolWorkerError):
+            pool.run(["version"], str(tmp_path), timeout=10)
+
+    assert pool.disabled
+    assert popen.call_count == 1
+    with patch.dict(tool_worker._pools, {"fake": pool}), patch.object(batch_config, "TOOL_WORKERS_ENABLED", True):
+        assert run_tool_job("fake", "unused", ["version"], str(tmp_path), 10) is None
+
+
+def test_run_tool_job_falls_back_and_raises_timeouts(worker_command, tmp_path):
+    pool = ToolWorkerPool("fake", worker_command(), size=1, max_jobs=0)
+
+    with patch.object(tool_worker, "get_tool_pool", return_value=pool):
+        assert run_tool_job("fake", "unused", ["crash"], str(tmp_path), 10) is None
+        with pytest.raises(subprocess.TimeoutExpired):
+            run_tool_job("fake", "unused", ["sleep", "5"], str(tmp_path), 0.2)
+    pool.close()
+
+
+def test_workers_disabled_by_default():
+    assert tool_worker.get_tool_pool("cmftool", "unused") is None
+
+
+def test_worker_command_reads_launcher(tmp_path):
+    launcher = tmp_path / "tool-1.0" / "bin" / "tool"
+    launcher.parent.mkdir(parents=True)
+    launcher.write_text(
+        "CLASSPATH=$APP_HOME/lib/app-tool-1.0.jar:$APP_HOME/lib/dep.jar\n"
+        'set -- \\\n        -classpath "$CLASSPATH" \\\n        org.example.Tool \\\n        "$@"\n'
+    )
+
+    with patch.object(tool_worker, "_java_executable", return_value="/usr/bin/java"):
+        command = tool_worker.worker_command(str(launcher))
+
+    home = tmp_path / "tool-1.0"
+    assert command[-2:] == [str(tool_worker.WORKER_SOURCE), "org.example.Tool"]
+    assert command[command.index("-cp") + 1] == f"{home}/lib/app-tool-1.0.jar:{home}/lib/dep.jar"
@@ -1,11 +1,18 @@
 #!/usr/bin/env python3
 
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from minio import Minio
 
-from niem_api.handlers.admin import count_data_files, count_neo4j_objects, count_schemas, handle_reset, reset_neo4j
+from niem_api.handlers.admin import (
+    count_data_files,
+    count_neo4j_objects,
+    count_neo4j_objects_async,
+    count_schemas,
+    handle_reset,
+    reset_neo4j,
+)
 from niem_api.models.models import ResetRequest
 
 
@@ -70,14 +77,16 @@ class TestAdminHandlers:
         """Test reset handler dry run (no confirm token)"""
         reset_request = ResetRequest(schemas=True, data=True, neo4j=True, dry_run=True)
 
-        with patch("niem_api.handlers.admin.count_schemas", return_value=5), patch(
-            "niem_api.handlers.admin.count_data_files", return_value={"total_files": 10}
-        ), patch(
-            "niem_api.handlers.admin.count_neo4j_objects",
-            return_value={
-                "status": "success",
-                "stats": {"nodes": 100, "relationships": 50, "indexes": 2, "constraints": 1},
-            },
+        with (
+            patch("niem_api.handlers.admin.count_schemas", return_value=5),
+            patch("niem_api.handlers.admin.count_data_files", return_value={"total_files": 10}),
+            patch(
+                "niem_api.handlers.admin.count_neo4j_objects",
+                return_value={
+                    "status": "success",
+                    "stats": {"nodes": 100, "relationships": 50, "indexes": 2, "constraints": 1},
+                },
+            ),
         ):
             result = handle_reset(reset_request, mock_s3_client)
 
@@ -105,6 +114,26 @@ class TestAdminHandlers:
             assert result["stats"]["indexes"] == 1  # Only BTREE, not LOOKUP
             assert result["stats"]["constraints"] == 1
 
+    @pytest.mark.asyncio
+    async def test_count_neo4j_objects_async(self):
+        """Stats route counts on the async client"""
+        with patch("niem_api.core.dependencies.get_async_neo4j_client") as mock_client:
+            mock_neo4j = Mock()
+            mock_client.return_value = mock_neo4j
+            mock_neo4j.query = AsyncMock(
+                side_effect=[
+                    [{"count": 100}],
+                    [{"count": 50}],
+                    [{"name": "index1", "type": "RANGE"}, {"name": "lookup_index", "type": "LOOKUP"}],
+                    [],
+                ]
+            )
+
+            result = await count_neo4j_objects_async()
+
+            assert result["stats"] == {"nodes": 100, "relationships": 50, "indexes": 1, "constraints": 0}
+            assert mock_neo4j.query.await_count == 4
+
     def test_reset_neo4j_error_handling(self):
         """Test Neo4j reset with error handling"""
         with patch("niem_api.core.dependencies.get_neo4j_client") as mock_client:
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""Tests for chunked commits with retry and rollback in the ingest executor."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from neo4j.exceptions import ClientError, TransientError
+
+from niem_api.core.config import batch_config
+from niem_api.handlers.ingest import (
+    _commit_groups,
+    _execute_cypher_statements,
+    _generate_cypher_from_json,
+    _write_streamed_batches,
+)
+from niem_api.services.domain.graph.batch_writer import CypherStatement, WriteBatch
+from niem_api.services.domain.json_to_graph import sanitize_neo4j_label
+from niem_api.services.domain.xml_to_graph.converter import build_cypher_statements
+
+
+@pytest.fixture
+def chunked(monkeypatch):
+    """Enable chunked commits every 2 rows with no retry delay."""
+    monkeypatch.setattr(batch_config, "INGEST_COMMIT_EVERY", 2)
+    monkeypatch.setattr(batch_config, "INGEST_COMMIT_MAX_RETRIES", 2)
+    monkeypatch.setattr(batch_config, "INGEST_COMMIT_RETRY_BACKOFF_MS", 0)
+
+
+# NIEM JSON document whose labels need sanitizing (hyphenated prefix, dotted element)
+HYPHENATED_JSON = {
+    "@context": {"my-ext": "http://example.com/ext/", "nc": "http://release.niem.gov/niem/niem-core/5.0/"},
+    "my-ext:Report.Info": {"nc:Person": {"nc:PersonName": {"nc:PersonGivenName": "Peter"}}},
+}
+
+
+def session_of(neo4j_client):
+    return neo4j_client.driver.session.return_value.__enter__.return_value
+
+
+def test_commit_groups_bound_rows_per_commit():
+    batches = [WriteBatch(query="Q", rows=[{"id": i} for i in range(5)]), CypherStatement("S")]
+
+    groups = list(_commit_groups(batches, batch_size=2, commit_every=2))
+
+    assert [len(group) for group in groups] == [1, 1, 2]
+    assert [len(query_params.get("rows", [])) for group in groups for _, query_params in group] == [2, 2, 1, 0]
+
+
+class TestChunkedExecution:
+    """Chunked commit mode of _execute_cypher_statements."""
+
+    def test_commits_each_chunk_separately(self, chunked):
+        neo4j_client = MagicMock()
+        session = session_of(neo4j_client)
+        batches = [WriteBatch(query="Q", rows=[{"id": i} for i in range(5)])]
+
+        executed = _execute_cypher_statements(batches, neo4j_client, "up1", "a.xml")
+
+        assert executed == 3
+        assert session.begin_transaction.call_count == 3
+
+    def test_transient_error_is_retried(self, chunked):
+        neo4j_client = MagicMock()
+        tx = session_of(neo4j_client).begin_transaction.return_value.__enter__.return_value
+        tx.run.side_effect = [TransientError("deadlock"), None]
+
+        executed = _execute_cypher_statements([CypherStatement("S")], neo4j_client, "up1", "a.xml")
+
+        assert executed == 1
+        assert tx.run.call_count == 2
+
+    def test_failed_chunk_rolls_back_partial_write(self, chunked):
+        neo4j_client = MagicMock()
+        session = session_of(neo4j_client)
+        tx = session.begin_transaction.return_value.__enter__.return_value
+        tx.run.side_effect = [None, None, ClientError("constraint violated")]
+        session.run.return_value.single.return_value = {"deleted": 2}
+        statements = [CypherStatement("S1"), CypherStatement("S2"), CypherStatement("S3")]
+
+        with pytest.raises(ClientError):
+            _execute_cypher_statements(statements, neo4j_client, "up1", "a.xml")
+
+        args, kwargs = session.run.call_args
+        assert "DETACH DELETE" in args[0]
+        assert kwargs["upload_id"] == "up1" and kwargs["filename"] == "a.xml"
+
+    def test_rollback_removes_edges_added_to_existing_nodes(self, chunked):
+        """A failed file's edge to a node that existed before is deleted; the node itself is not."""
+        neo4j_client = MagicMock()
+        session = session_of(neo4j_client)
+        tx = session.begin_transaction.return_value.__enter__.return_value
+        tx.run.side_effect = [None, None, ClientError("constraint violated")]
+        # Two relationship batches (10000 + 1), then one node batch
+        session.run.return_value.single.side_effect = [{"deleted": 10000}, {"deleted": 1}, {"deleted": 1}]
+        nodes = {"new1": ["nc_Person", "nc:Person", {}, {}]}
+        edges = [("new1", "nc_Person", "existing", "nc_Person", "NC_PERSONKNOWS", {})]
+        statements = build_cypher_statements(nodes, [], edges, "a.xml", "up1") + [CypherStatement("S3")]
+
+        with pytest.raises(ClientError):
+            _execute_cypher_statements(statements, neo4j_client, "up1", "a.xml")
+
+        edge_query = statements[1].query
+        assert "ON CREATE SET r._upload_id='up1', r._source_file='a.xml'" in edge_query
+        queries = [call.args[0] for call in session.run.call_args_list]
+        assert len(queries) == 3
+        assert all("()-[r {_upload_id: $upload_id, _source_file: $filename}]->()" in q for q in queries[:2])
+        assert "DELETE r" in queries[0] and "DETACH" not in queries[0]
+        assert "MATCH (n {_upload_id: $upload_id, _source_file: $filename})" in queries[2]
+
+    def test_rollback_only_scans_the_labels_the_file_wrote(self, chunked):
+        neo4j_client = MagicMock()
+        session = session_of(neo4j_client)
+        tx = session.begin_transaction.return_value.__enter__.return_value
+        tx.run.side_effect = [None, None, ClientError("constraint violated")]
+        session.run.return_value.single.return_value = {"deleted": 0}
+        statements = [CypherStatement("S1"), CypherStatement("S2"), CypherStatement("S3")]
+
+        with pytest.raises(ClientError):
+            _execute_cypher_statements(statements, neo4j_client, "up1", "a.xml", ["j_Charge", "nc_Person"])
+
+        queries = [call.args[0] for call in session.run.call_args_list]
+        assert [q.split(" WITH")[0] for q in queries] == [
+            "MATCH (a:`j_Charge`)-[r {_upload_id: $upload_id, _source_file: $filename}]->()",
+            "MATCH (a:`nc_Person`)-[r {_upload_id: $upload_id, _source_file: $filename}]->()",
+            "MATCH (n:`j_Charge` {_upload_id: $upload_id, _source_file: $filename})",
+            "MATCH (n:`nc_Person` {_upload_id: $upload_id, _source_file: $filename})",
+        ]
+
+    def test_rollback_uses_sanitized_json_labels(self, chunked):
+        """A failed JSON file is rolled back under the labels its statements wrote."""
+        neo4j_client = MagicMock()
+        session = session_of(neo4j_client)
+        tx = session.begin_transaction.return_value.__enter__.return_value
+        tx.run.side_effect = [None, None, ClientError("constraint violated")]
+        session.run.return_value.single.return_value = {"deleted": 0}
+        statements, stats = _generate_cypher_from_json(
+            json.dumps(HYPHENATED_JSON), {}, "r.json", "up1", "s1", write_mode="statement_list"
+        )
+
+        with pytest.raises(ClientError):
+            _execute_cypher_statements(statements, neo4j_client, "up1", "r.json", stats["labels"])
+
+        assert statements[0].query.startswith("MERGE (n:my_ext_Report_Info ")
+        queries = [call.args[0] for call in session.run.call_args_list]
+        assert "MATCH (a:`my_ext_Report_Info`)-[r" in queries[0]
+        assert "MATCH (n:`my_ext_Report_Info` {" in queries[3]
+        assert not any("my-ext" in q or "Report.Info" in q for q in queries)
+
+    def test_disabled_without_upload_tag(self, chunked):
+        neo4j_client = MagicMock()
+        session = session_of(neo4j_client)
+
+        _execute_cypher_statements([CypherStatement("S1"), CypherStatement("S2"), CypherStatement("S3")], neo4j_client)
+
+        assert session.begin_transaction.call_count == 1
+
+    def test_retries_exhausted_raises(self, chunked):
+        neo4j_client = MagicMock()
+        tx = session_of(neo4j_client).begin_transaction.return_value.__enter__.return_value
+        tx.run.side_effect = TransientError("still busy")
+
+        with patch("time.sleep"), pytest.raises(TransientError):
+            _execute_cypher_statements([CypherStatement("S")], neo4j_client, "up1", "a.xml")
+
+        assert tx.run.call_count == 3
+
+
+class TestStreamedWrite:
+    """Writing streamed files batch by batch with _write_streamed_batches."""
+
+    def test_conversion_failure_rolls_back_committed_batches(self, chunked, monkeypatch):
+        monkeypatch.setattr(batch_config, "INGEST_AUTO_INDEXES", False)
+        neo4j_client = MagicMock()
+        session = session_of(neo4j_client)
+        session.run.return_value.single.return_value = {"deleted": 0}
+
+        def batches():
+            yield [WriteBatch(query="Q", rows=[{"id": i} for i in range(4)])], {"n1": ["nc_Person"]}, [], []
+            raise ValueError("unexpected @graph item")
+
+        with pytest.raises(ValueError):
+            _write_streamed_batches(batches(), neo4j_client, "up1", "big.json")
+
+        assert session.begin_transaction.call_count == 2
+        queries = [call.args[0] for call in session.run.call_args_list]
+        assert "DELETE r" in queries[0] and "DETACH DELETE n" in queries[1]
+
+    def test_commits_per_batch_without_chunked_commits(self, monkeypatch):
+        monkeypatch.setattr(batch_config, "INGEST_AUTO_INDEXES", False)
+        monkeypatch.setattr(batch_config, "INGEST_COMMIT_EVERY", 0)
+        monkeypatch.setattr(batch_config, "INGEST_STREAMING_BATCH_NODES", 3)
+        neo4j_client = MagicMock()
+        batches = [([WriteBatch(query="Q", rows=[{"id": i} for i in range(3)])], {"n1": ["nc_Person"]}, [], [])] * 2
+
+        executed, stats = _write_streamed_batches(iter(batches), neo4j_client, "up1", "big.json")
+
+        assert executed == 2
+        assert session_of(neo4j_client).begin_transaction.call_count == 2
+        assert stats["nodes_count"] == 2 and stats["labels"] == ["nc_Person"]
+
+    def test_rollback_uses_written_labels(self, chunked, monkeypatch):
+        monkeypatch.setattr(batch_config, "INGEST_AUTO_INDEXES", False)
+        neo4j_client = MagicMock()
+        session = session_of(neo4j_client)
+        tx = session.begin_transaction.return_value.__enter__.return_value
+        tx.run.side_effect = [None, ClientError("constraint violated")]
+        session.run.return_value.single.return_value = {"deleted": 0}
+        rows = [{"id": i} for i in range(4)]
+        batches = [([WriteBatch(query="Q", rows=rows)], {"n1": ["my-ext_Report.Info"]}, [], [])]
+
+        with pytest.raises(ClientError):
+            _write_streamed_batches(iter(batches), neo4j_client, "up1", "big.json", written_label=sanitize_neo4j_label)
+
+        queries = [call.args[0] for call in session.run.call_args_list]
+        assert [q.split(" WITH")[0] for q in queries] == [
+            "MATCH (a:`my_ext_Report_Info`)-[r {_upload_id: $upload_id, _source_file: $filename}]->()",
+            "MATCH (n:`my_ext_Report_Info` {_upload_id: $upload_id, _source_file: $filename})",
+        ]
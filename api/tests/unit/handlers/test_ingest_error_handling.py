@@ -64,3 +64,24 @@ class TestIngestErrorHandling:
             data_call = mock_upload.call_args_list[0]
             assert "xml/" in data_call[0][2]  # filename path includes "xml/"
             assert test_filename in data_call[0][2]  # original filename is included
+
+    @pytest.mark.asyncio
+    async def test_archive_failure_is_reported_as_storage_failure(self):
+        """A MinIO failure after the Neo4j write is not reported as a Cypher failure."""
+        from niem_api.handlers.ingest import _write_and_archive_stages
+
+        _, archive = _write_and_archive_stages(MagicMock(), MagicMock(), "up1", "xml")
+        cypher = MagicMock()
+        job = {"file": MagicMock(filename="test.xml"), "content": b"<a/>", "cypher": cypher, "executed": 3}
+
+        with patch(
+            "niem_api.handlers.ingest._store_processed_files",
+            new_callable=AsyncMock,
+            side_effect=OSError("bucket down"),
+        ):
+            await archive.run(job)
+
+        assert job["result"]["status"] == "failed"
+        assert job["result"]["error"].startswith("Archiving to MinIO failed")
+        assert "Cypher" not in job["result"]["error"]
+        cypher.close.assert_called_once()
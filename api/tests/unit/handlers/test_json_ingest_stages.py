@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""Tests for the NIEM JSON ingest stages with the default conversion settings."""
+
+import json
+from io import BytesIO
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+from fastapi import UploadFile
+
+from niem_api.core.config import batch_config
+from niem_api.handlers import ingest
+from niem_api.services import conversion_pool, validation_cache
+from niem_api.services.conversion_pool import pack_mapping
+from niem_api.services.domain import json_to_graph
+from niem_api.services.domain.json_to_graph import parser
+
+MAPPING = {
+    "namespaces": {"nc": "http://release.niem.gov/niem/niem-core/5.0/"},
+    "objects": [{"qname": "nc:Person", "label": "nc_Person", "carries_structures_id": True, "scalar_props": []}],
+    "associations": [],
+    "references": [],
+}
+
+SCHEMA = {"type": "object", "required": ["nc:Person"]}
+
+GRAPH_SCHEMA = {
+    "type": "object",
+    "required": ["@context"],
+    "properties": {"@graph": {"type": "array", "minItems": 5, "items": {"required": ["nc:Person"]}}},
+}
+
+
+def upload(filename, document):
+    return UploadFile(filename=filename, file=BytesIO(json.dumps(document).encode()))
+
+
+def document(person_id):
+    return {
+        "@context": {"nc": "http://release.niem.gov/niem/niem-core/5.0/"},
+        "nc:Person": {"@id": person_id, "nc:PersonName": {"nc:PersonFullName": "Ann"}},
+    }
+
+
+def graph_document(count):
+    return {
+        "@context": {"nc": "http://release.niem.gov/niem/niem-core/5.0/"},
+        "@graph": [{"nc:Person": document(f"P{i}")["nc:Person"]} for i in range(count)],
+    }
+
+
+@pytest.fixture
+def in_process_conversion(monkeypatch):
+    """Run pool conversions in a thread and count JSON parses."""
+    monkeypatch.setattr(conversion_pool, "get_conversion_pool", lambda: None)
+    json_module = Mock(wraps=json)
+    monkeypatch.setattr(parser, "json", json_module)
+    validation_cache.clear_validation_cache()
+    yield json_module
+    validation_cache.clear_validation_cache()
+
+
+async def run_json_ingest(files):
+    stages = ingest._json_ingest_stages(
+        MAPPING, SCHEMA, Mock(), Mock(), "up1", "schema1", mapping_payload=pack_mapping(MAPPING)
+    )
+    with (
+        patch.object(ingest, "_execute_cypher_statements", return_value=1),
+        patch.object(ingest, "_store_processed_files"),
+    ):
+        results, _, _ = await ingest._run_ingest_pipeline(files, stages, "json")
+    return results
+
+
+@pytest.mark.asyncio
+async def test_each_file_is_parsed_once(in_process_conversion):
+    results = await run_json_ingest([upload("a.json", document("P1")), upload("b.json", document("P2"))])
+
+    assert [result["status"] for result in results] == ["success", "success"]
+    assert in_process_conversion.loads.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_invalid_document_is_rejected_by_the_worker(in_process_conversion):
+    results = await run_json_ingest([upload("bad.json", {"nc:Activity": {}})])
+
+    assert results[0]["status"] == "failed"
+    assert in_process_conversion.loads.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_large_file_is_written_as_batches_are_converted(monkeypatch):
+    monkeypatch.setattr(batch_config, "INGEST_STREAMING_THRESHOLD_MB", 0)
+    monkeypatch.setattr(batch_config, "INGEST_STREAMING_BATCH_NODES", 2)
+    monkeypatch.setattr(batch_config, "INGEST_COMMIT_EVERY", 0)
+    monkeypatch.setattr(batch_config, "INGEST_AUTO_INDEXES", False)
+    events = []
+    iter_batches = json_to_graph.iter_json_cypher_batches
+
+    def recording_iter(*args, **kwargs):
+        for batch in iter_batches(*args, **kwargs):
+            events.append("batch")
+            yield batch
+
+    monkeypatch.setattr(json_to_graph, "iter_json_cypher_batches", recording_iter)
+    monkeypatch.setattr(ingest, "_commit_with_retry", lambda *args: events.append("commit"))
+    archived = []
+
+    async def store(s3, content, filename, cypher_file, file_type):
+        cypher_file.seek(0)
+        archived.append(cypher_file.read().decode())
+
+    stages = ingest._json_ingest_stages(
+        MAPPING, GRAPH_SCHEMA, MagicMock(), Mock(), "up1", "schema1", mapping_payload=pack_mapping(MAPPING)
+    )
+    with (
+        patch.object(ingest, "_validate_json_content") as validate,
+        patch.object(ingest, "_store_processed_files", side_effect=store),
+    ):
+        results, _, _ = await ingest._run_ingest_pipeline([upload("big.json", graph_document(4))], stages, "json")
+
+    assert results[0]["status"] == "success"
+    assert results[0]["nodes_created"] == 8
+    # The first batch is committed before the second is converted
+    assert events.index("commit") < events.index("batch", 1)
+    # Streamed files are validated item by item, never parsed whole
+    validate.assert_not_called()
+    assert archived[0].count("MERGE (n:nc_Person {") == 4
+
+
+@pytest.mark.asyncio
+async def test_large_file_with_an_invalid_item_is_rejected_before_writing(monkeypatch):
+    monkeypatch.setattr(batch_config, "INGEST_STREAMING_THRESHOLD_MB", 0)
+    validation_cache.clear_validation_cache()
+    document = graph_document(3)
+    document["@graph"][2] = {"nc:Activity": {}}
+    neo4j_client = MagicMock()
+
+    stages = ingest._json_ingest_stages(
+        MAPPING, GRAPH_SCHEMA, neo4j_client, Mock(), "up1", "schema1", mapping_payload=pack_mapping(MAPPING)
+    )
+    results, _, _ = await ingest._run_ingest_pipeline([upload("big.json", document)], stages, "json")
+
+    assert results[0]["status"] == "failed"
+    errors = results[0]["validation_details"]["errors"]
+    assert [error["context"] for error in errors] == ["@graph.2"]
+    neo4j_client.driver.session.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("threshold_mb", [1024, 0], ids=["in_memory", "streamed"])
+async def test_indexes_are_provisioned_for_sanitized_labels(monkeypatch, in_process_conversion, threshold_mb):
+    monkeypatch.setattr(batch_config, "INGEST_STREAMING_THRESHOLD_MB", threshold_mb)
+    monkeypatch.setattr(batch_config, "INGEST_COMMIT_EVERY", 0)
+    indexed = set()
+    monkeypatch.setattr(ingest, "_ensure_ingest_indexes", lambda client, labels: indexed.update(labels or ()))
+    document = {
+        "@context": {"my-ext": "http://example.com/ext/", "nc": "http://release.niem.gov/niem/niem-core/5.0/"},
+        "my-ext:Report.Info": {"nc:Person": {"nc:PersonName": {"nc:PersonFullName": "Ann"}}},
+    }
+
+    stages = ingest._json_ingest_stages(
+        MAPPING, {"type": "object"}, MagicMock(), Mock(), "up1", "schema1", mapping_payload=pack_mapping(MAPPING)
+    )
+    with patch.object(ingest, "_store_processed_files"):
+        results, _, _ = await ingest._run_ingest_pipeline([upload("r.json", document)], stages, "json")
+
+    assert results[0]["status"] == "success"
+    assert "my_ext_Report_Info" in indexed
+    assert not any("-" in label or "." in label for label in indexed)
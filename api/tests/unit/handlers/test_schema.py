@@ -199,3 +199,85 @@ class TestSchemaHandlers:
         result = get_active_schema_id(mock_s3_client)
 
         assert result is None
+
+
+class TestSchevalValidation:
+    """NDR schematron validation across uploaded files"""
+
+    @pytest.mark.asyncio
+    async def test_files_validate_concurrently_in_upload_order(self, monkeypatch):
+        """Files are validated in parallel up to the limit and reported in upload order"""
+        import asyncio
+        from pathlib import Path
+
+        from niem_api.core.config import batch_config
+        from niem_api.handlers.schema import _validate_all_scheval
+
+        monkeypatch.setattr(batch_config, "SCHEVAL_CONCURRENCY", 2)
+        running = peak = 0
+
+        async def fake_validate(self, xsd_content, schematron_file, use_compiled_xslt=False):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02 if "slow" in xsd_content else 0.01)
+            running -= 1
+            error = {"file": "schema.xsd", "line": 3, "column": 1, "message": xsd_content, "severity": "error"}
+            return {"status": "fail" if "bad" in xsd_content else "pass", "errors": [error], "warnings": []}
+
+        files = {f"f{i}.xsd": (b"slow bad" if i == 0 else b"ok %d" % i) for i in range(5)}
+        with (
+            patch("niem_api.handlers.schema.is_scheval_available", return_value=True),
+            patch.object(Path, "exists", return_value=True),
+            patch("niem_api.handlers.schema.ndr_rules_version", return_value="rules1"),
+            patch("niem_api.handlers.schema.SchevalValidator.validate_xsd_with_schematron", fake_validate),
+        ):
+            report = await _validate_all_scheval(files)
+
+        assert peak == 2
+        assert report.status == "fail"
+        assert [error.file for error in report.errors] == list(files)
+        assert report.summary["error_count"] == 5
+
+    @pytest.mark.asyncio
+    async def test_unchanged_files_reuse_cached_results(self):
+        """Only new or changed files go to scheval; cached issues keep the uploaded filename"""
+        from pathlib import Path
+
+        from minio.error import S3Error
+
+        from niem_api.handlers.schema import _validate_all_scheval
+
+        stored = {}
+        s3 = Mock()
+        s3.put_object.side_effect = lambda bucket, name, data, length, content_type: stored.update({name: data.read()})
+
+        def get_object(bucket, name):
+            if name not in stored:
+                raise S3Error(Mock(), "NoSuchKey", "", "", "", "")
+            return Mock(read=Mock(return_value=stored[name]))
+
+        s3.get_object.side_effect = get_object
+        validated = []
+
+        async def fake_validate(self, xsd_content, schematron_file, use_compiled_xslt=False):
+            validated.append(xsd_content)
+            error = {"file": "schema.xsd", "line": 3, "column": 1, "message": "Rule 7-10", "severity": "error"}
+            return {"status": "fail", "errors": [error], "warnings": []}
+
+        async def upload(files):
+            with (
+                patch("niem_api.handlers.schema.is_scheval_available", return_value=True),
+                patch.object(Path, "exists", return_value=True),
+                patch("niem_api.handlers.schema.ndr_rules_version", return_value="rules1"),
+                patch("niem_api.handlers.schema.SchevalValidator.validate_xsd_with_schematron", fake_validate),
+            ):
+                return await _validate_all_scheval(files, s3)
+
+        await upload({"core.xsd": b"core", "ext.xsd": b"ext v1", "copy.xsd": b"core"})
+        report = await upload({"niem-core.xsd": b"core", "ext.xsd": b"ext v2"})
+
+        assert validated == ["core", "ext v1", "ext v2"]
+        assert report.metadata["files_from_cache"] == 1
+        assert [error.file for error in report.errors] == ["niem-core.xsd", "ext.xsd"]
+        assert report.status == "fail"
@@ -2,7 +2,7 @@
 
 import pytest
 from fastapi.testclient import TestClient
-from unittest.mock import patch, Mock
+from unittest.mock import AsyncMock, patch, Mock
 
 from niem_api.main import app
 from niem_api.models.models import Settings
@@ -31,11 +31,11 @@ class TestSettingsEndpoints:
         # Arrange
         expected_settings = create_settings_object(skip_xml=True, skip_json=False)
 
-        with patch("niem_api.core.dependencies.get_neo4j_client") as mock_get_client, \
+        with patch("niem_api.core.dependencies.get_async_neo4j_client") as mock_get_client, \
              patch("niem_api.services.settings_service.SettingsService") as mock_service_class:
 
             mock_service = Mock()
-            mock_service.get_settings.return_value = expected_settings
+            mock_service.get_settings_async = AsyncMock(return_value=expected_settings)
             mock_service_class.return_value = mock_service
 
             # Act
@@ -46,7 +46,7 @@ class TestSettingsEndpoints:
             data = response.json()
             assert data["skip_xml_validation"] is True
             assert data["skip_json_validation"] is False
-            mock_service.get_settings.assert_called_once()
+            mock_service.get_settings_async.assert_awaited_once()
 
     def test_update_settings_endpoint_updates_and_returns_settings(self, client):
         """Test PUT /api/settings updates and returns settings."""
@@ -118,11 +118,11 @@ class TestSettingsEndpoints:
         # Arrange
         default_settings = create_settings_object(skip_xml=False, skip_json=False)
 
-        with patch("niem_api.core.dependencies.get_neo4j_client") as mock_get_client, \
+        with patch("niem_api.core.dependencies.get_async_neo4j_client") as mock_get_client, \
              patch("niem_api.services.settings_service.SettingsService") as mock_service_class:
 
             mock_service = Mock()
-            mock_service.get_settings.return_value = default_settings
+            mock_service.get_settings_async = AsyncMock(return_value=default_settings)
             mock_service_class.return_value = mock_service
 
             # Act
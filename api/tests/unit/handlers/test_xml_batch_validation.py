@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Tests for validating a batch of XML files with a single xval run."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException
+
+from niem_api.handlers.ingest import _validate_xml_batch, _validate_xml_content
+
+DOCUMENTS = [("a.xml", "<a/>"), ("b.xml", "<b/>")]
+
+
+@pytest.fixture
+def schema_dir(tmp_path):
+    (tmp_path / "model.xsd").write_text("<xs:schema/>")
+    return str(tmp_path)
+
+
+def xval_result(stdout: str = "", returncode: int = 0) -> dict:
+    return {"returncode": returncode, "stdout": stdout, "stderr": ""}
+
+
+def validated_files(cmd: list) -> list[str]:
+    return [Path(cmd[index + 1]).name for index, arg in enumerate(cmd) if arg == "--file"]
+
+
+def test_valid_batch_runs_validator_once(schema_dir):
+    with patch("niem_api.clients.cmf_client.run_cmf_command", return_value=xval_result()) as run:
+        outcomes = _validate_xml_batch(DOCUMENTS, schema_dir)
+
+    assert outcomes == [None, None]
+    cmd = run.call_args.args[0]
+    assert cmd.count("--schema") == 1
+    assert cmd.count("--file") == 2
+
+
+def test_errors_are_mapped_back_to_their_file(schema_dir):
+    def xval(cmd, working_dir):
+        return xval_result(f"[error] {validated_files(cmd)[1]}:3:7: cvc-complex-type.2.4.a: Invalid content")
+
+    with patch("niem_api.clients.cmf_client.run_cmf_command", side_effect=xval) as run:
+        outcomes = _validate_xml_batch(DOCUMENTS, schema_dir)
+
+    assert run.call_count == 1
+    assert outcomes[0] is None
+    assert outcomes[1].status_code == 400
+    errors = outcomes[1].detail["validation_result"]["errors"]
+    assert errors[0]["file"] == "b.xml"
+    assert errors[0]["line"] == 3
+
+
+def test_unattributable_output_falls_back_to_per_file_validation(schema_dir):
+    results = [xval_result("[error] schema could not be assembled"), xval_result(), xval_result()]
+
+    with patch("niem_api.clients.cmf_client.run_cmf_command", side_effect=results) as run:
+        outcomes = _validate_xml_batch(DOCUMENTS, schema_dir)
+
+    assert run.call_count == 3
+    assert outcomes == [None, None]
+
+
+def test_concurrent_batches_use_distinct_file_names(schema_dir):
+    with patch("niem_api.clients.cmf_client.run_cmf_command", return_value=xval_result()) as run:
+        _validate_xml_batch(DOCUMENTS, schema_dir)
+        _validate_xml_batch(DOCUMENTS, schema_dir)
+
+    first, second = (validated_files(call.args[0]) for call in run.call_args_list)
+    assert not set(first) & set(second)
+
+
+def test_single_file_is_validated_under_a_unique_name(schema_dir):
+    def xval(cmd, working_dir):
+        (name,) = validated_files(cmd)
+        assert name != "a.xml"
+        return xval_result(f"[error] {name}:3:7: cvc-complex-type.2.4.a: Invalid content")
+
+    with (
+        patch("niem_api.clients.cmf_client.run_cmf_command", side_effect=xval),
+        pytest.raises(HTTPException) as exc_info,
+    ):
+        _validate_xml_content("<a/>", schema_dir, "a.xml")
+
+    assert exc_info.value.detail["validation_result"]["errors"][0]["file"] == "a.xml"
+    assert [path.name for path in Path(schema_dir).iterdir()] == ["model.xsd"]
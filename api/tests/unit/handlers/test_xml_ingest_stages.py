@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Tests for the XML ingest stages on uploads at or above the streaming threshold."""
+
+from io import BytesIO
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+from fastapi import UploadFile
+
+from niem_api.core.config import batch_config
+from niem_api.handlers import ingest
+from niem_api.services.domain import xml_to_graph
+
+EXAMPLES = Path(__file__).parent.parent.parent / "fixtures" / "crashdriver" / "examples"
+
+MAPPING = {"objects": [], "associations": [], "references": [], "namespaces": {}}
+
+
+@pytest.fixture
+def streamed(monkeypatch):
+    """Stream every upload in batches of a few nodes, committing each batch."""
+    monkeypatch.setattr(batch_config, "INGEST_STREAMING_THRESHOLD_MB", 0)
+    monkeypatch.setattr(batch_config, "INGEST_STREAMING_BATCH_NODES", 3)
+    monkeypatch.setattr(batch_config, "INGEST_COMMIT_EVERY", 0)
+    monkeypatch.setattr(batch_config, "INGEST_AUTO_INDEXES", False)
+
+
+def upload(name):
+    return UploadFile(filename=name, file=BytesIO((EXAMPLES / name).read_bytes()))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("write_mode", ["statements", "batched"])
+async def test_large_file_is_written_as_records_are_converted(streamed, monkeypatch, write_mode):
+    monkeypatch.setattr(batch_config, "INGEST_WRITE_MODE", write_mode)
+    events = []
+    iter_batches = xml_to_graph.iter_xml_cypher_batches
+
+    def recording_iter(*args, **kwargs):
+        for batch in iter_batches(*args, **kwargs):
+            events.append("batch")
+            yield batch
+
+    monkeypatch.setattr(xml_to_graph, "iter_xml_cypher_batches", recording_iter)
+    monkeypatch.setattr(ingest, "_commit_with_retry", lambda *args: events.append("commit"))
+    archived = []
+
+    async def store(s3, content, filename, cypher_file, file_type):
+        cypher_file.seek(0)
+        archived.append((content, cypher_file.read().decode()))
+
+    file = upload("msg1.xml")
+    stages = ingest._xml_ingest_stages(MAPPING, MagicMock(), Mock(), "/schemas", "up1", "schema1")
+    with (
+        patch.object(ingest, "_validate_xml_content") as validate,
+        patch.object(ingest, "_store_processed_files", side_effect=store),
+        patch.object(UploadFile, "read", AsyncMock()) as read,
+    ):
+        results, _, _ = await ingest._run_ingest_pipeline([file], stages, "xml")
+
+    assert results[0]["status"] == "success"
+    # The first batch is committed before the second is converted
+    assert events.index("commit") < events.index("batch", 1)
+    # The upload is validated and archived from its file, never read into memory
+    read.assert_not_called()
+    assert validate.call_args.args[0] is file.file
+    assert archived[0][0] is file.file
+    assert "MERGE" in archived[0][1]
+
+
+@pytest.mark.asyncio
+async def test_prevalidation_leaves_large_files_to_their_own_stage(streamed):
+    file = upload("msg1.xml")
+
+    with patch.object(ingest, "_validate_xml_batch") as validate_batch:
+        outcomes = await ingest._prevalidate_xml_files([file], "/schemas")
+
+    assert outcomes == {}
+    validate_batch.assert_not_called()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""Unit tests for parameterized UNWIND write batches."""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from niem_api.handlers.ingest import _execute_cypher_statements
+from niem_api.services.domain.graph.batch_writer import (
+    CypherStatement,
+    WriteBatch,
+    build_node_batches,
+    build_relationship_batches,
+    render_batches_as_cypher,
+)
+from niem_api.services.domain.xml_to_graph.converter import generate_for_xml_content
+
+
+@pytest.fixture
+def msg2_xml():
+    """Load CrashDriver msg2.xml (multiple persons and associations)."""
+    fixtures_dir = Path(__file__).parent.parent.parent.parent.parent / "fixtures"
+    return (fixtures_dir / "crashdriver" / "examples" / "msg2.xml").read_text()
+
+
+@pytest.fixture
+def minimal_mapping():
+    """Minimal mapping for dynamic mode."""
+    return {"objects": [], "associations": [], "references": [], "namespaces": {}}
+
+
+class TestBatchBuilders:
+    """Test grouping rows into UNWIND batches."""
+
+    def test_node_batches_grouped_by_label(self):
+        """One batch per label, each row carrying id and props."""
+        batches = build_node_batches(
+            {
+                "Person": [{"id": "p1", "props": {"a": "1"}}, {"id": "p2", "props": {}}],
+                "Vehicle": [{"id": "v1", "props": {}}],
+            }
+        )
+
+        assert len(batches) == 2
+        assert "UNWIND $rows AS row" in batches[0].query
+        assert "MERGE (n:`Person` {id: row.id})" in batches[0].query
+        assert len(batches[0].rows) == 2
+
+    def test_relationship_batches_use_isolation_params(self):
+        """Endpoints are matched on id plus upload/source params, not literals."""
+        batches = build_relationship_batches(
+            {("Person", None, "REL"): [{"from_id": "a", "to_id": "b", "props": {}}]}, "up1", "f.xml"
+        )
+
+        query = batches[0].query
+        assert "(a:`Person` {id: row.from_id, _upload_id: $_upload_id, _source_file: $_source_file})" in query
+        assert "(b {id: row.to_id" in query  # unresolved target label matches without label
+        assert query.endswith("ON CREATE SET r._upload_id = $_upload_id, r._source_file = $_source_file")
+        assert "up1" not in query
+        assert batches[0].params == {"_upload_id": "up1", "_source_file": "f.xml"}
+
+    def test_chunks_split_rows(self):
+        """Rows are split into chunks of the requested size."""
+        batch = WriteBatch(query="UNWIND $rows AS row RETURN row", rows=[{"id": i} for i in range(5)], params={"x": 1})
+
+        chunks = list(batch.chunks(2))
+
+        assert [len(params["rows"]) for _, params in chunks] == [2, 2, 1]
+        assert all(params["x"] == 1 for _, params in chunks)
+
+    def test_render_escapes_strings(self):
+        """Archived script renders params as Cypher literals."""
+        batch = WriteBatch(query="UNWIND $rows AS row RETURN row", rows=[{"id": "x", "props": {"name": "O'Brien"}}])
+
+        script = render_batches_as_cypher([batch], header="test")
+
+        assert script.startswith("// test")
+        assert ':param rows => [{id: "x", props: {name: "O\'Brien"}}];' in script
+
+
+class TestXmlConverterBatchedMode:
+    """Test the converter's batched write mode."""
+
+    def test_batched_mode_matches_statement_counts(self, msg2_xml, minimal_mapping):
+        """Batched mode writes the same nodes and relationships as literal statements."""
+        batches, nodes, contains, edges = generate_for_xml_content(
+            msg2_xml, minimal_mapping, "msg2.xml", upload_id="up1", write_mode="batched"
+        )
+
+        node_rows = sum(len(b.rows) for b in batches if b.kind == "node")
+        rel_rows = sum(len(b.rows) for b in batches if b.kind == "relationship")
+        assert node_rows == len(nodes)
+        assert rel_rows == len(contains) + len(edges)
+        # Far fewer queries than elements
+        assert len(batches) < len(nodes) + len(contains) + len(edges)
+        # Nodes are written before relationships
+        kinds = [b.kind for b in batches]
+        assert kinds == sorted(kinds)
+
+    def test_batched_node_props_include_isolation(self, msg2_xml, minimal_mapping):
+        """Node rows carry the same provenance properties as literal statements."""
+        batches, _, _, _ = generate_for_xml_content(
+            msg2_xml, minimal_mapping, "msg2.xml", upload_id="up1", schema_id="s1", write_mode="batched"
+        )
+
+        row = batches[0].rows[0]
+        assert row["props"]["_upload_id"] == "up1"
+        assert row["props"]["_schema_id"] == "s1"
+        assert row["props"]["_source_file"] == "msg2.xml"
+        assert "qname" in row["props"] and "ingestDate" in row["props"]
+
+
+def test_execute_cypher_statements_runs_batches_in_one_transaction():
+    """WriteBatch lists are executed as parameterized queries in a single transaction."""
+    neo4j_client = MagicMock()
+    session = neo4j_client.driver.session.return_value.__enter__.return_value
+    tx = session.begin_transaction.return_value.__enter__.return_value
+    batches = [
+        WriteBatch(query="Q1", rows=[{"id": 1}, {"id": 2}, {"id": 3}]),
+        WriteBatch(query="Q2", rows=[{"id": 4}], params={"_upload_id": "u"}, kind="relationship"),
+    ]
+
+    executed = _execute_cypher_statements(batches, neo4j_client)
+
+    assert executed == 2
+    tx.run.assert_any_call("Q2", {"_upload_id": "u", "rows": [{"id": 4}]})
+    tx.commit.assert_called_once()
+
+
+class TestStructuredStatements:
+    """Literal statements handed to the executor as objects."""
+
+    def test_statement_list_matches_script_text(self, msg2_xml, minimal_mapping):
+        with patch("time.time", return_value=1.0):
+            text, *_ = generate_for_xml_content(msg2_xml, minimal_mapping, "msg2.xml", "up1", "s1")
+            statements, *_ = generate_for_xml_content(
+                msg2_xml, minimal_mapping, "msg2.xml", "up1", "s1", write_mode="statement_list"
+            )
+
+        assert all(isinstance(statement, CypherStatement) for statement in statements)
+        rendered = [f"{statement.query};" for statement in statements]
+        strip = lambda lines: [line for line in lines if "ingestDate" not in line]  # noqa: E731
+        assert strip("\n".join(rendered).splitlines()) == strip(text.splitlines()[1:])
+
+    def test_semicolon_in_value_is_not_split(self):
+        """Statements are executed as-is, so a ';' inside a value stays intact."""
+        neo4j_client = MagicMock()
+        session = neo4j_client.driver.session.return_value.__enter__.return_value
+        tx = session.begin_transaction.return_value.__enter__.return_value
+        statements = [CypherStatement("MERGE (n:`A` {id:'a1'})\n  ON CREATE SET n.note='x; y // z'")]
+
+        executed = _execute_cypher_statements(statements, neo4j_client)
+
+        assert executed == 1
+        tx.run.assert_called_once_with(statements[0].query, {})
+
+    def test_render_puts_plain_statements_on_own_lines(self):
+        script = render_batches_as_cypher(
+            [CypherStatement("MERGE (a)"), CypherStatement("MERGE (b)")], header="Generated for t.xml"
+        )
+
+        assert script == "// Generated for t.xml\nMERGE (a);\nMERGE (b);"
@@ -0,0 +1,83 @@
+"""
+Unit tests for ingest match-key index provisioning.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from niem_api.services.domain.graph.schema_manager import (
+    clear_indexed_labels,
+    ensure_match_key_indexes,
+    mapping_labels,
+)
+
+MAPPING = {
+    "objects": [{"qname": "nc:Person", "label": "nc_Person"}],
+    "associations": [
+        {
+            "qname": "j:PersonChargeAssociation",
+            "rel_type": "J_PERSONCHARGEASSOCIATION",
+            "endpoints": [{"maps_to_label": "nc_Person"}, {"maps_to_label": "j_Charge"}],
+        }
+    ],
+    "references": [{"target_label": "nc_Location", "rel_type": "NC_LOCATION"}],
+}
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_indexed_labels()
+    yield
+    clear_indexed_labels()
+
+
+def created_labels(neo4j_client) -> list[str]:
+    return [call.args[0] for call in neo4j_client.query.call_args_list if call.args[0].startswith("CREATE INDEX")]
+
+
+def test_mapping_labels_cover_objects_associations_and_references():
+    assert mapping_labels(MAPPING) == {"nc_Person", "j_PersonChargeAssociation", "j_Charge", "nc_Location"}
+
+
+def test_creates_index_only_for_labels_without_one():
+    neo4j_client = MagicMock()
+    neo4j_client.query.return_value = [
+        {"entityType": "NODE", "labelsOrTypes": ["nc_Person"], "properties": ["id"]},
+        {"entityType": "NODE", "labelsOrTypes": None, "properties": None},
+    ]
+
+    created = ensure_match_key_indexes(neo4j_client, ["nc_Person", "j_Charge"])
+
+    assert created == ["j_Charge"]
+    assert created_labels(neo4j_client) == ["CREATE INDEX IF NOT EXISTS FOR (n:`j_Charge`) ON (n.`id`)"]
+
+
+def test_known_labels_skip_the_database():
+    neo4j_client = MagicMock()
+    neo4j_client.query.return_value = []
+    ensure_match_key_indexes(neo4j_client, ["j_Charge"])
+    neo4j_client.query.reset_mock()
+
+    assert ensure_match_key_indexes(neo4j_client, ["j_Charge"]) == []
+    neo4j_client.query.assert_not_called()
+
+
+def test_failed_index_creation_is_retried():
+    from neo4j.exceptions import ClientError
+
+    def query(cypher):
+        if cypher.startswith("CREATE INDEX") and "j_Charge" in cypher and not retried:
+            raise ClientError("index creation failed")
+        return []
+
+    retried = False
+    neo4j_client = MagicMock()
+    neo4j_client.query.side_effect = query
+
+    assert ensure_match_key_indexes(neo4j_client, ["nc_Person", "j_Charge"]) == ["nc_Person"]
+    retried = True
+    neo4j_client.query.reset_mock()
+
+    assert ensure_match_key_indexes(neo4j_client, ["nc_Person", "j_Charge"]) == ["j_Charge"]
+    assert created_labels(neo4j_client) == ["CREATE INDEX IF NOT EXISTS FOR (n:`j_Charge`) ON (n.`id`)"]
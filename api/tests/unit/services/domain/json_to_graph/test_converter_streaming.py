@@ -0,0 +1,126 @@
+"""
+Unit tests for the streaming NIEM JSON-LD converter.
+
+Streaming conversion must produce the same nodes, containment edges and
+reference edges as the in-memory converter, however the batches are cut.
+"""
+
+import io
+import json
+from unittest.mock import patch
+
+import pytest
+
+from niem_api.services.domain.json_to_graph.converter import generate_for_json_content
+from niem_api.services.domain.json_to_graph.streaming import iter_json_cypher_batches, iter_jsonld_document
+
+CONTEXT = {"nc": "http://release.niem.gov/niem/niem-core/5.0/", "j": "http://release.niem.gov/niem/domains/jxdm/7.2/"}
+
+GRAPH = [
+    {"@id": "P01", "@type": "nc:PersonType", "nc:PersonName": {"nc:PersonGivenName": "Peter"}},
+    {"@id": "P02", "@type": "nc:PersonType", "nc:PersonName": {"nc:PersonGivenName": "Wendy"}},
+    {"j:Crash": {"j:CrashDriver": {"@id": "P01"}, "nc:ActivityDate": {"nc:Date": "2024-01-01"}}},
+    {"j:PersonChargeAssociation": {"nc:Person": {"@id": "P02"}, "j:Charge": {"@id": "CH01"}}},
+    {"@id": "CH01", "j:ChargeDescriptionText": "Théft", "nc:Person": {"@id": "P01"}},
+]
+
+
+def _document(context_last=False) -> bytes:
+    members = [("@graph", GRAPH), ("@context", CONTEXT)]
+    if not context_last:
+        members.reverse()
+    return json.dumps(dict(members), ensure_ascii=False).encode("utf-8")
+
+
+def _convert_both(content, batch_nodes):
+    """Run both converters with a fixed file prefix so IDs are comparable."""
+    with patch("time.time", return_value=1.0):
+        _, nodes, contains, edges = generate_for_json_content(content, {}, "doc.json", "upload1", "schema1")
+        batches = list(
+            iter_json_cypher_batches(io.BytesIO(content), {}, "doc.json", "upload1", "schema1", batch_nodes=batch_nodes)
+        )
+    return (nodes, contains, edges), batches
+
+
+class TestStreamingMatchesInMemory:
+    """Streaming conversion produces the same graph as in-memory conversion."""
+
+    @pytest.mark.parametrize("batch_nodes", [1, 3, 10000])
+    @pytest.mark.parametrize("context_last", [False, True])
+    def test_same_graph(self, batch_nodes, context_last):
+        """Nodes, CONTAINS edges and reference edges are identical across batches."""
+        (nodes, contains, edges), batches = _convert_both(_document(context_last), batch_nodes)
+
+        stream_nodes = {}
+        for _, batch_nodes_dict, _, _ in batches:
+            assert not set(stream_nodes) & set(batch_nodes_dict)
+            stream_nodes.update(batch_nodes_dict)
+        assert stream_nodes == nodes
+        assert sorted(c for batch in batches for c in batch[2]) == sorted(contains)
+        assert sorted(repr(e) for batch in batches for e in batch[3]) == sorted(map(repr, edges))
+
+    def test_edges_follow_their_endpoints(self):
+        """An edge is emitted in the batch that hands out its later endpoint, or after it."""
+        _, batches = _convert_both(_document(), batch_nodes=1)
+
+        assert len(batches) > 1
+        batch_of = {node_id: index for index, batch in enumerate(batches) for node_id in batch[1]}
+        for index, batch in enumerate(batches):
+            for from_id, _, to_id, *_ in batch[3]:
+                assert batch_of[from_id] <= index
+                assert batch_of.get(to_id, index) <= index
+        assert any(batch[3] for batch in batches[:-1])
+
+    @pytest.mark.parametrize("batch_nodes", [1, 7, 25])
+    def test_edge_heavy_document_is_batched(self, batch_nodes):
+        """No batch carries more than batch_nodes reference edges, including dangling ones."""
+        persons = [{"@id": f"P{i}", "@type": "nc:PersonType"} for i in range(20)]
+        charges = [
+            {"@id": f"CH{i}", "nc:Person": [{"@id": f"P{k}"} for k in range(20)] + [{"@id": "MISSING"}]}
+            for i in range(5)
+        ]
+        content = json.dumps({"@context": CONTEXT, "@graph": charges + persons}).encode("utf-8")
+
+        (_, _, edges), batches = _convert_both(content, batch_nodes)
+
+        assert len(edges) == 105
+        assert all(len(batch[3]) <= batch_nodes for batch in batches)
+        assert sorted(repr(e) for batch in batches for e in batch[3]) == sorted(map(repr, edges))
+
+    def test_document_without_graph(self):
+        """A single-object document is converted in one batch."""
+        content = json.dumps({"@context": CONTEXT, **GRAPH[2]}).encode("utf-8")
+
+        (nodes, contains, edges), batches = _convert_both(content, batch_nodes=1)
+
+        assert len(batches) == 1
+        assert batches[0][1] == nodes
+        assert batches[0][2] == contains
+
+
+class TestIterJsonldDocument:
+    """The incremental reader yields the same values as json.loads."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+    def test_small_chunks(self, chunk_size):
+        """Values split across reads (including multi-byte characters and numbers) decode intact."""
+        content = b"\xef\xbb\xbf" + json.dumps(
+            {"@context": CONTEXT, "@graph": GRAPH + [{"n": 12345678901234567890123}], "x": [1.5, None]},
+            ensure_ascii=False,
+        ).encode("utf-8")
+
+        members = list(iter_jsonld_document(io.BytesIO(content), chunk_size=chunk_size))
+
+        assert [value for key, value, is_item in members if is_item] == GRAPH + [{"n": 12345678901234567890123}]
+        assert [(key, value) for key, value, is_item in members if not is_item] == [
+            ("@context", CONTEXT),
+            ("x", [1.5, None]),
+        ]
+
+    def test_empty_graph_is_a_member(self):
+        assert list(iter_jsonld_document(io.BytesIO(b'{"@graph": []}'))) == [("@graph", [], False)]
+
+    @pytest.mark.parametrize("content", [b"[1, 2]", b'{"@graph": [1, }', b'{"a": 1'])
+    def test_invalid_json(self, content):
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_jsonld_document(io.BytesIO(content), chunk_size=4))
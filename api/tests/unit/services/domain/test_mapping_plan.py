@@ -0,0 +1,95 @@
+"""
+Unit tests for compiled mapping plans and their cache.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from niem_api.services.domain import mapping_plan
+from niem_api.services.domain.mapping_plan import (
+    MappingPlan,
+    clear_mapping_plan_cache,
+    get_mapping_plan,
+    load_mapping_plan,
+)
+from niem_api.services.domain.xml_to_graph import generate_for_xml_content
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    clear_mapping_plan_cache()
+    yield
+    clear_mapping_plan_cache()
+
+
+@pytest.fixture
+def mapping():
+    return {
+        "objects": [{"qname": "nc:Person", "label": "nc_Person"}],
+        "associations": [{"qname": "j:PersonChargeAssociation", "endpoints": []}],
+        "references": [],
+        "namespaces": {"nc": "urn:nc"},
+        "augmentations": [{"augmentation_element_qname": "j:PersonAugmentation"}],
+        "metadata": {"cmf_element_index": ["nc:Person", "nc:PersonName"]},
+    }
+
+
+def test_from_dict_builds_lookups(mapping):
+    plan = MappingPlan.from_dict(mapping)
+
+    assert set(plan.obj_rules) == {"nc:Person"}
+    assert set(plan.assoc_by_qn) == {"j:PersonChargeAssociation"}
+    assert set(plan.augmentation_index) == {"j:PersonAugmentation"}
+    assert plan.cmf_element_index == frozenset({"nc:Person", "nc:PersonName"})
+
+
+def test_get_mapping_plan_reuses_plan_for_same_dict(mapping):
+    plan = get_mapping_plan(mapping)
+
+    assert get_mapping_plan(mapping) is plan
+    assert get_mapping_plan(plan) is plan
+    assert get_mapping_plan(dict(mapping)) is not plan
+
+
+def test_load_mapping_plan_calls_loader_once_per_version(mapping):
+    loader = Mock(side_effect=[mapping, dict(mapping)])
+
+    first = load_mapping_plan(("schema1", "etag1"), loader)
+    second = load_mapping_plan(("schema1", "etag1"), loader)
+    assert load_mapping_plan(("schema1", "etag2"), loader) is not first
+
+    assert first is second
+    assert loader.call_count == 2
+    # Converters given the returned dict hit the same plan
+    assert get_mapping_plan(first.mapping) is first
+
+
+def test_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(mapping_plan._plan_cache, "max_size", 2)
+
+    load_mapping_plan("a", lambda: {})
+    load_mapping_plan("b", lambda: {})
+    load_mapping_plan("a", lambda: {})  # touch "a"; "b" is now least recent
+
+    assert len(mapping_plan._plan_cache) == 2
+    loader = Mock(return_value={})
+    load_mapping_plan("a", loader)
+    loader.assert_not_called()
+
+
+def test_dynamic_mode_does_not_mutate_cached_plan(mapping):
+    plan = get_mapping_plan(mapping)
+    xml = """<?xml version="1.0"?>
+<ex:Root xmlns:ex="urn:ex" xmlns:structures="https://docs.oasis-open.org/niemopen/ns/model/structures/6.0/">
+  <ex:Person structures:id="P1"><ex:Name>A</ex:Name></ex:Person>
+  <ex:Vehicle structures:id="V1"><ex:Make>B</ex:Make></ex:Vehicle>
+  <ex:PersonVehicleAssociation>
+    <ex:Person structures:ref="P1" xsi:nil="true" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"/>
+    <ex:Vehicle structures:ref="V1" xsi:nil="true" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"/>
+  </ex:PersonVehicleAssociation>
+</ex:Root>"""
+
+    generate_for_xml_content(xml, plan, "assoc.xml", mode="dynamic")
+
+    assert set(plan.assoc_by_qn) == {"j:PersonChargeAssociation"}
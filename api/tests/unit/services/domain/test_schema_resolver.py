@@ -0,0 +1,85 @@
+"""
+Unit tests for schema dependency resolution of uploaded files.
+"""
+
+from niem_api.services.domain.schema.resolver import SchemaValidator
+
+XS = 'xmlns:xs="http://www.w3.org/2001/XMLSchema"'
+
+
+def schema(target_namespace, imports=(), declarations="", body=""):
+    import_elements = "".join(
+        f'<xs:import namespace="{namespace}" schemaLocation="{location}"/>' for namespace, location in imports
+    )
+    return (
+        f'<xs:schema {XS} {declarations} targetNamespace="{target_namespace}">' f"{import_elements}{body}</xs:schema>"
+    )
+
+
+def import_status(result, filename):
+    details = next(detail for detail in result["file_details"] if detail["filename"] == filename)
+    return {imp["schema_location"]: imp["status"] for imp in details["imports"]}
+
+
+def test_imports_resolve_by_path_suffix_basename_and_xsd_folder():
+    uploaded = {
+        "exchange.xsd": schema(
+            "urn:exchange",
+            imports=[
+                ("urn:core", "niem/niem-core.xsd"),
+                ("urn:justice", "../niem/domains/justice.xsd"),
+                ("urn:structures", "utility\\structures.xsd"),
+                ("urn:missing", "niem/domains/missing.xsd"),
+            ],
+        ),
+        "subset/niem/niem-core.xsd": schema("urn:core"),
+        "model.xsd/niem/domains/justice.xsd": schema("urn:justice"),
+        "subset\\utility\\structures.xsd": schema("urn:structures"),
+    }
+
+    result = SchemaValidator().validate_uploaded_schemas(uploaded)
+
+    assert import_status(result, "exchange.xsd") == {
+        "niem/niem-core.xsd": "satisfied",
+        "../niem/domains/justice.xsd": "satisfied",
+        "utility\\structures.xsd": "satisfied",
+        "niem/domains/missing.xsd": "missing",
+    }
+    assert result["missing_imports"] == [
+        {
+            "source_file": "exchange.xsd",
+            "schema_location": "niem/domains/missing.xsd",
+            "expected_filename": "missing.xsd",
+        }
+    ]
+
+
+def test_used_prefixes_checked_against_uploaded_namespaces():
+    uploaded = {
+        "exchange.xsd": schema(
+            "urn:exchange",
+            declarations='xmlns:nc="urn:core" xmlns:j="urn:justice" xmlns:unused="urn:unused"',
+            body='<xs:element name="Case" type="j:CaseType"/><xs:element ref="nc:Person"/>',
+        ),
+        "niem-core.xsd": schema("urn:core"),
+    }
+
+    result = SchemaValidator().validate_uploaded_schemas(uploaded)
+
+    assert result["missing_namespaces"] == [
+        {"source_file": "exchange.xsd", "prefix": "j", "namespace_uri": "urn:justice"}
+    ]
+    assert result["namespace_mappings"] == {"urn:exchange": "exchange.xsd", "urn:core": "niem-core.xsd"}
+
+
+def test_unparsable_schema_falls_back_to_text_scan():
+    uploaded = {
+        "broken.xsd": f'<xs:schema {XS} xmlns:nc="urn:core"><xs:import namespace="urn:core" '
+        'schemaLocation="niem-core.xsd"/><xs:element ref="nc:Person"/>',
+        "niem-core.xsd": schema("urn:core"),
+    }
+
+    result = SchemaValidator().validate_uploaded_schemas(uploaded)
+
+    assert result["valid"] is True
+    assert import_status(result, "broken.xsd") == {"niem-core.xsd": "satisfied"}
@@ -0,0 +1,109 @@
+"""
+Unit tests for the streaming (iterparse) XML converter.
+
+The streaming converter must produce the same nodes, containment edges and
+reference edges as the in-memory converter.
+"""
+
+import io
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from niem_api.services.domain.xml_to_graph.converter import (
+    generate_for_xml_content,
+    generate_for_xml_stream,
+    iter_xml_cypher_batches,
+)
+
+
+@pytest.fixture
+def examples_dir():
+    """Path to CrashDriver example instances."""
+    return Path(__file__).parent.parent.parent.parent.parent / "fixtures" / "crashdriver" / "examples"
+
+
+@pytest.fixture
+def minimal_mapping():
+    """Minimal mapping for dynamic mode."""
+    return {"objects": [], "associations": [], "references": [], "namespaces": {}}
+
+
+def _convert_both(xml_bytes, mapping, mode="dynamic"):
+    """Run both converters with a fixed file prefix so IDs are comparable."""
+    with patch("time.time", return_value=1.0):
+        _, tree_nodes, tree_contains, tree_edges = generate_for_xml_content(
+            xml_bytes.decode("utf-8"), mapping, "msg.xml", "upload1", "schema1", mode=mode
+        )
+        _, stream_nodes, stream_contains, stream_edges = generate_for_xml_stream(
+            io.BytesIO(xml_bytes), mapping, "msg.xml", "upload1", "schema1", mode=mode
+        )
+    return (tree_nodes, tree_contains, tree_edges), (stream_nodes, stream_contains, stream_edges)
+
+
+class TestStreamingMatchesInMemory:
+    """Streaming conversion produces the same graph as in-memory conversion."""
+
+    @pytest.mark.parametrize("example", ["msg1.xml", "msg2.xml", "msg5.xml"])
+    def test_same_graph(self, examples_dir, minimal_mapping, example):
+        """Nodes, CONTAINS edges and reference edges are identical."""
+        tree, stream = _convert_both((examples_dir / example).read_bytes(), minimal_mapping)
+
+        assert stream[0] == tree[0]
+        assert sorted(stream[1]) == sorted(tree[1])
+        assert sorted(map(repr, stream[2])) == sorted(map(repr, tree[2]))
+
+    def test_accepts_file_path(self, examples_dir, minimal_mapping):
+        """A filesystem path can be streamed directly."""
+        _, nodes, contains, _ = generate_for_xml_stream(str(examples_dir / "msg1.xml"), minimal_mapping, "msg1.xml")
+
+        root_ids = [nid for nid, node in nodes.items() if node[2].get("_isRoot")]
+        contained = {child_id for _pid, _pl, child_id, _cl, _rel in contains}
+        assert len(root_ids) == 1
+        assert set(nodes) == contained | set(root_ids)
+
+    def test_root_association_falls_back_to_in_memory(self, minimal_mapping):
+        """A root element that needs its whole subtree is converted in memory."""
+        xml = b"""<?xml version="1.0"?>
+<nc:PersonUnionAssociation xmlns:nc="http://example.com/nc"
+    xmlns:structures="https://docs.oasis-open.org/niemopen/ns/model/structures/6.0/">
+  <nc:Person structures:ref="P1"/>
+  <nc:Person structures:ref="P2"/>
+</nc:PersonUnionAssociation>"""
+
+        tree, stream = _convert_both(xml, minimal_mapping)
+
+        assert stream[0] == tree[0]
+        assert sorted(map(repr, stream[2])) == sorted(map(repr, tree[2]))
+
+
+class TestBatchedStreaming:
+    """iter_xml_cypher_batches hands out the streamed graph in bounded batches."""
+
+    def _batches(self, xml_bytes, mapping):
+        with patch("time.time", return_value=1.0):
+            return list(
+                iter_xml_cypher_batches(io.BytesIO(xml_bytes), mapping, "msg.xml", "upload1", "schema1", batch_nodes=3)
+            )
+
+    @pytest.mark.parametrize("example", ["msg1.xml", "msg2.xml", "msg5.xml"])
+    def test_batches_add_up_to_the_whole_graph(self, examples_dir, minimal_mapping, example):
+        xml_bytes = (examples_dir / example).read_bytes()
+        tree, _ = _convert_both(xml_bytes, minimal_mapping)
+
+        batches = self._batches(xml_bytes, minimal_mapping)
+
+        assert len(batches) > 1
+        assert {nid for _, nodes, _, _ in batches for nid in nodes} == set(tree[0])
+        assert sorted(c for _, _, contains, _ in batches for c in contains) == sorted(tree[1])
+        assert sorted(repr(e) for _, _, _, edges in batches for e in edges) == sorted(map(repr, tree[2]))
+
+    def test_edges_follow_their_endpoint_nodes(self, examples_dir, minimal_mapping):
+        batches = self._batches((examples_dir / "msg1.xml").read_bytes(), minimal_mapping)
+        all_ids = {nid for _, nodes, _, _ in batches for nid in nodes}
+        written = set()
+        for statements, nodes, contains, edges in batches:
+            written.update(nid for statement in statements for nid in nodes if f"{{id:'{nid}'}}" in statement.query)
+            endpoints = {node_id for edge in contains + edges for node_id in (edge[0], edge[2])}
+            assert endpoints & all_ids <= written
@@ -0,0 +1,58 @@
+"""
+Unit tests for the single-pass, iterative XML traversal.
+
+Covers deeply nested documents (no recursion limit), forward structures:ref
+resolution and the namespace qname cache.
+"""
+
+import pytest
+
+from niem_api.services.domain.xml_to_graph.converter import (
+    NamespaceMap,
+    generate_for_xml_content,
+    qname_from_tag,
+)
+
+
+@pytest.fixture
+def minimal_mapping():
+    """Minimal mapping for dynamic mode."""
+    return {"objects": [], "associations": [], "references": [], "namespaces": {}}
+
+
+def test_deeply_nested_document_does_not_hit_recursion_limit(minimal_mapping):
+    """Nesting deeper than Python's recursion limit converts without RecursionError."""
+    depth = 3000
+    xml = '<a:Root xmlns:a="urn:a">' + "<a:Item><a:Value>1</a:Value>" * depth + "</a:Item>" * depth + "</a:Root>"
+
+    _, nodes, contains, _ = generate_for_xml_content(xml, minimal_mapping, "deep.xml")
+
+    assert len(nodes) == depth + 1
+    assert len(contains) == depth
+
+
+def test_forward_reference_resolves_target_label(minimal_mapping):
+    """A structures:ref that appears before its target still resolves the target label."""
+    xml = """<?xml version="1.0"?>
+<ex:Root xmlns:ex="urn:ex" xmlns:structures="https://docs.oasis-open.org/niemopen/ns/model/structures/6.0/">
+  <ex:Pointer structures:ref="T1"><ex:Note>see target</ex:Note></ex:Pointer>
+  <ex:Target structures:id="T1"><ex:Name>target</ex:Name></ex:Target>
+</ex:Root>"""
+
+    _, nodes, _, edges = generate_for_xml_content(xml, minimal_mapping, "fwd.xml")
+
+    refers = [e for e in edges if e[4] == "REFERS_TO"]
+    assert len(refers) == 1
+    assert refers[0][3] == "ex_Target"
+    assert not any(node[2].get("_unresolved") for node in nodes.values())
+
+
+def test_namespace_map_cache_invalidated_on_redeclaration():
+    """Cached qnames are dropped when a prefix is (re)declared."""
+    ns_map = NamespaceMap({"a": "urn:one"})
+    assert qname_from_tag("{urn:two}Thing", ns_map) == "ns:Thing"
+
+    ns_map["b"] = "urn:two"
+
+    assert qname_from_tag("{urn:two}Thing", ns_map) == "b:Thing"
+    assert qname_from_tag("{urn:one}Thing", ns_map) == "a:Thing"
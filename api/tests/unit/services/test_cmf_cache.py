@@ -0,0 +1,89 @@
+"""
+Unit tests for the CMF conversion cache.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+from minio.error import S3Error
+
+from niem_api.handlers.schema import _convert_to_cmf
+from niem_api.services.cmf_cache import get_cached_conversion, put_conversion, resolved_schema_set_hash
+
+
+def memory_minio():
+    """MinIO mock keeping objects in a dict."""
+    stored = {}
+    s3 = Mock()
+    s3.put_object.side_effect = lambda bucket, name, data, length, content_type: stored.update({name: data.read()})
+
+    def get_object(bucket, name):
+        if name not in stored:
+            raise S3Error(Mock(), "NoSuchKey", "", "", "", "")
+        return Mock(read=Mock(return_value=stored[name]))
+
+    s3.get_object.side_effect = get_object
+    return s3
+
+
+def write_set(root, files):
+    for rel_path, content in files.items():
+        (root / rel_path).parent.mkdir(parents=True, exist_ok=True)
+        (root / rel_path).write_text(content)
+    return root
+
+
+def test_hash_covers_paths_and_contents(tmp_path):
+    files = {"main.xsd": "<main/>", "niem/niem-core.xsd": "<core/>"}
+    first = write_set(tmp_path / "a", files)
+    same = write_set(tmp_path / "b", files)
+    changed = write_set(tmp_path / "c", {**files, "niem/niem-core.xsd": "<core v2/>"})
+    moved = write_set(tmp_path / "d", {"main.xsd": "<main/>", "niem/core.xsd": "<core/>"})
+
+    digest = resolved_schema_set_hash(first, "main.xsd")
+
+    assert resolved_schema_set_hash(same, "main.xsd") == digest
+    assert resolved_schema_set_hash(changed, "main.xsd") != digest
+    assert resolved_schema_set_hash(moved, "main.xsd") != digest
+    assert resolved_schema_set_hash(first, "niem/niem-core.xsd") != digest
+
+
+@pytest.mark.asyncio
+async def test_cache_round_trip():
+    s3 = memory_minio()
+
+    assert await get_cached_conversion(s3, "abc") is None
+    await put_conversion(s3, "abc", "<cmf/>", {"type": "object"})
+
+    assert await get_cached_conversion(s3, "abc") == ("<cmf/>", {"type": "object"})
+
+
+@pytest.mark.asyncio
+async def test_reupload_skips_both_conversions():
+    s3 = memory_minio()
+    files = {"main.xsd": b"<xs:schema/>", "niem-core.xsd": b"<xs:schema/>"}
+    cmf = Mock(return_value={"status": "success", "cmf_content": "<cmf/>", "metadata": {}})
+    jsonschema = Mock(return_value={"status": "success", "jsonschema": {"type": "object"}, "metadata": {}})
+
+    async def upload(schema_files):
+        with (
+            patch("niem_api.handlers.schema.is_cmf_available", return_value=True),
+            patch(
+                "niem_api.handlers.schema._validate_schema_dependencies",
+                side_effect=lambda temp_path, *_: {"can_convert": True, "summary": "ok", "temp_path": temp_path},
+            ),
+            patch("niem_api.handlers.schema.convert_xsd_to_cmf", cmf),
+            patch("niem_api.handlers.schema.convert_cmf_to_jsonschema", jsonschema),
+        ):
+            primary = SimpleNamespace(filename="main.xsd")
+            return await _convert_to_cmf(schema_files, {}, primary, schema_files["main.xsd"], s3)
+
+    await upload(files)
+    cmf_result, json_result = await upload(dict(files))
+    await upload({**files, "niem-core.xsd": b"<xs:schema version='2'/>"})
+
+    assert cmf_result["cmf_content"] == "<cmf/>"
+    assert cmf_result["metadata"]["cache_hit"] is True
+    assert json_result == {"status": "success", "jsonschema": {"type": "object"}, "metadata": json_result["metadata"]}
+    assert cmf.call_count == jsonschema.call_count == 2
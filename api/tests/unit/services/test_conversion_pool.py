@@ -0,0 +1,99 @@
+"""
+Unit tests for the ingest conversion pool.
+"""
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from niem_api.core.config import batch_config
+from niem_api.handlers.ingest import _convert_xml_in_worker
+from niem_api.services import conversion_pool
+from niem_api.services.conversion_pool import (
+    MappingNotLoadedError,
+    pack_mapping,
+    run_conversion,
+    shutdown_conversion_pool,
+    unpack_mapping,
+)
+
+SAMPLE_XML = """<?xml version="1.0"?>
+<ex:Root xmlns:ex="urn:ex">
+  <ex:Person><ex:Name>A</ex:Name></ex:Person>
+</ex:Root>"""
+
+MAPPING = {"objects": [], "associations": [], "references": [], "namespaces": {}}
+
+
+@pytest.fixture
+def workers(monkeypatch):
+    """Set the configured worker count and tear the pool down afterwards."""
+
+    def set_workers(count: int):
+        monkeypatch.setattr(batch_config, "INGEST_CONVERSION_WORKERS", count)
+
+    yield set_workers
+    shutdown_conversion_pool()
+
+
+def test_unpack_mapping_returns_same_object_for_same_payload():
+    payload = pack_mapping(MAPPING)
+
+    first = unpack_mapping(payload)
+
+    assert first == MAPPING
+    assert unpack_mapping(pack_mapping(dict(MAPPING))) is first
+
+
+def test_key_only_payload_needs_a_loaded_mapping(monkeypatch):
+    monkeypatch.setattr(conversion_pool, "_worker_mappings", OrderedDict())
+    payload = pack_mapping(MAPPING)
+    key_only = conversion_pool.MappingPayload(payload.key, None)
+
+    with pytest.raises(MappingNotLoadedError):
+        unpack_mapping(key_only)
+
+    unpack_mapping(payload)
+    assert unpack_mapping(key_only) == MAPPING
+
+
+@pytest.mark.asyncio
+async def test_tasks_carry_the_mapping_only_until_the_worker_has_it(monkeypatch):
+    monkeypatch.setattr(conversion_pool, "_worker_mappings", OrderedDict())
+    executor = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(conversion_pool, "get_conversion_pool", lambda: executor)
+    sent_data = []
+
+    def convert(payload):
+        sent_data.append(payload.data is not None)
+        return unpack_mapping(payload)
+
+    payload = pack_mapping(MAPPING)
+    try:
+        assert await run_conversion(convert, payload) == MAPPING
+        assert await run_conversion(convert, payload) == MAPPING
+    finally:
+        executor.shutdown()
+
+    # Key only, resubmitted with the mapping once, then key only again
+    assert sent_data == [False, True, False]
+
+
+def test_zero_workers_runs_in_thread(workers):
+    workers(0)
+
+    assert conversion_pool.get_conversion_pool() is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("count", [0, 1])
+async def test_run_conversion_converts_xml(workers, count):
+    workers(count)
+
+    cypher, stats = await run_conversion(
+        _convert_xml_in_worker, SAMPLE_XML, pack_mapping(MAPPING), "a.xml", "u1", "s1", "dynamic", "statements"
+    )
+
+    assert "MERGE" in cypher
+    assert stats["nodes_created"] == 2
@@ -0,0 +1,157 @@
+"""
+Unit tests for background ingest jobs.
+"""
+
+import asyncio
+import io
+import json
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException, UploadFile
+
+from niem_api.core.config import batch_config
+from niem_api.handlers.ingest import handle_get_ingest_job, handle_ingest_job_events, handle_submit_ingest_job
+from niem_api.services import ingest_jobs
+from niem_api.services.ingest_pipeline import PipelineStage, run_pipeline
+
+
+@pytest.fixture(autouse=True)
+def fresh_jobs():
+    ingest_jobs.clear_ingest_jobs()
+    yield
+    ingest_jobs.clear_ingest_jobs()
+
+
+def pipeline_runner(filenames, release: asyncio.Event | None = None, fail_file: str | None = None):
+    """Runner pushing the files through two stages, like the ingest handlers do."""
+
+    async def run(progress):
+        async def convert(job):
+            if release is not None:
+                await release.wait()
+            if job["name"] == fail_file:
+                job["result"] = {"filename": job["name"], "status": "failed"}
+
+        async def write(job):
+            job["result"] = {"filename": job["name"], "status": "success"}
+
+        jobs = [{"name": name, "index": index} for index, name in enumerate(filenames)]
+        await run_pipeline(jobs, [PipelineStage("convert", convert), PipelineStage("write", write)], progress)
+        return {"schema_id": "s1", "results": [job["result"] for job in jobs]}
+
+    return run
+
+
+async def wait_finished(job):
+    while not job.finished:
+        await job.wait_for_change(job.version, 1.0)
+
+
+@pytest.mark.asyncio
+async def test_job_reports_file_progress_and_result():
+    release = asyncio.Event()
+    filenames = ["a.xml", "b.xml"]
+    job = ingest_jobs.submit_ingest_job("xml", filenames, pipeline_runner(filenames, release, fail_file="b.xml"))
+    assert job.status == "queued"
+
+    await asyncio.sleep(0.01)
+    running = job.snapshot()
+    assert running["status"] == "running"
+    assert running["files"][0]["stage"] == "convert"
+
+    release.set()
+    await wait_finished(job)
+
+    snapshot = ingest_jobs.get_ingest_job(job.job_id).snapshot()
+    assert snapshot["status"] == "completed"
+    assert snapshot["schema_id"] == "s1"
+    assert snapshot["file_counts"] == {"success": 1, "failed": 1}
+    assert set(snapshot["files"][0]["timings"]) == {"convert", "write"}
+    assert snapshot["result"]["results"][1]["status"] == "failed"
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_marks_unstarted_files_skipped():
+    async def run(progress):
+        raise HTTPException(status_code=404, detail="Schema not found")
+
+    job = ingest_jobs.submit_ingest_job("json", ["a.json"], run)
+    await wait_finished(job)
+
+    snapshot = job.snapshot()
+    assert snapshot["status"] == "failed"
+    assert snapshot["error"] == {"status_code": 404, "detail": "Schema not found"}
+    assert snapshot["files"][0]["status"] == "skipped"
+
+
+@pytest.mark.asyncio
+async def test_jobs_beyond_worker_limit_wait(monkeypatch):
+    monkeypatch.setattr(batch_config, "INGEST_JOB_WORKERS", 1)
+    release = asyncio.Event()
+    first = ingest_jobs.submit_ingest_job("xml", ["a.xml"], pipeline_runner(["a.xml"], release))
+    second = ingest_jobs.submit_ingest_job("xml", ["b.xml"], pipeline_runner(["b.xml"]))
+
+    await asyncio.sleep(0.01)
+    assert (first.status, second.status) == ("running", "queued")
+
+    release.set()
+    await wait_finished(second)
+    assert first.status == second.status == "completed"
+
+
+def test_oldest_finished_jobs_are_dropped():
+    registry = ingest_jobs._JobRegistry(max_retained=1)
+    jobs = [ingest_jobs.IngestJob(f"j{i}", "xml", []) for i in range(3)]
+    for job in jobs[:2]:
+        registry.add(job)
+        job.finish("completed", result={"results": []})
+    registry.add(jobs[2])
+
+    assert [job.job_id for job in registry.all()] == ["j1", "j2"]
+
+
+@pytest.mark.asyncio
+async def test_event_stream_ends_with_done():
+    release = asyncio.Event()
+    job = ingest_jobs.submit_ingest_job("xml", ["a.xml"], pipeline_runner(["a.xml"], release))
+    events = handle_ingest_job_events(job.job_id, keepalive_seconds=0.01)
+
+    chunks = [await events.__anext__(), await events.__anext__()]
+    release.set()
+    chunks += [chunk async for chunk in events]
+
+    assert chunks[0].startswith("event: progress\n")
+    assert chunks[1] == ": keep-alive\n\n" or chunks[1].startswith("event: progress\n")
+    done = chunks[-1]
+    assert done.startswith("event: done\n")
+    payload = json.loads(done.split("data: ", 1)[1])
+    assert payload["status"] == "completed"
+    assert payload["result"]["results"][0]["status"] == "success"
+
+
+def test_unknown_job_is_404():
+    with pytest.raises(HTTPException) as exc_info:
+        handle_get_ingest_job("missing")
+    assert exc_info.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_submitted_uploads_outlive_the_request():
+    received = {}
+
+    async def fake_ingest(files, s3, schema_id=None, progress=None):
+        received.update({file.filename: await file.read() for file in files})
+        return {"schema_id": schema_id, "results": []}
+
+    upload = UploadFile(file=io.BytesIO(b"<a/>"), filename="a.xml")
+    with patch("niem_api.handlers.ingest.handle_xml_ingest", fake_ingest):
+        response = await handle_submit_ingest_job([upload], s3=None, schema_id="s1", file_type="xml")
+        # The request's own file is closed once the response has been sent
+        await upload.close()
+        job = ingest_jobs.get_ingest_job(response["job_id"])
+        await wait_finished(job)
+
+    assert response["status_url"] == f"/api/ingest/jobs/{job.job_id}"
+    assert job.status == "completed"
+    assert received == {"a.xml": b"<a/>"}
@@ -0,0 +1,81 @@
+"""
+Unit tests for the staged batch ingest pipeline.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from niem_api.services.ingest_pipeline import PipelineStage, run_pipeline
+
+
+def sleeping_stage(name: str, seconds: float, concurrency: int = 1, log: list | None = None) -> PipelineStage:
+    async def run(job):
+        await asyncio.sleep(seconds)
+        if log is not None:
+            log.append((name, job["id"]))
+
+    return PipelineStage(name, run, concurrency)
+
+
+@pytest.mark.asyncio
+async def test_stages_overlap_across_files():
+    """Throughput follows the slowest stage, not the sum of the stages."""
+    jobs = [{"id": i} for i in range(6)]
+    stages = [sleeping_stage("a", 0.05), sleeping_stage("b", 0.05), sleeping_stage("c", 0.05)]
+
+    started = time.perf_counter()
+    summary = await run_pipeline(jobs, stages)
+    elapsed = time.perf_counter() - started
+
+    # Sequential would take 6 * 3 * 0.05 = 0.9s; pipelined is about (6 + 2) * 0.05
+    assert elapsed < 0.7
+    assert summary["b"]["files"] == 6
+    assert all(set(job["timings"]) == {"a", "b", "c"} for job in jobs)
+
+
+@pytest.mark.asyncio
+async def test_finished_and_failed_jobs_skip_later_stages():
+    log = []
+
+    async def check(job):
+        if job["id"] == 1:
+            raise ValueError("bad file")
+        if job["id"] == 2:
+            job["result"] = {"status": "failed"}
+
+    jobs = [{"id": i} for i in range(3)]
+    await run_pipeline(jobs, [PipelineStage("check", check), sleeping_stage("write", 0, log=log)])
+
+    assert isinstance(jobs[1]["error"], ValueError)
+    assert log == [("write", 0)]
+
+
+@pytest.mark.asyncio
+async def test_stage_concurrency_limit():
+    active = 0
+    peak = 0
+
+    async def run(job):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+
+    await run_pipeline([{"id": i} for i in range(8)], [PipelineStage("convert", run, concurrency=2)])
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_progress_callback_sees_stage_entries_and_completion():
+    events = []
+    jobs = [{"id": i} for i in range(2)]
+    stages = [sleeping_stage("a", 0.01), sleeping_stage("b", 0.01)]
+
+    await run_pipeline(jobs, stages, progress=lambda job, stage: events.append((job["id"], stage)))
+
+    for job_id in range(2):
+        assert [stage for jid, stage in events if jid == job_id] == ["a", "b", None]
@@ -0,0 +1,73 @@
+"""
+Unit tests for the JSON Schema validator cache.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from niem_api.core.config import batch_config
+from niem_api.handlers.ingest import _download_json_schema_from_s3
+from niem_api.services import json_schema_validator
+from niem_api.services.json_schema_validator import get_json_schema_validator, load_json_schema_validator
+
+SCHEMA = {
+    "type": "object",
+    "properties": {"nc:PersonAgeMeasure": {"type": "integer"}},
+    "required": ["nc:PersonName"],
+}
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    json_schema_validator.clear_json_schema_cache()
+    yield
+    json_schema_validator.clear_json_schema_cache()
+
+
+def test_loader_runs_once_per_version():
+    loader = MagicMock(side_effect=lambda: dict(SCHEMA))
+
+    first = load_json_schema_validator(("s1", "e1"), loader)
+    second = load_json_schema_validator(("s1", "e1"), loader)
+    reuploaded = load_json_schema_validator(("s1", "e2"), loader)
+
+    assert first is second
+    assert reuploaded is not first
+    assert loader.call_count == 2
+
+
+def test_loaded_schema_dict_reuses_its_validator():
+    validator = load_json_schema_validator(("s1", "e1"), lambda: dict(SCHEMA))
+
+    assert get_json_schema_validator(validator.schema) is validator
+
+
+def test_download_stats_instead_of_refetching():
+    s3 = MagicMock()
+    s3.stat_object.return_value.etag = "e1"
+
+    with (
+        patch("niem_api.handlers.schema.get_schema_metadata", return_value={"primary_filename": "dir/person.xsd"}),
+        patch("niem_api.clients.s3_client.get_json_content", return_value=dict(SCHEMA)) as get_json,
+    ):
+        first = _download_json_schema_from_s3(s3, "s1")
+        second = _download_json_schema_from_s3(s3, "s1")
+
+    assert first is second
+    get_json.assert_called_once_with(s3, "niem-schemas", "s1/person.json")
+
+
+def test_fast_backend_reports_full_errors(monkeypatch):
+    pytest.importorskip("fastjsonschema")
+    monkeypatch.setattr(batch_config, "JSON_VALIDATION_BACKEND", "fastjsonschema")
+    validator = get_json_schema_validator(dict(SCHEMA))
+    assert validator.fast_validate is not None
+
+    with patch.object(validator, "validator", wraps=validator.validator) as slow:
+        assert list(validator.iter_errors({"nc:PersonName": "Ann"})) == []
+        slow.iter_errors.assert_not_called()
+
+        errors = list(validator.iter_errors({"nc:PersonAgeMeasure": "old"}))
+
+    assert sorted(error.validator for error in errors) == ["required", "type"]
@@ -42,3 +42,68 @@ def test_generate_for_json_content_uses_sha1_hash():
     assert cypher is not None
     assert "Person" in cypher
     assert len(nodes) > 0
+
+
+def test_generate_for_json_content_accepts_bytes_and_parsed_document():
+    """Bytes and an already parsed document convert exactly like the JSON string."""
+    mapping_dict = {"objects": [], "associations": [], "references": [], "namespaces": {}}
+    json_data = {
+        "@context": {"nc": "http://example.com/nc"},
+        "@graph": [{"@id": "person1", "@type": "nc:Person", "nc:PersonName": "John Doe"}],
+    }
+    json_str = json.dumps(json_data)
+
+    from_str = generate_for_json_content(json_str, mapping_dict, "test.json", "u1", "s1")
+    from_bytes = generate_for_json_content(json_str.encode("utf-8"), mapping_dict, "test.json", "u1", "s1")
+    from_document = generate_for_json_content(json_data, mapping_dict, "test.json", "u1", "s1")
+
+    # Node IDs carry a per-call file prefix; compare the node data
+    assert list(from_bytes[1].values()) == list(from_str[1].values())
+    assert list(from_document[1].values()) == list(from_str[1].values())
+
+
+@pytest.mark.parametrize("parser", ["orjson", "json"])
+def test_parse_json_backends_accept_the_same_documents(parser, monkeypatch):
+    from niem_api.core.config import batch_config
+    from niem_api.services.domain.json_to_graph import parse_json
+
+    monkeypatch.setattr(batch_config, "JSON_PARSER", parser)
+
+    assert parse_json(b'{"a": [1, 2.5, "x"]}') == {"a": [1, 2.5, "x"]}
+    assert parse_json('{"a": NaN}')["a"] != parse_json('{"a": NaN}')["a"]
+    with pytest.raises(json.JSONDecodeError) as exc_info:
+        parse_json(b'{\n  "a": }')
+    assert exc_info.value.lineno == 2
+
+
+@pytest.mark.parametrize("write_mode", ["statements", "statement_list"])
+def test_nodes_merge_on_identity_key_only(write_mode):
+    """Node MERGEs key on id plus isolation properties; other properties are set on create."""
+    mapping_dict = {"objects": [], "associations": [], "references": [], "namespaces": {}}
+    json_data = {
+        "@context": {"nc": "http://example.com/nc"},
+        "@graph": [{"@id": "person1", "nc:PersonName": {"nc:PersonGivenName": "O'Hara", "nc:Age": 42}}],
+    }
+
+    cypher, nodes, _, _ = generate_for_json_content(
+        json.dumps(json_data), mapping_dict, "test.json", "u1", "s1", write_mode=write_mode
+    )
+
+    node_id = next(nid for nid, node in nodes.items() if node[1] == "nc:PersonName")
+    if write_mode == "statement_list":
+        statement = next(s for s in cypher if s.params.get("id") == node_id)
+        assert statement.query == (
+            "MERGE (n:nc_PersonName {id: $id, _upload_id: $_upload_id, _source_file: $_source_file}) "
+            "ON CREATE SET n += $props"
+        )
+        assert statement.params["_upload_id"] == "u1"
+        assert statement.params["props"]["nc_PersonGivenName"] == "O'Hara"
+        assert statement.params["props"]["nc_Age"] == 42
+        assert "_upload_id" not in statement.params["props"]
+    else:
+        merge = next(line for line in cypher.split("\n") if f"id: '{node_id}'" in line and "MERGE (n:" in line)
+        assert merge.startswith(
+            f"MERGE (n:nc_PersonName {{id: '{node_id}', _upload_id: 'u1', _source_file: 'test.json'}}) ON CREATE SET "
+        )
+        assert "n.nc_PersonGivenName = 'O\\'Hara'" in merge
+        assert "n.nc_Age = 42" in merge
@@ -1,12 +1,17 @@
 #!/usr/bin/env python3
 
-from unittest.mock import MagicMock, Mock, patch
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 from neo4j.exceptions import ClientError
 from neo4j.graph import Node, Relationship
 
-from niem_api.clients.neo4j_client import Neo4jClient
+from niem_api.clients.neo4j_client import AsyncNeo4jClient, Neo4jClient
+from niem_api.core import dependencies
 
 
 class TestNeo4jClient:
@@ -224,3 +229,158 @@ class TestNeo4jClient:
         assert props["bool_prop"] is True
         assert props["list_prop"] == [1, 2, 3]
         assert props["null_prop"] is None
+
+
+class TestSharedNeo4jClient:
+    """Test suite for the process-wide Neo4j client"""
+
+    def test_driver_receives_pool_settings(self):
+        with patch("niem_api.clients.neo4j_client.GraphDatabase.driver") as mock_driver:
+            Neo4jClient("bolt://localhost:7687", "neo4j", "password", max_connection_pool_size=5)
+
+        mock_driver.assert_called_once_with(
+            "bolt://localhost:7687", auth=("neo4j", "password"), max_connection_pool_size=5
+        )
+
+    def test_shared_client_is_reused_and_closed(self, monkeypatch):
+        monkeypatch.setattr(dependencies, "_neo4j_client", None)
+        with patch("niem_api.clients.neo4j_client.GraphDatabase.driver") as mock_driver:
+            first = dependencies.get_neo4j_client()
+
+            assert dependencies.get_neo4j_client() is first
+            assert mock_driver.call_count == 1
+            assert "max_connection_pool_size" in mock_driver.call_args.kwargs
+
+            dependencies.cleanup_connections()
+
+        mock_driver.return_value.close.assert_called_once()
+        assert dependencies._neo4j_client is None
+
+    def test_concurrent_first_calls_build_one_driver(self, monkeypatch):
+        monkeypatch.setattr(dependencies, "_neo4j_client", None)
+        barrier = threading.Barrier(4)
+
+        def slow_driver(*args, **kwargs):
+            time.sleep(0.05)
+            return MagicMock()
+
+        def first_call():
+            barrier.wait()
+            return dependencies.get_neo4j_client()
+
+        with patch("niem_api.clients.neo4j_client.GraphDatabase.driver", side_effect=slow_driver) as mock_driver:
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                clients = list(pool.map(lambda _: first_call(), range(4)))
+
+        assert mock_driver.call_count == 1
+        assert all(client is clients[0] for client in clients)
+        dependencies.cleanup_connections()
+
+    def test_readiness_probe_is_bounded_when_the_pool_is_saturated(self, monkeypatch):
+        """/readyz answers 503 within NEO4J_READINESS_TIMEOUT instead of waiting for a connection."""
+        from fastapi.testclient import TestClient
+
+        from niem_api import main
+        from niem_api.core.config import neo4j_config
+
+        async def never_acquires(*args, **kwargs):
+            await asyncio.sleep(60)
+
+        async_client = Mock()
+        async_client.query = never_acquires
+        monkeypatch.setattr(neo4j_config, "READINESS_TIMEOUT", 0.05)
+        monkeypatch.setattr(main, "get_s3_client", Mock())
+        monkeypatch.setattr(dependencies, "get_async_neo4j_client", lambda: async_client)
+
+        started = time.monotonic()
+        response = TestClient(main.app).get("/readyz")
+
+        assert response.status_code == 503
+        assert time.monotonic() - started < 5
+
+
+class AsyncRecords:
+    """Async-iterable stand-in for an AsyncResult"""
+
+    def __init__(self, records):
+        self.records = records
+
+    def __aiter__(self):
+        self.iterator = iter(self.records)
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self.iterator)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+class TestAsyncNeo4jClient:
+    """Test suite for the asyncio Neo4j client"""
+
+    @pytest.fixture
+    def async_client(self):
+        """Async client with mocked driver and session"""
+        mock_session = MagicMock()
+        mock_session.run = AsyncMock()
+        mock_session_context = MagicMock()
+        mock_session_context.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_session_context.__aexit__ = AsyncMock(return_value=None)
+        mock_driver = MagicMock()
+        mock_driver.session = Mock(return_value=mock_session_context)
+        mock_driver.close = AsyncMock()
+        with patch("niem_api.clients.neo4j_client.AsyncGraphDatabase.driver", return_value=mock_driver):
+            client = AsyncNeo4jClient("bolt://localhost:7687", "neo4j", "password", max_connection_pool_size=5)
+        return client, mock_session
+
+    def test_driver_receives_pool_settings(self):
+        with patch("niem_api.clients.neo4j_client.AsyncGraphDatabase.driver") as mock_driver:
+            AsyncNeo4jClient("bolt://localhost:7687", "neo4j", "password", max_connection_pool_size=5)
+
+        mock_driver.assert_called_once_with(
+            "bolt://localhost:7687", auth=("neo4j", "password"), max_connection_pool_size=5
+        )
+
+    @pytest.mark.asyncio
+    async def test_query(self, async_client):
+        client, mock_session = async_client
+        mock_record = Mock()
+        mock_record.data.return_value = {"count": 3}
+        mock_session.run.return_value = AsyncRecords([mock_record])
+
+        result = await client.query("MATCH (n) RETURN count(n) AS count")
+
+        assert result == [{"count": 3}]
+
+    @pytest.mark.asyncio
+    async def test_query_graph(self, async_client):
+        client, mock_session = async_client
+        mock_node = MagicMock(spec=Node)
+        mock_node.id = 1
+        mock_node.labels = frozenset(["Person"])
+        mock_node.items.return_value = [("id", "P1")]
+        mock_record = MagicMock()
+        mock_record.values.return_value = [mock_node]
+        mock_session.run.return_value = AsyncRecords([mock_record])
+
+        result = await client.query_graph("MATCH (n) RETURN n")
+
+        assert result["nodes"][0]["id"] == "P1"
+        assert result["metadata"]["nodeLabels"] == ["Person"]
+
+    @pytest.mark.asyncio
+    async def test_shared_client_is_reused_and_closed(self, monkeypatch):
+        monkeypatch.setattr(dependencies, "_async_neo4j_client", None)
+        with patch("niem_api.clients.neo4j_client.AsyncGraphDatabase.driver") as mock_driver:
+            mock_driver.return_value.close = AsyncMock()
+            first = dependencies.get_async_neo4j_client()
+
+            assert dependencies.get_async_neo4j_client() is first
+            assert mock_driver.call_count == 1
+            assert "max_connection_pool_size" in mock_driver.call_args.kwargs
+
+            await dependencies.cleanup_async_connections()
+
+        mock_driver.return_value.close.assert_awaited_once()
+        assert dependencies._async_neo4j_client is None
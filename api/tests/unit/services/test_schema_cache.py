@@ -0,0 +1,85 @@
+"""
+Unit tests for the local schema directory cache.
+"""
+
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from niem_api.core.config import batch_config
+from niem_api.services import schema_cache
+from niem_api.services.schema_cache import prepare_schema_dir
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(batch_config, "SCHEMA_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(batch_config, "SCHEMA_CACHE_MAX_MB", 1)
+    return tmp_path / "cache"
+
+
+def minio_with(files: dict[str, tuple[bytes, str]]):
+    """MinIO mock listing {relative_path: (content, etag)} under schema s1."""
+    s3 = MagicMock()
+    s3.list_objects.return_value = [
+        SimpleNamespace(object_name=f"s1/source/{name}", etag=etag) for name, (_, etag) in files.items()
+    ]
+    download = AsyncMock(side_effect=lambda client, bucket, name: files[name.split("/source/", 1)[1]][0])
+    return s3, download
+
+
+@pytest.mark.asyncio
+async def test_second_request_is_served_from_cache(cache_dir):
+    s3, download = minio_with({"core.xsd": (b"<xs:schema/>", "e1"), "ext/a.xsd": (b"<a/>", "e2")})
+
+    with patch("niem_api.clients.s3_client.download_file", download):
+        first = await prepare_schema_dir(s3, "s1")
+        second = await prepare_schema_dir(s3, "s1")
+
+    assert download.await_count == 2
+    assert first != second
+    assert (Path(second) / "ext" / "a.xsd").read_bytes() == b"<a/>"
+
+
+@pytest.mark.asyncio
+async def test_changed_etag_replaces_entry(cache_dir):
+    files = {"core.xsd": (b"v1", "e1")}
+    s3, download = minio_with(files)
+
+    with patch("niem_api.clients.s3_client.download_file", download):
+        await prepare_schema_dir(s3, "s1")
+        files["core.xsd"] = (b"v2", "e2")
+        s3.list_objects.return_value = [SimpleNamespace(object_name="s1/source/core.xsd", etag="e2")]
+        workspace = await prepare_schema_dir(s3, "s1")
+
+    assert (Path(workspace) / "core.xsd").read_bytes() == b"v2"
+    assert len(list((cache_dir / "s1").iterdir())) == 1
+
+
+def test_workspace_writes_do_not_touch_cache(cache_dir, tmp_path):
+    entry = cache_dir / "s1" / "abc"
+    entry.mkdir(parents=True)
+    (entry / "core.xsd").write_text("schema")
+    workspace = tmp_path / "work"
+    workspace.mkdir()
+
+    schema_cache._link_tree(entry, workspace)
+    (workspace / "instance.xml").write_text("<x/>")
+
+    assert (workspace / "core.xsd").read_text() == "schema"
+    assert not (entry / "instance.xml").exists()
+
+
+def test_evicts_least_recently_used_entries(cache_dir, monkeypatch):
+    monkeypatch.setattr(batch_config, "SCHEMA_CACHE_MAX_MB", 0)
+    old, new = cache_dir / "a" / "1", cache_dir / "b" / "2"
+    for entry in (old, new):
+        entry.mkdir(parents=True)
+        (entry / schema_cache._COMPLETE_MARKER).write_text("100")
+
+    schema_cache._evict(keep=new)
+
+    assert not old.exists()
+    assert new.exists()
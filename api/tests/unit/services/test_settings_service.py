@@ -1,7 +1,7 @@
 """Unit tests for SettingsService."""
 
 import pytest
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 from niem_api.services.settings_service import SettingsService
 from niem_api.models.models import Settings
@@ -57,6 +57,28 @@ class TestSettingsService:
         assert result.skip_json_validation is False  # Default value
         mock_neo4j_client.query.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_get_settings_async_reads_from_async_client(self):
+        """Test get_settings_async awaits the async client and builds Settings."""
+        async_client = Mock()
+        async_client.query = AsyncMock(return_value=create_neo4j_settings_response(skip_xml=False, skip_json=True))
+
+        result = await SettingsService(async_client).get_settings_async()
+
+        assert result.skip_xml_validation is False
+        assert result.skip_json_validation is True
+        async_client.query.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_get_settings_async_returns_defaults_on_error(self):
+        """Test get_settings_async falls back to defaults when the query fails."""
+        async_client = Mock()
+        async_client.query = AsyncMock(side_effect=Exception("Database connection failed"))
+
+        result = await SettingsService(async_client).get_settings_async()
+
+        assert result == Settings()
+
     def test_get_settings_returns_defaults_on_error(self, settings_service, mock_neo4j_client):
         """Test get_settings returns default settings when database error occurs."""
         # Arrange
@@ -0,0 +1,124 @@
+"""
+Unit tests for the content-hash validation result cache.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException
+
+from niem_api.core.config import batch_config
+from niem_api.handlers.ingest import _remember_validation_outcome, _validate_json_content, _validate_xml_content
+from niem_api.services import validation_cache
+
+JSON_SCHEMA = {"type": "object", "required": ["nc:Person"]}
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    validation_cache.clear_validation_cache()
+    yield
+    validation_cache.clear_validation_cache()
+
+
+@pytest.fixture
+def schema_dir(tmp_path):
+    (tmp_path / "model.xsd").write_text("<xs:schema/>")
+    return str(tmp_path)
+
+
+def xval_result(stdout: str = "") -> dict:
+    return {"returncode": 0, "stdout": stdout, "stderr": ""}
+
+
+def test_resent_xml_skips_validator(schema_dir):
+    with patch("niem_api.clients.cmf_client.run_cmf_command", return_value=xval_result()) as run:
+        _validate_xml_content("<a/>", schema_dir, "a.xml", "s1")
+        _validate_xml_content("<a/>", schema_dir, "a-resent.xml", "s1")
+        _validate_xml_content("<a/>", schema_dir, "a.xml", "s2")
+
+    assert run.call_count == 2
+
+
+def test_cached_failure_is_reported_for_new_filename(schema_dir):
+    stdout = "[error] a.xml:3:7: cvc-complex-type.2.4.a: Invalid content"
+
+    with patch("niem_api.clients.cmf_client.run_cmf_command", return_value=xval_result(stdout)) as run:
+        with pytest.raises(HTTPException):
+            _validate_xml_content("<a/>", schema_dir, "a.xml", "s1")
+        with pytest.raises(HTTPException) as exc_info:
+            _validate_xml_content("<a/>", schema_dir, "b.xml", "s1")
+
+    assert run.call_count == 1
+    detail = exc_info.value.detail
+    assert exc_info.value.status_code == 400
+    assert detail["message"] == "Validation error: b.xml"
+    assert detail["validation_result"]["errors"][0]["file"] == "b.xml"
+    assert detail["validation_result"]["errors"][0]["line"] == 3
+
+
+def test_json_results_are_cached():
+    with patch("jsonschema.Draft7Validator.iter_errors", autospec=True, return_value=iter([])) as iter_errors:
+        _validate_json_content('{"nc:Person": {}}', JSON_SCHEMA, "a.json", "s1")
+        _validate_json_content('{"nc:Person": {}}', JSON_SCHEMA, "a.json", "s1")
+
+    assert iter_errors.call_count == 1
+
+
+def test_tool_errors_are_not_cached():
+    key = validation_cache.result_key("<a/>", "s1", "xsd-cmftool")
+    error = HTTPException(status_code=500, detail={"message": "CMF tool error", "validation_result": None})
+
+    _remember_validation_outcome(key, "a.xml", error)
+
+    assert validation_cache.get_result(key, "a.xml") == (False, None)
+
+
+def test_zero_ttl_disables_cache(monkeypatch):
+    monkeypatch.setattr(batch_config, "VALIDATION_CACHE_TTL_SECONDS", 0)
+    key = validation_cache.result_key(b"<a/>", "s1", "xsd-cmftool")
+
+    validation_cache.put_result(key, "a.xml", None)
+
+    assert validation_cache.get_result(key, "a.xml") == (False, None)
+
+
+def test_expired_results_are_dropped(monkeypatch):
+    key = validation_cache.result_key(b"<a/>", "s1", "xsd-cmftool")
+    validation_cache.put_result(key, "a.xml", None)
+    assert validation_cache.get_result(key, "a.xml") == (True, None)
+
+    later = validation_cache.time.monotonic() + batch_config.VALIDATION_CACHE_TTL_SECONDS + 1
+    monkeypatch.setattr(validation_cache, "time", SimpleNamespace(monotonic=lambda: later))
+
+    assert validation_cache.get_result(key, "a.xml") == (False, None)
+
+
+def test_json_validation_returns_parsed_document_from_bytes():
+    document = _validate_json_content(b'{"nc:Person": {}}', JSON_SCHEMA, "a.json", "s1")
+
+    assert document == {"nc:Person": {}}
+    # A cache hit skips parsing; conversion parses the bytes itself
+    assert _validate_json_content(b'{"nc:Person": {}}', JSON_SCHEMA, "a.json", "s1") is None
+
+
+def test_validator_upgrade_changes_xml_key(monkeypatch):
+    from niem_api.clients import cmf_client
+    from niem_api.handlers import ingest
+    from niem_api.services import xsd_validator
+
+    def version(cmf_path, lxml="lxml-5.2.1-libxml2-2.12.6"):
+        monkeypatch.setattr(cmf_client, "CMF_TOOL_PATH", cmf_path)
+        monkeypatch.setattr(xsd_validator, "lxml_versions", lambda: lxml)
+        ingest._cmftool_release.cache_clear()
+        return ingest._xml_validator_version()
+
+    try:
+        current = version("/opt/cmftool-1.0/bin/cmftool")
+        assert version("/opt/cmftool-1.1/bin/cmftool") != current
+        monkeypatch.setattr(batch_config, "XML_VALIDATION_BACKEND", "lxml")
+        current = version("/opt/cmftool-1.0/bin/cmftool")
+        assert version("/opt/cmftool-1.0/bin/cmftool", "lxml-5.3.0-libxml2-2.13.1") != current
+    finally:
+        ingest._cmftool_release.cache_clear()
@@ -0,0 +1,109 @@
+"""
+Unit tests for in-process XSD validation.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException
+
+from niem_api.core.config import batch_config
+from niem_api.handlers.ingest import _validate_xml_content
+from niem_api.services import xsd_validator
+from niem_api.services.xsd_validator import validate_documents
+
+pytest.importorskip("lxml")
+
+PERSON_XSD = """<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"
+           xmlns:ex="http://example.com/person" targetNamespace="http://example.com/person"
+           elementFormDefault="qualified">
+  <xs:import namespace="http://example.com/common" schemaLocation="common/common.xsd"/>
+  <xs:element name="Person">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="Name" type="xs:string"/>
+        <xs:element name="Age" type="xs:int"/>
+      </xs:sequence>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>
+"""
+
+COMMON_XSD = """<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"
+           targetNamespace="http://example.com/common">
+  <xs:element name="Note" type="xs:string"/>
+</xs:schema>
+"""
+
+
+@pytest.fixture
+def schema_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(batch_config, "XML_VALIDATION_BACKEND", "lxml")
+    (tmp_path / "person.xsd").write_text(PERSON_XSD)
+    (tmp_path / "common").mkdir()
+    (tmp_path / "common" / "common.xsd").write_text(COMMON_XSD)
+    xsd_validator.clear_validator_cache()
+    yield str(tmp_path)
+    xsd_validator.clear_validator_cache()
+
+
+def person(age: str) -> str:
+    return f'<Person xmlns="http://example.com/person">\n  <Name>Ann</Name>\n  <Age>{age}</Age>\n</Person>'
+
+
+def test_valid_and_invalid_documents(schema_dir):
+    results = validate_documents([("ok.xml", person("42")), ("bad.xml", person("old"))], schema_dir)
+
+    assert results[0] == ([], [])
+    errors, warnings = results[1]
+    assert warnings == []
+    assert errors[0]["file"] == "bad.xml"
+    assert errors[0]["line"] == 3
+    assert errors[0]["severity"] == "error"
+    assert "old" in errors[0]["message"]
+
+
+def test_namespaces_from_every_xsd_file_are_available(schema_dir):
+    results = validate_documents([("note.xml", '<Note xmlns="http://example.com/common">hi</Note>')], schema_dir)
+
+    assert results == [([], [])]
+
+
+def test_malformed_document_reports_position(schema_dir):
+    errors, _ = validate_documents([("broken.xml", "<Person>\n<Name>")], schema_dir)[0]
+
+    assert len(errors) == 1
+    assert errors[0]["line"] == 2
+
+
+def test_schema_set_is_compiled_once(schema_dir, monkeypatch):
+    compiled = []
+    original = xsd_validator._compile
+    monkeypatch.setattr(xsd_validator, "_compile", lambda *args: compiled.append(args) or original(*args))
+
+    validate_documents([("a.xml", person("1"))], schema_dir)
+    validate_documents([("b.xml", person("2"))], schema_dir)
+
+    assert len(compiled) == 1
+
+
+def test_uncompilable_schema_falls_back_to_cmftool(schema_dir, tmp_path):
+    (tmp_path / "broken.xsd").write_text('<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"><xs:bogus/>')
+
+    assert validate_documents([("a.xml", person("1"))], schema_dir) is None
+
+
+def test_cmftool_backend_is_not_replaced(schema_dir, monkeypatch):
+    monkeypatch.setattr(batch_config, "XML_VALIDATION_BACKEND", "cmftool")
+
+    assert validate_documents([("a.xml", person("1"))], schema_dir) is None
+
+
+def test_ingest_validation_skips_cmftool(schema_dir):
+    with patch("niem_api.clients.cmf_client.run_cmf_command") as run:
+        with pytest.raises(HTTPException) as exc_info:
+            _validate_xml_content(person("old"), schema_dir, "bad.xml")
+
+    run.assert_not_called()
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.detail["validation_result"]["errors"][0]["line"] == 3